@@ -0,0 +1,45 @@
+"""add trace events
+
+Revision ID: 20261019_0003
+Revises: 20260207_0002
+Create Date: 2026-10-19 00:03:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "20261019_0003"
+down_revision = "20260207_0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "trace_events",
+        sa.Column("id", sa.BigInteger().with_variant(sa.Integer(), "sqlite"), autoincrement=True, nullable=False),
+        sa.Column("run_id", sa.String(length=36), nullable=False),
+        sa.Column("user_id", sa.String(length=36), nullable=True),
+        sa.Column("stage", sa.String(length=120), nullable=False),
+        sa.Column("event", sa.String(length=64), nullable=False),
+        sa.Column("timestamp", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("payload", sa.JSON().with_variant(postgresql.JSONB(), "postgresql"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_trace_events_run_id_timestamp", "trace_events", ["run_id", "timestamp"], unique=False)
+    op.create_index("ix_trace_events_user_id_timestamp", "trace_events", ["user_id", "timestamp"], unique=False)
+    op.create_index(
+        "ix_trace_events_stage_event_timestamp",
+        "trace_events",
+        ["stage", "event", "timestamp"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_trace_events_stage_event_timestamp", table_name="trace_events")
+    op.drop_index("ix_trace_events_user_id_timestamp", table_name="trace_events")
+    op.drop_index("ix_trace_events_run_id_timestamp", table_name="trace_events")
+    op.drop_table("trace_events")
@@ -0,0 +1,69 @@
+"""add trace stage rollups
+
+Revision ID: 20261019_0004
+Revises: 20261019_0003
+Create Date: 2026-10-19 00:04:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261019_0004"
+down_revision = "20261019_0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "trace_stage_rollups",
+        sa.Column("id", sa.BigInteger().with_variant(sa.Integer(), "sqlite"), autoincrement=True, nullable=False),
+        sa.Column("window_start", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("graph_id", sa.String(length=120), nullable=False),
+        sa.Column("graph_version", sa.String(length=64), nullable=False),
+        sa.Column("stage", sa.String(length=120), nullable=False),
+        sa.Column("llm_model", sa.String(length=255), nullable=False),
+        sa.Column("prompt_hash", sa.String(length=64), nullable=False),
+        sa.Column("completed_count", sa.Integer(), nullable=False),
+        sa.Column("failed_count", sa.Integer(), nullable=False),
+        sa.Column("duration_ms_total", sa.BigInteger(), nullable=False),
+        sa.Column("latency_histogram", sa.JSON(), nullable=False),
+        sa.Column("output_chars_histogram", sa.JSON(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "window_start",
+            "graph_id",
+            "graph_version",
+            "stage",
+            "llm_model",
+            "prompt_hash",
+            name="uq_trace_stage_rollups_key",
+        ),
+    )
+    op.create_index(
+        op.f("ix_trace_stage_rollups_window_start"),
+        "trace_stage_rollups",
+        ["window_start"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_trace_stage_rollups_graph_id_window_start",
+        "trace_stage_rollups",
+        ["graph_id", "window_start"],
+        unique=False,
+    )
+    op.create_table(
+        "trace_rollup_state",
+        sa.Column("name", sa.String(length=64), nullable=False),
+        sa.Column("last_event_id", sa.BigInteger(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("trace_rollup_state")
+    op.drop_index("ix_trace_stage_rollups_graph_id_window_start", table_name="trace_stage_rollups")
+    op.drop_index(op.f("ix_trace_stage_rollups_window_start"), table_name="trace_stage_rollups")
+    op.drop_table("trace_stage_rollups")
@@ -0,0 +1,30 @@
+"""ground source list index
+
+Revision ID: 20261019_0005
+Revises: 20261019_0004
+Create Date: 2026-10-19 00:05:00.000000
+"""
+
+from alembic import op
+
+
+revision = "20261019_0005"
+down_revision = "20261019_0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_ground_sources_user_id_created_at_id",
+        "ground_sources",
+        ["user_id", "created_at", "id"],
+        unique=False,
+    )
+    # The composite index has user_id as its prefix, so the single-column one only costs writes.
+    op.drop_index("ix_ground_sources_user_id", table_name="ground_sources")
+
+
+def downgrade() -> None:
+    op.create_index("ix_ground_sources_user_id", "ground_sources", ["user_id"], unique=False)
+    op.drop_index("ix_ground_sources_user_id_created_at_id", table_name="ground_sources")
@@ -0,0 +1,30 @@
+"""add ground source sha256
+
+Revision ID: 20261019_0006
+Revises: 20261019_0005
+Create Date: 2026-10-19 00:06:00.000000
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "20261019_0006"
+down_revision = "20261019_0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("ground_sources", sa.Column("source_sha256", sa.String(length=64), nullable=True))
+    op.create_index(
+        "ix_ground_sources_user_id_source_sha256",
+        "ground_sources",
+        ["user_id", "source_sha256"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_ground_sources_user_id_source_sha256", table_name="ground_sources")
+    op.drop_column("ground_sources", "source_sha256")
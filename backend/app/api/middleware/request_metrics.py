@@ -0,0 +1,51 @@
+import time
+
+from anyio import to_thread
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import (
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_FLIGHT,
+    THREADPOOL_BUSY_THREADS,
+    THREADPOOL_QUEUE_DEPTH,
+)
+
+
+class RequestMetricsMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self._app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        sample_threadpool()
+        status_code = 500
+        started = time.perf_counter()
+        HTTP_REQUESTS_IN_FLIGHT.inc()
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = int(message["status"])
+            await send(message)
+
+        try:
+            await self._app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUESTS_IN_FLIGHT.dec()
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started,
+                method=scope.get("method", ""),
+                # Unmatched paths share one label so scanners cannot blow up cardinality.
+                route=getattr(route, "path", None) or "unmatched",
+                status=status_code,
+            )
+
+
+def sample_threadpool() -> None:
+    statistics = to_thread.current_default_thread_limiter().statistics()
+    THREADPOOL_BUSY_THREADS.set(statistics.borrowed_tokens)
+    THREADPOOL_QUEUE_DEPTH.set(statistics.tasks_waiting)
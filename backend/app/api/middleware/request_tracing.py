@@ -0,0 +1,60 @@
+import re
+from uuid import uuid4
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.telemetry import start_span
+
+_REQUEST_ID_PATTERN = re.compile(r"^[A-Za-z0-9._-]{1,128}$")
+_TRACEPARENT_PATTERN = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-[0-9a-f]{2}$")
+
+
+class RequestTracingMiddleware:
+    def __init__(self, app: ASGIApp) -> None:
+        self._app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self._app(scope, receive, send)
+            return
+
+        headers = {key.decode("latin-1").lower(): value.decode("latin-1") for key, value in scope.get("headers", [])}
+        request_id = headers.get("x-request-id", "")
+        if not _REQUEST_ID_PATTERN.match(request_id):
+            request_id = uuid4().hex
+
+        trace_id = None
+        parent_span_id = None
+        traceparent = _TRACEPARENT_PATTERN.match(headers.get("traceparent", "").strip())
+        if traceparent is not None:
+            trace_id, parent_span_id = traceparent.group(1), traceparent.group(2)
+
+        with start_span(
+            "http.request",
+            attributes={
+                "request_id": request_id,
+                "http.method": scope.get("method", ""),
+                "http.target": scope.get("path", ""),
+            },
+            trace_id=trace_id,
+            parent_span_id=parent_span_id,
+        ) as span:
+
+            async def send_with_request_id(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    status_code = int(message["status"])
+                    span.set_attribute("http.status_code", status_code)
+                    if status_code >= 500:
+                        span.status = "error"
+                    message.setdefault("headers", [])
+                    message["headers"] = [
+                        *message["headers"],
+                        (b"x-request-id", request_id.encode("latin-1")),
+                        (b"x-trace-id", span.trace_id.encode("latin-1")),
+                    ]
+                await send(message)
+
+            await self._app(scope, receive, send_with_request_id)
+            route = scope.get("route")
+            if route is not None and getattr(route, "path", None):
+                span.set_attribute("http.route", route.path)
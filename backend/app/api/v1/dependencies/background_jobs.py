@@ -0,0 +1,90 @@
+from functools import lru_cache
+
+from app.api.v1.dependencies.cv_generation import get_local_trace_store
+from app.api.v1.dependencies.document_pipeline import get_artifact_store, get_ingestion_cache
+from app.api.v1.dependencies.metrics import get_metrics_store
+from app.application.use_cases.rollup_trace_events import RollupTraceEventsUseCase
+from app.core.database import SessionLocal
+from app.core.settings import settings
+from app.infrastructure.background.periodic_worker import PeriodicWorker
+from app.infrastructure.repositories.sqlalchemy_trace_analytics_repository import SQLAlchemyTraceAnalyticsRepository
+from app.infrastructure.storage.local_file_storage import GROUND_SOURCE_UPLOADS, TRANSIENT_UPLOADS
+from app.infrastructure.storage.upload_sweeper import UploadSweeper
+
+
+@lru_cache(maxsize=1)
+def get_background_workers() -> tuple[PeriodicWorker, ...]:
+    workers: list[PeriodicWorker] = []
+    if (
+        settings.cv_generation_trace_backend == "local"
+        and settings.cv_generation_trace_maintenance_interval_seconds > 0
+    ):
+        workers.append(
+            PeriodicWorker(
+                name="trace-maintenance",
+                task=get_local_trace_store().run_maintenance,
+                interval_seconds=settings.cv_generation_trace_maintenance_interval_seconds,
+            )
+        )
+    if (
+        settings.cv_generation_trace_backend == "database"
+        and settings.cv_generation_trace_rollup_interval_seconds > 0
+    ):
+        workers.append(
+            PeriodicWorker(
+                name="trace-rollup",
+                task=_rollup_trace_events,
+                interval_seconds=settings.cv_generation_trace_rollup_interval_seconds,
+            )
+        )
+    ingestion_cache = get_ingestion_cache()
+    if ingestion_cache is not None and settings.ingestion_cache_purge_interval_seconds > 0:
+        workers.append(
+            PeriodicWorker(
+                name="ingestion-cache-purge",
+                task=ingestion_cache.purge_expired,
+                interval_seconds=settings.ingestion_cache_purge_interval_seconds,
+            )
+        )
+    if settings.artifact_purge_interval_seconds > 0 and settings.artifact_retention_hours > 0:
+        workers.append(
+            PeriodicWorker(
+                name="artifact-purge",
+                task=get_artifact_store().purge_expired,
+                interval_seconds=settings.artifact_purge_interval_seconds,
+            )
+        )
+    if settings.upload_sweep_interval_seconds > 0 and settings.upload_transient_retention_hours > 0:
+        retention_hours = {TRANSIENT_UPLOADS: settings.upload_transient_retention_hours}
+        if settings.storage_backend == "s3":
+            # The bucket holds ground sources; the local copy only served ingestion.
+            retention_hours[GROUND_SOURCE_UPLOADS] = settings.upload_transient_retention_hours
+        sweeper = UploadSweeper(
+            settings.upload_dir,
+            retention_hours=retention_hours,
+            batch_size=settings.upload_sweep_batch_size,
+        )
+        workers.append(
+            PeriodicWorker(
+                name="upload-sweep",
+                task=sweeper.sweep,
+                interval_seconds=settings.upload_sweep_interval_seconds,
+            )
+        )
+    metrics_store = get_metrics_store()
+    if metrics_store is not None:
+        workers.append(
+            PeriodicWorker(
+                name="metrics-flush",
+                task=metrics_store.flush,
+                interval_seconds=settings.metrics_flush_interval_seconds,
+                run_on_stop=True,
+            )
+        )
+    return tuple(workers)
+
+
+def _rollup_trace_events() -> int:
+    with SessionLocal() as session:
+        use_case = RollupTraceEventsUseCase(analytics=SQLAlchemyTraceAnalyticsRepository(session))
+        return use_case.execute()
@@ -1,14 +1,28 @@
 from functools import lru_cache
+from typing import Annotated
 
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from app.api.v1.dependencies.auth import get_db
 from app.api.v1.dependencies.document_pipeline import get_document_pipeline_use_case
 from app.application.errors import CvGenerationConfigurationError
 from app.application.use_cases.generate_targeted_cv import GenerateTargetedCvUseCase
+from app.application.use_cases.get_run_trace import GetRunTraceUseCase
+from app.application.use_cases.get_stage_latency_report import GetStageLatencyReportUseCase
+from app.application.use_cases.list_trace_runs import ListTraceRunsUseCase
+from app.core.database import SessionLocal
 from app.core.settings import settings
 from app.infrastructure.langgraph.config import load_cv_generation_runtime_config
 from app.infrastructure.llm.configurable_llm_gateway import ConfigurableLLMGateway
 from app.infrastructure.prompts.filesystem_prompt_repository import FilesystemPromptRepository
+from app.infrastructure.repositories.sqlalchemy_trace_analytics_repository import SQLAlchemyTraceAnalyticsRepository
+from app.infrastructure.repositories.sqlalchemy_trace_repository import SQLAlchemyTraceRepository
+from app.domain.services.trace_store import TraceStore
 from app.infrastructure.storage.local_file_storage import LocalFileStorage
+from app.infrastructure.tracing.buffered_jsonl_trace_store import BufferedJsonlTraceStore
 from app.infrastructure.tracing.local_jsonl_trace_store import LocalJsonlTraceStore
+from app.infrastructure.tracing.sqlalchemy_trace_store import SQLAlchemyTraceStore
 
 
 @lru_cache(maxsize=1)
@@ -42,7 +56,7 @@ def get_cv_generation_orchestrator():
     )
     llm_gateway = ConfigurableLLMGateway(providers=config.providers)
     prompt_repository = FilesystemPromptRepository(settings.cv_generation_prompts_dir)
-    trace_store = LocalJsonlTraceStore(settings.cv_generation_trace_dir)
+    trace_store = get_trace_store()
 
     return LangGraphCvGenerationOrchestrator(
         config=config,
@@ -50,3 +64,58 @@ def get_cv_generation_orchestrator():
         prompt_repository=prompt_repository,
         trace_store=trace_store,
     )
+
+
+@lru_cache(maxsize=1)
+def get_trace_store() -> TraceStore:
+    if settings.cv_generation_trace_backend == "database":
+        return SQLAlchemyTraceStore(
+            SessionLocal,
+            max_queue_size=settings.cv_generation_trace_queue_size,
+            batch_size=settings.cv_generation_trace_batch_size,
+        )
+
+    local_store = get_local_trace_store()
+    if settings.cv_generation_trace_buffered:
+        return BufferedJsonlTraceStore(
+            settings.cv_generation_trace_dir,
+            max_queue_size=settings.cv_generation_trace_queue_size,
+            batch_size=settings.cv_generation_trace_batch_size,
+            layout=local_store,
+        )
+    return local_store
+
+
+@lru_cache(maxsize=1)
+def get_local_trace_store() -> LocalJsonlTraceStore:
+    return LocalJsonlTraceStore(
+        settings.cv_generation_trace_dir,
+        compact_after_seconds=settings.cv_generation_trace_compact_after_seconds,
+        retention_days=settings.cv_generation_trace_retention_days,
+    )
+
+
+def get_trace_repository(db: Annotated[Session, Depends(get_db)]) -> SQLAlchemyTraceRepository:
+    return SQLAlchemyTraceRepository(db)
+
+
+def get_run_trace_use_case(
+    traces: Annotated[SQLAlchemyTraceRepository, Depends(get_trace_repository)],
+) -> GetRunTraceUseCase:
+    return GetRunTraceUseCase(traces=traces)
+
+
+def get_list_trace_runs_use_case(
+    traces: Annotated[SQLAlchemyTraceRepository, Depends(get_trace_repository)],
+) -> ListTraceRunsUseCase:
+    return ListTraceRunsUseCase(traces=traces)
+
+
+def get_trace_analytics_repository(db: Annotated[Session, Depends(get_db)]) -> SQLAlchemyTraceAnalyticsRepository:
+    return SQLAlchemyTraceAnalyticsRepository(db)
+
+
+def get_stage_latency_report_use_case(
+    analytics: Annotated[SQLAlchemyTraceAnalyticsRepository, Depends(get_trace_analytics_repository)],
+) -> GetStageLatencyReportUseCase:
+    return GetStageLatencyReportUseCase(analytics=analytics)
@@ -1,29 +1,83 @@
-from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
 
+from app.api.v1.dependencies.storage import get_s3_client
 from app.application.services.ocr_policy_strategy import RuleBasedOcrPolicyStrategy
 from app.application.use_cases.process_document_pipeline import ProcessDocumentPipelineUseCase
+from app.application.use_cases.render_deferred_artifact import RenderDeferredArtifactUseCase
 from app.core.settings import settings
+from app.domain.services.artifact_store import DeferredArtifactStore
 from app.domain.services.document_ingestor import DocumentIngestor
-from app.infrastructure.ingestion.docling_document_ingestor import DoclingDocumentIngestor
+from app.domain.services.document_renderer import BinaryDocumentRenderer, DocumentRenderer
+from app.infrastructure.ingestion.caching_document_ingestor import CachingDocumentIngestor
+from app.infrastructure.ingestion.docling_converter_pool import DoclingConverterPool
+from app.infrastructure.ingestion.docling_document_ingestor import DoclingDocumentIngestor, build_docling_ingestor
+from app.infrastructure.ingestion.docling_payload import DoclingPayloadMerger
 from app.infrastructure.ingestion.fallback_text_document_ingestor import FallbackTextDocumentIngestor
+from app.infrastructure.ingestion.local_ingestion_cache import LocalIngestionCache
+from app.infrastructure.ingestion.page_parallel_document_ingestor import PageParallelDocumentIngestor
+from app.infrastructure.ingestion.pdf_text_layer_prober import PdfTextLayerProber
+from app.infrastructure.ingestion.process_pool_document_ingestor import ProcessPoolDocumentIngestor
 from app.infrastructure.ingestion.basic_ingestion_quality_validator import BasicIngestionQualityValidator
+from app.infrastructure.rendering.compact_document_renderer import CompactDocumentRenderer
 from app.infrastructure.rendering.json_renderer import JsonRenderer
 from app.infrastructure.rendering.markdown_renderer import MarkdownRenderer
+from app.infrastructure.storage.blob_compression import resolve_compression
 from app.infrastructure.storage.local_artifact_store import LocalArtifactStore
+from app.infrastructure.storage.s3_artifact_store import S3ArtifactStore
 
 
 @lru_cache(maxsize=1)
 def get_document_pipeline_use_case() -> ProcessDocumentPipelineUseCase:
     return ProcessDocumentPipelineUseCase(
         ingestors=resolve_ingestors(),
-        renderers=[MarkdownRenderer(), JsonRenderer()],
-        artifact_store=LocalArtifactStore(base_dir=settings.artifact_dir),
+        renderers=get_renderers(),
+        artifact_store=get_artifact_store(),
         quality_validator=BasicIngestionQualityValidator(),
         ocr_policy_strategy=RuleBasedOcrPolicyStrategy(
             default_ocr_enabled=settings.document_pdf_do_ocr,
             auto_retry_on_quality_failure=settings.document_ocr_auto_retry_on_quality_failure,
             retry_min_text_length=settings.document_ocr_retry_min_text_length,
+            probe_scanned_page_ratio=settings.document_ocr_probe_scanned_page_ratio,
         ),
+        document_prober=PdfTextLayerProber() if settings.document_ocr_probe_enabled else None,
+        racing_executor=(
+            ThreadPoolExecutor(thread_name_prefix="ingestion-race") if settings.document_ingestor_racing_enabled else None
+        ),
+        render_executor=ThreadPoolExecutor(thread_name_prefix="artifact-render"),
+        deferred_rendering=settings.document_artifact_rendering == "lazy",
+        payload_merger=DoclingPayloadMerger(),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_deferred_artifact_use_case() -> RenderDeferredArtifactUseCase:
+    return RenderDeferredArtifactUseCase(artifact_store=get_artifact_store(), renderers=get_renderers())
+
+
+def get_renderers() -> list[DocumentRenderer | BinaryDocumentRenderer]:
+    return [
+        MarkdownRenderer(),
+        JsonRenderer(artifact_store=get_artifact_store()),
+        CompactDocumentRenderer(artifact_store=get_artifact_store(), compress=settings.artifact_compression == "none"),
+    ]
+
+
+@lru_cache(maxsize=1)
+def get_artifact_store() -> DeferredArtifactStore:
+    local = LocalArtifactStore(
+        base_dir=settings.artifact_dir,
+        compression=resolve_compression(settings.artifact_compression),
+        retention_hours=settings.artifact_retention_hours,
+    )
+    if settings.storage_backend != "s3":
+        return local
+    return S3ArtifactStore(
+        local,
+        get_s3_client(),
+        presign_ttl_seconds=settings.artifact_download_token_ttl_seconds,
     )
 
 
@@ -37,9 +91,120 @@ def resolve_output_formats() -> tuple[str, ...]:
 
 
 def resolve_ingestors() -> list[DocumentIngestor]:
-    docling = DoclingDocumentIngestor(enable_pdf_ocr=settings.document_pdf_do_ocr)
+    docling = get_docling_ingestor()
     fallback = FallbackTextDocumentIngestor()
 
     if settings.document_ingestor_preferred == "docling":
         return [docling, fallback]
     return [fallback, docling]
+
+
+@lru_cache(maxsize=1)
+def get_docling_ingestor() -> DocumentIngestor:
+    ingestor = get_page_parallel_ingestor() or get_docling_engine()
+    cache = get_ingestion_cache()
+    if cache is None:
+        return ingestor
+    return CachingDocumentIngestor(
+        delegate=ingestor,
+        cache=cache,
+        engine_name="docling",
+        engine_version=_docling_version(),
+        default_ocr_enabled=settings.document_pdf_do_ocr,
+        flight_timeout_seconds=settings.document_ingestion_task_timeout_seconds,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_page_parallel_ingestor() -> PageParallelDocumentIngestor | None:
+    if settings.document_page_parallel_min_pages <= 0:
+        return None
+    return PageParallelDocumentIngestor(
+        delegate=get_docling_engine(),
+        max_parallel=settings.document_ingestion_process_pool_size or settings.docling_converter_pool_size,
+        min_pages=settings.document_page_parallel_min_pages,
+        artifact_store=get_artifact_store(),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_ingestion_cache() -> LocalIngestionCache | None:
+    if not settings.ingestion_cache_enabled:
+        return None
+    base_dir = settings.ingestion_cache_dir or str(Path(settings.artifact_dir) / ".ingestion_cache")
+    return LocalIngestionCache(
+        base_dir,
+        max_age_days=settings.ingestion_cache_max_age_days,
+        artifact_store=get_artifact_store(),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_docling_engine() -> DocumentIngestor:
+    if settings.document_ingestion_process_pool_size > 0:
+        return ProcessPoolDocumentIngestor(
+            ingestor_factory=partial(
+                build_docling_ingestor,
+                enable_pdf_ocr=settings.document_pdf_do_ocr,
+                artifacts_path=settings.docling_artifacts_path,
+                warm_ocr_modes=_warm_ocr_modes() if settings.docling_warmup_on_startup else (),
+                artifact_dir=settings.artifact_dir,
+            ),
+            local_ingestor=DoclingDocumentIngestor(enable_pdf_ocr=settings.document_pdf_do_ocr),
+            max_workers=settings.document_ingestion_process_pool_size,
+            task_timeout_seconds=settings.document_ingestion_task_timeout_seconds,
+            max_tasks_per_worker=settings.document_ingestion_max_tasks_per_worker,
+            max_worker_rss_bytes=settings.document_ingestion_max_worker_rss_mb * 1024 * 1024 or None,
+        )
+    return DoclingDocumentIngestor(
+        enable_pdf_ocr=settings.document_pdf_do_ocr,
+        converter_pool=get_docling_converter_pool(),
+        artifact_store=get_artifact_store(),
+    )
+
+
+@lru_cache(maxsize=1)
+def get_docling_converter_pool() -> DoclingConverterPool:
+    return DoclingConverterPool(
+        max_converters_per_config=settings.docling_converter_pool_size,
+        artifacts_path=settings.docling_artifacts_path,
+    )
+
+
+def warm_docling_converters() -> bool:
+    if not settings.docling_warmup_on_startup:
+        return False
+    ingestor = get_docling_engine()
+    if isinstance(ingestor, ProcessPoolDocumentIngestor):
+        # Workers build and warm their own converters as soon as they start.
+        ingestor.start()
+        return True
+    try:
+        get_docling_converter_pool().warm(ocr_modes=_warm_ocr_modes())
+    except ImportError:
+        # Docling is an optional runtime dependency; the first request will report it.
+        return False
+    return True
+
+
+def stop_docling_ingestion() -> None:
+    page_parallel = get_page_parallel_ingestor()
+    if page_parallel is not None:
+        page_parallel.close()
+    ingestor = get_docling_engine()
+    if isinstance(ingestor, ProcessPoolDocumentIngestor):
+        ingestor.close()
+
+
+def _warm_ocr_modes() -> tuple[bool, ...]:
+    ocr_modes = {settings.document_pdf_do_ocr}
+    if settings.document_ocr_auto_retry_on_quality_failure:
+        ocr_modes.add(True)
+    return tuple(sorted(ocr_modes))
+
+
+def _docling_version() -> str | None:
+    try:
+        return version("docling")
+    except PackageNotFoundError:
+        return None
@@ -0,0 +1,23 @@
+from functools import lru_cache
+
+from app.core.database import engine
+from app.core.metrics import DB_POOL_CHECKED_OUT, registry
+from app.core.settings import settings
+from app.infrastructure.metrics.multiprocess_metrics_store import MultiprocessMetricsStore
+
+
+@lru_cache(maxsize=1)
+def get_metrics_store() -> MultiprocessMetricsStore | None:
+    if not settings.metrics_multiproc_dir:
+        return None
+    return MultiprocessMetricsStore(settings.metrics_multiproc_dir, registry=registry)
+
+
+def render_metrics() -> str:
+    checkedout = getattr(engine.pool, "checkedout", None)
+    if checkedout is not None:
+        DB_POOL_CHECKED_OUT.set(checkedout())
+    store = get_metrics_store()
+    if store is None:
+        return registry.render()
+    return store.render()
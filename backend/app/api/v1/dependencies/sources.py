@@ -7,6 +7,7 @@ from app.api.v1.dependencies.auth import get_db
 from app.api.v1.dependencies.cv_export import get_export_cv_pdf_use_case
 from app.api.v1.dependencies.cv_generation import get_cv_generation_orchestrator
 from app.api.v1.dependencies.document_pipeline import get_document_pipeline_use_case
+from app.api.v1.dependencies.storage import get_s3_client
 from app.application.use_cases.create_ground_source import CreateGroundSourceUseCase
 from app.application.use_cases.delete_ground_source import DeleteGroundSourceUseCase
 from app.application.use_cases.export_cv_pdf import ExportCvPdfUseCase
@@ -16,12 +17,17 @@ from app.application.use_cases.list_ground_sources import ListGroundSourcesUseCa
 from app.application.use_cases.process_document_pipeline import ProcessDocumentPipelineUseCase
 from app.core.settings import settings
 from app.domain.services.cv_generation_orchestrator import CvGenerationOrchestrator
+from app.domain.services.file_storage import FileStorage
 from app.infrastructure.repositories.sqlalchemy_ground_source_repository import SQLAlchemyGroundSourceRepository
-from app.infrastructure.storage.local_file_storage import LocalFileStorage
+from app.infrastructure.storage.local_file_storage import GROUND_SOURCE_UPLOADS, LocalFileStorage
+from app.infrastructure.storage.s3_file_storage import S3FileStorage
 
 
-def get_upload_storage() -> LocalFileStorage:
-    return LocalFileStorage(upload_dir=settings.upload_dir)
+def get_upload_storage() -> FileStorage:
+    local = LocalFileStorage(upload_dir=settings.upload_dir, purpose=GROUND_SOURCE_UPLOADS)
+    if settings.storage_backend != "s3":
+        return local
+    return S3FileStorage(local, get_s3_client())
 
 
 def get_ground_source_repository(
@@ -33,7 +39,7 @@ def get_ground_source_repository(
 def get_create_ground_source_use_case(
     sources: Annotated[SQLAlchemyGroundSourceRepository, Depends(get_ground_source_repository)],
     document_pipeline: Annotated[ProcessDocumentPipelineUseCase, Depends(get_document_pipeline_use_case)],
-    storage: Annotated[LocalFileStorage, Depends(get_upload_storage)],
+    storage: Annotated[FileStorage, Depends(get_upload_storage)],
 ) -> CreateGroundSourceUseCase:
     return CreateGroundSourceUseCase(
         sources=sources,
@@ -52,7 +58,7 @@ def get_list_ground_sources_use_case(
 
 def get_delete_ground_source_use_case(
     sources: Annotated[SQLAlchemyGroundSourceRepository, Depends(get_ground_source_repository)],
-    storage: Annotated[LocalFileStorage, Depends(get_upload_storage)],
+    storage: Annotated[FileStorage, Depends(get_upload_storage)],
 ) -> DeleteGroundSourceUseCase:
     return DeleteGroundSourceUseCase(sources=sources, storage=storage)
 
@@ -0,0 +1,16 @@
+from functools import lru_cache
+
+from app.core.settings import settings
+from app.infrastructure.storage.s3_client import S3Client
+
+
+@lru_cache(maxsize=1)
+def get_s3_client() -> S3Client:
+    return S3Client(
+        endpoint_url=settings.s3_endpoint_url or "",
+        bucket=settings.s3_bucket or "",
+        access_key_id=settings.s3_access_key_id or "",
+        secret_access_key=settings.s3_secret_access_key or "",
+        region=settings.s3_region,
+        addressing_style=settings.s3_addressing_style,
+    )
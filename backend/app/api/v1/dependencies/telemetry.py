@@ -0,0 +1,29 @@
+from functools import lru_cache
+
+from app.core.settings import settings
+from app.core.telemetry import SpanExporter
+from app.infrastructure.tracing.span_exporters import InMemorySpanExporter, JsonlSpanExporter, OtlpHttpSpanExporter
+
+
+@lru_cache(maxsize=1)
+def get_span_exporter() -> SpanExporter | None:
+    if settings.tracing_exporter == "none":
+        return None
+    if settings.tracing_exporter == "file":
+        return JsonlSpanExporter(settings.tracing_file_path)
+    if settings.tracing_exporter == "otlp" and settings.tracing_otlp_endpoint:
+        return OtlpHttpSpanExporter(
+            settings.tracing_otlp_endpoint,
+            service_name=settings.tracing_service_name,
+            headers=_parse_headers(settings.tracing_otlp_headers),
+        )
+    return InMemorySpanExporter()
+
+
+def _parse_headers(raw: str) -> dict[str, str]:
+    headers: dict[str, str] = {}
+    for item in raw.split(","):
+        key, separator, value = item.partition("=")
+        if separator and key.strip():
+            headers[key.strip()] = value.strip()
+    return headers
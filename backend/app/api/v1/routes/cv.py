@@ -53,6 +53,7 @@ def upload_cv(
         artifacts=[
             _to_artifact_response(
                 storage_path=artifact.storage_path,
+                filename=artifact.filename,
                 output_format=artifact.format,
                 media_type=artifact.media_type,
                 user_id=current_user.id,
@@ -78,6 +79,7 @@ def upload_cv(
 def _to_artifact_response(
     *,
     storage_path: str,
+    filename: str | None,
     output_format: str,
     media_type: str,
     user_id: str,
@@ -87,12 +89,13 @@ def _to_artifact_response(
         "format": output_format,
         "media_type": media_type,
         "storage_path": storage_path,
+        "filename": filename,
     }
     if not settings.use_signed_artifact_download():
         return payload
 
     resolved_storage_path = str(Path(storage_path).resolve())
-    token = token_service.create_token(user_id=user_id, storage_path=resolved_storage_path)
+    token = token_service.create_token(user_id=user_id, storage_path=resolved_storage_path, filename=filename)
     payload["download_token"] = token
     payload["download_url"] = (
         f"/api/v1/documents/artifacts/download?storage_path={quote(resolved_storage_path)}&token={quote(token)}"
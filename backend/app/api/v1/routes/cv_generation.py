@@ -1,12 +1,25 @@
+from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Response, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Response, UploadFile, status
 
-from app.api.v1.dependencies.auth import AuthenticatedUser, get_current_user
+from app.api.v1.dependencies.auth import AuthenticatedUser, get_current_admin_user, get_current_user
 from app.api.v1.dependencies.cv_export import get_export_cv_pdf_use_case
-from app.api.v1.dependencies.cv_generation import get_cv_generation_use_case
+from app.api.v1.dependencies.cv_generation import (
+    get_cv_generation_use_case,
+    get_list_trace_runs_use_case,
+    get_run_trace_use_case,
+    get_stage_latency_report_use_case,
+)
 from app.api.v1.dependencies.sources import get_generate_from_source_pdf_use_case, get_generate_from_source_use_case
-from app.api.v1.schemas.cv_generation import CVExportPdfRequest, CVGenerateFromSourceResponse, CVGenerateResponse
+from app.api.v1.schemas.cv_generation import (
+    CVExportPdfRequest,
+    CVGenerateFromSourceResponse,
+    CVGenerateResponse,
+    RunTraceResponse,
+    StageLatencyReportListResponse,
+    TraceRunListResponse,
+)
 from app.application.errors import (
     ArtifactPersistenceError,
     CvExportError,
@@ -16,23 +29,28 @@ from app.application.errors import (
     IngestionFailedError,
     IngestorNotFoundError,
     InvalidJobDescriptionError,
+    InvalidReportWindowError,
     LowQualityExtractionError,
     MissingFileNameError,
     PromptResolutionError,
     RenderingFailedError,
+    TraceRunNotFoundError,
     UploadedFileTooLargeError,
 )
 from app.application.use_cases.export_cv_pdf import ExportCvPdfUseCase
 from app.application.use_cases.generate_targeted_cv import GenerateTargetedCvUseCase
 from app.application.use_cases.generate_targeted_cv_from_source import GenerateTargetedCvFromSourceUseCase
 from app.application.use_cases.generate_targeted_cv_pdf_from_source import GenerateTargetedCvPdfFromSourceUseCase
+from app.application.use_cases.get_run_trace import GetRunTraceUseCase
+from app.application.use_cases.get_stage_latency_report import GetStageLatencyReportUseCase
+from app.application.use_cases.list_trace_runs import ListTraceRunsUseCase
 
 router = APIRouter(prefix="/cv", tags=["cv"])
 
 
 @router.post("/generate", response_model=CVGenerateResponse)
 def generate_cv(
-    _current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
     use_case: Annotated[GenerateTargetedCvUseCase, Depends(get_cv_generation_use_case)],
     job_description: Annotated[str, Form(...)],
     graph_id: Annotated[str | None, Form()] = None,
@@ -45,6 +63,7 @@ def generate_cv(
             stream=file.file,
             job_description=job_description,
             graph_id=graph_id,
+            user_id=current_user.id,
         )
     except (MissingFileNameError, InvalidJobDescriptionError) as exc:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
@@ -221,3 +240,91 @@ def generate_cv_from_source_pdf(
         headers["X-CV-Run-Id"] = result.run_id
 
     return Response(content=result.content_bytes, media_type=result.media_type, headers=headers)
+
+
+@router.get("/runs", response_model=TraceRunListResponse)
+def list_runs(
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
+    use_case: Annotated[ListTraceRunsUseCase, Depends(get_list_trace_runs_use_case)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 20,
+    offset: Annotated[int, Query(ge=0)] = 0,
+) -> TraceRunListResponse:
+    runs = use_case.execute(user_id=current_user.id, limit=limit, offset=offset)
+    return TraceRunListResponse(
+        items=[
+            {
+                "run_id": run.run_id,
+                "started_at": run.started_at,
+                "last_event_at": run.last_event_at,
+                "event_count": run.event_count,
+                "failed_stage_count": run.failed_stage_count,
+            }
+            for run in runs
+        ],
+        limit=limit,
+        offset=offset,
+    )
+
+
+@router.get("/runs/{run_id}/trace", response_model=RunTraceResponse)
+def get_run_trace(
+    run_id: str,
+    current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
+    use_case: Annotated[GetRunTraceUseCase, Depends(get_run_trace_use_case)],
+) -> RunTraceResponse:
+    try:
+        events = use_case.execute(user_id=current_user.id, run_id=run_id)
+    except TraceRunNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+
+    return RunTraceResponse(
+        run_id=run_id,
+        events=[
+            {
+                "stage": event.stage,
+                "event": event.event,
+                "timestamp": event.timestamp,
+                "payload": event.payload,
+            }
+            for event in events
+        ],
+    )
+
+
+@router.get("/analytics/stages", response_model=StageLatencyReportListResponse)
+def get_stage_latency_report(
+    _admin_user: Annotated[AuthenticatedUser, Depends(get_current_admin_user)],
+    use_case: Annotated[GetStageLatencyReportUseCase, Depends(get_stage_latency_report_use_case)],
+    since: Annotated[datetime | None, Query()] = None,
+    until: Annotated[datetime | None, Query()] = None,
+    graph_id: Annotated[str | None, Query(max_length=120)] = None,
+    window_hours: Annotated[int | None, Query(ge=1, le=24 * 90)] = None,
+) -> StageLatencyReportListResponse:
+    try:
+        reports = use_case.execute(since=since, until=until, graph_id=graph_id, window_hours=window_hours)
+    except InvalidReportWindowError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
+
+    return StageLatencyReportListResponse(
+        items=[
+            {
+                "graph_id": report.graph_id,
+                "graph_version": report.graph_version,
+                "stage": report.stage,
+                "llm_model": report.llm_model,
+                "prompt_hash": report.prompt_hash,
+                "first_window_start": report.first_window_start,
+                "last_window_start": report.last_window_start,
+                "completed_count": report.completed_count,
+                "failed_count": report.failed_count,
+                "failure_rate": report.failure_rate,
+                "mean_ms": report.mean_ms,
+                "p50_ms": report.p50_ms,
+                "p95_ms": report.p95_ms,
+                "p99_ms": report.p99_ms,
+                "output_chars_p50": report.output_chars_p50,
+                "output_chars_p95": report.output_chars_p95,
+            }
+            for report in reports
+        ]
+    )
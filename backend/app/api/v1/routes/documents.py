@@ -1,14 +1,17 @@
+import re
 from pathlib import Path
 from typing import Annotated
 from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, Response, UploadFile, status
+from fastapi.responses import FileResponse, RedirectResponse, StreamingResponse
 
 from app.api.v1.dependencies.auth import AuthenticatedUser, get_current_user
+from app.api.v1.dependencies.document_pipeline import get_artifact_store, get_deferred_artifact_use_case
 from app.api.v1.dependencies.documents import get_artifact_access_token_service, get_document_upload_use_case
 from app.api.v1.schemas.documents import DocumentProcessResponse
 from app.application.errors import (
+    ArtifactNotFoundError,
     ArtifactPersistenceError,
     IngestionFailedError,
     IngestorNotFoundError,
@@ -19,11 +22,20 @@ from app.application.errors import (
     UploadedFileTooLargeError,
 )
 from app.application.use_cases.process_document_upload import ProcessDocumentUploadUseCase
+from app.application.use_cases.render_deferred_artifact import RenderDeferredArtifactUseCase
 from app.core.settings import settings
+from app.domain.services.artifact_store import DeferredArtifactStore, PresignedArtifactStore
 from app.infrastructure.security.artifact_access_token_service import ArtifactAccessTokenService
+from app.infrastructure.storage.blob_compression import accepts_encoding, content_encoding, iter_decompressed, iter_stream
 
 router = APIRouter(prefix="/documents", tags=["documents"])
 
+_ARTIFACT_MEDIA_TYPES = {
+    ".md": "text/markdown",
+    ".json": "application/json",
+    ".cdoc": "application/vnd.cv-optimizer.cdoc",
+}
+
 
 @router.post("/process", response_model=DocumentProcessResponse)
 def process_document(
@@ -70,6 +82,7 @@ def process_document(
         artifacts=[
             _to_artifact_response(
                 storage_path=artifact.storage_path,
+                filename=artifact.filename,
                 output_format=artifact.format,
                 media_type=artifact.media_type,
                 user_id=current_user.id,
@@ -82,11 +95,15 @@ def process_document(
 
 @router.get("/artifacts/download")
 def download_artifact(
+    request: Request,
     current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
     token_service: Annotated[ArtifactAccessTokenService, Depends(get_artifact_access_token_service)],
+    deferred_artifacts: Annotated[RenderDeferredArtifactUseCase, Depends(get_deferred_artifact_use_case)],
+    artifact_store: Annotated[DeferredArtifactStore, Depends(get_artifact_store)],
     storage_path: Annotated[str, Query(description="Artifact path returned by /documents/process")],
     token: Annotated[str | None, Query(description="Signed access token from artifact payload")] = None,
-) -> FileResponse:
+    filename: Annotated[str | None, Query(description="Download name returned by /documents/process")] = None,
+) -> Response:
     artifact_path = Path(storage_path).resolve()
     artifact_root = Path(settings.artifact_dir).resolve()
 
@@ -101,21 +118,69 @@ def download_artifact(
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Artifact token user mismatch")
         if payload.storage_path != str(artifact_path):
             raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Artifact token path mismatch")
+        filename = payload.filename
 
     if artifact_root not in artifact_path.parents:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid artifact path")
-    if artifact_path.suffix not in {".md", ".json"}:
+    encoding = content_encoding(artifact_path)
+    logical_path = artifact_path.with_suffix("") if encoding else artifact_path
+    media_type = _ARTIFACT_MEDIA_TYPES.get(logical_path.suffix)
+    if media_type is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Unsupported artifact type")
-    if not artifact_path.is_file():
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Artifact not found")
+    download_name = _download_name(filename, logical_path)
+    try:
+        deferred_artifacts.execute(storage_path=str(artifact_path))
+    except ArtifactNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Artifact not found") from exc
+    except (RenderingFailedError, ArtifactPersistenceError) as exc:
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=str(exc)) from exc
+
+    accepted = encoding is None or accepts_encoding(request.headers.get("accept-encoding", ""), encoding)
+    if isinstance(artifact_store, PresignedArtifactStore):
+        if accepted:
+            # The object store serves the bytes; this worker only authorizes the download.
+            url = artifact_store.presigned_download_url(
+                str(artifact_path),
+                filename=download_name,
+                media_type=media_type,
+            )
+            return RedirectResponse(
+                url,
+                status_code=status.HTTP_307_TEMPORARY_REDIRECT,
+                headers={"Vary": "Accept-Encoding"},
+            )
+        return StreamingResponse(
+            iter_stream(artifact_store.open_artifact(str(artifact_path))),
+            media_type=media_type,
+            headers={"Content-Disposition": f'attachment; filename="{download_name}"', "Vary": "Accept-Encoding"},
+        )
+
+    if encoding is None:
+        return FileResponse(path=artifact_path, media_type=media_type, filename=download_name)
+    if accepted:
+        return FileResponse(
+            path=artifact_path,
+            media_type=media_type,
+            filename=download_name,
+            headers={"Content-Encoding": encoding, "Vary": "Accept-Encoding"},
+        )
+    return StreamingResponse(
+        iter_decompressed(artifact_path),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{download_name}"', "Vary": "Accept-Encoding"},
+    )
+
 
-    media_type = "text/markdown" if artifact_path.suffix == ".md" else "application/json"
-    return FileResponse(path=artifact_path, media_type=media_type, filename=artifact_path.name)
+def _download_name(filename: str | None, logical_path: Path) -> str:
+    # Stored artifacts are named by content hash, so the requested name only contributes its stem.
+    stem = re.sub(r"[^A-Za-z0-9._-]", "_", Path(filename).stem) if filename else ""
+    return f"{stem}{logical_path.suffix}" if stem else logical_path.name
 
 
 def _to_artifact_response(
     *,
     storage_path: str,
+    filename: str | None,
     output_format: str,
     media_type: str,
     user_id: str,
@@ -125,12 +190,13 @@ def _to_artifact_response(
         "format": output_format,
         "media_type": media_type,
         "storage_path": storage_path,
+        "filename": filename,
     }
     if not settings.use_signed_artifact_download():
         return payload
 
     resolved_storage_path = str(Path(storage_path).resolve())
-    token = token_service.create_token(user_id=user_id, storage_path=resolved_storage_path)
+    token = token_service.create_token(user_id=user_id, storage_path=resolved_storage_path, filename=filename)
     payload["download_token"] = token
     payload["download_url"] = (
         f"/api/v1/documents/artifacts/download?storage_path={quote(resolved_storage_path)}&token={quote(token)}"
@@ -1,6 +1,6 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, File, Form, HTTPException, Response, UploadFile, status
+from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Response, UploadFile, status
 
 from app.api.v1.dependencies.auth import AuthenticatedUser, get_current_user
 from app.api.v1.dependencies.sources import (
@@ -14,6 +14,7 @@ from app.application.errors import (
     IngestionFailedError,
     IngestorNotFoundError,
     InvalidGroundSourceNameError,
+    InvalidPageCursorError,
     LowQualityExtractionError,
     MissingFileNameError,
     RenderingFailedError,
@@ -76,8 +77,13 @@ def create_source(
 def list_sources(
     current_user: Annotated[AuthenticatedUser, Depends(get_current_user)],
     use_case: Annotated[ListGroundSourcesUseCase, Depends(get_list_ground_sources_use_case)],
+    limit: Annotated[int, Query(ge=1, le=100)] = 50,
+    cursor: Annotated[str | None, Query(description="next_cursor from the previous page")] = None,
 ) -> GroundSourceListResponse:
-    sources = use_case.execute(user_id=current_user.id)
+    try:
+        page = use_case.execute(user_id=current_user.id, limit=limit, cursor=cursor)
+    except InvalidPageCursorError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc)) from exc
     return GroundSourceListResponse(
         items=[
             {
@@ -89,8 +95,9 @@ def list_sources(
                 "created_at": source.created_at,
                 "updated_at": source.updated_at,
             }
-            for source in sources
-        ]
+            for source in page.items
+        ],
+        next_cursor=page.next_cursor,
     )
 
 
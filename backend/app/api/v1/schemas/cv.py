@@ -5,6 +5,7 @@ class ArtifactResponse(BaseModel):
     format: str
     media_type: str
     storage_path: str
+    filename: str | None = None
     download_token: str | None = None
     download_url: str | None = None
 
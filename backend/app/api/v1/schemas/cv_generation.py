@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -55,3 +56,52 @@ class CVExportPdfRequest(BaseModel):
     content: str
     format_hint: str | None = None
     filename: str | None = None
+
+
+class TraceEventResponse(BaseModel):
+    stage: str
+    event: str
+    timestamp: datetime
+    payload: dict[str, Any] = Field(default_factory=dict)
+
+
+class RunTraceResponse(BaseModel):
+    run_id: str
+    events: list[TraceEventResponse] = Field(default_factory=list)
+
+
+class TraceRunSummaryResponse(BaseModel):
+    run_id: str
+    started_at: datetime
+    last_event_at: datetime
+    event_count: int
+    failed_stage_count: int
+
+
+class TraceRunListResponse(BaseModel):
+    items: list[TraceRunSummaryResponse] = Field(default_factory=list)
+    limit: int
+    offset: int
+
+
+class StageLatencyReportResponse(BaseModel):
+    graph_id: str
+    graph_version: str
+    stage: str
+    llm_model: str
+    prompt_hash: str
+    first_window_start: datetime
+    last_window_start: datetime
+    completed_count: int
+    failed_count: int
+    failure_rate: float
+    mean_ms: float
+    p50_ms: int | None = None
+    p95_ms: int | None = None
+    p99_ms: int | None = None
+    output_chars_p50: int | None = None
+    output_chars_p95: int | None = None
+
+
+class StageLatencyReportListResponse(BaseModel):
+    items: list[StageLatencyReportResponse] = Field(default_factory=list)
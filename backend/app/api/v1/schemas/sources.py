@@ -22,3 +22,4 @@ class GroundSourceCreateResponse(GroundSourceResponse):
 
 class GroundSourceListResponse(BaseModel):
     items: list[GroundSourceResponse] = Field(default_factory=list)
+    next_cursor: str | None = None
@@ -3,7 +3,11 @@ from app.application.dto.auth_result import AuthResult
 from app.application.dto.cv_generation_result import CvGenerationUploadResult
 from app.application.dto.cv_pdf_result import CvPdfResult
 from app.application.dto.document_upload_result import DocumentUploadResult
-from app.application.dto.ground_source_result import CvGenerationFromSourceResult, GroundSourceCreateResult
+from app.application.dto.ground_source_result import (
+    CvGenerationFromSourceResult,
+    GroundSourceCreateResult,
+    GroundSourceListResult,
+)
 
 __all__ = [
     "AccountResult",
@@ -12,5 +16,6 @@ __all__ = [
     "CvPdfResult",
     "DocumentUploadResult",
     "GroundSourceCreateResult",
+    "GroundSourceListResult",
     "CvGenerationFromSourceResult",
 ]
@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from app.domain.models.cv_generation import CvGenerationResult
 from app.domain.models.document_pipeline import ProcessingReport
-from app.domain.models.ground_source import GroundSource
+from app.domain.models.ground_source import GroundSource, GroundSourceSummary
 
 
 @dataclass(frozen=True)
@@ -15,3 +15,9 @@ class GroundSourceCreateResult:
 class CvGenerationFromSourceResult:
     source: GroundSource
     generation_result: CvGenerationResult
+
+
+@dataclass(frozen=True)
+class GroundSourceListResult:
+    items: list[GroundSourceSummary]
+    next_cursor: str | None
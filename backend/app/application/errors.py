@@ -54,6 +54,10 @@ class ArtifactPersistenceError(ApplicationError):
     pass
 
 
+class ArtifactNotFoundError(ApplicationError):
+    pass
+
+
 class InvalidJobDescriptionError(ApplicationError):
     pass
 
@@ -66,6 +70,10 @@ class GroundSourceNotFoundError(ApplicationError):
     pass
 
 
+class InvalidPageCursorError(ApplicationError):
+    pass
+
+
 class CvExportError(ApplicationError):
     pass
 
@@ -80,3 +88,11 @@ class CvGenerationExecutionError(ApplicationError):
 
 class PromptResolutionError(ApplicationError):
     pass
+
+
+class TraceRunNotFoundError(ApplicationError):
+    pass
+
+
+class InvalidReportWindowError(ApplicationError):
+    pass
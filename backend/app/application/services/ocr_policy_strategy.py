@@ -1,6 +1,8 @@
 from dataclasses import dataclass
 
-from app.domain.models.document_pipeline import IngestionPolicy, InputDocument
+from app.domain.models.document_pipeline import DocumentProbe, IngestionPolicy, InputDocument
+
+RETRY_QUALITY_FLAGS = frozenset({"pdf_internal_markers", "non_printable_ratio_high", "empty_text"})
 
 
 @dataclass(frozen=True)
@@ -17,34 +19,51 @@ class RuleBasedOcrPolicyStrategy:
         default_ocr_enabled: bool = False,
         auto_retry_on_quality_failure: bool = True,
         retry_min_text_length: int = 120,
+        probe_scanned_page_ratio: float = 0.5,
     ) -> None:
         self._default_ocr_enabled = default_ocr_enabled
         self._auto_retry_on_quality_failure = auto_retry_on_quality_failure
         self._retry_min_text_length = retry_min_text_length
+        self._probe_scanned_page_ratio = probe_scanned_page_ratio
 
-    def initial_policy(self, document: InputDocument) -> IngestionPolicy:
+    def initial_policy(self, document: InputDocument, *, probe: DocumentProbe | None = None) -> IngestionPolicy:
         if not self._is_ocr_candidate(document.media_type):
             return IngestionPolicy(ocr_enabled=False, decision_reason="ocr_not_applicable")
         if self._default_ocr_enabled:
             return IngestionPolicy(ocr_enabled=True, decision_reason="configured_default_on")
+        if probe is not None and probe.page_count > 0:
+            scanned = f"{probe.pages_without_text}/{probe.page_count}"
+            if probe.pages_without_text / probe.page_count >= self._probe_scanned_page_ratio:
+                return IngestionPolicy(ocr_enabled=True, decision_reason=f"probe_scanned_pages={scanned}")
+            return IngestionPolicy(ocr_enabled=False, decision_reason=f"probe_text_layer_pages_without_text={scanned}")
         return IngestionPolicy(ocr_enabled=False, decision_reason="configured_default_off")
 
     def retry_policy(self, document: InputDocument, *, context: OcrRetryContext) -> IngestionPolicy | None:
-        if not self._auto_retry_on_quality_failure:
-            return None
-        if context.previous_policy.ocr_enabled:
-            return None
-        if not self._is_ocr_candidate(document.media_type):
+        if not self._can_retry(document, context):
             return None
         if not self._should_retry(context):
             return None
         return IngestionPolicy(ocr_enabled=True, decision_reason="quality_gate_retry")
 
+    def page_retry_policy(self, document: InputDocument, *, context: OcrRetryContext) -> IngestionPolicy | None:
+        # Single pages are legitimately short, so only hard extraction failures trigger page OCR.
+        if not self._can_retry(document, context):
+            return None
+        if not RETRY_QUALITY_FLAGS.intersection(context.quality_flags):
+            return None
+        return IngestionPolicy(ocr_enabled=True, decision_reason="page_quality_retry")
+
+    def _can_retry(self, document: InputDocument, context: OcrRetryContext) -> bool:
+        return (
+            self._auto_retry_on_quality_failure
+            and not context.previous_policy.ocr_enabled
+            and self._is_ocr_candidate(document.media_type)
+        )
+
     def _is_ocr_candidate(self, media_type: str) -> bool:
         return media_type == "application/pdf" or media_type.startswith("image/")
 
     def _should_retry(self, context: OcrRetryContext) -> bool:
-        retry_flags = {"pdf_internal_markers", "non_printable_ratio_high", "empty_text"}
-        if retry_flags.intersection(context.quality_flags):
+        if RETRY_QUALITY_FLAGS.intersection(context.quality_flags):
             return True
         return len(context.extracted_text.strip()) < self._retry_min_text_length
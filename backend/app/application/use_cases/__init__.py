@@ -4,10 +4,15 @@ from app.application.use_cases.export_cv_pdf import ExportCvPdfUseCase
 from app.application.use_cases.generate_targeted_cv import GenerateTargetedCvUseCase
 from app.application.use_cases.generate_targeted_cv_from_source import GenerateTargetedCvFromSourceUseCase
 from app.application.use_cases.generate_targeted_cv_pdf_from_source import GenerateTargetedCvPdfFromSourceUseCase
+from app.application.use_cases.get_run_trace import GetRunTraceUseCase
+from app.application.use_cases.get_stage_latency_report import GetStageLatencyReportUseCase
 from app.application.use_cases.list_ground_sources import ListGroundSourcesUseCase
+from app.application.use_cases.list_trace_runs import ListTraceRunsUseCase
 from app.application.use_cases.process_cv_upload import ProcessCVUploadUseCase
 from app.application.use_cases.process_document_upload import ProcessDocumentUploadUseCase
 from app.application.use_cases.process_document_pipeline import ProcessDocumentPipelineUseCase
+from app.application.use_cases.render_deferred_artifact import RenderDeferredArtifactUseCase
+from app.application.use_cases.rollup_trace_events import RollupTraceEventsUseCase
 
 __all__ = [
     "CreateGroundSourceUseCase",
@@ -16,8 +21,13 @@ __all__ = [
     "GenerateTargetedCvUseCase",
     "GenerateTargetedCvFromSourceUseCase",
     "GenerateTargetedCvPdfFromSourceUseCase",
+    "GetRunTraceUseCase",
+    "GetStageLatencyReportUseCase",
     "ListGroundSourcesUseCase",
+    "ListTraceRunsUseCase",
     "ProcessCVUploadUseCase",
     "ProcessDocumentPipelineUseCase",
     "ProcessDocumentUploadUseCase",
+    "RenderDeferredArtifactUseCase",
+    "RollupTraceEventsUseCase",
 ]
@@ -4,7 +4,9 @@ from typing import BinaryIO
 from app.application.dto.ground_source_result import GroundSourceCreateResult
 from app.application.errors import InvalidGroundSourceNameError, MissingFileNameError, UploadedFileTooLargeError
 from app.application.use_cases.process_document_pipeline import ProcessDocumentPipelineUseCase
-from app.domain.models.document_pipeline import InputDocument
+from app.domain.models.document_pipeline import InputDocument, ProcessingReport
+from app.domain.models.ground_source import GroundSource
+from app.domain.models.stored_file import StoredFile
 from app.domain.repositories.ground_source_repository import GroundSourceRepository
 from app.domain.services.file_storage import FileStorage, FileTooLargeError
 
@@ -59,12 +61,20 @@ class CreateGroundSourceUseCase:
         except FileTooLargeError as exc:
             raise UploadedFileTooLargeError("File is too large") from exc
 
+        duplicate = self._find_duplicate(user_id=user_id, source_sha256=stored_file.sha256)
+        if duplicate is not None:
+            reused = self._reuse(duplicate, user_id=user_id, name=normalized_name, stored_file=stored_file)
+            if reused is not None:
+                return reused
+
         try:
             processing_result = self._document_pipeline.execute(
                 source_document=InputDocument(
                     source_path=stored_file.storage_path,
                     original_name=stored_file.original_name,
                     media_type=stored_file.content_type,
+                    content_sha256=stored_file.sha256,
+                    detected_media_type=stored_file.detected_media_type,
                 ),
                 output_formats=(),
             )
@@ -72,6 +82,8 @@ class CreateGroundSourceUseCase:
             canonical_text = processing_result.canonical_document.text
             content_hash = sha256(canonical_text.encode("utf-8")).hexdigest()
 
+            # Only uploads that become a new source are written durably.
+            self._storage.persist(stored_file=stored_file)
             source = self._sources.create(
                 user_id=user_id,
                 name=normalized_name,
@@ -81,6 +93,7 @@ class CreateGroundSourceUseCase:
                 storage_path=str(stored_file.storage_path),
                 canonical_text=canonical_text,
                 content_hash=content_hash,
+                source_sha256=stored_file.sha256,
             )
         except Exception:
             self._cleanup_failed_upload(str(stored_file.storage_path))
@@ -88,10 +101,45 @@ class CreateGroundSourceUseCase:
 
         return GroundSourceCreateResult(source=source, processing_report=processing_result.report)
 
-    def _cleanup_failed_upload(self, storage_path: str) -> None:
-        if self._preserve_failed_uploads:
-            return
+    def _find_duplicate(self, *, user_id: str, source_sha256: str | None) -> GroundSource | None:
+        if source_sha256 is None:
+            return None
+        return self._sources.find_by_source_sha256(user_id=user_id, source_sha256=source_sha256)
+
+    def _reuse(
+        self,
+        duplicate: GroundSource,
+        *,
+        user_id: str,
+        name: str,
+        stored_file: StoredFile,
+    ) -> GroundSourceCreateResult | None:
+        # Same bytes as an existing source: its file and canonical text stand in for a fresh ingestion.
+        source = self._sources.create_from_existing(
+            source_id=duplicate.id,
+            user_id=user_id,
+            name=name,
+            original_filename=stored_file.original_name,
+            content_type=stored_file.content_type,
+        )
+        if source is None:
+            # Deleted in the meantime; the new upload is ingested on its own.
+            return None
+        # The spooled copy was never persisted, so dropping it is all that is left.
+        self._discard_upload(str(stored_file.storage_path))
+        report = ProcessingReport(
+            engine_name="ground_source_reuse",
+            warnings=[f"ground_source_reused: source_id={duplicate.id}"],
+        )
+        return GroundSourceCreateResult(source=source, processing_report=report)
+
+    def _discard_upload(self, storage_path: str) -> None:
         try:
             self._storage.delete(storage_path=storage_path)
         except Exception:
             pass
+
+    def _cleanup_failed_upload(self, storage_path: str) -> None:
+        if self._preserve_failed_uploads:
+            return
+        self._discard_upload(storage_path)
@@ -9,16 +9,16 @@ class DeleteGroundSourceUseCase:
         self._storage = storage
 
     def execute(self, *, user_id: str, source_id: str) -> None:
-        source = self._sources.get_for_user(source_id=source_id, user_id=user_id)
-        if source is None:
+        deletion = self._sources.delete_for_user(source_id=source_id, user_id=user_id)
+        if deletion is None:
             raise GroundSourceNotFoundError("Ground source not found")
 
-        deleted = self._sources.delete_for_user(source_id=source_id, user_id=user_id)
-        if not deleted:
-            raise GroundSourceNotFoundError("Ground source not found")
+        if deletion.storage_shared:
+            # Re-uploads of identical bytes share the first upload's file.
+            return
 
         try:
-            self._storage.delete(storage_path=source.storage_path)
+            self._storage.delete(storage_path=deletion.storage_path)
         except Exception:
             # Business deletion should remain successful even if file cleanup fails.
             pass
@@ -34,6 +34,7 @@ class GenerateTargetedCvUseCase:
         stream: BinaryIO,
         job_description: str,
         graph_id: str | None = None,
+        user_id: str | None = None,
     ) -> CvGenerationUploadResult:
         if not filename:
             raise MissingFileNameError("Missing file name")
@@ -64,6 +65,8 @@ class GenerateTargetedCvUseCase:
                     source_path=stored_file.storage_path,
                     original_name=stored_file.original_name,
                     media_type=stored_file.content_type,
+                    content_sha256=stored_file.sha256,
+                    detected_media_type=stored_file.detected_media_type,
                 ),
                 output_formats=(),
             )
@@ -72,6 +75,7 @@ class GenerateTargetedCvUseCase:
                 cv_text=processing_result.canonical_document.text,
                 job_description=normalized_job_description,
                 graph_id=graph_id,
+                user_id=user_id,
             )
         except Exception:
             self._cleanup_failed_upload(str(stored_file.storage_path))
@@ -40,6 +40,7 @@ class GenerateTargetedCvFromSourceUseCase:
             cv_text=source.canonical_text,
             job_description=normalized_job_description,
             graph_id=graph_id,
+            user_id=user_id,
         )
 
         return CvGenerationFromSourceResult(
@@ -0,0 +1,14 @@
+from app.application.errors import TraceRunNotFoundError
+from app.domain.repositories.trace_repository import TraceRepository
+from app.domain.services.trace_store import TraceEvent
+
+
+class GetRunTraceUseCase:
+    def __init__(self, *, traces: TraceRepository) -> None:
+        self._traces = traces
+
+    def execute(self, *, user_id: str, run_id: str) -> list[TraceEvent]:
+        events = self._traces.list_events_for_run(run_id=run_id, user_id=user_id)
+        if not events:
+            raise TraceRunNotFoundError("Run trace not found")
+        return events
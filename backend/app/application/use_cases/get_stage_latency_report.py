@@ -0,0 +1,102 @@
+from datetime import UTC, datetime, timedelta
+
+from app.application.errors import InvalidReportWindowError
+from app.domain.models.trace_analytics import (
+    LATENCY_BUCKETS_MS,
+    OUTPUT_CHARS_BUCKETS,
+    StageLatencyReport,
+    StageRollup,
+    histogram_percentile,
+)
+from app.domain.repositories.trace_analytics_repository import TraceAnalyticsRepository
+
+
+class GetStageLatencyReportUseCase:
+    def __init__(self, *, analytics: TraceAnalyticsRepository, max_range_days: int = 90) -> None:
+        self._analytics = analytics
+        self._max_range = timedelta(days=max_range_days)
+
+    def execute(
+        self,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+        graph_id: str | None = None,
+        window_hours: int | None = None,
+    ) -> list[StageLatencyReport]:
+        normalized_until = _as_utc(until) if until is not None else datetime.now(UTC)
+        normalized_since = _as_utc(since) if since is not None else normalized_until - timedelta(days=7)
+        if normalized_since >= normalized_until:
+            raise InvalidReportWindowError("Report start must be before its end")
+        if normalized_until - normalized_since > self._max_range:
+            raise InvalidReportWindowError(f"Report range is too large (max {self._max_range.days} days)")
+        if window_hours is not None and window_hours < 1:
+            raise InvalidReportWindowError("Report window must be at least one hour")
+
+        rollups = self._analytics.list_rollups(since=normalized_since, until=normalized_until, graph_id=graph_id)
+
+        groups: dict[tuple[object, ...], tuple[StageRollup, datetime, datetime]] = {}
+        for rollup in rollups:
+            key = rollup.key
+            group_key: tuple[object, ...] = (
+                key.graph_id,
+                key.graph_version,
+                key.stage,
+                key.llm_model,
+                key.prompt_hash,
+                _window_floor(key.window_start, window_hours),
+            )
+            existing = groups.get(group_key)
+            if existing is None:
+                merged = StageRollup(key=key)
+                merged.merge(rollup)
+                groups[group_key] = (merged, key.window_start, key.window_start)
+                continue
+            merged, first_window, last_window = existing
+            merged.merge(rollup)
+            groups[group_key] = (
+                merged,
+                min(first_window, key.window_start),
+                max(last_window, key.window_start),
+            )
+
+        reports = [_to_report(merged, first, last) for merged, first, last in groups.values()]
+        return sorted(
+            reports,
+            key=lambda report: (report.graph_id, report.graph_version, report.stage, report.first_window_start),
+        )
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
+
+
+def _window_floor(window_start: datetime, window_hours: int | None) -> datetime | None:
+    if window_hours is None:
+        return None
+    epoch_hours = int(window_start.timestamp() // 3600)
+    return datetime.fromtimestamp((epoch_hours - epoch_hours % window_hours) * 3600, UTC)
+
+
+def _to_report(rollup: StageRollup, first_window: datetime, last_window: datetime) -> StageLatencyReport:
+    total = rollup.completed_count + rollup.failed_count
+    return StageLatencyReport(
+        graph_id=rollup.key.graph_id,
+        graph_version=rollup.key.graph_version,
+        stage=rollup.key.stage,
+        llm_model=rollup.key.llm_model,
+        prompt_hash=rollup.key.prompt_hash,
+        first_window_start=first_window,
+        last_window_start=last_window,
+        completed_count=rollup.completed_count,
+        failed_count=rollup.failed_count,
+        failure_rate=round(rollup.failed_count / total, 4) if total else 0.0,
+        mean_ms=round(rollup.duration_ms_total / total, 1) if total else 0.0,
+        p50_ms=histogram_percentile(rollup.latency_histogram, LATENCY_BUCKETS_MS, 0.50),
+        p95_ms=histogram_percentile(rollup.latency_histogram, LATENCY_BUCKETS_MS, 0.95),
+        p99_ms=histogram_percentile(rollup.latency_histogram, LATENCY_BUCKETS_MS, 0.99),
+        output_chars_p50=histogram_percentile(rollup.output_chars_histogram, OUTPUT_CHARS_BUCKETS, 0.50),
+        output_chars_p95=histogram_percentile(rollup.output_chars_histogram, OUTPUT_CHARS_BUCKETS, 0.95),
+    )
@@ -1,10 +1,38 @@
-from app.domain.models.ground_source import GroundSource
+import base64
+import binascii
+from datetime import datetime
+
+from app.application.dto.ground_source_result import GroundSourceListResult
+from app.application.errors import InvalidPageCursorError
 from app.domain.repositories.ground_source_repository import GroundSourceRepository
 
 
 class ListGroundSourcesUseCase:
-    def __init__(self, *, sources: GroundSourceRepository) -> None:
+    def __init__(self, *, sources: GroundSourceRepository, max_page_size: int = 100) -> None:
         self._sources = sources
+        self._max_page_size = max_page_size
+
+    def execute(self, *, user_id: str, limit: int = 50, cursor: str | None = None) -> GroundSourceListResult:
+        normalized_limit = min(max(1, limit), self._max_page_size)
+        after = _decode_cursor(cursor) if cursor else None
+        # One extra row tells whether another page exists without a COUNT query.
+        items = self._sources.list_for_user(user_id=user_id, limit=normalized_limit + 1, after=after)
+        if len(items) <= normalized_limit:
+            return GroundSourceListResult(items=items, next_cursor=None)
+        items = items[:normalized_limit]
+        last = items[-1]
+        return GroundSourceListResult(items=items, next_cursor=_encode_cursor(last.created_at, last.id))
+
+
+def _encode_cursor(created_at: datetime, source_id: str) -> str:
+    raw = f"{created_at.isoformat()}|{source_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
 
-    def execute(self, *, user_id: str) -> list[GroundSource]:
-        return self._sources.list_for_user(user_id=user_id)
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        created_at, source_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), source_id
+    except (binascii.Error, UnicodeDecodeError, ValueError) as exc:
+        raise InvalidPageCursorError("Invalid page cursor") from exc
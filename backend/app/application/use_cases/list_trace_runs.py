@@ -0,0 +1,13 @@
+from app.domain.models.trace_run import TraceRunSummary
+from app.domain.repositories.trace_repository import TraceRepository
+
+
+class ListTraceRunsUseCase:
+    def __init__(self, *, traces: TraceRepository, max_page_size: int = 100) -> None:
+        self._traces = traces
+        self._max_page_size = max_page_size
+
+    def execute(self, *, user_id: str, limit: int = 20, offset: int = 0) -> list[TraceRunSummary]:
+        normalized_limit = min(max(1, limit), self._max_page_size)
+        normalized_offset = max(0, offset)
+        return self._traces.list_runs_for_user(user_id=user_id, limit=normalized_limit, offset=normalized_offset)
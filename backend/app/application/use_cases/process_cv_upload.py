@@ -52,6 +52,8 @@ class ProcessCVUploadUseCase:
                         source_path=stored_file.storage_path,
                         original_name=stored_file.original_name,
                         media_type=stored_file.content_type,
+                        content_sha256=stored_file.sha256,
+                        detected_media_type=stored_file.detected_media_type,
                     ),
                     output_formats=self._output_formats,
                 )
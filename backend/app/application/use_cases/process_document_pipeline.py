@@ -1,4 +1,9 @@
+import json
 from collections.abc import Iterable
+from concurrent.futures import Executor, Future, as_completed, wait
+from contextvars import copy_context
+from dataclasses import replace
+from typing import Any, BinaryIO
 
 from app.application.errors import (
     ArtifactPersistenceError,
@@ -9,11 +14,30 @@ from app.application.errors import (
     UnsupportedOutputFormatError,
 )
 from app.application.services.ocr_policy_strategy import OcrRetryContext, RuleBasedOcrPolicyStrategy
-from app.domain.models.document_pipeline import DocumentProcessingResult, IngestionPolicy, IngestionResult, InputDocument
-from app.domain.services.artifact_store import ArtifactStore
+from app.core.metrics import DOCUMENT_OCR_RETRIES, DOCUMENT_QUALITY_REJECTS
+from app.core.telemetry import start_span
+from app.domain.models.document_pipeline import (
+    CanonicalDocument,
+    DocumentPage,
+    DocumentProcessingResult,
+    IngestionPolicy,
+    IngestionResult,
+    InputDocument,
+    PayloadRef,
+    RenderedArtifact,
+)
+from app.domain.services.artifact_store import ArtifactStore, DeferredArtifactStore, StreamingArtifactStore
 from app.domain.services.document_ingestor import DocumentIngestor
-from app.domain.services.document_renderer import DocumentRenderer
-from app.domain.services.ingestion_quality_validator import IngestionQualityValidator
+from app.domain.services.document_prober import DocumentProber
+from app.domain.services.document_renderer import (
+    BinaryDocumentRenderer,
+    DocumentRenderer,
+    StreamingDocumentRenderer,
+)
+from app.domain.services.engine_payload_merger import EnginePayloadMerger
+from app.domain.services.ingestion_quality_validator import IngestionQualityAssessment, IngestionQualityValidator
+
+_TEXT_ONLY_FORMATS = frozenset({"markdown"})
 
 
 class ProcessDocumentPipelineUseCase:
@@ -21,21 +45,41 @@ class ProcessDocumentPipelineUseCase:
         self,
         *,
         ingestors: Iterable[DocumentIngestor],
-        renderers: Iterable[DocumentRenderer],
+        renderers: Iterable[DocumentRenderer | BinaryDocumentRenderer],
         artifact_store: ArtifactStore,
         quality_validator: IngestionQualityValidator | None = None,
         ocr_policy_strategy: RuleBasedOcrPolicyStrategy | None = None,
+        document_prober: DocumentProber | None = None,
+        racing_executor: Executor | None = None,
+        render_executor: Executor | None = None,
+        deferred_rendering: bool = False,
+        payload_merger: EnginePayloadMerger | None = None,
     ) -> None:
         self._ingestors = list(ingestors)
         self._renderers = {renderer.output_format: renderer for renderer in renderers}
         self._artifact_store = artifact_store
         self._quality_validator = quality_validator
         self._ocr_policy_strategy = ocr_policy_strategy
+        self._document_prober = document_prober
+        self._racing_executor = racing_executor
+        self._render_executor = render_executor
+        self._deferred_rendering = deferred_rendering
+        self._payload_merger = payload_merger
 
     def execute(self, *, source_document: InputDocument, output_formats: Iterable[str]) -> DocumentProcessingResult:
+        with start_span("document_pipeline.process", attributes={"media_type": source_document.media_type}):
+            return self._process(source_document=source_document, output_formats=output_formats)
+
+    def _process(self, *, source_document: InputDocument, output_formats: Iterable[str]) -> DocumentProcessingResult:
+        output_formats = list(output_formats)
+        if any(output_format not in _TEXT_ONLY_FORMATS for output_format in output_formats):
+            # Only structured renderings read the engine's own tree; text-only callers never export it.
+            source_document = replace(source_document, export_engine_payload=True)
+        declared_media_type = source_document.media_type
+        source_document = self._with_detected_media_type(source_document)
         compatible_ingestors = self._resolve_ingestors(source_document.media_type)
         policy = self._build_initial_policy(source_document)
-        ingestion_result, last_error, attempted_engines = self._ingest_with_policy(
+        ingestion_result, ingestor, last_error, attempted_engines = self._ingest_with_policy(
             source_document=source_document,
             ingestors=compatible_ingestors,
             policy=policy,
@@ -50,97 +94,384 @@ class ProcessDocumentPipelineUseCase:
                 f"with engines: {', '.join(attempted_engines)}.{root_cause}"
             ) from last_error
 
-        report = ingestion_result.report
-        final_policy = policy
-        if self._quality_validator is not None:
-            quality = self._quality_validator.assess(ingestion_result.canonical_document)
-            retry_policy = self._build_retry_policy(
-                source_document=source_document,
-                quality_flags=quality.flags,
-                extracted_text=ingestion_result.canonical_document.text,
-                previous_policy=policy,
-            )
-            if not quality.accepted and retry_policy is not None:
-                retry_result, retry_last_error, retry_attempts = self._ingest_with_policy(
+        try:
+            report = ingestion_result.report
+            final_policy = policy
+            if self._quality_validator is not None:
+                page_retry = self._retry_failing_pages(
+                    source_document=source_document,
+                    ingestor=ingestor,
+                    ingestion_result=ingestion_result,
+                    validator=self._quality_validator,
+                    previous_policy=policy,
+                    attempted_engines=attempted_engines,
+                )
+                if page_retry is not None:
+                    ingestion_result, final_policy = page_retry
+                    report = ingestion_result.report
+                quality = self._assess_quality(self._quality_validator, ingestion_result.canonical_document)
+                retry_policy = self._build_retry_policy(
                     source_document=source_document,
-                    ingestors=compatible_ingestors,
-                    policy=retry_policy,
+                    quality_flags=quality.flags,
+                    extracted_text=ingestion_result.canonical_document.text,
+                    previous_policy=final_policy,
                 )
-                attempted_engines.extend(retry_attempts)
-                if retry_result is None:
-                    root_cause = ""
-                    if retry_last_error is not None:
-                        root_cause = f" Root cause: {type(retry_last_error).__name__}: {retry_last_error}"
-                    raise IngestionFailedError(
-                        f"Document ingestion failed during OCR retry for media type {source_document.media_type} "
-                        f"with engines: {', '.join(retry_attempts)}.{root_cause}"
-                    ) from retry_last_error
-                ingestion_result = retry_result
-                report = retry_result.report
-                final_policy = retry_policy
-                quality = self._quality_validator.assess(ingestion_result.canonical_document)
+                if not quality.accepted and retry_policy is not None:
+                    DOCUMENT_OCR_RETRIES.inc(media_type=source_document.media_type)
+                    with start_span(
+                        "ingestion.ocr_retry",
+                        attributes={"quality_flags": ",".join(quality.flags), "reason": retry_policy.decision_reason},
+                    ):
+                        retry_result, _, retry_last_error, retry_attempts = self._ingest_with_policy(
+                            source_document=source_document,
+                            ingestors=compatible_ingestors,
+                            policy=retry_policy,
+                        )
+                    attempted_engines.extend(retry_attempts)
+                    if retry_result is None:
+                        root_cause = ""
+                        if retry_last_error is not None:
+                            root_cause = f" Root cause: {type(retry_last_error).__name__}: {retry_last_error}"
+                        raise IngestionFailedError(
+                            f"Document ingestion failed during OCR retry for media type {source_document.media_type} "
+                            f"with engines: {', '.join(retry_attempts)}.{root_cause}"
+                        ) from retry_last_error
+                    self._release_payloads([ingestion_result.canonical_document.extensions])
+                    ingestion_result = retry_result
+                    report = retry_result.report
+                    final_policy = retry_policy
+                    quality = self._assess_quality(self._quality_validator, ingestion_result.canonical_document)
 
-            report = report.__class__(
-                engine_name=report.engine_name,
-                engine_version=report.engine_version,
-                warnings=list(report.warnings),
-                quality_score=quality.score,
-                quality_flags=quality.flags,
-                engine_attempts=attempted_engines,
-            )
-            if not quality.accepted:
-                raise LowQualityExtractionError(
-                    f"Extraction quality check failed: {', '.join(quality.flags) or 'unknown_reason'}"
+                report = report.__class__(
+                    engine_name=report.engine_name,
+                    engine_version=report.engine_version,
+                    warnings=list(report.warnings),
+                    quality_score=quality.score,
+                    quality_flags=quality.flags,
+                    engine_attempts=attempted_engines,
+                )
+                if not quality.accepted:
+                    DOCUMENT_QUALITY_REJECTS.inc(media_type=source_document.media_type)
+                    raise LowQualityExtractionError(
+                        f"Extraction quality check failed: {', '.join(quality.flags) or 'unknown_reason'}"
+                    )
+            else:
+                report = report.__class__(
+                    engine_name=report.engine_name,
+                    engine_version=report.engine_version,
+                    warnings=list(report.warnings),
+                    quality_score=report.quality_score,
+                    quality_flags=report.quality_flags,
+                    engine_attempts=attempted_engines,
+                )
+            sniff_warnings = []
+            if source_document.media_type != declared_media_type:
+                sniff_warnings.append(
+                    f"media_type_sniffed: declared={declared_media_type}, detected={source_document.media_type}"
                 )
-        else:
             report = report.__class__(
                 engine_name=report.engine_name,
                 engine_version=report.engine_version,
-                warnings=list(report.warnings),
+                warnings=[
+                    *report.warnings,
+                    *sniff_warnings,
+                    f"ocr_policy: enabled={str(final_policy.ocr_enabled).lower()}, "
+                    f"reason={final_policy.decision_reason}",
+                ],
                 quality_score=report.quality_score,
                 quality_flags=report.quality_flags,
-                engine_attempts=attempted_engines,
+                engine_attempts=report.engine_attempts,
             )
-        report = report.__class__(
-            engine_name=report.engine_name,
-            engine_version=report.engine_version,
-            warnings=[
-                *report.warnings,
-                f"ocr_policy: enabled={str(final_policy.ocr_enabled).lower()}, reason={final_policy.decision_reason}",
-            ],
-            quality_score=report.quality_score,
-            quality_flags=report.quality_flags,
-            engine_attempts=report.engine_attempts,
+
+            artifacts = self._render_artifacts(
+                source_document=source_document,
+                document=ingestion_result.canonical_document,
+                output_formats=output_formats,
+            )
+        except BaseException:
+            self._release_payloads([ingestion_result.canonical_document.extensions])
+            raise
+        if not self._snapshots_documents(output_formats):
+            # Rendered artifacts carry their own copy of the engine payload; a deferred snapshot keeps the reference.
+            self._release_payloads([ingestion_result.canonical_document.extensions])
+
+        return DocumentProcessingResult(
+            canonical_document=ingestion_result.canonical_document,
+            report=report,
+            artifacts=artifacts,
         )
 
-        artifacts = []
+    def _render_artifacts(
+        self,
+        *,
+        source_document: InputDocument,
+        document: CanonicalDocument,
+        output_formats: list[str],
+    ) -> list[RenderedArtifact]:
+        renderers: list[DocumentRenderer | BinaryDocumentRenderer] = []
         for output_format in output_formats:
             renderer = self._renderers.get(output_format)
             if renderer is None:
                 raise UnsupportedOutputFormatError(f"Unsupported output format: {output_format}")
+            renderers.append(renderer)
+
+        if self._snapshots_documents(output_formats):
+            return self._defer_artifacts(source_document, document, renderers)
+        if not isinstance(self._artifact_store, StreamingArtifactStore):
+            for renderer in renderers:
+                if isinstance(renderer, BinaryDocumentRenderer):
+                    raise UnsupportedOutputFormatError(
+                        f"Output format requires a streaming artifact store: {renderer.output_format}"
+                    )
+
+        if self._render_executor is None or len(renderers) < 2:
+            return [self._render_artifact(source_document, document, renderer) for renderer in renderers]
+
+        # Formats are independent: render and persist them side by side, then report failures in request order.
+        futures = [
+            self._render_executor.submit(copy_context().run, self._render_artifact, source_document, document, renderer)
+            for renderer in renderers
+        ]
+        wait(futures)
+        return [future.result() for future in futures]
+
+    def _snapshots_documents(self, output_formats: list[str]) -> bool:
+        return (
+            self._deferred_rendering
+            and bool(output_formats)
+            and isinstance(self._artifact_store, DeferredArtifactStore)
+        )
+
+    def _defer_artifacts(
+        self,
+        source_document: InputDocument,
+        document: CanonicalDocument,
+        renderers: list[DocumentRenderer | BinaryDocumentRenderer],
+    ) -> list[RenderedArtifact]:
+        store = self._artifact_store
+        try:
+            # Only the canonical document is written now; each format is rendered on its first download.
+            with start_span("document.snapshot", attributes={"formats": len(renderers)}):
+                document_id = store.save_document(source_document=source_document, document=document)
+        except Exception as exc:
+            raise ArtifactPersistenceError("Failed to persist canonical document") from exc
+        return [
+            store.deferred_artifact(
+                source_document=source_document,
+                document_id=document_id,
+                output_format=renderer.output_format,
+                media_type=renderer.media_type,
+            )
+            for renderer in renderers
+        ]
+
+    def _render_artifact(
+        self,
+        source_document: InputDocument,
+        document: CanonicalDocument,
+        renderer: DocumentRenderer | BinaryDocumentRenderer,
+    ) -> RenderedArtifact:
+        output_format = renderer.output_format
+        streams = isinstance(renderer, (StreamingDocumentRenderer, BinaryDocumentRenderer))
+        if streams and isinstance(self._artifact_store, StreamingArtifactStore):
+            def write(sink: BinaryIO) -> None:
+                try:
+                    renderer.render_to(document, sink)
+                except Exception as exc:
+                    raise RenderingFailedError(f"Rendering failed for format: {output_format}") from exc
 
             try:
-                content = renderer.render(ingestion_result.canonical_document)
+                with start_span("document.render", attributes={"output_format": output_format, "streaming": True}):
+                    return self._artifact_store.save_artifact_stream(
+                        source_document=source_document,
+                        output_format=output_format,
+                        media_type=renderer.media_type,
+                        write=write,
+                    )
+            except RenderingFailedError:
+                raise
             except Exception as exc:
-                raise RenderingFailedError(f"Rendering failed for format: {output_format}") from exc
+                raise ArtifactPersistenceError(f"Failed to persist artifact: {output_format}") from exc
 
-            try:
-                artifact = self._artifact_store.save_artifact(
+        try:
+            with start_span("document.render", attributes={"output_format": output_format}):
+                content = renderer.render(document)
+        except Exception as exc:
+            raise RenderingFailedError(f"Rendering failed for format: {output_format}") from exc
+
+        try:
+            with start_span("artifact.save", attributes={"output_format": output_format, "size_bytes": len(content)}):
+                return self._artifact_store.save_artifact(
                     source_document=source_document,
                     output_format=output_format,
                     media_type=renderer.media_type,
                     content=content,
                 )
-            except Exception as exc:
-                raise ArtifactPersistenceError(f"Failed to persist artifact: {output_format}") from exc
+        except Exception as exc:
+            raise ArtifactPersistenceError(f"Failed to persist artifact: {output_format}") from exc
 
-            artifacts.append(artifact)
+    def _assess_quality(
+        self,
+        validator: IngestionQualityValidator,
+        document: CanonicalDocument,
+    ) -> IngestionQualityAssessment:
+        with start_span("ingestion.quality_check") as span:
+            quality = validator.assess(document)
+            span.set_attribute("accepted", quality.accepted)
+            span.set_attribute("score", quality.score)
+            return quality
 
-        return DocumentProcessingResult(
-            canonical_document=ingestion_result.canonical_document,
-            report=report,
-            artifacts=artifacts,
+    def _retry_failing_pages(
+        self,
+        *,
+        source_document: InputDocument,
+        ingestor: DocumentIngestor,
+        ingestion_result: IngestionResult,
+        validator: IngestionQualityValidator,
+        previous_policy: IngestionPolicy,
+        attempted_engines: list[str],
+    ) -> tuple[IngestionResult, IngestionPolicy] | None:
+        document = ingestion_result.canonical_document
+        if self._ocr_policy_strategy is None or len(document.pages) < 2:
+            return None
+
+        failing_pages: list[DocumentPage] = []
+        failing_flags: list[str] = []
+        for page in document.pages:
+            quality = self._assess_quality(validator, replace(document, text=page.text, pages=[]))
+            if not quality.accepted:
+                failing_pages.append(page)
+                failing_flags.extend(flag for flag in quality.flags if flag not in failing_flags)
+        if not failing_pages or len(failing_pages) == len(document.pages):
+            # A clean document needs nothing; a fully broken one goes through the whole-document retry.
+            return None
+
+        retry_policy = self._ocr_policy_strategy.page_retry_policy(
+            source_document,
+            context=OcrRetryContext(
+                quality_flags=failing_flags,
+                extracted_text="\n\n".join(page.text for page in failing_pages),
+                previous_policy=previous_policy,
+            ),
         )
+        if retry_policy is None:
+            return None
+
+        page_numbers = [page.page_no for page in failing_pages]
+        replacements: dict[int, DocumentPage] = {}
+        retry_results: list[IngestionResult] = []
+        retry_attempts: list[str] = []
+        with start_span(
+            "ingestion.page_ocr_retry",
+            attributes={"pages": ",".join(map(str, page_numbers)), "quality_flags": ",".join(failing_flags)},
+        ):
+            for first_page, last_page in _page_runs(page_numbers):
+                retry_attempts.append(f"{type(ingestor).__name__}(ocr=on, pages={first_page}-{last_page})")
+                try:
+                    retry_result = ingestor.ingest(
+                        replace(source_document, page_range=(first_page, last_page)),
+                        policy=retry_policy,
+                    )
+                except Exception:
+                    self._release_payloads([result.canonical_document.extensions for result in retry_results])
+                    return None
+                retry_results.append(retry_result)
+                for page in retry_result.canonical_document.pages:
+                    if first_page <= page.page_no <= last_page:
+                        replacements[page.page_no] = page
+        if not replacements:
+            self._release_payloads([result.canonical_document.extensions for result in retry_results])
+            return None
+        DOCUMENT_OCR_RETRIES.inc(media_type=source_document.media_type)
+        attempted_engines.extend(retry_attempts)
+
+        merged_pages = [replacements.get(page.page_no, page) for page in document.pages]
+        merged_document = replace(
+            document,
+            text="\n\n".join(page.text.strip("\n") for page in merged_pages),
+            pages=merged_pages,
+            extensions=self._merge_page_payloads(
+                source_document=source_document,
+                extensions=document.extensions,
+                retry_results=retry_results,
+                page_numbers=set(replacements),
+            ),
+        )
+        report = replace(
+            ingestion_result.report,
+            warnings=[*ingestion_result.report.warnings, f"ocr_pages: {','.join(map(str, sorted(replacements)))}"],
+        )
+        return IngestionResult(canonical_document=merged_document, report=report), retry_policy
+
+    def _merge_page_payloads(
+        self,
+        *,
+        source_document: InputDocument,
+        extensions: dict[str, Any],
+        retry_results: list[IngestionResult],
+        page_numbers: set[int],
+    ) -> dict[str, Any]:
+        try:
+            return self._splice_page_payloads(
+                source_document=source_document,
+                extensions=extensions,
+                retry_results=retry_results,
+                page_numbers=page_numbers,
+            )
+        finally:
+            self._release_payloads([result.canonical_document.extensions for result in retry_results])
+
+    def _splice_page_payloads(
+        self,
+        *,
+        source_document: InputDocument,
+        extensions: dict[str, Any],
+        retry_results: list[IngestionResult],
+        page_numbers: set[int],
+    ) -> dict[str, Any]:
+        merged = dict(extensions)
+        merger = self._payload_merger
+        if merger is not None:
+            base = extensions.get(merger.extension_key)
+            parts = [result.canonical_document.extensions.get(merger.extension_key) for result in retry_results]
+            if all(isinstance(value, (dict, PayloadRef)) for value in [base, *parts]):
+                # The engine tree is spliced too, so exported JSON carries the OCR pages, not the first pass.
+                payload = merger.replace_pages(
+                    self._load_payload(base),
+                    [self._load_payload(part) for part in parts],
+                    page_numbers=page_numbers,
+                )
+                if isinstance(base, PayloadRef):
+                    merged[merger.extension_key] = self._artifact_store.save_payload(
+                        source_document=source_document,
+                        payload=payload,
+                    )
+                    self._release_payloads([base])
+                else:
+                    merged[merger.extension_key] = payload
+        return merged
+
+    def _load_payload(self, value: dict[str, Any] | PayloadRef) -> dict[str, Any]:
+        if not isinstance(value, PayloadRef):
+            return value
+        with self._artifact_store.open_payload(value) as handle:
+            return json.load(handle)
+
+    def _release_payloads(self, values: list[Any]) -> None:
+        for value in values:
+            if isinstance(value, PayloadRef):
+                self._artifact_store.delete_payload(value)
+            elif isinstance(value, dict):
+                self._release_payloads(list(value.values()))
+            elif isinstance(value, list):
+                self._release_payloads(value)
+
+    def _with_detected_media_type(self, source_document: InputDocument) -> InputDocument:
+        detected = source_document.detected_media_type
+        if not detected or detected == source_document.media_type:
+            return source_document
+        # Magic bytes beat the client's label: a mislabelled upload is routed, or rejected, without doomed attempts.
+        return replace(source_document, media_type=detected)
 
     def _resolve_ingestors(self, media_type: str) -> list[DocumentIngestor]:
         compatible = [ingestor for ingestor in self._ingestors if ingestor.supports(media_type)]
@@ -151,7 +482,14 @@ class ProcessDocumentPipelineUseCase:
     def _build_initial_policy(self, source_document: InputDocument) -> IngestionPolicy:
         if self._ocr_policy_strategy is None:
             return IngestionPolicy(ocr_enabled=False, decision_reason="no_strategy")
-        return self._ocr_policy_strategy.initial_policy(source_document)
+        probe = None
+        if self._document_prober is not None:
+            with start_span("ingestion.probe", attributes={"media_type": source_document.media_type}) as span:
+                probe = self._document_prober.probe(source_document)
+                if probe is not None:
+                    span.set_attribute("page_count", probe.page_count)
+                    span.set_attribute("pages_without_text", probe.pages_without_text)
+        return self._ocr_policy_strategy.initial_policy(source_document, probe=probe)
 
     def _build_retry_policy(
         self,
@@ -178,8 +516,15 @@ class ProcessDocumentPipelineUseCase:
         source_document: InputDocument,
         ingestors: list[DocumentIngestor],
         policy: IngestionPolicy,
-    ) -> tuple[IngestionResult | None, Exception | None, list[str]]:
-        ingestion_result = None
+    ) -> tuple[IngestionResult | None, DocumentIngestor | None, Exception | None, list[str]]:
+        if self._racing_executor is not None and len(ingestors) > 1:
+            return self._race_with_policy(
+                source_document=source_document,
+                ingestors=ingestors,
+                policy=policy,
+                executor=self._racing_executor,
+            )
+
         last_error: Exception | None = None
         attempted_engines: list[str] = []
         for ingestor in ingestors:
@@ -187,9 +532,97 @@ class ProcessDocumentPipelineUseCase:
                 f"{type(ingestor).__name__}(ocr={'on' if policy.ocr_enabled else 'off'})"
             )
             try:
-                ingestion_result = ingestor.ingest(source_document, policy=policy)
-                break
+                return (
+                    self._attempt(ingestor, source_document, policy),
+                    ingestor,
+                    last_error,
+                    attempted_engines,
+                )
             except Exception as exc:
                 last_error = exc
 
-        return ingestion_result, last_error, attempted_engines
+        return None, None, last_error, attempted_engines
+
+    def _race_with_policy(
+        self,
+        *,
+        source_document: InputDocument,
+        ingestors: list[DocumentIngestor],
+        policy: IngestionPolicy,
+        executor: Executor,
+    ) -> tuple[IngestionResult | None, DocumentIngestor | None, Exception | None, list[str]]:
+        outcomes = ["pending"] * len(ingestors)
+        results: dict[int, IngestionResult] = {}
+        last_error: Exception | None = None
+        winner: int | None = None
+        with start_span("ingestion.race", attributes={"engines": len(ingestors), "ocr_enabled": policy.ocr_enabled}):
+            futures = {
+                executor.submit(copy_context().run, self._attempt, ingestor, source_document, policy): index
+                for index, ingestor in enumerate(ingestors)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    outcomes[index] = "failed"
+                    last_error = exc
+                    continue
+                results[index] = result
+                if self._quality_validator is None or self._assess_quality(
+                    self._quality_validator, result.canonical_document
+                ).accepted:
+                    outcomes[index] = "won"
+                    winner = index
+                    break
+                outcomes[index] = "rejected"
+
+            for future, index in futures.items():
+                if outcomes[index] == "pending":
+                    # Engines already running cannot be interrupted; their results are discarded.
+                    outcomes[index] = "cancelled" if future.cancel() else "abandoned"
+                    future.add_done_callback(self._release_abandoned)
+
+        if winner is None and results:
+            # Nothing passed the gate: keep the preferred engine's output for the OCR retry and quality error.
+            winner = min(results)
+        self._release_payloads(
+            [result.canonical_document.extensions for index, result in results.items() if index != winner]
+        )
+        attempted_engines = [
+            f"{type(ingestor).__name__}(ocr={'on' if policy.ocr_enabled else 'off'}, race={outcome})"
+            for ingestor, outcome in zip(ingestors, outcomes, strict=True)
+        ]
+        if winner is None:
+            return None, None, last_error, attempted_engines
+        return results[winner], ingestors[winner], last_error, attempted_engines
+
+    def _release_abandoned(self, future: Future) -> None:
+        if not future.cancelled() and future.exception() is None:
+            self._release_payloads([future.result().canonical_document.extensions])
+
+    def _attempt(
+        self,
+        ingestor: DocumentIngestor,
+        source_document: InputDocument,
+        policy: IngestionPolicy,
+    ) -> IngestionResult:
+        with start_span(
+            "ingestion.attempt",
+            attributes={
+                "engine": type(ingestor).__name__,
+                "media_type": source_document.media_type,
+                "ocr_enabled": policy.ocr_enabled,
+            },
+        ):
+            return ingestor.ingest(source_document, policy=policy)
+
+
+def _page_runs(page_numbers: list[int]) -> list[tuple[int, int]]:
+    runs: list[tuple[int, int]] = []
+    for page_no in sorted(page_numbers):
+        if runs and runs[-1][1] == page_no - 1:
+            runs[-1] = (runs[-1][0], page_no)
+        else:
+            runs.append((page_no, page_no))
+    return runs
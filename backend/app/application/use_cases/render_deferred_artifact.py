@@ -0,0 +1,110 @@
+import threading
+from collections.abc import Iterable
+from typing import BinaryIO
+
+from app.application.errors import ArtifactNotFoundError, ArtifactPersistenceError, RenderingFailedError
+from app.core.telemetry import start_span
+from app.domain.models.document_pipeline import CanonicalDocument
+from app.domain.services.artifact_store import DeferredArtifactStore
+from app.domain.services.document_renderer import (
+    BinaryDocumentRenderer,
+    DocumentRenderer,
+    StreamingDocumentRenderer,
+)
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.error: BaseException | None = None
+
+
+class RenderDeferredArtifactUseCase:
+    def __init__(
+        self,
+        *,
+        artifact_store: DeferredArtifactStore,
+        renderers: Iterable[DocumentRenderer | BinaryDocumentRenderer],
+        flight_timeout_seconds: float = 60.0,
+    ) -> None:
+        self._artifact_store = artifact_store
+        self._renderers = {renderer.output_format: renderer for renderer in renderers}
+        self._flight_timeout_seconds = flight_timeout_seconds
+        self._flights: dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def execute(self, *, storage_path: str) -> None:
+        if self._artifact_store.artifact_exists(storage_path):
+            return
+        deferred = self._artifact_store.find_deferred(storage_path)
+        if deferred is None:
+            raise ArtifactNotFoundError("Artifact not found")
+        document_id, output_format = deferred
+        renderer = self._renderers.get(output_format)
+        if renderer is None:
+            raise ArtifactNotFoundError(f"Unsupported output format: {output_format}")
+
+        with self._lock:
+            flight = self._flights.get(storage_path)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[storage_path] = flight
+
+        if not leader:
+            # Concurrent first downloads of the same artifact wait for one render instead of each running it.
+            if not flight.done.wait(self._flight_timeout_seconds):
+                # A stuck leader must not hang every download; renders are replaced atomically, so race it instead.
+                self._render(storage_path, document_id, renderer)
+                return
+            if flight.error is not None:
+                raise flight.error
+            return
+
+        try:
+            if not self._artifact_store.artifact_exists(storage_path):
+                self._render(storage_path, document_id, renderer)
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(storage_path, None)
+            flight.done.set()
+
+    def _render(
+        self,
+        storage_path: str,
+        document_id: str,
+        renderer: DocumentRenderer | BinaryDocumentRenderer,
+    ) -> None:
+        output_format = renderer.output_format
+        try:
+            document = self._artifact_store.load_document(document_id)
+        except FileNotFoundError as exc:
+            raise ArtifactNotFoundError("Artifact source document is no longer available") from exc
+
+        def write(sink: BinaryIO) -> None:
+            try:
+                _render_into(renderer, document, sink)
+            except Exception as exc:
+                raise RenderingFailedError(f"Rendering failed for format: {output_format}") from exc
+
+        try:
+            with start_span("document.render", attributes={"output_format": output_format, "deferred": True}):
+                self._artifact_store.save_deferred_artifact(storage_path=storage_path, write=write)
+        except RenderingFailedError:
+            raise
+        except Exception as exc:
+            raise ArtifactPersistenceError(f"Failed to persist artifact: {output_format}") from exc
+
+
+def _render_into(
+    renderer: DocumentRenderer | BinaryDocumentRenderer,
+    document: CanonicalDocument,
+    sink: BinaryIO,
+) -> None:
+    if isinstance(renderer, (StreamingDocumentRenderer, BinaryDocumentRenderer)):
+        renderer.render_to(document, sink)
+        return
+    sink.write(renderer.render(document).encode("utf-8"))
@@ -0,0 +1,87 @@
+from datetime import UTC, datetime, timedelta
+
+from app.domain.models.trace_analytics import StageRollup, StageRollupKey
+from app.domain.repositories.trace_analytics_repository import TraceAnalyticsRepository
+from app.domain.services.trace_store import TraceEvent
+
+ROLLUP_EVENTS = ("stage_completed", "stage_failed")
+
+
+class RollupTraceEventsUseCase:
+    def __init__(
+        self,
+        *,
+        analytics: TraceAnalyticsRepository,
+        batch_size: int = 5000,
+        max_batches: int = 20,
+        settle_seconds: int = 60,
+    ) -> None:
+        self._analytics = analytics
+        self._batch_size = batch_size
+        self._max_batches = max_batches
+        self._settle = timedelta(seconds=settle_seconds)
+
+    def execute(self, *, now: datetime | None = None) -> int:
+        # Recent events are left for the next run so that slower concurrent inserts
+        # with lower ids are committed before the watermark moves past them.
+        cutoff = (now or datetime.now(UTC)) - self._settle
+        processed = 0
+        for _ in range(self._max_batches):
+            watermark = self._analytics.get_rollup_watermark()
+            rows = self._analytics.list_events_after(
+                after_id=watermark,
+                events=ROLLUP_EVENTS,
+                limit=self._batch_size,
+            )
+            settled = []
+            for event_id, event in rows:
+                if _as_utc(event.timestamp) > cutoff:
+                    break
+                settled.append((event_id, event))
+            if not settled:
+                break
+
+            rollups: dict[StageRollupKey, StageRollup] = {}
+            for _, event in settled:
+                _accumulate(rollups, event)
+
+            applied = self._analytics.apply_rollups(
+                rollups=list(rollups.values()),
+                previous_watermark=watermark,
+                watermark=settled[-1][0],
+            )
+            if not applied:
+                # Another worker advanced the watermark first.
+                break
+            processed += len(settled)
+            if len(settled) < len(rows) or len(rows) < self._batch_size:
+                break
+        return processed
+
+
+def _accumulate(rollups: dict[StageRollupKey, StageRollup], event: TraceEvent) -> None:
+    payload = event.payload
+    key = StageRollupKey(
+        window_start=_as_utc(event.timestamp).replace(minute=0, second=0, microsecond=0),
+        graph_id=str(payload.get("graph_id") or "unknown"),
+        graph_version=str(payload.get("graph_version") or "unknown"),
+        stage=event.stage,
+        llm_model=str(payload.get("llm_model") or "unknown"),
+        prompt_hash=str(payload.get("prompt_hash") or "unknown"),
+    )
+    rollup = rollups.get(key)
+    if rollup is None:
+        rollup = StageRollup(key=key)
+        rollups[key] = rollup
+
+    duration_ms = int(payload.get("duration_ms") or 0)
+    if event.event == "stage_completed":
+        rollup.add_completed(duration_ms=duration_ms, output_chars=int(payload.get("output_chars") or 0))
+    else:
+        rollup.add_failed(duration_ms=duration_ms)
+
+
+def _as_utc(value: datetime) -> datetime:
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value.astimezone(UTC)
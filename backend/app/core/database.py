@@ -1,16 +1,83 @@
+import time
 from collections.abc import Generator
+from typing import Any
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
 from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
+from sqlalchemy.pool import QueuePool
 
+from app.core.metrics import DB_POOL_CHECKED_OUT, DB_POOL_CHECKOUT_WAIT
 from app.core.settings import settings
+from app.core.telemetry import begin_span, current_span, end_span
 
 
 class Base(DeclarativeBase):
     pass
 
 
-engine = create_engine(settings.database_url, pool_pre_ping=True)
+class InstrumentedQueuePool(QueuePool):
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(time.perf_counter() - started)
+            DB_POOL_CHECKED_OUT.set(self.checkedout())
+
+    def _do_return_conn(self, record: Any) -> None:
+        super()._do_return_conn(record)
+        DB_POOL_CHECKED_OUT.set(self.checkedout())
+
+
+def engine_options(database_url: str) -> dict[str, Any]:
+    options: dict[str, Any] = {"pool_pre_ping": True}
+    url = make_url(database_url)
+    # In-memory SQLite needs its single-connection pool.
+    if url.get_backend_name() != "sqlite" or url.database not in (None, "", ":memory:"):
+        options["poolclass"] = InstrumentedQueuePool
+    return options
+
+
+def instrument_engine(target: Engine) -> None:
+    dialect = target.dialect.name
+
+    @event.listens_for(target, "before_cursor_execute")
+    def _start_query_span(_conn: Any, _cursor: Any, statement: str, _params: Any, context: Any, _many: bool) -> None:
+        # Only queries issued inside a traced request are recorded; background jobs stay quiet.
+        if current_span() is None:
+            return
+        context._telemetry_span = begin_span(
+            "db.query",
+            attributes={
+                "db.system": dialect,
+                "db.operation": statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "",
+                "db.statement": statement[:500],
+            },
+        )
+
+    @event.listens_for(target, "after_cursor_execute")
+    def _end_query_span(_conn: Any, cursor: Any, _statement: str, _params: Any, context: Any, _many: bool) -> None:
+        span = getattr(context, "_telemetry_span", None)
+        if span is None:
+            return
+        context._telemetry_span = None
+        if getattr(cursor, "rowcount", -1) >= 0:
+            span.set_attribute("db.rowcount", cursor.rowcount)
+        end_span(span)
+
+    @event.listens_for(target, "handle_error")
+    def _fail_query_span(exception_context: Any) -> None:
+        context = exception_context.execution_context
+        span = getattr(context, "_telemetry_span", None) if context is not None else None
+        if span is None:
+            return
+        context._telemetry_span = None
+        end_span(span, error=exception_context.original_exception)
+
+
+engine = create_engine(settings.database_url, **engine_options(settings.database_url))
+instrument_engine(engine)
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False, expire_on_commit=False)
 
 
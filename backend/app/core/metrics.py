@@ -0,0 +1,304 @@
+import math
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+LabelValues = tuple[str, ...]
+
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0,
+)
+
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...]) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.label_names = label_names
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, object]) -> LabelValues:
+        return tuple(str(labels.get(name, "")) for name in self.label_names)
+
+
+class Counter(_Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, label_names)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def merge(self, key: LabelValues, value: float) -> None:
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + value
+
+    def snapshot(self) -> dict[LabelValues, Any]:
+        with self._lock:
+            return dict(self._values)
+
+
+class Gauge(_Metric):
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> None:
+        super().__init__(name, documentation, label_names)
+        self._values: dict[LabelValues, float] = {}
+
+    def set(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, amount: float = 1.0, **labels: object) -> None:
+        self.inc(-amount, **labels)
+
+    def snapshot(self) -> dict[LabelValues, Any]:
+        with self._lock:
+            return dict(self._values)
+
+
+class Histogram(_Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        *,
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, label_names)
+        self.buckets = tuple(sorted(buckets))
+        # Per label set: one count per bucket plus +Inf, then the running sum.
+        self._values: dict[LabelValues, list[float]] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                series = [0.0] * (len(self.buckets) + 2)
+                self._values[key] = series
+            series[index] += 1
+            series[-1] += value
+
+    @contextmanager
+    def time(self, **labels: object) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def merge(self, key: LabelValues, value: list[float]) -> None:
+        with self._lock:
+            series = self._values.get(key)
+            if series is None:
+                self._values[key] = list(value)
+                return
+            for index, count in enumerate(value[: len(series)]):
+                series[index] += count
+
+    def snapshot(self) -> dict[LabelValues, Any]:
+        with self._lock:
+            return {key: list(series) for key, series in self._values.items()}
+
+
+class MetricsRegistry:
+    def __init__(self) -> None:
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+
+    def counter(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> Counter:
+        return self._register(Counter(name, documentation, label_names))
+
+    def gauge(self, name: str, documentation: str, label_names: tuple[str, ...] = ()) -> Gauge:
+        return self._register(Gauge(name, documentation, label_names))
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        label_names: tuple[str, ...] = (),
+        *,
+        buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS,
+    ) -> Histogram:
+        return self._register(Histogram(name, documentation, label_names, buckets=buckets))
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return {
+            metric.name: {
+                "series": [[list(key), value] for key, value in metric.snapshot().items()],
+            }
+            for metric in metrics
+        }
+
+    def changes_since(self, before: dict[str, dict[str, Any]]) -> dict[str, dict[str, Any]]:
+        # Counter and histogram increments recorded after `before`, in snapshot form, for replay elsewhere.
+        with self._lock:
+            metrics = [metric for metric in self._metrics.values() if metric.kind != "gauge"]
+        changes: dict[str, dict[str, Any]] = {}
+        for metric in metrics:
+            previous = {tuple(key): value for key, value in before.get(metric.name, {}).get("series", [])}
+            series = []
+            for key, value in metric.snapshot().items():
+                old = previous.get(key)
+                if isinstance(metric, Histogram):
+                    delta = value if old is None else [a - b for a, b in zip(value, old, strict=False)]
+                    if any(delta):
+                        series.append([list(key), delta])
+                elif value != (old or 0.0):
+                    series.append([list(key), value - (old or 0.0)])
+            if series:
+                changes[metric.name] = {"series": series}
+        return changes
+
+    def merge(self, changes: dict[str, dict[str, Any]]) -> None:
+        with self._lock:
+            metrics = dict(self._metrics)
+        for name, entry in changes.items():
+            metric = metrics.get(name)
+            if metric is None:
+                continue
+            for key, value in entry.get("series", []):
+                metric.merge(tuple(key), value)
+
+    def render(self, snapshots: list[tuple[dict[str, dict[str, Any]], bool]] | None = None) -> str:
+        # Each snapshot comes with a liveness flag: counters and histograms keep the totals
+        # of exited workers, gauges only report processes that are still running.
+        sources = snapshots if snapshots is not None else [(self.snapshot(), True)]
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda metric: metric.name)
+
+        lines: list[str] = []
+        for metric in metrics:
+            merged: dict[LabelValues, Any] = {}
+            for snapshot, alive in sources:
+                if metric.kind == "gauge" and not alive:
+                    continue
+                for raw_key, value in snapshot.get(metric.name, {}).get("series", []):
+                    key = tuple(raw_key)
+                    if metric.kind == "histogram":
+                        current = merged.get(key)
+                        merged[key] = value if current is None else [a + b for a, b in zip(current, value, strict=False)]
+                    else:
+                        merged[key] = merged.get(key, 0.0) + value
+
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            for key in sorted(merged):
+                labels = dict(zip(metric.label_names, key, strict=False))
+                if isinstance(metric, Histogram):
+                    lines.extend(_render_histogram(metric, labels, merged[key]))
+                else:
+                    lines.append(f"{metric.name}{_format_labels(labels)} {_format_value(merged[key])}")
+        return "\n".join(lines) + "\n"
+
+    def _register(self, metric: Any) -> Any:
+        with self._lock:
+            existing = self._metrics.get(metric.name)
+            if existing is not None:
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+
+def _render_histogram(metric: Histogram, labels: dict[str, str], series: list[float]) -> list[str]:
+    lines = []
+    cumulative = 0.0
+    for bound, count in zip((*metric.buckets, math.inf), series[:-1], strict=False):
+        cumulative += count
+        bucket_labels = {**labels, "le": "+Inf" if bound == math.inf else _format_value(bound)}
+        lines.append(f"{metric.name}_bucket{_format_labels(bucket_labels)} {_format_value(cumulative)}")
+    lines.append(f"{metric.name}_sum{_format_labels(labels)} {_format_value(series[-1])}")
+    lines.append(f"{metric.name}_count{_format_labels(labels)} {_format_value(cumulative)}")
+    return lines
+
+
+def _format_labels(labels: dict[str, str]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape_label(value)}"' for name, value in labels.items()) + "}"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route.",
+    ("method", "route", "status"),
+)
+HTTP_REQUESTS_IN_FLIGHT = registry.gauge("http_requests_in_flight", "Requests currently being served.")
+THREADPOOL_BUSY_THREADS = registry.gauge("threadpool_busy_threads", "Worker threads running sync endpoints.")
+THREADPOOL_QUEUE_DEPTH = registry.gauge("threadpool_queue_depth", "Sync endpoint calls waiting for a worker thread.")
+DOCLING_INGESTION_DURATION = registry.histogram(
+    "docling_ingestion_duration_seconds",
+    "Docling conversion time by media type and OCR policy.",
+    ("media_type", "ocr"),
+)
+INGESTION_WORKER_RECYCLES = registry.counter(
+    "ingestion_worker_recycles_total",
+    "Ingestion worker processes replaced, by reason.",
+    ("reason",),
+)
+INGESTION_CACHE_LOOKUPS = registry.counter(
+    "ingestion_cache_lookups_total",
+    "Ingestion cache lookups by engine and outcome (hit, shared, miss).",
+    ("engine", "result"),
+)
+DOCUMENT_QUALITY_REJECTS = registry.counter(
+    "document_quality_rejects_total",
+    "Documents rejected by the extraction quality gate.",
+    ("media_type",),
+)
+DOCUMENT_OCR_RETRIES = registry.counter(
+    "document_ocr_retries_total",
+    "Ingestions retried with OCR after a failed quality check.",
+    ("media_type",),
+)
+LLM_STAGE_DURATION = registry.histogram(
+    "llm_stage_duration_seconds",
+    "LLM stage latency by provider and model.",
+    ("provider", "model", "stage", "status"),
+)
+LLM_STAGE_ERRORS = registry.counter(
+    "llm_stage_errors_total",
+    "Failed LLM stage calls by provider and model.",
+    ("provider", "model", "stage"),
+)
+PDF_RENDER_DURATION = registry.histogram("pdf_render_duration_seconds", "PDF export render time.")
+DB_POOL_CHECKOUT_WAIT = registry.histogram(
+    "db_pool_checkout_wait_seconds",
+    "Time spent waiting for a database connection from the pool.",
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 5.0, 30.0),
+)
+DB_POOL_CHECKED_OUT = registry.gauge("db_pool_checked_out_connections", "Database connections currently in use.")
@@ -0,0 +1,147 @@
+import secrets
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+CORRELATION_ATTRIBUTES = ("request_id", "run_id", "user_id")
+
+
+@dataclass
+class Span:
+    trace_id: str
+    span_id: str
+    name: str
+    start_time_ns: int
+    parent_span_id: str | None = None
+    end_time_ns: int | None = None
+    attributes: dict[str, Any] = field(default_factory=dict)
+    status: str = "ok"
+    error: str | None = None
+
+    @property
+    def duration_ms(self) -> float | None:
+        if self.end_time_ns is None:
+            return None
+        return (self.end_time_ns - self.start_time_ns) / 1_000_000
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        self.attributes[key] = value
+
+    def record_error(self, exc: BaseException) -> None:
+        self.status = "error"
+        self.error = f"{type(exc).__name__}: {exc}"
+
+
+class SpanExporter(Protocol):
+    def export(self, span: Span) -> None:
+        ...
+
+
+_current_span: ContextVar[Span | None] = ContextVar("telemetry_current_span", default=None)
+_root_span: ContextVar[Span | None] = ContextVar("telemetry_root_span", default=None)
+_exporter: SpanExporter | None = None
+
+
+def configure_span_exporter(exporter: SpanExporter | None) -> None:
+    global _exporter
+    _exporter = exporter
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+def current_trace_id() -> str | None:
+    span = _current_span.get()
+    return span.trace_id if span is not None else None
+
+
+def set_correlation(key: str, value: Any) -> None:
+    # Tags the whole request so spans that already ended still group under e.g. run_id.
+    for span in (_root_span.get(), _current_span.get()):
+        if span is not None:
+            span.set_attribute(key, value)
+
+
+@contextmanager
+def start_span(
+    name: str,
+    *,
+    attributes: dict[str, Any] | None = None,
+    trace_id: str | None = None,
+    parent_span_id: str | None = None,
+) -> Iterator[Span]:
+    span = begin_span(name, attributes=attributes, trace_id=trace_id, parent_span_id=parent_span_id)
+    token = _current_span.set(span)
+    root_token = _root_span.set(span) if _root_span.get() is None else None
+    try:
+        yield span
+    except BaseException as exc:
+        span.record_error(exc)
+        raise
+    finally:
+        _current_span.reset(token)
+        if root_token is not None:
+            _root_span.reset(root_token)
+        end_span(span)
+
+
+@contextmanager
+def continue_trace(trace_id: str, parent_span_id: str, *, attributes: dict[str, Any] | None = None) -> Iterator[None]:
+    # Spans opened in another process attach to the caller's span; the stand-in itself is never exported.
+    parent = Span(
+        trace_id=trace_id,
+        span_id=parent_span_id,
+        name="remote_parent",
+        start_time_ns=time.time_ns(),
+        attributes=dict(attributes or {}),
+    )
+    token = _current_span.set(parent)
+    root_token = _root_span.set(parent)
+    try:
+        yield
+    finally:
+        _root_span.reset(root_token)
+        _current_span.reset(token)
+
+
+def export_span(span: Span) -> None:
+    exporter = _exporter
+    if exporter is None:
+        return
+    try:
+        exporter.export(span)
+    except Exception:
+        # Telemetry must never break the request it observes.
+        pass
+
+
+def begin_span(
+    name: str,
+    *,
+    attributes: dict[str, Any] | None = None,
+    trace_id: str | None = None,
+    parent_span_id: str | None = None,
+) -> Span:
+    parent = _current_span.get()
+    inherited = {}
+    if parent is not None:
+        inherited = {key: parent.attributes[key] for key in CORRELATION_ATTRIBUTES if key in parent.attributes}
+    return Span(
+        trace_id=trace_id or (parent.trace_id if parent is not None else secrets.token_hex(16)),
+        span_id=secrets.token_hex(8),
+        parent_span_id=parent_span_id or (parent.span_id if parent is not None else None),
+        name=name,
+        start_time_ns=time.time_ns(),
+        attributes={**inherited, **(attributes or {})},
+    )
+
+
+def end_span(span: Span, *, error: BaseException | None = None) -> None:
+    if error is not None:
+        span.record_error(error)
+    span.end_time_ns = time.time_ns()
+    export_span(span)
@@ -8,8 +8,10 @@ from app.domain.models.document_pipeline import (
     ProcessingReport,
     RenderedArtifact,
 )
-from app.domain.models.ground_source import GroundSource
+from app.domain.models.ground_source import GroundSource, GroundSourceDeletion, GroundSourceSummary
 from app.domain.models.refresh_session import RefreshSession
+from app.domain.models.trace_analytics import StageLatencyReport, StageRollup, StageRollupKey
+from app.domain.models.trace_run import TraceRunSummary
 from app.domain.models.user import User
 
 __all__ = [
@@ -18,6 +20,8 @@ __all__ = [
     "CanonicalDocument",
     "DocumentProcessingResult",
     "GroundSource",
+    "GroundSourceDeletion",
+    "GroundSourceSummary",
     "IngestionResult",
     "InputDocument",
     "OrientationDecision",
@@ -25,5 +29,9 @@ __all__ = [
     "RefreshSession",
     "RenderedArtifact",
     "StageExecutionTrace",
+    "StageLatencyReport",
+    "StageRollup",
+    "StageRollupKey",
+    "TraceRunSummary",
     "User",
 ]
@@ -8,6 +8,10 @@ class InputDocument:
     source_path: Path
     original_name: str
     media_type: str
+    content_sha256: str | None = None
+    detected_media_type: str | None = None
+    page_range: tuple[int, int] | None = None
+    export_engine_payload: bool = False
 
 
 @dataclass(frozen=True)
@@ -16,6 +20,27 @@ class IngestionPolicy:
     decision_reason: str = "default"
 
 
+@dataclass(frozen=True)
+class DocumentProbe:
+    page_count: int
+    pages_without_text: int
+    pages_with_images: int
+    text_chars: int
+
+
+@dataclass(frozen=True)
+class PayloadRef:
+    storage_path: str
+    media_type: str
+    size_bytes: int
+
+
+@dataclass(frozen=True)
+class DocumentPage:
+    page_no: int
+    text: str
+
+
 @dataclass(frozen=True)
 class CanonicalDocument:
     schema_version: str
@@ -23,6 +48,7 @@ class CanonicalDocument:
     text: str
     metadata: dict[str, str] = field(default_factory=dict)
     extensions: dict[str, Any] = field(default_factory=dict)
+    pages: list[DocumentPage] = field(default_factory=list)
 
 
 @dataclass(frozen=True)
@@ -46,6 +72,7 @@ class RenderedArtifact:
     format: str
     media_type: str
     storage_path: str
+    filename: str | None = None
 
 
 @dataclass(frozen=True)
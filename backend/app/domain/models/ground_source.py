@@ -15,3 +15,22 @@ class GroundSource:
     content_hash: str
     created_at: datetime
     updated_at: datetime
+    source_sha256: str | None = None
+
+
+@dataclass(frozen=True)
+class GroundSourceSummary:
+    id: str
+    user_id: str
+    name: str
+    original_filename: str
+    content_type: str
+    size_bytes: int
+    created_at: datetime
+    updated_at: datetime
+
+
+@dataclass(frozen=True)
+class GroundSourceDeletion:
+    storage_path: str
+    storage_shared: bool
@@ -8,3 +8,5 @@ class StoredFile:
     content_type: str
     size_bytes: int
     storage_path: Path
+    sha256: str | None = None
+    detected_media_type: str | None = None
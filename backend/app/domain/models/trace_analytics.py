@@ -0,0 +1,92 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+LATENCY_BUCKETS_MS: tuple[int, ...] = (50, 100, 250, 500, 1000, 2000, 4000, 8000, 15000, 30000, 60000, 120000)
+OUTPUT_CHARS_BUCKETS: tuple[int, ...] = (100, 250, 500, 1000, 2000, 4000, 8000, 16000, 32000, 64000)
+
+
+@dataclass(frozen=True)
+class StageRollupKey:
+    window_start: datetime
+    graph_id: str
+    graph_version: str
+    stage: str
+    llm_model: str
+    prompt_hash: str
+
+
+@dataclass
+class StageRollup:
+    key: StageRollupKey
+    completed_count: int = 0
+    failed_count: int = 0
+    duration_ms_total: int = 0
+    latency_histogram: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS_MS) + 1))
+    output_chars_histogram: list[int] = field(default_factory=lambda: [0] * (len(OUTPUT_CHARS_BUCKETS) + 1))
+
+    def add_completed(self, *, duration_ms: int, output_chars: int) -> None:
+        self.completed_count += 1
+        self.duration_ms_total += duration_ms
+        self.latency_histogram[histogram_bucket(duration_ms, LATENCY_BUCKETS_MS)] += 1
+        self.output_chars_histogram[histogram_bucket(output_chars, OUTPUT_CHARS_BUCKETS)] += 1
+
+    def add_failed(self, *, duration_ms: int) -> None:
+        self.failed_count += 1
+        self.duration_ms_total += duration_ms
+        self.latency_histogram[histogram_bucket(duration_ms, LATENCY_BUCKETS_MS)] += 1
+
+    def merge(self, other: "StageRollup") -> None:
+        self.completed_count += other.completed_count
+        self.failed_count += other.failed_count
+        self.duration_ms_total += other.duration_ms_total
+        self.latency_histogram = _add_histograms(self.latency_histogram, other.latency_histogram)
+        self.output_chars_histogram = _add_histograms(self.output_chars_histogram, other.output_chars_histogram)
+
+
+@dataclass(frozen=True)
+class StageLatencyReport:
+    graph_id: str
+    graph_version: str
+    stage: str
+    llm_model: str
+    prompt_hash: str
+    first_window_start: datetime
+    last_window_start: datetime
+    completed_count: int
+    failed_count: int
+    failure_rate: float
+    mean_ms: float
+    p50_ms: int | None
+    p95_ms: int | None
+    p99_ms: int | None
+    output_chars_p50: int | None
+    output_chars_p95: int | None
+
+
+def histogram_bucket(value: int, bounds: tuple[int, ...]) -> int:
+    for index, bound in enumerate(bounds):
+        if value <= bound:
+            return index
+    return len(bounds)
+
+
+def histogram_percentile(histogram: list[int], bounds: tuple[int, ...], quantile: float) -> int | None:
+    total = sum(histogram)
+    if total == 0:
+        return None
+    threshold = quantile * total
+    cumulative = 0
+    for index, count in enumerate(histogram):
+        cumulative += count
+        if cumulative >= threshold:
+            # Overflow samples are reported at the last bound; buckets only give an upper estimate.
+            return bounds[min(index, len(bounds) - 1)]
+    return bounds[-1]
+
+
+def _add_histograms(left: list[int], right: list[int]) -> list[int]:
+    size = max(len(left), len(right))
+    return [
+        (left[index] if index < len(left) else 0) + (right[index] if index < len(right) else 0)
+        for index in range(size)
+    ]
@@ -0,0 +1,11 @@
+from dataclasses import dataclass
+from datetime import datetime
+
+
+@dataclass(frozen=True)
+class TraceRunSummary:
+    run_id: str
+    started_at: datetime
+    last_event_at: datetime
+    event_count: int
+    failed_stage_count: int
@@ -1,6 +1,15 @@
 from app.domain.repositories.auth_registration_repository import AuthRegistrationRepository
 from app.domain.repositories.ground_source_repository import GroundSourceRepository
 from app.domain.repositories.refresh_session_repository import RefreshSessionRepository
+from app.domain.repositories.trace_analytics_repository import TraceAnalyticsRepository
+from app.domain.repositories.trace_repository import TraceRepository
 from app.domain.repositories.user_repository import UserRepository
 
-__all__ = ["UserRepository", "RefreshSessionRepository", "GroundSourceRepository", "AuthRegistrationRepository"]
+__all__ = [
+    "UserRepository",
+    "RefreshSessionRepository",
+    "GroundSourceRepository",
+    "AuthRegistrationRepository",
+    "TraceRepository",
+    "TraceAnalyticsRepository",
+]
@@ -1,6 +1,7 @@
+from datetime import datetime
 from typing import Protocol
 
-from app.domain.models.ground_source import GroundSource
+from app.domain.models.ground_source import GroundSource, GroundSourceDeletion, GroundSourceSummary
 
 
 class GroundSourceRepository(Protocol):
@@ -15,14 +16,35 @@ class GroundSourceRepository(Protocol):
         storage_path: str,
         canonical_text: str,
         content_hash: str,
+        source_sha256: str | None = None,
     ) -> GroundSource:
         ...
 
-    def list_for_user(self, *, user_id: str) -> list[GroundSource]:
+    def find_by_source_sha256(self, *, user_id: str, source_sha256: str) -> GroundSource | None:
+        ...
+
+    def create_from_existing(
+        self,
+        *,
+        source_id: str,
+        user_id: str,
+        name: str,
+        original_filename: str,
+        content_type: str,
+    ) -> GroundSource | None:
+        ...
+
+    def list_for_user(
+        self,
+        *,
+        user_id: str,
+        limit: int,
+        after: tuple[datetime, str] | None = None,
+    ) -> list[GroundSourceSummary]:
         ...
 
     def get_for_user(self, *, source_id: str, user_id: str) -> GroundSource | None:
         ...
 
-    def delete_for_user(self, *, source_id: str, user_id: str) -> bool:
+    def delete_for_user(self, *, source_id: str, user_id: str) -> GroundSourceDeletion | None:
         ...
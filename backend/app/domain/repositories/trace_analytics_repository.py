@@ -0,0 +1,19 @@
+from datetime import datetime
+from typing import Protocol
+
+from app.domain.models.trace_analytics import StageRollup
+from app.domain.services.trace_store import TraceEvent
+
+
+class TraceAnalyticsRepository(Protocol):
+    def get_rollup_watermark(self) -> int:
+        ...
+
+    def list_events_after(self, *, after_id: int, events: tuple[str, ...], limit: int) -> list[tuple[int, TraceEvent]]:
+        ...
+
+    def apply_rollups(self, *, rollups: list[StageRollup], previous_watermark: int, watermark: int) -> bool:
+        ...
+
+    def list_rollups(self, *, since: datetime, until: datetime, graph_id: str | None = None) -> list[StageRollup]:
+        ...
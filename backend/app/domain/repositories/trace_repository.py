@@ -0,0 +1,12 @@
+from typing import Protocol
+
+from app.domain.models.trace_run import TraceRunSummary
+from app.domain.services.trace_store import TraceEvent
+
+
+class TraceRepository(Protocol):
+    def list_events_for_run(self, *, run_id: str, user_id: str) -> list[TraceEvent]:
+        ...
+
+    def list_runs_for_user(self, *, user_id: str, limit: int, offset: int) -> list[TraceRunSummary]:
+        ...
@@ -1,9 +1,21 @@
-from app.domain.services.artifact_store import ArtifactStore
+from app.domain.services.artifact_store import (
+    ArtifactStore,
+    DeferredArtifactStore,
+    PresignedArtifactStore,
+    StreamingArtifactStore,
+)
 from app.domain.services.cv_generation_orchestrator import CvGenerationOrchestrator
 from app.domain.services.cv_analyzer import CVAnalyzer
 from app.domain.services.cv_exporter import CvExporter
 from app.domain.services.document_ingestor import DocumentIngestor
-from app.domain.services.document_renderer import DocumentRenderer
+from app.domain.services.document_prober import DocumentProber
+from app.domain.services.document_renderer import (
+    BinaryDocumentRenderer,
+    DocumentRenderer,
+    StreamingDocumentRenderer,
+)
+from app.domain.services.engine_payload_merger import EnginePayloadMerger
+from app.domain.services.ingestion_cache import IngestionCache
 from app.domain.services.ingestion_quality_validator import IngestionQualityValidator
 from app.domain.services.llm_gateway import LLMGateway, LLMRequest
 from app.domain.services.password_hasher import PasswordHasher
@@ -14,17 +26,25 @@ from app.domain.services.trace_store import TraceEvent, TraceStore
 __all__ = [
     "AccessTokenPayload",
     "ArtifactStore",
+    "BinaryDocumentRenderer",
     "CvGenerationOrchestrator",
     "CvExporter",
     "CVAnalyzer",
+    "DeferredArtifactStore",
     "DocumentIngestor",
+    "DocumentProber",
     "DocumentRenderer",
+    "EnginePayloadMerger",
+    "IngestionCache",
     "IngestionQualityValidator",
     "LLMGateway",
     "LLMRequest",
     "PasswordHasher",
+    "PresignedArtifactStore",
     "PromptRepository",
     "PromptTemplate",
+    "StreamingArtifactStore",
+    "StreamingDocumentRenderer",
     "TraceEvent",
     "TraceStore",
     "TokenService",
@@ -1,6 +1,7 @@
-from typing import Protocol
+from collections.abc import Callable
+from typing import Any, BinaryIO, Protocol, runtime_checkable
 
-from app.domain.models.document_pipeline import InputDocument, RenderedArtifact
+from app.domain.models.document_pipeline import CanonicalDocument, InputDocument, PayloadRef, RenderedArtifact
 
 
 class ArtifactStore(Protocol):
@@ -13,3 +14,71 @@ class ArtifactStore(Protocol):
         content: str,
     ) -> RenderedArtifact:
         ...
+
+    def save_payload(self, *, source_document: InputDocument, payload: Any) -> PayloadRef:
+        ...
+
+    def save_payload_stream(self, *, source_document: InputDocument, write: Callable[[BinaryIO], None]) -> PayloadRef:
+        ...
+
+    def open_payload(self, ref: PayloadRef) -> BinaryIO:
+        ...
+
+    def retain_payload(self, ref: PayloadRef) -> None:
+        ...
+
+    def delete_payload(self, ref: PayloadRef) -> None:
+        ...
+
+
+@runtime_checkable
+class StreamingArtifactStore(ArtifactStore, Protocol):
+    def save_artifact_stream(
+        self,
+        *,
+        source_document: InputDocument,
+        output_format: str,
+        media_type: str,
+        write: Callable[[BinaryIO], None],
+    ) -> RenderedArtifact:
+        ...
+
+
+@runtime_checkable
+class DeferredArtifactStore(ArtifactStore, Protocol):
+    def save_document(self, *, source_document: InputDocument, document: CanonicalDocument) -> str:
+        ...
+
+    def load_document(self, document_id: str) -> CanonicalDocument:
+        ...
+
+    def deferred_artifact(
+        self,
+        *,
+        source_document: InputDocument,
+        document_id: str,
+        output_format: str,
+        media_type: str,
+    ) -> RenderedArtifact:
+        ...
+
+    def find_deferred(self, storage_path: str) -> tuple[str, str] | None:
+        ...
+
+    def artifact_exists(self, storage_path: str) -> bool:
+        ...
+
+    def save_deferred_artifact(self, *, storage_path: str, write: Callable[[BinaryIO], None]) -> None:
+        ...
+
+    def purge_expired(self, *, now: float | None = None) -> int:
+        ...
+
+
+@runtime_checkable
+class PresignedArtifactStore(ArtifactStore, Protocol):
+    def presigned_download_url(self, storage_path: str, *, filename: str, media_type: str) -> str:
+        ...
+
+    def open_artifact(self, storage_path: str) -> BinaryIO:
+        ...
@@ -10,5 +10,6 @@ class CvGenerationOrchestrator(Protocol):
         cv_text: str,
         job_description: str,
         graph_id: str | None = None,
+        user_id: str | None = None,
     ) -> CvGenerationResult:
         ...
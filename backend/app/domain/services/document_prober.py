@@ -0,0 +1,8 @@
+from typing import Protocol
+
+from app.domain.models.document_pipeline import DocumentProbe, InputDocument
+
+
+class DocumentProber(Protocol):
+    def probe(self, document: InputDocument) -> DocumentProbe | None:
+        ...
@@ -1,4 +1,4 @@
-from typing import Protocol
+from typing import BinaryIO, Protocol, runtime_checkable
 
 from app.domain.models.document_pipeline import CanonicalDocument
 
@@ -14,3 +14,26 @@ class DocumentRenderer(Protocol):
 
     def render(self, document: CanonicalDocument) -> str:
         ...
+
+
+@runtime_checkable
+class StreamingDocumentRenderer(DocumentRenderer, Protocol):
+    def render_to(self, document: CanonicalDocument, sink: BinaryIO) -> None:
+        ...
+
+
+@runtime_checkable
+class BinaryDocumentRenderer(Protocol):
+    @property
+    def output_format(self) -> str:
+        ...
+
+    @property
+    def media_type(self) -> str:
+        ...
+
+    def render_bytes(self, document: CanonicalDocument) -> bytes:
+        ...
+
+    def render_to(self, document: CanonicalDocument, sink: BinaryIO) -> None:
+        ...
@@ -0,0 +1,17 @@
+from collections.abc import Sequence
+from typing import Any, Protocol
+
+
+class EnginePayloadMerger(Protocol):
+    @property
+    def extension_key(self) -> str:
+        ...
+
+    def replace_pages(
+        self,
+        payload: dict[str, Any],
+        replacements: Sequence[dict[str, Any]],
+        *,
+        page_numbers: set[int],
+    ) -> dict[str, Any]:
+        ...
@@ -22,5 +22,8 @@ class FileStorage(Protocol):
     ) -> StoredFile:
         ...
 
+    def persist(self, *, stored_file: StoredFile) -> None:
+        ...
+
     def delete(self, *, storage_path: str) -> None:
         ...
@@ -0,0 +1,11 @@
+from typing import Protocol
+
+from app.domain.models.document_pipeline import IngestionResult
+
+
+class IngestionCache(Protocol):
+    def get(self, key: str) -> IngestionResult | None:
+        ...
+
+    def put(self, key: str, result: IngestionResult) -> None:
+        ...
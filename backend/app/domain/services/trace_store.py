@@ -10,6 +10,7 @@ class TraceEvent:
     event: str
     timestamp: datetime
     payload: dict[str, Any] = field(default_factory=dict)
+    user_id: str | None = None
 
 
 class TraceStore(Protocol):
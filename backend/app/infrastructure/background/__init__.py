@@ -0,0 +1,3 @@
+from app.infrastructure.background.periodic_worker import PeriodicWorker
+
+__all__ = ["PeriodicWorker"]
@@ -0,0 +1,49 @@
+import threading
+from collections.abc import Callable
+
+
+class PeriodicWorker:
+    def __init__(
+        self,
+        *,
+        name: str,
+        task: Callable[[], object],
+        interval_seconds: float,
+        run_on_stop: bool = False,
+    ) -> None:
+        self._name = name
+        self._task = task
+        self._interval_seconds = interval_seconds
+        self._run_on_stop = run_on_stop
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name=self._name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+            if self._run_on_stop:
+                self.run_once()
+
+    def run_once(self) -> None:
+        try:
+            self._task()
+        except Exception:
+            # Background jobs are best effort and retried on the next tick.
+            pass
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval_seconds):
+            self.run_once()
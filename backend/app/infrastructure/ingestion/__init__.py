@@ -1,5 +1,21 @@
 from app.infrastructure.ingestion.basic_ingestion_quality_validator import BasicIngestionQualityValidator
+from app.infrastructure.ingestion.caching_document_ingestor import CachingDocumentIngestor
+from app.infrastructure.ingestion.docling_converter_pool import DoclingConverterPool
 from app.infrastructure.ingestion.docling_document_ingestor import DoclingDocumentIngestor
 from app.infrastructure.ingestion.fallback_text_document_ingestor import FallbackTextDocumentIngestor
+from app.infrastructure.ingestion.local_ingestion_cache import LocalIngestionCache
+from app.infrastructure.ingestion.page_parallel_document_ingestor import PageParallelDocumentIngestor
+from app.infrastructure.ingestion.pdf_text_layer_prober import PdfTextLayerProber
+from app.infrastructure.ingestion.process_pool_document_ingestor import ProcessPoolDocumentIngestor
 
-__all__ = ["BasicIngestionQualityValidator", "DoclingDocumentIngestor", "FallbackTextDocumentIngestor"]
+__all__ = [
+    "BasicIngestionQualityValidator",
+    "CachingDocumentIngestor",
+    "DoclingConverterPool",
+    "DoclingDocumentIngestor",
+    "FallbackTextDocumentIngestor",
+    "LocalIngestionCache",
+    "PageParallelDocumentIngestor",
+    "PdfTextLayerProber",
+    "ProcessPoolDocumentIngestor",
+]
@@ -1,30 +1,87 @@
 import re
+from collections.abc import Iterable
 
 from app.domain.models.document_pipeline import CanonicalDocument
 from app.domain.services.ingestion_quality_validator import IngestionQualityAssessment
 
+_PDF_MARKERS = ("%PDF-", "endobj", "xref", "stream", "endstream")
+_MOJIBAKE_MARKERS = ("Ã", "Â", "â€")
+_CARRY_CHARS = max(len(marker) for marker in (*_PDF_MARKERS, *_MOJIBAKE_MARKERS)) - 1
+_CHUNK_CHARS = 1 << 20
 
-class BasicIngestionQualityValidator:
-    def assess(self, document: CanonicalDocument) -> IngestionQualityAssessment:
-        text = document.text
-        if not text.strip():
+# Signals are counted over the UTF-8 bytes with translate/count, which run in C: control
+# characters and ASCII letters/whitespace are single bytes in UTF-8 and never occur inside
+# a multi-byte sequence.
+_ALLOWED_CONTROLS = b"\n\r\t"
+_CONTROL_BYTES = bytes(code for code in range(32) if code not in _ALLOWED_CONTROLS)
+_ASCII_LETTERS = b"ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+_LETTER_TABLE = bytes(ord("a") if code in _ASCII_LETTERS else ord(" ") for code in range(256))
+_SPACE_TABLE = bytes(ord(" ") if chr(code).isspace() and code < 128 else ord("x") for code in range(256))
+_UNICODE_WHITESPACE = re.compile("[" + "".join(chr(code) for code in range(128, 0x3001) if chr(code).isspace()) + "]")
+_NON_ASCII_LEAD_BYTES = bytes(range(0xC0, 0x100))
+_LATIN_LEAD_BYTES = bytes(range(0xC3, 0xCA))
+
+
+class QualitySignalAccumulator:
+    def __init__(self) -> None:
+        self.char_count = 0
+        self.non_printable_count = 0
+        self.word_count = 0
+        self.token_count = 0
+        self.non_ascii_count = 0
+        self.non_latin_count = 0
+        self.replacement_count = 0
+        self.mojibake_count = 0
+        self.pdf_markers: set[str] = set()
+        self._text_tail = ""
+        self._letter_tail = b"  "
+        self._space_tail = b" "
+
+    def feed(self, chunk: str) -> None:
+        if not chunk:
+            return
+        self.char_count += len(chunk)
+        window = self._text_tail + chunk
+        for marker in _PDF_MARKERS:
+            if marker not in self.pdf_markers and marker in window:
+                self.pdf_markers.add(marker)
+        # Each marker may only reach len(marker) - 1 characters back into the tail, so a match counted
+        # here ends in this chunk and was not counted with the previous one.
+        tail_length = len(self._text_tail)
+        self.mojibake_count += sum(
+            window.count(marker, max(0, tail_length - len(marker) + 1)) for marker in _MOJIBAKE_MARKERS
+        )
+        self.replacement_count += chunk.count("\ufffd")
+        self._text_tail = window[-_CARRY_CHARS:]
+
+        encoded = chunk.encode("utf-8", errors="surrogatepass")
+        self.non_printable_count += len(encoded) - len(encoded.translate(None, _CONTROL_BYTES))
+
+        letters = self._letter_tail + encoded.translate(_LETTER_TABLE)
+        self.word_count += letters.count(b" aa")
+        self._letter_tail = letters[-2:]
+
+        if chunk.isascii():
+            spaced = encoded
+        else:
+            non_ascii = len(encoded) - len(encoded.translate(None, _NON_ASCII_LEAD_BYTES))
+            self.non_ascii_count += non_ascii
+            self.non_latin_count += non_ascii - (len(encoded) - len(encoded.translate(None, _LATIN_LEAD_BYTES)))
+            spaced = _UNICODE_WHITESPACE.sub(" ", chunk).encode("utf-8", errors="surrogatepass")
+        tokens = self._space_tail + spaced.translate(_SPACE_TABLE)
+        self.token_count += tokens.count(b" x")
+        self._space_tail = tokens[-1:]
+
+    def assessment(self) -> IngestionQualityAssessment:
+        if self.token_count == 0:
             return IngestionQualityAssessment(accepted=False, score=0.0, flags=["empty_text"])
 
         flags: list[str] = []
-
-        pdf_markers = ["%PDF-", "endobj", "xref", "stream", "endstream"]
-        marker_hits = sum(1 for marker in pdf_markers if marker in text)
-        if marker_hits >= 3:
+        if len(self.pdf_markers) >= 3:
             flags.append("pdf_internal_markers")
-
-        non_printable_count = sum(1 for char in text if ord(char) < 32 and char not in "\n\r\t")
-        non_printable_ratio = non_printable_count / max(1, len(text))
-        if non_printable_ratio > 0.02:
+        if self.non_printable_count / max(1, self.char_count) > 0.02:
             flags.append("non_printable_ratio_high")
-
-        words = re.findall(r"[A-Za-z]{2,}", text)
-        lexical_density = len(words) / max(1, len(text.split()))
-        if lexical_density < 0.4:
+        if self.word_count / max(1, self.token_count) < 0.4:
             flags.append("low_lexical_density")
 
         score = 1.0
@@ -36,5 +93,23 @@ class BasicIngestionQualityValidator:
             score -= 0.2
         score = max(0.0, round(score, 3))
 
+        # Informational signals: they are reported but do not change the score or the gate.
+        if (self.mojibake_count + self.replacement_count) / self.char_count > 0.005:
+            flags.append("mojibake_suspected")
+        if self.non_ascii_count and self.non_latin_count / self.char_count > 0.5:
+            flags.append("non_latin_script")
+
         accepted = not ({"pdf_internal_markers", "non_printable_ratio_high"} & set(flags))
         return IngestionQualityAssessment(accepted=accepted, score=score, flags=flags)
+
+
+class BasicIngestionQualityValidator:
+    def assess(self, document: CanonicalDocument) -> IngestionQualityAssessment:
+        text = document.text
+        return self.assess_chunks(text[start : start + _CHUNK_CHARS] for start in range(0, len(text), _CHUNK_CHARS))
+
+    def assess_chunks(self, chunks: Iterable[str]) -> IngestionQualityAssessment:
+        accumulator = QualitySignalAccumulator()
+        for chunk in chunks:
+            accumulator.feed(chunk)
+        return accumulator.assessment()
@@ -0,0 +1,116 @@
+import hashlib
+import threading
+
+from app.core.metrics import INGESTION_CACHE_LOOKUPS
+from app.core.telemetry import start_span
+from app.domain.models.document_pipeline import IngestionPolicy, IngestionResult, InputDocument
+from app.domain.services.document_ingestor import DocumentIngestor
+from app.domain.services.ingestion_cache import IngestionCache
+
+
+class _Flight:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.error: BaseException | None = None
+
+
+class CachingDocumentIngestor:
+    def __init__(
+        self,
+        *,
+        delegate: DocumentIngestor,
+        cache: IngestionCache,
+        engine_name: str,
+        engine_version: str | None = None,
+        default_ocr_enabled: bool = False,
+        flight_timeout_seconds: float = 300.0,
+    ) -> None:
+        self._delegate = delegate
+        self._cache = cache
+        self._engine_name = engine_name
+        self._engine_version = engine_version
+        self._default_ocr_enabled = default_ocr_enabled
+        self._flight_timeout_seconds = flight_timeout_seconds
+        self._flights: dict[str, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def supports(self, media_type: str) -> bool:
+        return self._delegate.supports(media_type)
+
+    def ingest(self, document: InputDocument, *, policy: IngestionPolicy | None = None) -> IngestionResult:
+        key = self.cache_key(document, policy=policy)
+        with start_span("ingestion.cache.lookup", attributes={"engine": self._engine_name}) as span:
+            cached = self._cache.get(key)
+            span.set_attribute("hit", cached is not None)
+        if cached is not None:
+            INGESTION_CACHE_LOOKUPS.inc(engine=self._engine_name, result="hit")
+            return cached
+
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._flights[key] = flight
+
+        if not leader:
+            # Identical uploads in flight share one conversion instead of each running Docling.
+            if not flight.done.wait(self._flight_timeout_seconds):
+                # A stuck leader must not hold every follower hostage; convert independently instead.
+                INGESTION_CACHE_LOOKUPS.inc(engine=self._engine_name, result="miss")
+                return self._delegate.ingest(document, policy=policy)
+            if flight.error is not None:
+                raise flight.error
+            # Read back through the cache so each caller owns its own reference to any stored payload.
+            shared = self._cache.get(key)
+            if shared is not None:
+                INGESTION_CACHE_LOOKUPS.inc(engine=self._engine_name, result="shared")
+                return shared
+            INGESTION_CACHE_LOOKUPS.inc(engine=self._engine_name, result="miss")
+            return self._delegate.ingest(document, policy=policy)
+
+        INGESTION_CACHE_LOOKUPS.inc(engine=self._engine_name, result="miss")
+        try:
+            result = self._cache.get(key)
+            if result is None:
+                result = self._delegate.ingest(document, policy=policy)
+                self._store(key, result)
+            return result
+        except BaseException as exc:
+            flight.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+            flight.done.set()
+
+    def cache_key(self, document: InputDocument, *, policy: IngestionPolicy | None = None) -> str:
+        content_sha256 = document.content_sha256 or _hash_file(document)
+        ocr_enabled = policy.ocr_enabled if policy is not None else self._default_ocr_enabled
+        fingerprint = "|".join(
+            (
+                content_sha256,
+                document.media_type,
+                self._engine_name,
+                self._engine_version or "unknown",
+                f"ocr={int(ocr_enabled)}",
+                f"pages={document.page_range[0]}-{document.page_range[1]}" if document.page_range else "pages=all",
+                f"payload={int(document.export_engine_payload)}",
+            )
+        )
+        return hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+
+    def _store(self, key: str, result: IngestionResult) -> None:
+        try:
+            self._cache.put(key, result)
+        except OSError:
+            # The cache is an optimisation: a full disk must not fail an ingestion that already succeeded.
+            pass
+
+
+def _hash_file(document: InputDocument) -> str:
+    digest = hashlib.sha256()
+    with document.source_path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
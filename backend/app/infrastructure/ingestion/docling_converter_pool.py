@@ -0,0 +1,90 @@
+import queue
+import threading
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from typing import Any
+
+from app.application.errors import IngestionFailedError
+
+ConverterFactory = Callable[[bool], Any]
+
+
+class DoclingConverterPool:
+    def __init__(
+        self,
+        *,
+        max_converters_per_config: int = 2,
+        artifacts_path: str | None = None,
+        checkout_timeout_seconds: float = 120.0,
+        factory: ConverterFactory | None = None,
+    ) -> None:
+        self._max_converters = max(1, max_converters_per_config)
+        self._artifacts_path = artifacts_path
+        self._checkout_timeout_seconds = checkout_timeout_seconds
+        self._factory = factory or self._build_converter
+        self._idle: dict[bool, queue.LifoQueue[Any]] = {}
+        self._created: dict[bool, int] = {}
+        self._lock = threading.Lock()
+
+    def warm(self, *, ocr_modes: tuple[bool, ...] = (False, True)) -> None:
+        for ocr_enabled in ocr_modes:
+            with self.checkout(ocr_enabled=ocr_enabled):
+                pass
+
+    @contextmanager
+    def checkout(self, *, ocr_enabled: bool) -> Iterator[Any]:
+        idle = self._idle_queue(ocr_enabled)
+        converter = self._acquire(ocr_enabled, idle)
+        try:
+            yield converter
+        finally:
+            idle.put(converter)
+
+    def _acquire(self, ocr_enabled: bool, idle: "queue.LifoQueue[Any]") -> Any:
+        try:
+            return idle.get_nowait()
+        except queue.Empty:
+            pass
+
+        with self._lock:
+            can_create = self._created.get(ocr_enabled, 0) < self._max_converters
+            if can_create:
+                self._created[ocr_enabled] = self._created.get(ocr_enabled, 0) + 1
+        if can_create:
+            try:
+                return self._factory(ocr_enabled)
+            except BaseException:
+                with self._lock:
+                    self._created[ocr_enabled] -= 1
+                raise
+
+        try:
+            return idle.get(timeout=self._checkout_timeout_seconds)
+        except queue.Empty as exc:
+            raise IngestionFailedError("Timed out waiting for an idle Docling converter") from exc
+
+    def _idle_queue(self, ocr_enabled: bool) -> "queue.LifoQueue[Any]":
+        with self._lock:
+            idle = self._idle.get(ocr_enabled)
+            if idle is None:
+                idle = queue.LifoQueue()
+                self._idle[ocr_enabled] = idle
+            return idle
+
+    def _build_converter(self, ocr_enabled: bool) -> Any:
+        from docling.datamodel.base_models import InputFormat
+        from docling.datamodel.pipeline_options import PdfPipelineOptions
+        from docling.document_converter import DocumentConverter, PdfFormatOption
+
+        pdf_options = PdfPipelineOptions()
+        pdf_options.do_ocr = ocr_enabled
+        if self._artifacts_path:
+            # Models are loaded from the bundled directory instead of being fetched at runtime.
+            pdf_options.artifacts_path = self._artifacts_path
+        converter = DocumentConverter(
+            format_options={
+                InputFormat.PDF: PdfFormatOption(pipeline_options=pdf_options),
+            }
+        )
+        converter.initialize_pipeline(InputFormat.PDF)
+        return converter
@@ -1,7 +1,20 @@
 from importlib.metadata import PackageNotFoundError, version
 from typing import Any
 
-from app.domain.models.document_pipeline import CanonicalDocument, IngestionPolicy, IngestionResult, InputDocument, ProcessingReport
+from app.core.metrics import DOCLING_INGESTION_DURATION
+from app.core.telemetry import start_span
+from app.domain.models.document_pipeline import (
+    CanonicalDocument,
+    DocumentPage,
+    IngestionPolicy,
+    IngestionResult,
+    InputDocument,
+    PayloadRef,
+    ProcessingReport,
+)
+from app.domain.services.artifact_store import ArtifactStore
+from app.infrastructure.ingestion.docling_converter_pool import DoclingConverterPool
+from app.infrastructure.storage.local_artifact_store import LocalArtifactStore
 
 
 class DoclingDocumentIngestor:
@@ -10,6 +23,8 @@ class DoclingDocumentIngestor:
         supported_media_types: set[str] | None = None,
         *,
         enable_pdf_ocr: bool = False,
+        converter_pool: DoclingConverterPool | None = None,
+        artifact_store: ArtifactStore | None = None,
     ) -> None:
         default_media_types = {
             "application/pdf",
@@ -21,37 +36,45 @@ class DoclingDocumentIngestor:
         }
         self._supported_media_types = supported_media_types or default_media_types
         self._enable_pdf_ocr = enable_pdf_ocr
+        self._converter_pool = converter_pool or DoclingConverterPool()
+        self._artifact_store = artifact_store
 
     def supports(self, media_type: str) -> bool:
         return media_type in self._supported_media_types
 
     def ingest(self, document: InputDocument, *, policy: IngestionPolicy | None = None) -> IngestionResult:
-        from docling.datamodel.base_models import InputFormat
-        from docling.datamodel.pipeline_options import PdfPipelineOptions
-        from docling.document_converter import DocumentConverter, PdfFormatOption
-
-        pdf_options = PdfPipelineOptions()
         should_enable_ocr = self._enable_pdf_ocr
         if policy is not None:
             should_enable_ocr = policy.ocr_enabled
-        pdf_options.do_ocr = should_enable_ocr
-        converter = DocumentConverter(
-            format_options={
-                InputFormat.PDF: PdfFormatOption(pipeline_options=pdf_options),
-            }
-        )
-        conversion_result = converter.convert(str(document.source_path))
+        with (
+            self._converter_pool.checkout(ocr_enabled=should_enable_ocr) as converter,
+            start_span(
+                "ingestion.docling.convert",
+                attributes={"media_type": document.media_type, "ocr_enabled": should_enable_ocr},
+            ),
+            DOCLING_INGESTION_DURATION.time(media_type=document.media_type, ocr="on" if should_enable_ocr else "off"),
+        ):
+            if document.page_range is not None:
+                conversion_result = converter.convert(str(document.source_path), page_range=document.page_range)
+            else:
+                conversion_result = converter.convert(str(document.source_path))
         docling_document = self._resolve_document(conversion_result)
 
-        markdown = self._export_markdown(docling_document)
-        docling_payload = self._export_payload(docling_document)
+        with start_span("ingestion.docling.export"):
+            markdown = self._export_markdown(docling_document)
+            pages = self._export_pages(docling_document)
+            extensions: dict[str, Any] = {}
+            if document.export_engine_payload:
+                # Only renderers read the tree; text-only callers never pay for exporting or storing it.
+                extensions["docling"] = self._store_payload(document, self._export_payload(docling_document))
 
         canonical_document = CanonicalDocument(
             schema_version="1.0",
             source_media_type=document.media_type,
             text=markdown,
             metadata={"original_name": document.original_name},
-            extensions={"docling": docling_payload},
+            extensions=extensions,
+            pages=pages,
         )
 
         report = ProcessingReport(
@@ -78,9 +101,52 @@ class DoclingDocumentIngestor:
             return docling_document.export_to_markdown()
         return str(docling_document)
 
+    def _export_pages(self, docling_document: Any) -> list[DocumentPage]:
+        page_numbers = getattr(docling_document, "pages", None)
+        if not isinstance(page_numbers, dict) or not hasattr(docling_document, "export_to_markdown"):
+            return []
+        try:
+            return [
+                DocumentPage(page_no=int(page_no), text=docling_document.export_to_markdown(page_no=int(page_no)))
+                for page_no in sorted(page_numbers, key=int)
+            ]
+        except TypeError:
+            # Older docling-core releases cannot export a single page.
+            return []
+
+    def _store_payload(self, document: InputDocument, payload: dict[str, Any]) -> dict[str, Any] | PayloadRef:
+        if self._artifact_store is None:
+            return payload
+        # Written where it was produced so the tree never travels back to, or stays in, the API process.
+        return self._artifact_store.save_payload(source_document=document, payload=payload)
+
     def _export_payload(self, docling_document: Any) -> dict[str, Any]:
         if hasattr(docling_document, "export_to_dict"):
             exported = docling_document.export_to_dict()
             if isinstance(exported, dict):
                 return exported
         return {"content": str(docling_document)}
+
+
+def build_docling_ingestor(
+    *,
+    enable_pdf_ocr: bool = False,
+    artifacts_path: str | None = None,
+    max_converters_per_config: int = 1,
+    warm_ocr_modes: tuple[bool, ...] = (),
+    artifact_dir: str | None = None,
+) -> DoclingDocumentIngestor:
+    pool = DoclingConverterPool(
+        max_converters_per_config=max_converters_per_config,
+        artifacts_path=artifacts_path,
+    )
+    if warm_ocr_modes:
+        try:
+            pool.warm(ocr_modes=warm_ocr_modes)
+        except ImportError:
+            pass
+    return DoclingDocumentIngestor(
+        enable_pdf_ocr=enable_pdf_ocr,
+        converter_pool=pool,
+        artifact_store=LocalArtifactStore(base_dir=artifact_dir) if artifact_dir else None,
+    )
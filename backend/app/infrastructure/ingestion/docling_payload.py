@@ -0,0 +1,201 @@
+import copy
+import json
+import re
+import shutil
+import tempfile
+from collections.abc import Iterable, Sequence
+from contextlib import ExitStack
+from typing import IO, Any, BinaryIO
+
+_ITEM_COLLECTIONS = ("groups", "texts", "pictures", "tables", "key_value_items", "form_items")
+_ITEM_REF = re.compile(r"^#/(\w+)/(\d+)$")
+_REGIONS = ("body", "furniture")
+
+
+def merge_docling_payloads(payloads: Sequence[dict[str, Any]]) -> dict[str, Any]:
+    # Page-range conversions are exported separately; item references ("#/texts/3") of every
+    # later part are shifted past the items already merged so the result reads as one document.
+    merged = copy.deepcopy(payloads[0])
+    for payload in payloads[1:]:
+        offsets = {name: len(merged.get(name) or []) for name in _ITEM_COLLECTIONS}
+        shifted = _shift_refs(payload, offsets)
+        for name in _ITEM_COLLECTIONS:
+            if shifted.get(name):
+                merged.setdefault(name, []).extend(shifted[name])
+        for region in ("body", "furniture"):
+            children = (shifted.get(region) or {}).get("children")
+            if children:
+                merged.setdefault(region, {}).setdefault("children", []).extend(children)
+        pages = shifted.get("pages")
+        if isinstance(pages, dict):
+            merged.setdefault("pages", {}).update(pages)
+        if isinstance(merged.get("content"), str) and isinstance(shifted.get("content"), str):
+            merged["content"] = f"{merged['content']}\n\n{shifted['content']}"
+    return merged
+
+
+def write_merged_docling_payloads(payloads: Iterable[dict[str, Any]], sink: BinaryIO) -> None:
+    # Streaming twin of merge_docling_payloads: parts are consumed one at a time and their items
+    # spooled to temporary files, so memory never holds more than a single part.
+    head: dict[str, Any] = {}
+    regions: dict[str, dict[str, Any]] = {}
+    keys: list[str] = []
+    offsets = dict.fromkeys(_ITEM_COLLECTIONS, 0)
+    with ExitStack() as stack:
+        spools: dict[str, _Spool] = {}
+
+        def spool(name: str) -> "_Spool":
+            if name not in spools:
+                spools[name] = _Spool(stack.enter_context(tempfile.TemporaryFile()))
+            return spools[name]
+
+        for index, payload in enumerate(payloads):
+            shifted = _shift_refs(payload, offsets) if index else payload
+            if not index:
+                keys = list(payload)
+                head = {key: value for key, value in payload.items() if key not in (*_ITEM_COLLECTIONS, *_REGIONS)}
+                regions = {
+                    region: payload[region] for region in _REGIONS if isinstance(payload.get(region), dict)
+                }
+                for name in _ITEM_COLLECTIONS:
+                    if isinstance(payload.get(name), list):
+                        spool(name)
+            elif isinstance(head.get("content"), str) and isinstance(shifted.get("content"), str):
+                head["content"] = f"{head['content']}\n\n{shifted['content']}"
+            for name in _ITEM_COLLECTIONS:
+                items = shifted.get(name) or []
+                for item in items:
+                    spool(name).append(_dumps(item))
+                offsets[name] += len(items)
+            for region in _REGIONS:
+                children = (shifted.get(region) or {}).get("children")
+                if children or (not index and region in regions and "children" in regions[region]):
+                    target = spool(region)
+                    for child in children or []:
+                        target.append(_dumps(child))
+            pages = shifted.get("pages")
+            if isinstance(pages, dict):
+                target = spool("pages")
+                for key, page in pages.items():
+                    target.append(_dumps(str(key)) + b":" + _dumps(page))
+            del payload, shifted
+
+        keys.extend(name for name in spools if name not in keys)
+        sink.write(b"{")
+        for index, key in enumerate(keys):
+            if index:
+                sink.write(b",")
+            sink.write(_dumps(key) + b":")
+            if key in _ITEM_COLLECTIONS:
+                spools[key].copy_to(sink, b"[", b"]")
+            elif key in _REGIONS:
+                fields = {name: value for name, value in regions.get(key, {}).items() if name != "children"}
+                sink.write(_dumps(fields)[:-1])
+                if key in spools:
+                    spools[key].copy_to(sink, b',"children":[' if fields else b'"children":[', b"]")
+                sink.write(b"}")
+            elif key == "pages" and key in spools:
+                spools[key].copy_to(sink, b"{", b"}")
+            else:
+                sink.write(_dumps(head[key]))
+        sink.write(b"}")
+
+
+class _Spool:
+    def __init__(self, handle: IO[bytes]) -> None:
+        self._handle = handle
+        self._count = 0
+
+    def append(self, fragment: bytes) -> None:
+        self._handle.write(b"," + fragment if self._count else fragment)
+        self._count += 1
+
+    def copy_to(self, sink: BinaryIO, opening: bytes, closing: bytes) -> None:
+        sink.write(opening)
+        self._handle.seek(0)
+        shutil.copyfileobj(self._handle, sink)
+        sink.write(closing)
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _shift_refs(value: Any, offsets: dict[str, int]) -> Any:
+    if isinstance(value, dict):
+        return {key: _shift_refs(item, offsets) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_shift_refs(item, offsets) for item in value]
+    if isinstance(value, str):
+        match = _ITEM_REF.match(value)
+        if match is not None and match.group(1) in offsets:
+            return f"#/{match.group(1)}/{int(match.group(2)) + offsets[match.group(1)]}"
+    return value
+
+
+def replace_docling_pages(
+    payload: dict[str, Any],
+    replacements: Sequence[dict[str, Any]],
+    *,
+    page_numbers: set[int],
+) -> dict[str, Any]:
+    # Items that only sit on replaced pages are dropped and the survivors renumbered, so the
+    # replacement parts can be appended like any other page range.
+    kept: dict[str, dict[int, int]] = {}
+    trimmed = dict(payload)
+    for name in _ITEM_COLLECTIONS:
+        items = payload.get(name)
+        if not isinstance(items, list):
+            continue
+        kept[name] = {}
+        for index, item in enumerate(items):
+            if not _only_on_pages(item, page_numbers):
+                kept[name][index] = len(kept[name])
+        trimmed[name] = [item for index, item in enumerate(items) if index in kept[name]]
+    trimmed = _renumber_refs(trimmed, kept)
+    if isinstance(trimmed.get("pages"), dict):
+        trimmed["pages"] = {key: page for key, page in trimmed["pages"].items() if int(key) not in page_numbers}
+    return merge_docling_payloads([trimmed, *replacements])
+
+
+def _only_on_pages(item: Any, page_numbers: set[int]) -> bool:
+    provenance = item.get("prov") if isinstance(item, dict) else None
+    if not provenance:
+        return False
+    return all(isinstance(entry, dict) and entry.get("page_no") in page_numbers for entry in provenance)
+
+
+def _renumber_refs(value: Any, kept: dict[str, dict[int, int]]) -> Any:
+    if isinstance(value, dict):
+        return {key: _renumber_refs(item, kept) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_renumber_refs(item, kept) for item in value if not _is_dropped_ref(item, kept)]
+    if isinstance(value, str):
+        match = _ITEM_REF.match(value)
+        if match is not None and match.group(1) in kept:
+            index = kept[match.group(1)].get(int(match.group(2)))
+            if index is not None:
+                return f"#/{match.group(1)}/{index}"
+    return value
+
+
+def _is_dropped_ref(value: Any, kept: dict[str, dict[int, int]]) -> bool:
+    if not isinstance(value, dict) or not isinstance(value.get("$ref"), str):
+        return False
+    match = _ITEM_REF.match(value["$ref"])
+    return match is not None and match.group(1) in kept and int(match.group(2)) not in kept[match.group(1)]
+
+
+class DoclingPayloadMerger:
+    @property
+    def extension_key(self) -> str:
+        return "docling"
+
+    def replace_pages(
+        self,
+        payload: dict[str, Any],
+        replacements: Sequence[dict[str, Any]],
+        *,
+        page_numbers: set[int],
+    ) -> dict[str, Any]:
+        return replace_docling_pages(payload, replacements, page_numbers=page_numbers)
@@ -0,0 +1,137 @@
+import gzip
+import json
+import os
+import secrets
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from app.domain.models.document_pipeline import IngestionResult, PayloadRef, ProcessingReport
+from app.domain.services.artifact_store import ArtifactStore
+from app.infrastructure.storage.canonical_document_codec import (
+    decode_canonical_document,
+    encode_canonical_document,
+    payload_refs,
+)
+
+
+class LocalIngestionCache:
+    def __init__(
+        self,
+        base_dir: str | Path,
+        *,
+        max_age_days: int = 30,
+        artifact_store: ArtifactStore | None = None,
+    ) -> None:
+        self._base_dir = Path(base_dir)
+        self._base_dir.mkdir(parents=True, exist_ok=True)
+        self._max_age_seconds = max(0, max_age_days) * 86400
+        self._artifact_store = artifact_store
+
+    def get(self, key: str) -> IngestionResult | None:
+        path = self._path_for(key)
+        try:
+            payload = self._read(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, EOFError, ValueError):
+            # A truncated or corrupt entry is treated as a miss and rewritten by the next ingestion.
+            path.unlink(missing_ok=True)
+            return None
+
+        try:
+            result = IngestionResult(
+                canonical_document=decode_canonical_document(payload["canonical_document"]),
+                report=ProcessingReport(**payload["report"]),
+            )
+            # The entry keeps its own reference; the caller gets another one and releases it when done.
+            self._retain(list(payload_refs(result.canonical_document.extensions)))
+        except (KeyError, TypeError, FileNotFoundError):
+            # Stale layouts and entries whose stored engine payload is gone are dropped as misses.
+            self._drop(path, payload)
+            return None
+        return result
+
+    def put(self, key: str, result: IngestionResult) -> None:
+        path = self._path_for(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        refs = list(payload_refs(result.canonical_document.extensions))
+        self._retain(refs)
+        payload = {
+            "canonical_document": encode_canonical_document(result.canonical_document),
+            "report": asdict(result.report),
+        }
+        temp_path = path.with_name(f".{path.name}.{secrets.token_hex(4)}.tmp")
+        stored = False
+        try:
+            with gzip.open(temp_path, "wt", encoding="utf-8", compresslevel=6) as handle:
+                json.dump(payload, handle, ensure_ascii=False)
+            # Linking never replaces an entry, so the references held by a concurrent writer's entry stay counted.
+            os.link(temp_path, path)
+            stored = True
+        except FileExistsError:
+            pass
+        finally:
+            temp_path.unlink(missing_ok=True)
+            if not stored:
+                self._release(refs)
+
+    def purge_expired(self, *, now: float | None = None) -> int:
+        if self._max_age_seconds <= 0:
+            return 0
+        cutoff = (now if now is not None else time.time()) - self._max_age_seconds
+        removed = 0
+        for path in self._base_dir.glob("*/*.json.gz"):
+            try:
+                if path.stat().st_mtime >= cutoff:
+                    continue
+                payload = self._read(path)
+            except FileNotFoundError:
+                continue
+            except (OSError, EOFError, ValueError):
+                payload = None
+            if self._drop(path, payload):
+                removed += 1
+        return removed
+
+    def _read(self, path: Path) -> Any:
+        with gzip.open(path, "rt", encoding="utf-8") as handle:
+            return json.load(handle)
+
+    def _drop(self, path: Path, payload: Any) -> bool:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            # Someone else dropped the entry and released its references.
+            return False
+        try:
+            document = decode_canonical_document(payload["canonical_document"], payload_exists=lambda _: True)
+        except (KeyError, TypeError):
+            return True
+        self._release(list(payload_refs(document.extensions)))
+        return True
+
+    def _retain(self, refs: list[PayloadRef]) -> None:
+        if self._artifact_store is None:
+            return
+        retained: list[PayloadRef] = []
+        try:
+            for ref in refs:
+                self._artifact_store.retain_payload(ref)
+                retained.append(ref)
+        except FileNotFoundError:
+            self._release(retained)
+            raise
+
+    def _release(self, refs: list[PayloadRef]) -> None:
+        if self._artifact_store is None:
+            return
+        for ref in refs:
+            try:
+                self._artifact_store.delete_payload(ref)
+            except FileNotFoundError:
+                continue
+
+    def _path_for(self, key: str) -> Path:
+        return self._base_dir / key[:2] / f"{key}.json.gz"
@@ -0,0 +1,184 @@
+import contextvars
+import json
+from collections.abc import Callable, Iterator
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from dataclasses import replace
+from pathlib import Path
+from typing import Any
+
+from app.application.errors import IngestionFailedError
+from app.core.telemetry import start_span
+from app.domain.models.document_pipeline import (
+    CanonicalDocument,
+    IngestionPolicy,
+    IngestionResult,
+    InputDocument,
+    PayloadRef,
+    ProcessingReport,
+)
+from app.domain.services.artifact_store import ArtifactStore
+from app.domain.services.document_ingestor import DocumentIngestor
+from app.infrastructure.ingestion.docling_payload import merge_docling_payloads, write_merged_docling_payloads
+
+PageCounter = Callable[[Path], int | None]
+
+
+class PageParallelDocumentIngestor:
+    def __init__(
+        self,
+        *,
+        delegate: DocumentIngestor,
+        max_parallel: int = 2,
+        min_pages: int = 4,
+        page_counter: PageCounter | None = None,
+        artifact_store: ArtifactStore | None = None,
+    ) -> None:
+        self._delegate = delegate
+        self._max_parallel = max(1, max_parallel)
+        self._min_pages = max(2, min_pages)
+        self._page_counter = page_counter or count_pdf_pages
+        self._artifact_store = artifact_store
+        self._executor = ThreadPoolExecutor(max_workers=self._max_parallel, thread_name_prefix="page-ingestion")
+
+    def supports(self, media_type: str) -> bool:
+        return self._delegate.supports(media_type)
+
+    def ingest(self, document: InputDocument, *, policy: IngestionPolicy | None = None) -> IngestionResult:
+        page_ranges = self._plan(document)
+        if len(page_ranges) < 2:
+            return self._delegate.ingest(document, policy=policy)
+
+        attributes = {"pages": page_ranges[-1][1], "chunks": len(page_ranges)}
+        with start_span("ingestion.page_parallel", attributes=attributes):
+            # Each chunk runs in a copy of this context so its spans stay under this one.
+            futures = [
+                self._executor.submit(
+                    contextvars.copy_context().run,
+                    self._delegate.ingest,
+                    replace(document, page_range=page_range),
+                    policy=policy,
+                )
+                for page_range in page_ranges
+            ]
+            done, pending = wait(futures, return_when=FIRST_EXCEPTION)
+            failure = next((future.exception() for future in futures if future in done and future.exception()), None)
+            if failure is not None:
+                for future in pending:
+                    future.cancel()
+                wait(futures)
+                self._release(
+                    [future.result() for future in futures if not future.cancelled() and future.exception() is None]
+                )
+                raise failure
+            parts = [future.result() for future in futures]
+        return self._merge(document, parts)
+
+    def _plan(self, document: InputDocument) -> list[tuple[int, int]]:
+        if document.media_type != "application/pdf" or document.page_range is not None or self._max_parallel < 2:
+            return []
+        page_count = self._page_counter(document.source_path)
+        if page_count is None or page_count < self._min_pages:
+            return []
+        chunks = min(self._max_parallel, page_count)
+        size, extra = divmod(page_count, chunks)
+        ranges = []
+        start = 1
+        for index in range(chunks):
+            end = start + size - 1 + (1 if index < extra else 0)
+            ranges.append((start, end))
+            start = end + 1
+        return ranges
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def _merge(self, document: InputDocument, parts: list[IngestionResult]) -> IngestionResult:
+        first = parts[0]
+        extensions = dict(first.canonical_document.extensions)
+        payloads = [part.canonical_document.extensions.get("docling") for part in parts]
+        if all(isinstance(payload, dict) for payload in payloads):
+            extensions["docling"] = merge_docling_payloads(payloads)
+        elif any(payload is not None for payload in payloads):
+            extensions["docling"] = self._merge_stored_payloads(document, parts, payloads)
+
+        warnings: list[str] = []
+        for part in parts:
+            warnings.extend(warning for warning in part.report.warnings if warning not in warnings)
+
+        return IngestionResult(
+            canonical_document=CanonicalDocument(
+                schema_version=first.canonical_document.schema_version,
+                source_media_type=first.canonical_document.source_media_type,
+                text="\n\n".join(part.canonical_document.text.strip("\n") for part in parts),
+                metadata=dict(first.canonical_document.metadata),
+                extensions=extensions,
+                pages=[page for part in parts for page in part.canonical_document.pages],
+            ),
+            report=ProcessingReport(
+                engine_name=first.report.engine_name,
+                engine_version=first.report.engine_version,
+                warnings=warnings,
+            ),
+        )
+
+    def _merge_stored_payloads(
+        self, document: InputDocument, parts: list[IngestionResult], payloads: list[Any]
+    ) -> PayloadRef:
+        store = self._artifact_store
+        if store is None or not all(isinstance(payload, dict | PayloadRef) for payload in payloads):
+            self._release(parts)
+            raise IngestionFailedError(
+                f"Page chunks of {document.original_name} returned Docling payloads that cannot be merged"
+            )
+
+        saved: list[PayloadRef] = []
+        try:
+            # Inline chunks are stored too, so the merge streams every part the same way.
+            for payload in payloads:
+                if isinstance(payload, dict):
+                    saved.append(store.save_payload(source_document=document, payload=payload))
+        except BaseException:
+            self._release(parts)
+            for ref in saved:
+                store.delete_payload(ref)
+            raise
+        stored = iter(saved)
+        refs = [payload if isinstance(payload, PayloadRef) else next(stored) for payload in payloads]
+
+        def chunks() -> Iterator[dict[str, Any]]:
+            for ref in refs:
+                with store.open_payload(ref) as handle:
+                    yield json.load(handle)
+
+        try:
+            return store.save_payload_stream(
+                source_document=document,
+                write=lambda sink: write_merged_docling_payloads(chunks(), sink),
+            )
+        finally:
+            for ref in refs:
+                store.delete_payload(ref)
+
+    def _release(self, parts: list[IngestionResult]) -> None:
+        if self._artifact_store is None:
+            return
+        for part in parts:
+            payload = part.canonical_document.extensions.get("docling")
+            if isinstance(payload, PayloadRef):
+                self._artifact_store.delete_payload(payload)
+
+
+def count_pdf_pages(path: Path) -> int | None:
+    try:
+        import pypdfium2
+    except ImportError:
+        return None
+    try:
+        pdf = pypdfium2.PdfDocument(str(path))
+    except Exception:
+        # Unreadable PDFs go through the regular single conversion, which reports the real error.
+        return None
+    try:
+        return len(pdf)
+    finally:
+        pdf.close()
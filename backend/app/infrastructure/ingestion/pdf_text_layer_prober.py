@@ -0,0 +1,54 @@
+from app.domain.models.document_pipeline import DocumentProbe, InputDocument
+
+
+class PdfTextLayerProber:
+    def __init__(self, *, min_chars_per_page: int = 16, max_pages: int = 50) -> None:
+        self._min_chars_per_page = min_chars_per_page
+        self._max_pages = max_pages
+
+    def probe(self, document: InputDocument) -> DocumentProbe | None:
+        if document.media_type != "application/pdf":
+            return None
+        try:
+            import pypdfium2
+            import pypdfium2.raw as pdfium_c
+        except ImportError:
+            return None
+
+        try:
+            pdf = pypdfium2.PdfDocument(str(document.source_path))
+        except Exception:
+            return None
+        try:
+            page_count = len(pdf)
+            pages_without_text = 0
+            pages_with_images = 0
+            text_chars = 0
+            # Only the text layer and object list are read; nothing is rasterised.
+            for index in range(min(page_count, self._max_pages)):
+                page = pdf[index]
+                try:
+                    textpage = page.get_textpage()
+                    try:
+                        chars = len(textpage.get_text_range().strip())
+                    finally:
+                        textpage.close()
+                    has_image = any(True for _ in page.get_objects(filter=(pdfium_c.FPDF_PAGEOBJ_IMAGE,), max_depth=1))
+                finally:
+                    page.close()
+                text_chars += chars
+                if chars < self._min_chars_per_page:
+                    pages_without_text += 1
+                if has_image:
+                    pages_with_images += 1
+        except Exception:
+            return None
+        finally:
+            pdf.close()
+
+        return DocumentProbe(
+            page_count=min(page_count, self._max_pages),
+            pages_without_text=pages_without_text,
+            pages_with_images=pages_with_images,
+            text_chars=text_chars,
+        )
@@ -0,0 +1,216 @@
+import multiprocessing
+import os
+import threading
+from collections.abc import Callable
+from contextlib import nullcontext
+from multiprocessing.connection import Connection
+from multiprocessing.process import BaseProcess
+
+from app.application.errors import IngestionFailedError
+from app.core.metrics import INGESTION_WORKER_RECYCLES, registry
+from app.core.telemetry import (
+    CORRELATION_ATTRIBUTES,
+    Span,
+    configure_span_exporter,
+    continue_trace,
+    current_span,
+    export_span,
+)
+from app.domain.models.document_pipeline import IngestionPolicy, IngestionResult, InputDocument
+from app.domain.services.document_ingestor import DocumentIngestor
+
+IngestorFactory = Callable[[], DocumentIngestor]
+_TraceContext = tuple[str, str, dict[str, object]]
+
+
+class _CollectingExporter:
+    def __init__(self) -> None:
+        self.spans: list[Span] = []
+
+    def export(self, span: Span) -> None:
+        self.spans.append(span)
+
+
+class _Worker:
+    def __init__(self, process: BaseProcess, connection: Connection) -> None:
+        self.process = process
+        self.connection = connection
+        self.completed_tasks = 0
+
+    def stop(self, *, graceful: bool) -> None:
+        if graceful:
+            try:
+                self.connection.send(None)
+            except (OSError, ValueError):
+                pass
+            self.process.join(2)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join(2)
+        self.connection.close()
+
+
+class ProcessPoolDocumentIngestor:
+    def __init__(
+        self,
+        *,
+        ingestor_factory: IngestorFactory,
+        local_ingestor: DocumentIngestor,
+        max_workers: int = 2,
+        task_timeout_seconds: float = 180.0,
+        max_tasks_per_worker: int = 100,
+        max_worker_rss_bytes: int | None = None,
+        start_method: str = "spawn",
+    ) -> None:
+        self._ingestor_factory = ingestor_factory
+        # Only answers supports() in the API process; conversions run in the workers.
+        self._local_ingestor = local_ingestor
+        self._max_workers = max(1, max_workers)
+        self._task_timeout_seconds = task_timeout_seconds
+        self._max_tasks_per_worker = max(1, max_tasks_per_worker)
+        self._max_worker_rss_bytes = max_worker_rss_bytes
+        self._context = multiprocessing.get_context(start_method)
+        self._slots = threading.BoundedSemaphore(self._max_workers)
+        self._idle: list[_Worker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def supports(self, media_type: str) -> bool:
+        return self._local_ingestor.supports(media_type)
+
+    def start(self) -> None:
+        with self._lock:
+            self._closed = False
+            while len(self._idle) < self._max_workers:
+                self._idle.append(self._spawn())
+
+    def close(self) -> None:
+        with self._lock:
+            self._closed = True
+            workers, self._idle = self._idle, []
+        for worker in workers:
+            worker.stop(graceful=True)
+
+    def ingest(self, document: InputDocument, *, policy: IngestionPolicy | None = None) -> IngestionResult:
+        if not self._slots.acquire(timeout=self._task_timeout_seconds):
+            raise IngestionFailedError("All ingestion workers are busy")
+        try:
+            worker = self._checkout()
+            try:
+                worker.connection.send((document, policy, _trace_context()))
+                if not worker.connection.poll(self._task_timeout_seconds):
+                    self._discard(worker, reason="timeout")
+                    raise IngestionFailedError(
+                        f"Ingestion timed out after {self._task_timeout_seconds:g}s for {document.original_name}"
+                    )
+                status, payload, rss_bytes, metric_changes, spans = worker.connection.recv()
+            except (EOFError, OSError) as exc:
+                self._discard(worker, reason="crash")
+                raise IngestionFailedError(f"Ingestion worker crashed while processing {document.original_name}") from exc
+
+            # Workers export nothing themselves: their metrics and spans are replayed here, in the request's process.
+            registry.merge(metric_changes)
+            for span in spans:
+                export_span(span)
+            worker.completed_tasks += 1
+            self._release(worker, rss_bytes=rss_bytes)
+            if status == "error":
+                raise IngestionFailedError(str(payload))
+            return payload
+        finally:
+            self._slots.release()
+
+    def _checkout(self) -> _Worker:
+        with self._lock:
+            if self._closed:
+                raise IngestionFailedError("Ingestion worker pool is shut down")
+            while self._idle:
+                worker = self._idle.pop()
+                if worker.process.is_alive():
+                    return worker
+                worker.stop(graceful=False)
+                INGESTION_WORKER_RECYCLES.inc(reason="crash")
+            return self._spawn()
+
+    def _release(self, worker: _Worker, *, rss_bytes: int) -> None:
+        reason = None
+        if worker.completed_tasks >= self._max_tasks_per_worker:
+            reason = "max_tasks"
+        elif self._max_worker_rss_bytes and rss_bytes > self._max_worker_rss_bytes:
+            reason = "rss"
+
+        if reason is None:
+            with self._lock:
+                if not self._closed:
+                    self._idle.append(worker)
+                    return
+            worker.stop(graceful=True)
+            return
+
+        worker.stop(graceful=True)
+        INGESTION_WORKER_RECYCLES.inc(reason=reason)
+        self._replace()
+
+    def _discard(self, worker: _Worker, *, reason: str) -> None:
+        worker.stop(graceful=False)
+        INGESTION_WORKER_RECYCLES.inc(reason=reason)
+        self._replace()
+
+    def _replace(self) -> None:
+        # Replacements start (and warm their converters) before the next request needs them.
+        with self._lock:
+            if not self._closed:
+                self._idle.append(self._spawn())
+
+    def _spawn(self) -> _Worker:
+        parent_connection, child_connection = self._context.Pipe()
+        process = self._context.Process(
+            target=_worker_main,
+            args=(child_connection, self._ingestor_factory),
+            name="ingestion-worker",
+            daemon=True,
+        )
+        process.start()
+        child_connection.close()
+        return _Worker(process, parent_connection)
+
+
+def _worker_main(connection: Connection, ingestor_factory: IngestorFactory) -> None:
+    exporter = _CollectingExporter()
+    configure_span_exporter(exporter)
+    ingestor = ingestor_factory()
+    while True:
+        try:
+            task = connection.recv()
+        except (EOFError, OSError):
+            return
+        if task is None:
+            return
+        document, policy, trace = task
+        metrics_before = registry.snapshot()
+        exporter.spans = []
+        try:
+            with continue_trace(*trace[:2], attributes=trace[2]) if trace is not None else nullcontext():
+                result = ingestor.ingest(document, policy=policy)
+            status, payload = "ok", result
+        except Exception as exc:
+            status, payload = "error", f"{type(exc).__name__}: {exc}"
+        connection.send((status, payload, _current_rss_bytes(), registry.changes_since(metrics_before), exporter.spans))
+
+
+def _trace_context() -> _TraceContext | None:
+    span = current_span()
+    if span is None:
+        return None
+    correlation = {key: span.attributes[key] for key in CORRELATION_ATTRIBUTES if key in span.attributes}
+    return span.trace_id, span.span_id, correlation
+
+
+def _current_rss_bytes() -> int:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        import resource
+
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
@@ -5,6 +5,8 @@ from typing import Any, TypedDict
 from uuid import uuid4
 
 from app.application.errors import CvGenerationExecutionError, PromptResolutionError
+from app.core.metrics import LLM_STAGE_DURATION, LLM_STAGE_ERRORS
+from app.core.telemetry import set_correlation, start_span
 from app.domain.models.cv_generation import CvGenerationResult, OrientationDecision, StageExecutionTrace
 from app.domain.services.cv_generation_orchestrator import CvGenerationOrchestrator
 from app.domain.services.llm_gateway import LLMGateway, LLMRequest
@@ -23,6 +25,7 @@ except ImportError as exc:  # pragma: no cover - explicit runtime failure path
 
 class CvGenerationState(TypedDict):
     run_id: str
+    user_id: str | None
     graph_id: str
     graph_version: str
     cv_text: str
@@ -55,11 +58,13 @@ class LangGraphCvGenerationOrchestrator(CvGenerationOrchestrator):
         cv_text: str,
         job_description: str,
         graph_id: str | None = None,
+        user_id: str | None = None,
     ) -> CvGenerationResult:
         definition = self._config.resolve_graph(graph_id)
         run_id = str(uuid4())
         initial_state: CvGenerationState = {
             "run_id": run_id,
+            "user_id": user_id,
             "graph_id": definition.graph_id,
             "graph_version": definition.version,
             "cv_text": cv_text,
@@ -77,7 +82,12 @@ class LangGraphCvGenerationOrchestrator(CvGenerationOrchestrator):
         }
 
         graph = self._get_or_compile_graph(definition)
-        final_state = graph.invoke(initial_state)
+        set_correlation("run_id", run_id)
+        with start_span(
+            "cv_generation.run",
+            attributes={"run_id": run_id, "graph_id": definition.graph_id, "graph_version": definition.version},
+        ):
+            final_state = graph.invoke(initial_state)
 
         final_stage_id = definition.final_stage_id or definition.stages[-1].stage_id
         final_cv = final_state["stage_outputs"].get(final_stage_id, final_state["latest_cv"])
@@ -164,6 +174,7 @@ class LangGraphCvGenerationOrchestrator(CvGenerationOrchestrator):
         self._trace_store.record(
             TraceEvent(
                 run_id=state["run_id"],
+                user_id=state["user_id"],
                 stage=stage.stage_id,
                 event="stage_started",
                 timestamp=started_at,
@@ -182,29 +193,51 @@ class LangGraphCvGenerationOrchestrator(CvGenerationOrchestrator):
         )
 
         try:
-            output = self._llm_gateway.generate(
-                LLMRequest(
-                    stage=stage.stage_id,
-                    provider=profile.provider,
-                    model=profile.model,
-                    prompt=rendered_prompt,
-                    temperature=profile.temperature,
-                    max_tokens=profile.max_tokens,
-                    timeout_seconds=provider.timeout_seconds,
+            with start_span(
+                "cv_generation.stage",
+                attributes={
+                    "run_id": state["run_id"],
+                    "stage": stage.stage_id,
+                    "llm_provider": profile.provider,
+                    "llm_model": profile.model,
+                    "prompt_hash": prompt.sha256,
+                },
+            ):
+                output = self._llm_gateway.generate(
+                    LLMRequest(
+                        stage=stage.stage_id,
+                        provider=profile.provider,
+                        model=profile.model,
+                        prompt=rendered_prompt,
+                        temperature=profile.temperature,
+                        max_tokens=profile.max_tokens,
+                        timeout_seconds=provider.timeout_seconds,
+                    )
                 )
-            )
         except Exception as exc:
             ended_at = _utc_now()
             duration_ms = int((ended_at - started_at).total_seconds() * 1000)
+            LLM_STAGE_DURATION.observe(
+                duration_ms / 1000,
+                provider=profile.provider,
+                model=profile.model,
+                stage=stage.stage_id,
+                status="error",
+            )
+            LLM_STAGE_ERRORS.inc(provider=profile.provider, model=profile.model, stage=stage.stage_id)
             self._trace_store.record(
                 TraceEvent(
                     run_id=state["run_id"],
+                    user_id=state["user_id"],
                     stage=stage.stage_id,
                     event="stage_failed",
                     timestamp=ended_at,
                     payload={
                         "graph_id": definition.graph_id,
                         "graph_version": definition.version,
+                        "prompt_hash": prompt.sha256,
+                        "llm_provider": profile.provider,
+                        "llm_model": profile.model,
                         "error": str(exc),
                         "duration_ms": duration_ms,
                     },
@@ -216,16 +249,27 @@ class LangGraphCvGenerationOrchestrator(CvGenerationOrchestrator):
 
         ended_at = _utc_now()
         duration_ms = int((ended_at - started_at).total_seconds() * 1000)
+        LLM_STAGE_DURATION.observe(
+            duration_ms / 1000,
+            provider=profile.provider,
+            model=profile.model,
+            stage=stage.stage_id,
+            status="success",
+        )
 
         self._trace_store.record(
             TraceEvent(
                 run_id=state["run_id"],
+                user_id=state["user_id"],
                 stage=stage.stage_id,
                 event="stage_completed",
                 timestamp=ended_at,
                 payload={
                     "graph_id": definition.graph_id,
                     "graph_version": definition.version,
+                    "prompt_hash": prompt.sha256,
+                    "llm_provider": profile.provider,
+                    "llm_model": profile.model,
                     "duration_ms": duration_ms,
                     "output_chars": len(output),
                 },
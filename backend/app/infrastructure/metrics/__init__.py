@@ -0,0 +1,3 @@
+from app.infrastructure.metrics.multiprocess_metrics_store import MultiprocessMetricsStore
+
+__all__ = ["MultiprocessMetricsStore"]
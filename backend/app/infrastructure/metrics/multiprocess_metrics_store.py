@@ -0,0 +1,46 @@
+import json
+import os
+from pathlib import Path
+from uuid import uuid4
+
+from app.core.metrics import MetricsRegistry
+
+
+class MultiprocessMetricsStore:
+    def __init__(self, directory: str | Path, *, registry: MetricsRegistry) -> None:
+        self._directory = Path(directory)
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._registry = registry
+        self._pid = os.getpid()
+        # The suffix keeps a recycled pid from overwriting an exited worker's totals.
+        self._path = self._directory / f"{self._pid}-{uuid4().hex[:8]}.json"
+
+    def flush(self) -> None:
+        payload = json.dumps({"pid": self._pid, "metrics": self._registry.snapshot()})
+        temp_path = self._path.with_suffix(".tmp")
+        temp_path.write_text(payload, encoding="utf-8")
+        os.replace(temp_path, self._path)
+
+    def render(self) -> str:
+        self.flush()
+        snapshots = []
+        for path in sorted(self._directory.glob("*.json")):
+            try:
+                data = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+            pid = int(data.get("pid", 0))
+            snapshots.append((data.get("metrics", {}), pid == self._pid or _is_alive(pid)))
+        return self._registry.render(snapshots)
+
+
+def _is_alive(pid: int) -> bool:
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
@@ -1,3 +1,3 @@
-from app.infrastructure.persistence.models import GroundSourceORM, RefreshSessionORM, UserORM
+from app.infrastructure.persistence.models import GroundSourceORM, RefreshSessionORM, TraceEventORM, UserORM
 
-__all__ = ["UserORM", "RefreshSessionORM", "GroundSourceORM"]
+__all__ = ["UserORM", "RefreshSessionORM", "GroundSourceORM", "TraceEventORM"]
@@ -1,7 +1,9 @@
 from datetime import datetime, timezone
+from typing import Any
 from uuid import uuid4
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, String, Text
+from sqlalchemy import JSON, BigInteger, Boolean, DateTime, ForeignKey, Index, Integer, String, Text, UniqueConstraint
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.core.database import Base
@@ -38,9 +40,13 @@ class RefreshSessionORM(Base):
 
 class GroundSourceORM(Base):
     __tablename__ = "ground_sources"
+    __table_args__ = (
+        Index("ix_ground_sources_user_id_created_at_id", "user_id", "created_at", "id"),
+        Index("ix_ground_sources_user_id_source_sha256", "user_id", "source_sha256"),
+    )
 
     id: Mapped[str] = mapped_column(String(36), primary_key=True, default=lambda: str(uuid4()))
-    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    user_id: Mapped[str] = mapped_column(String(36), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     name: Mapped[str] = mapped_column(String(120), nullable=False)
     original_filename: Mapped[str] = mapped_column(String(255), nullable=False)
     content_type: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -48,5 +54,60 @@ class GroundSourceORM(Base):
     storage_path: Mapped[str] = mapped_column(Text, nullable=False)
     canonical_text: Mapped[str] = mapped_column(Text, nullable=False)
     content_hash: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
+    source_sha256: Mapped[str | None] = mapped_column(String(64), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_utc_now)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_utc_now, onupdate=_utc_now)
+
+
+class TraceEventORM(Base):
+    __tablename__ = "trace_events"
+    __table_args__ = (
+        Index("ix_trace_events_run_id_timestamp", "run_id", "timestamp"),
+        Index("ix_trace_events_user_id_timestamp", "user_id", "timestamp"),
+        Index("ix_trace_events_stage_event_timestamp", "stage", "event", "timestamp"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    run_id: Mapped[str] = mapped_column(String(36), nullable=False)
+    user_id: Mapped[str | None] = mapped_column(String(36), nullable=True)
+    stage: Mapped[str] = mapped_column(String(120), nullable=False)
+    event: Mapped[str] = mapped_column(String(64), nullable=False)
+    timestamp: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    payload: Mapped[dict[str, Any]] = mapped_column(JSON().with_variant(JSONB(), "postgresql"), nullable=False, default=dict)
+
+
+class TraceStageRollupORM(Base):
+    __tablename__ = "trace_stage_rollups"
+    __table_args__ = (
+        UniqueConstraint(
+            "window_start",
+            "graph_id",
+            "graph_version",
+            "stage",
+            "llm_model",
+            "prompt_hash",
+            name="uq_trace_stage_rollups_key",
+        ),
+        Index("ix_trace_stage_rollups_graph_id_window_start", "graph_id", "window_start"),
+    )
+
+    id: Mapped[int] = mapped_column(BigInteger().with_variant(Integer, "sqlite"), primary_key=True, autoincrement=True)
+    window_start: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+    graph_id: Mapped[str] = mapped_column(String(120), nullable=False)
+    graph_version: Mapped[str] = mapped_column(String(64), nullable=False)
+    stage: Mapped[str] = mapped_column(String(120), nullable=False)
+    llm_model: Mapped[str] = mapped_column(String(255), nullable=False)
+    prompt_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    completed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    failed_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    duration_ms_total: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    latency_histogram: Mapped[list[int]] = mapped_column(JSON, nullable=False, default=list)
+    output_chars_histogram: Mapped[list[int]] = mapped_column(JSON, nullable=False, default=list)
+
+
+class TraceRollupStateORM(Base):
+    __tablename__ = "trace_rollup_state"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    last_event_id: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, default=_utc_now, onupdate=_utc_now)
@@ -1,5 +1,6 @@
+from app.infrastructure.rendering.compact_document_renderer import CompactDocumentRenderer, load_compact_document
 from app.infrastructure.rendering.json_renderer import JsonRenderer
 from app.infrastructure.rendering.markdown_renderer import MarkdownRenderer
 from app.infrastructure.rendering.markdown_pdf_exporter import MarkdownPdfExporter
 
-__all__ = ["JsonRenderer", "MarkdownRenderer", "MarkdownPdfExporter"]
+__all__ = ["CompactDocumentRenderer", "JsonRenderer", "MarkdownRenderer", "MarkdownPdfExporter", "load_compact_document"]
@@ -0,0 +1,95 @@
+import io
+import json
+import zlib
+from typing import Any, BinaryIO
+
+import msgpack
+
+from app.domain.models.document_pipeline import CanonicalDocument, DocumentPage, PayloadRef
+from app.domain.services.artifact_store import ArtifactStore
+
+MAGIC = b"CDOC"
+FORMAT_VERSION = 1
+_FLAG_ZLIB = 0x01
+
+
+class CompactDocumentRenderer:
+    def __init__(self, *, artifact_store: ArtifactStore | None = None, compress: bool = False) -> None:
+        self._artifact_store = artifact_store
+        self._compress = compress
+
+    @property
+    def output_format(self) -> str:
+        return "cdoc"
+
+    @property
+    def media_type(self) -> str:
+        return "application/vnd.cv-optimizer.cdoc"
+
+    def render_bytes(self, document: CanonicalDocument) -> bytes:
+        sink = io.BytesIO()
+        self.render_to(document, sink)
+        return sink.getvalue()
+
+    def render_to(self, document: CanonicalDocument, sink: BinaryIO) -> None:
+        sink.write(MAGIC + bytes((FORMAT_VERSION, _FLAG_ZLIB if self._compress else 0)))
+        compressor = zlib.compressobj(6) if self._compress else None
+
+        def write(chunk: bytes) -> None:
+            sink.write(compressor.compress(chunk) if compressor is not None else chunk)
+
+        packer = msgpack.Packer(use_bin_type=True)
+        fields = {
+            "schema_version": document.schema_version,
+            "source_media_type": document.source_media_type,
+            "text": document.text,
+            "metadata": document.metadata,
+        }
+        write(packer.pack_map_header(len(fields) + 2))
+        for key, value in fields.items():
+            write(packer.pack(key))
+            write(packer.pack(value))
+        # Payloads and pages are packed one entry at a time so only one of them is resolved in memory at once.
+        write(packer.pack("extensions"))
+        write(packer.pack_map_header(len(document.extensions)))
+        for key, value in document.extensions.items():
+            write(packer.pack(key))
+            write(packer.pack(self._resolve_refs(value)))
+        write(packer.pack("pages"))
+        write(packer.pack_array_header(len(document.pages)))
+        for page in document.pages:
+            write(packer.pack([page.page_no, page.text]))
+        if compressor is not None:
+            sink.write(compressor.flush())
+
+    def _resolve_refs(self, value: Any) -> Any:
+        if isinstance(value, PayloadRef):
+            if self._artifact_store is None:
+                raise ValueError(f"Cannot resolve payload without an artifact store: {value.storage_path}")
+            with self._artifact_store.open_payload(value) as handle:
+                return json.load(handle)
+        if isinstance(value, dict):
+            return {key: self._resolve_refs(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._resolve_refs(item) for item in value]
+        return value
+
+
+def load_compact_document(data: bytes) -> CanonicalDocument:
+    if data[:4] != MAGIC:
+        raise ValueError("Not a cdoc document")
+    version, flags = data[4], data[5]
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported cdoc version: {version}")
+    body = data[6:]
+    if flags & _FLAG_ZLIB:
+        body = zlib.decompress(body)
+    payload = msgpack.unpackb(body, raw=False, strict_map_key=False)
+    return CanonicalDocument(
+        schema_version=payload["schema_version"],
+        source_media_type=payload["source_media_type"],
+        text=payload["text"],
+        metadata=payload["metadata"],
+        extensions=payload["extensions"],
+        pages=[DocumentPage(page_no=page_no, text=text) for page_no, text in payload["pages"]],
+    )
@@ -1,9 +1,19 @@
+import io
 import json
+import shutil
+from typing import Any, BinaryIO
 
-from app.domain.models.document_pipeline import CanonicalDocument
+from app.domain.models.document_pipeline import CanonicalDocument, PayloadRef
+from app.domain.services.artifact_store import ArtifactStore
+from app.infrastructure.rendering.utf8_sink_writer import Utf8SinkWriter
+
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
 
 
 class JsonRenderer:
+    def __init__(self, *, artifact_store: ArtifactStore | None = None) -> None:
+        self._artifact_store = artifact_store
+
     @property
     def output_format(self) -> str:
         return "json"
@@ -13,14 +23,67 @@ class JsonRenderer:
         return "application/json"
 
     def render(self, document: CanonicalDocument) -> str:
-        return json.dumps(
-            {
-                "schema_version": document.schema_version,
-                "source_media_type": document.source_media_type,
-                "text": document.text,
-                "metadata": document.metadata,
-                "extensions": document.extensions,
-            },
-            ensure_ascii=False,
-            separators=(",", ":"),
-        )
+        buffer = io.BytesIO()
+        self.render_to(document, buffer)
+        return buffer.getvalue().decode("utf-8")
+
+    def render_to(self, document: CanonicalDocument, sink: BinaryIO) -> None:
+        writer = Utf8SinkWriter(sink)
+        writer.write("{")
+        for index, (key, value) in enumerate(
+            (
+                ("schema_version", document.schema_version),
+                ("source_media_type", document.source_media_type),
+                ("text", document.text),
+                ("metadata", document.metadata),
+                ("extensions", document.extensions),
+            )
+        ):
+            if index:
+                writer.write(",")
+            writer.write(_ENCODER.encode(key))
+            writer.write(":")
+            self._encode(value, writer, sink)
+        writer.write("}")
+        writer.flush()
+
+    def _encode(self, value: Any, writer: Utf8SinkWriter, sink: BinaryIO) -> None:
+        if isinstance(value, PayloadRef):
+            writer.flush()
+            self._copy_payload(value, sink)
+        elif isinstance(value, dict) and _contains_ref(value):
+            writer.write("{")
+            for index, (key, item) in enumerate(value.items()):
+                if index:
+                    writer.write(",")
+                writer.write(_ENCODER.encode(str(key)))
+                writer.write(":")
+                self._encode(item, writer, sink)
+            writer.write("}")
+        elif isinstance(value, list) and _contains_ref(value):
+            writer.write("[")
+            for index, item in enumerate(value):
+                if index:
+                    writer.write(",")
+                self._encode(item, writer, sink)
+            writer.write("]")
+        else:
+            for chunk in _ENCODER.iterencode(value):
+                writer.write(chunk)
+
+    def _copy_payload(self, ref: PayloadRef, sink: BinaryIO) -> None:
+        if self._artifact_store is None:
+            raise ValueError(f"Cannot resolve payload without an artifact store: {ref.storage_path}")
+        # Payloads are stored as compact UTF-8 JSON and copied through as-is instead of being parsed again.
+        with self._artifact_store.open_payload(ref) as handle:
+            shutil.copyfileobj(handle, sink, 1 << 20)
+
+
+def _contains_ref(value: Any) -> bool:
+    if isinstance(value, PayloadRef):
+        return True
+    if isinstance(value, dict):
+        return any(isinstance(item, (PayloadRef, dict, list)) and _contains_ref(item) for item in value.values())
+    if isinstance(value, list):
+        return any(isinstance(item, (PayloadRef, dict, list)) and _contains_ref(item) for item in value)
+    return False
@@ -2,6 +2,8 @@ import html
 import re
 
 from app.application.errors import CvExportError
+from app.core.metrics import PDF_RENDER_DURATION
+from app.core.telemetry import start_span
 from app.domain.services.cv_exporter import CvExporter
 
 
@@ -23,20 +25,26 @@ class MarkdownPdfExporter(CvExporter):
         if not normalized:
             raise CvExportError("Cannot export empty content to PDF")
 
-        normalized = _normalize_for_pdf(normalized)
-        is_markdown = _is_markdown_content(normalized, format_hint=format_hint)
-        body_html = self._render_body_html(normalized, is_markdown=is_markdown)
+        with (
+            start_span("export.render_pdf", attributes={"content_chars": len(normalized)}) as span,
+            PDF_RENDER_DURATION.time(),
+        ):
+            normalized = _normalize_for_pdf(normalized)
+            is_markdown = _is_markdown_content(normalized, format_hint=format_hint)
+            span.set_attribute("markdown", is_markdown)
+            body_html = self._render_body_html(normalized, is_markdown=is_markdown)
 
-        try:
-            return self._render_html_pdf(body_html)
-        except Exception:
-            # Some model outputs include HTML/Markdown combinations unsupported by
-            # fpdf's HTML engine. Fallback keeps export available.
-            plain = _markdown_to_plain_text(normalized)
             try:
-                return self._render_plain_text_pdf(plain)
-            except Exception as exc:  # pragma: no cover - converter errors vary by runtime
-                raise CvExportError("Failed to render PDF from content") from exc
+                return self._render_html_pdf(body_html)
+            except Exception:
+                # Some model outputs include HTML/Markdown combinations unsupported by
+                # fpdf's HTML engine. Fallback keeps export available.
+                span.set_attribute("fallback", "plain_text")
+                plain = _markdown_to_plain_text(normalized)
+                try:
+                    return self._render_plain_text_pdf(plain)
+                except Exception as exc:  # pragma: no cover - converter errors vary by runtime
+                    raise CvExportError("Failed to render PDF from content") from exc
 
     def _render_body_html(self, content: str, *, is_markdown: bool) -> str:
         if is_markdown:
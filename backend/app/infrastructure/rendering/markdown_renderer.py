@@ -1,4 +1,7 @@
+from typing import BinaryIO
+
 from app.domain.models.document_pipeline import CanonicalDocument
+from app.infrastructure.rendering.utf8_sink_writer import Utf8SinkWriter
 
 
 class MarkdownRenderer:
@@ -12,3 +15,8 @@ class MarkdownRenderer:
 
     def render(self, document: CanonicalDocument) -> str:
         return document.text
+
+    def render_to(self, document: CanonicalDocument, sink: BinaryIO) -> None:
+        writer = Utf8SinkWriter(sink)
+        writer.write(document.text)
+        writer.flush()
@@ -0,0 +1,33 @@
+from typing import BinaryIO
+
+_SLICE_CHARS = 1 << 16
+
+
+class Utf8SinkWriter:
+    def __init__(self, sink: BinaryIO, *, buffer_chars: int = _SLICE_CHARS) -> None:
+        self._sink = sink
+        self._buffer_chars = buffer_chars
+        self._pending: list[str] = []
+        self._pending_chars = 0
+
+    def write(self, text: str) -> None:
+        if len(text) >= self._buffer_chars:
+            self.flush()
+            # Large strings are encoded slice by slice so no full-size bytes copy is made.
+            for start in range(0, len(text), self._buffer_chars):
+                self._sink.write(text[start : start + self._buffer_chars].encode("utf-8", errors="surrogatepass"))
+            return
+        self._pending.append(text)
+        self._pending_chars += len(text)
+        if self._pending_chars >= self._buffer_chars:
+            self.flush()
+
+    def write_bytes(self, payload: bytes) -> None:
+        self.flush()
+        self._sink.write(payload)
+
+    def flush(self) -> None:
+        if self._pending:
+            self._sink.write("".join(self._pending).encode("utf-8", errors="surrogatepass"))
+            self._pending = []
+            self._pending_chars = 0
@@ -1,6 +1,7 @@
 from app.infrastructure.repositories.sqlalchemy_auth_registration_repository import SQLAlchemyAuthRegistrationRepository
 from app.infrastructure.repositories.sqlalchemy_ground_source_repository import SQLAlchemyGroundSourceRepository
 from app.infrastructure.repositories.sqlalchemy_refresh_session_repository import SQLAlchemyRefreshSessionRepository
+from app.infrastructure.repositories.sqlalchemy_trace_repository import SQLAlchemyTraceRepository
 from app.infrastructure.repositories.sqlalchemy_user_repository import SQLAlchemyUserRepository
 
 __all__ = [
@@ -8,4 +9,5 @@ __all__ = [
     "SQLAlchemyRefreshSessionRepository",
     "SQLAlchemyGroundSourceRepository",
     "SQLAlchemyAuthRegistrationRepository",
+    "SQLAlchemyTraceRepository",
 ]
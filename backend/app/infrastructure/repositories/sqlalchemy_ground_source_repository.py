@@ -1,7 +1,9 @@
-from sqlalchemy import delete, select
-from sqlalchemy.orm import Session
+from datetime import datetime
 
-from app.domain.models.ground_source import GroundSource
+from sqlalchemy import delete, select, tuple_
+from sqlalchemy.orm import Session, load_only
+
+from app.domain.models.ground_source import GroundSource, GroundSourceDeletion, GroundSourceSummary
 from app.infrastructure.persistence.models import GroundSourceORM
 
 
@@ -22,6 +24,7 @@ class SQLAlchemyGroundSourceRepository:
             content_hash=row.content_hash,
             created_at=row.created_at,
             updated_at=row.updated_at,
+            source_sha256=row.source_sha256,
         )
 
     def create(
@@ -35,6 +38,7 @@ class SQLAlchemyGroundSourceRepository:
         storage_path: str,
         canonical_text: str,
         content_hash: str,
+        source_sha256: str | None = None,
     ) -> GroundSource:
         row = GroundSourceORM(
             user_id=user_id,
@@ -45,20 +49,108 @@ class SQLAlchemyGroundSourceRepository:
             storage_path=storage_path,
             canonical_text=canonical_text,
             content_hash=content_hash,
+            source_sha256=source_sha256,
         )
         self._db.add(row)
         self._db.commit()
         self._db.refresh(row)
         return self._to_domain(row)
 
-    def list_for_user(self, *, user_id: str) -> list[GroundSource]:
+    def list_for_user(
+        self,
+        *,
+        user_id: str,
+        limit: int,
+        after: tuple[datetime, str] | None = None,
+    ) -> list[GroundSourceSummary]:
+        # canonical_text can be 100 KB per row; a listing only needs the metadata columns.
         stmt = (
             select(GroundSourceORM)
+            .options(
+                load_only(
+                    GroundSourceORM.id,
+                    GroundSourceORM.user_id,
+                    GroundSourceORM.name,
+                    GroundSourceORM.original_filename,
+                    GroundSourceORM.content_type,
+                    GroundSourceORM.size_bytes,
+                    GroundSourceORM.created_at,
+                    GroundSourceORM.updated_at,
+                    raiseload=True,
+                )
+            )
             .where(GroundSourceORM.user_id == user_id)
-            .order_by(GroundSourceORM.created_at.desc())
+            .order_by(GroundSourceORM.created_at.desc(), GroundSourceORM.id.desc())
+            .limit(limit)
         )
+        if after is not None:
+            # Keyset pagination: ix_ground_sources_user_id_created_at_id seeks straight to the next page.
+            stmt = stmt.where(tuple_(GroundSourceORM.created_at, GroundSourceORM.id) < tuple_(*after))
         rows = self._db.execute(stmt).scalars().all()
-        return [self._to_domain(row) for row in rows]
+        return [
+            GroundSourceSummary(
+                id=row.id,
+                user_id=row.user_id,
+                name=row.name,
+                original_filename=row.original_filename,
+                content_type=row.content_type,
+                size_bytes=row.size_bytes,
+                created_at=row.created_at,
+                updated_at=row.updated_at,
+            )
+            for row in rows
+        ]
+
+    def find_by_source_sha256(self, *, user_id: str, source_sha256: str) -> GroundSource | None:
+        stmt = (
+            select(GroundSourceORM)
+            .where(
+                GroundSourceORM.user_id == user_id,
+                GroundSourceORM.source_sha256 == source_sha256,
+            )
+            .order_by(GroundSourceORM.created_at.desc())
+            .limit(1)
+        )
+        row = self._db.execute(stmt).scalar_one_or_none()
+        if row is None:
+            return None
+        return self._to_domain(row)
+
+    def create_from_existing(
+        self,
+        *,
+        source_id: str,
+        user_id: str,
+        name: str,
+        original_filename: str,
+        content_type: str,
+    ) -> GroundSource | None:
+        # The copied row stays locked until the new one is committed, so a concurrent delete either
+        # sees the new row sharing the file or runs first and leaves nothing to copy.
+        stmt = (
+            select(GroundSourceORM)
+            .where(GroundSourceORM.id == source_id, GroundSourceORM.user_id == user_id)
+            .with_for_update()
+        )
+        existing = self._db.execute(stmt).scalar_one_or_none()
+        if existing is None:
+            self._db.rollback()
+            return None
+        row = GroundSourceORM(
+            user_id=user_id,
+            name=name,
+            original_filename=original_filename,
+            content_type=content_type,
+            size_bytes=existing.size_bytes,
+            storage_path=existing.storage_path,
+            canonical_text=existing.canonical_text,
+            content_hash=existing.content_hash,
+            source_sha256=existing.source_sha256,
+        )
+        self._db.add(row)
+        self._db.commit()
+        self._db.refresh(row)
+        return self._to_domain(row)
 
     def get_for_user(self, *, source_id: str, user_id: str) -> GroundSource | None:
         stmt = select(GroundSourceORM).where(
@@ -70,15 +162,33 @@ class SQLAlchemyGroundSourceRepository:
             return None
         return self._to_domain(row)
 
-    def delete_for_user(self, *, source_id: str, user_id: str) -> bool:
-        stmt = (
-            delete(GroundSourceORM)
-            .where(
+    def delete_for_user(self, *, source_id: str, user_id: str) -> GroundSourceDeletion | None:
+        storage_path = self._db.execute(
+            select(GroundSourceORM.storage_path).where(
                 GroundSourceORM.id == source_id,
                 GroundSourceORM.user_id == user_id,
             )
+        ).scalar_one_or_none()
+        if storage_path is None:
+            return None
+        # Every row sharing the file is locked in id order, so deletes and reuses of the same file serialize.
+        sharing_ids = (
+            self._db.execute(
+                select(GroundSourceORM.id)
+                .where(GroundSourceORM.user_id == user_id, GroundSourceORM.storage_path == storage_path)
+                .order_by(GroundSourceORM.id)
+                .with_for_update()
+            )
+            .scalars()
+            .all()
+        )
+        if source_id not in sharing_ids:
+            self._db.rollback()
+            return None
+        self._db.execute(
+            delete(GroundSourceORM)
+            .where(GroundSourceORM.id == source_id)
             .execution_options(synchronize_session=False)
         )
-        result = self._db.execute(stmt)
         self._db.commit()
-        return bool(result.rowcount)
+        return GroundSourceDeletion(storage_path=storage_path, storage_shared=len(sharing_ids) > 1)
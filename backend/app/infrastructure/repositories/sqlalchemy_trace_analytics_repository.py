@@ -0,0 +1,146 @@
+from datetime import UTC, datetime
+
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.domain.models.trace_analytics import StageRollup, StageRollupKey
+from app.domain.services.trace_store import TraceEvent
+from app.infrastructure.persistence.models import TraceEventORM, TraceRollupStateORM, TraceStageRollupORM
+
+_STATE_NAME = "stage_rollups"
+
+
+class SQLAlchemyTraceAnalyticsRepository:
+    def __init__(self, db: Session) -> None:
+        self._db = db
+
+    def get_rollup_watermark(self) -> int:
+        value = self._db.execute(
+            select(TraceRollupStateORM.last_event_id).where(TraceRollupStateORM.name == _STATE_NAME)
+        ).scalar_one_or_none()
+        return int(value or 0)
+
+    def list_events_after(self, *, after_id: int, events: tuple[str, ...], limit: int) -> list[tuple[int, TraceEvent]]:
+        stmt = (
+            select(TraceEventORM)
+            .where(TraceEventORM.id > after_id, TraceEventORM.event.in_(events))
+            .order_by(TraceEventORM.id)
+            .limit(limit)
+        )
+        rows = self._db.execute(stmt).scalars().all()
+        return [
+            (
+                row.id,
+                TraceEvent(
+                    run_id=row.run_id,
+                    stage=row.stage,
+                    event=row.event,
+                    timestamp=row.timestamp,
+                    payload=dict(row.payload or {}),
+                    user_id=row.user_id,
+                ),
+            )
+            for row in rows
+        ]
+
+    def apply_rollups(self, *, rollups: list[StageRollup], previous_watermark: int, watermark: int) -> bool:
+        state = self._db.execute(
+            select(TraceRollupStateORM).where(TraceRollupStateORM.name == _STATE_NAME).with_for_update()
+        ).scalar_one_or_none()
+        current = state.last_event_id if state is not None else 0
+        if current != previous_watermark:
+            self._db.rollback()
+            return False
+
+        for rollup in rollups:
+            self._merge_rollup(rollup)
+
+        if state is None:
+            self._db.add(TraceRollupStateORM(name=_STATE_NAME, last_event_id=watermark))
+        else:
+            state.last_event_id = watermark
+
+        try:
+            self._db.commit()
+        except IntegrityError:
+            # A concurrent worker created the state row or a rollup key first.
+            self._db.rollback()
+            return False
+        return True
+
+    def list_rollups(self, *, since: datetime, until: datetime, graph_id: str | None = None) -> list[StageRollup]:
+        stmt = select(TraceStageRollupORM).where(
+            TraceStageRollupORM.window_start >= since,
+            TraceStageRollupORM.window_start < until,
+        )
+        if graph_id is not None:
+            stmt = stmt.where(TraceStageRollupORM.graph_id == graph_id)
+        rows = self._db.execute(stmt.order_by(TraceStageRollupORM.window_start)).scalars().all()
+        return [self._to_domain(row) for row in rows]
+
+    def _merge_rollup(self, rollup: StageRollup) -> None:
+        key = rollup.key
+        row = self._db.execute(
+            select(TraceStageRollupORM)
+            .where(
+                TraceStageRollupORM.window_start == key.window_start,
+                TraceStageRollupORM.graph_id == key.graph_id,
+                TraceStageRollupORM.graph_version == key.graph_version,
+                TraceStageRollupORM.stage == key.stage,
+                TraceStageRollupORM.llm_model == key.llm_model,
+                TraceStageRollupORM.prompt_hash == key.prompt_hash,
+            )
+            .with_for_update()
+        ).scalar_one_or_none()
+
+        if row is None:
+            self._db.add(
+                TraceStageRollupORM(
+                    window_start=key.window_start,
+                    graph_id=key.graph_id,
+                    graph_version=key.graph_version,
+                    stage=key.stage,
+                    llm_model=key.llm_model,
+                    prompt_hash=key.prompt_hash,
+                    completed_count=rollup.completed_count,
+                    failed_count=rollup.failed_count,
+                    duration_ms_total=rollup.duration_ms_total,
+                    latency_histogram=list(rollup.latency_histogram),
+                    output_chars_histogram=list(rollup.output_chars_histogram),
+                )
+            )
+            return
+
+        merged = self._to_domain(row)
+        merged.merge(rollup)
+        row.completed_count = merged.completed_count
+        row.failed_count = merged.failed_count
+        row.duration_ms_total = merged.duration_ms_total
+        row.latency_histogram = merged.latency_histogram
+        row.output_chars_histogram = merged.output_chars_histogram
+
+    @staticmethod
+    def _to_domain(row: TraceStageRollupORM) -> StageRollup:
+        return StageRollup(
+            key=StageRollupKey(
+                window_start=_as_utc(row.window_start),
+                graph_id=row.graph_id,
+                graph_version=row.graph_version,
+                stage=row.stage,
+                llm_model=row.llm_model,
+                prompt_hash=row.prompt_hash,
+            ),
+            completed_count=row.completed_count,
+            failed_count=row.failed_count,
+            duration_ms_total=row.duration_ms_total,
+            latency_histogram=list(row.latency_histogram or []),
+            output_chars_histogram=list(row.output_chars_histogram or []),
+        )
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite drops tzinfo; stored values are always UTC.
+    if value.tzinfo is None:
+        return value.replace(tzinfo=UTC)
+    return value
@@ -0,0 +1,61 @@
+from sqlalchemy import case, func, select
+from sqlalchemy.orm import Session
+
+from app.domain.models.trace_run import TraceRunSummary
+from app.domain.services.trace_store import TraceEvent
+from app.infrastructure.persistence.models import TraceEventORM
+
+
+class SQLAlchemyTraceRepository:
+    def __init__(self, db: Session) -> None:
+        self._db = db
+
+    def list_events_for_run(self, *, run_id: str, user_id: str) -> list[TraceEvent]:
+        stmt = (
+            select(TraceEventORM)
+            .where(
+                TraceEventORM.run_id == run_id,
+                TraceEventORM.user_id == user_id,
+            )
+            .order_by(TraceEventORM.timestamp, TraceEventORM.id)
+        )
+        rows = self._db.execute(stmt).scalars().all()
+        return [
+            TraceEvent(
+                run_id=row.run_id,
+                stage=row.stage,
+                event=row.event,
+                timestamp=row.timestamp,
+                payload=dict(row.payload or {}),
+                user_id=row.user_id,
+            )
+            for row in rows
+        ]
+
+    def list_runs_for_user(self, *, user_id: str, limit: int, offset: int) -> list[TraceRunSummary]:
+        started_at = func.min(TraceEventORM.timestamp).label("started_at")
+        stmt = (
+            select(
+                TraceEventORM.run_id,
+                started_at,
+                func.max(TraceEventORM.timestamp).label("last_event_at"),
+                func.count().label("event_count"),
+                func.sum(case((TraceEventORM.event == "stage_failed", 1), else_=0)).label("failed_stage_count"),
+            )
+            .where(TraceEventORM.user_id == user_id)
+            .group_by(TraceEventORM.run_id)
+            .order_by(started_at.desc(), TraceEventORM.run_id)
+            .limit(limit)
+            .offset(offset)
+        )
+        rows = self._db.execute(stmt).all()
+        return [
+            TraceRunSummary(
+                run_id=row.run_id,
+                started_at=row.started_at,
+                last_event_at=row.last_event_at,
+                event_count=int(row.event_count),
+                failed_stage_count=int(row.failed_stage_count or 0),
+            )
+            for row in rows
+        ]
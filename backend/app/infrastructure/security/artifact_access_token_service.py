@@ -10,6 +10,7 @@ class ArtifactAccessPayload:
     user_id: str
     storage_path: str
     expires_at: datetime
+    filename: str | None = None
 
 
 class ArtifactAccessTokenService:
@@ -18,7 +19,7 @@ class ArtifactAccessTokenService:
         self._algorithm = algorithm
         self._ttl_seconds = ttl_seconds
 
-    def create_token(self, *, user_id: str, storage_path: str) -> str:
+    def create_token(self, *, user_id: str, storage_path: str, filename: str | None = None) -> str:
         expires_at = datetime.now(timezone.utc) + timedelta(seconds=self._ttl_seconds)
         payload = {
             "sub": user_id,
@@ -26,6 +27,8 @@ class ArtifactAccessTokenService:
             "scope": "artifact_download",
             "exp": int(expires_at.timestamp()),
         }
+        if filename:
+            payload["name"] = filename
         return jwt.encode(payload, self._secret_key, algorithm=self._algorithm)
 
     def verify_token(self, token: str) -> ArtifactAccessPayload:
@@ -38,6 +41,7 @@ class ArtifactAccessTokenService:
         user_id = payload.get("sub")
         storage_path = payload.get("path")
         exp = payload.get("exp")
+        filename = payload.get("name")
         if scope != "artifact_download" or not user_id or not storage_path or not exp:
             raise ValueError("Invalid artifact token")
 
@@ -46,4 +50,5 @@ class ArtifactAccessTokenService:
             user_id=str(user_id),
             storage_path=str(storage_path),
             expires_at=expires_at,
+            filename=str(filename) if filename else None,
         )
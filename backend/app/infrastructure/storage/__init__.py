@@ -1,4 +1,16 @@
 from app.infrastructure.storage.local_artifact_store import LocalArtifactStore
 from app.infrastructure.storage.local_file_storage import LocalFileStorage
+from app.infrastructure.storage.s3_artifact_store import S3ArtifactStore
+from app.infrastructure.storage.s3_client import S3Client, S3Error
+from app.infrastructure.storage.s3_file_storage import S3FileStorage
+from app.infrastructure.storage.upload_sweeper import UploadSweeper
 
-__all__ = ["LocalArtifactStore", "LocalFileStorage"]
+__all__ = [
+    "LocalArtifactStore",
+    "LocalFileStorage",
+    "S3ArtifactStore",
+    "S3Client",
+    "S3Error",
+    "S3FileStorage",
+    "UploadSweeper",
+]
@@ -0,0 +1,84 @@
+import gzip
+from collections.abc import Iterator
+from pathlib import Path
+from typing import BinaryIO
+
+SUFFIX_BY_ENCODING = {"gzip": ".gz", "zstd": ".zst"}
+ENCODING_BY_SUFFIX = {suffix: encoding for encoding, suffix in SUFFIX_BY_ENCODING.items()}
+
+
+def resolve_compression(name: str) -> str | None:
+    if name == "none":
+        return None
+    if name == "zstd":
+        try:
+            import zstandard  # noqa: F401
+        except ImportError as exc:
+            raise ValueError("ARTIFACT_COMPRESSION=zstd requires the zstandard package") from exc
+    if name not in SUFFIX_BY_ENCODING:
+        raise ValueError(f"Unsupported artifact compression: {name}")
+    return name
+
+
+def content_encoding(path: Path) -> str | None:
+    return ENCODING_BY_SUFFIX.get(path.suffix)
+
+
+def open_compressed_writer(target: BinaryIO, encoding: str | None) -> BinaryIO:
+    if encoding is None:
+        return target
+    if encoding == "gzip":
+        # mtime=0 keeps the compressed bytes a pure function of the content.
+        return gzip.GzipFile(fileobj=target, mode="wb", compresslevel=6, mtime=0)  # type: ignore[return-value]
+    import zstandard
+
+    return zstandard.ZstdCompressor(level=10).stream_writer(target, closefd=False)
+
+
+def open_decompressed(path: Path) -> BinaryIO:
+    return wrap_decompressed(path.open("rb"), content_encoding(path))
+
+
+def wrap_decompressed(source: BinaryIO, encoding: str | None) -> BinaryIO:
+    if encoding is None:
+        return source
+    if encoding == "gzip":
+        return _ClosingGzipFile(fileobj=source, mode="rb")  # type: ignore[return-value]
+    import zstandard
+
+    return zstandard.ZstdDecompressor().stream_reader(source, closefd=True)
+
+
+class _ClosingGzipFile(gzip.GzipFile):
+    def close(self) -> None:
+        source = self.fileobj
+        try:
+            super().close()
+        finally:
+            if source is not None:
+                source.close()
+
+
+def iter_decompressed(path: Path, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    return iter_stream(open_decompressed(path), chunk_size)
+
+
+def iter_stream(source: BinaryIO, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+    with source:
+        while chunk := source.read(chunk_size):
+            yield chunk
+
+
+def accepts_encoding(accept_encoding: str, encoding: str) -> bool:
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        if name.strip().lower() not in {encoding, "*"}:
+            continue
+        quality = params.strip()
+        if quality.startswith("q="):
+            try:
+                return float(quality[2:]) > 0
+            except ValueError:
+                return False
+        return True
+    return False
@@ -0,0 +1,57 @@
+from collections.abc import Callable, Iterator
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from app.domain.models.document_pipeline import CanonicalDocument, DocumentPage, PayloadRef
+
+
+def encode_canonical_document(document: CanonicalDocument) -> dict[str, Any]:
+    encoded = asdict(document)
+    encoded["extensions"] = _encode_refs(document.extensions)
+    return encoded
+
+
+def decode_canonical_document(
+    payload: dict[str, Any],
+    *,
+    payload_exists: Callable[[str], bool] = lambda storage_path: Path(storage_path).is_file(),
+) -> CanonicalDocument:
+    document = dict(payload)
+    document["pages"] = [DocumentPage(**page) for page in document.get("pages", [])]
+    document["extensions"] = _decode_refs(document.get("extensions", {}), payload_exists)
+    return CanonicalDocument(**document)
+
+
+def payload_refs(value: Any) -> Iterator[PayloadRef]:
+    if isinstance(value, PayloadRef):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from payload_refs(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from payload_refs(item)
+
+
+def _encode_refs(value: Any) -> Any:
+    if isinstance(value, PayloadRef):
+        return {"$payload_ref": asdict(value)}
+    if isinstance(value, dict):
+        return {key: _encode_refs(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_encode_refs(item) for item in value]
+    return value
+
+
+def _decode_refs(value: Any, payload_exists: Callable[[str], bool]) -> Any:
+    if isinstance(value, dict):
+        if set(value) == {"$payload_ref"}:
+            ref = PayloadRef(**value["$payload_ref"])
+            if not payload_exists(ref.storage_path):
+                raise FileNotFoundError(ref.storage_path)
+            return ref
+        return {key: _decode_refs(item, payload_exists) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_decode_refs(item, payload_exists) for item in value]
+    return value
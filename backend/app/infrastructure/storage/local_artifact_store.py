@@ -1,14 +1,61 @@
+import fcntl
+import hashlib
+import io
+import json
+import os
 import re
+import time
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any, BinaryIO
 from uuid import uuid4
 
-from app.domain.models.document_pipeline import InputDocument, RenderedArtifact
+from app.domain.models.document_pipeline import CanonicalDocument, InputDocument, PayloadRef, RenderedArtifact
+from app.infrastructure.storage.blob_compression import (
+    SUFFIX_BY_ENCODING,
+    content_encoding,
+    open_compressed_writer,
+    open_decompressed,
+)
+from app.infrastructure.storage.canonical_document_codec import (
+    decode_canonical_document,
+    encode_canonical_document,
+    payload_refs,
+)
+
+_RENDER_NAME = re.compile(r"(?P<document_id>[0-9a-f]{64})\.(?P<extension>[a-z0-9]+)(?:\.gz|\.zst)?")
+_LEASE_BUCKET_SECONDS = 3600
+
+
+class _HashingWriter(io.RawIOBase):
+    def __init__(self, target: BinaryIO) -> None:
+        self._target = target
+        self.digest = hashlib.sha256()
+        self.size_bytes = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data: bytes) -> int:  # type: ignore[override]
+        self.digest.update(data)
+        self.size_bytes += len(data)
+        self._target.write(data)
+        return len(data)
 
 
 class LocalArtifactStore:
-    def __init__(self, base_dir: str) -> None:
+    def __init__(self, base_dir: str, *, compression: str | None = "gzip", retention_hours: float = 0) -> None:
         self._base_dir = Path(base_dir)
-        self._base_dir.mkdir(parents=True, exist_ok=True)
+        self._blob_dir = self._base_dir / "blobs"
+        self._render_dir = self._base_dir / "renders"
+        self._lease_dir = self._base_dir / "leases"
+        self._blob_dir.mkdir(parents=True, exist_ok=True)
+        self._compression = compression
+        self._retention_seconds = max(0.0, retention_hours) * 3600
+
+    @property
+    def base_dir(self) -> Path:
+        return self._base_dir
 
     def save_artifact(
         self,
@@ -18,17 +65,243 @@ class LocalArtifactStore:
         media_type: str,
         content: str,
     ) -> RenderedArtifact:
-        source_stem = self._sanitize(source_document.source_path.stem)
-        filename = f"{source_stem}_{uuid4().hex}.{self._extension_for(output_format)}"
-        artifact_path = self._base_dir / filename
-        artifact_path.write_text(content, encoding="utf-8")
+        return self.save_artifact_stream(
+            source_document=source_document,
+            output_format=output_format,
+            media_type=media_type,
+            write=lambda sink: sink.write(content.encode("utf-8")),
+        )
+
+    def save_artifact_stream(
+        self,
+        *,
+        source_document: InputDocument,
+        output_format: str,
+        media_type: str,
+        write: Callable[[BinaryIO], None],
+    ) -> RenderedArtifact:
+        blob_path, _ = self._write_blob(self._extension_for(output_format), write)
+        self._lease("artifact", blob_path)
+        return RenderedArtifact(
+            format=output_format,
+            media_type=media_type,
+            storage_path=str(blob_path),
+            filename=self._download_name(source_document, output_format),
+        )
+
+    def save_payload(self, *, source_document: InputDocument, payload: Any) -> PayloadRef:
+        def write(sink: BinaryIO) -> None:
+            text = io.TextIOWrapper(sink, encoding="utf-8", write_through=True)  # type: ignore[arg-type]
+            # json.dump encodes incrementally, so the payload never exists as one big string.
+            json.dump(payload, text, ensure_ascii=False, separators=(",", ":"))
+            text.flush()
+            text.detach()
+
+        return self.save_payload_stream(source_document=source_document, write=write)
+
+    def save_payload_stream(self, *, source_document: InputDocument, write: Callable[[BinaryIO], None]) -> PayloadRef:
+        blob_path, size_bytes = self._write_blob("json", write)
+        return PayloadRef(storage_path=str(blob_path), media_type="application/json", size_bytes=size_bytes)
+
+    def open_payload(self, ref: PayloadRef) -> BinaryIO:
+        return open_decompressed(self._resolve_blob_path(ref.storage_path))
+
+    def retain_payload(self, ref: PayloadRef) -> None:
+        blob_path = self._resolve_blob_path(ref.storage_path)
+        with self._locked_refcount(blob_path) as refcount:
+            if not blob_path.exists():
+                raise FileNotFoundError(ref.storage_path)
+            refcount.write(refcount.read() + 1)
+
+    def delete_payload(self, ref: PayloadRef) -> None:
+        self.release(ref.storage_path)
+
+    def save_document(self, *, source_document: InputDocument, document: CanonicalDocument) -> str:
+        ref = self.save_payload(source_document=source_document, payload=encode_canonical_document(document))
+        self._lease("document", Path(ref.storage_path))
+        return Path(ref.storage_path).name.split(".", 1)[0]
+
+    def load_document(self, document_id: str) -> CanonicalDocument:
+        for suffix in ("", *SUFFIX_BY_ENCODING.values()):
+            path = self._blob_dir / document_id[:2] / document_id[2:4] / f"{document_id}.json{suffix}"
+            if path.is_file():
+                with open_decompressed(path) as handle:
+                    return decode_canonical_document(json.load(handle))
+        raise FileNotFoundError(document_id)
 
+    def document_path(self, document_id: str) -> Path:
+        return self._blob_path(document_id, "json")
+
+    def deferred_artifact(
+        self,
+        *,
+        source_document: InputDocument,
+        document_id: str,
+        output_format: str,
+        media_type: str,
+    ) -> RenderedArtifact:
+        suffix = SUFFIX_BY_ENCODING.get(self._compression or "", "")
+        filename = f"{document_id}.{self._extension_for(output_format)}{suffix}"
         return RenderedArtifact(
             format=output_format,
             media_type=media_type,
-            storage_path=str(artifact_path),
+            storage_path=str(self._render_dir / document_id[:2] / filename),
+            filename=self._download_name(source_document, output_format),
         )
 
+    def find_deferred(self, storage_path: str) -> tuple[str, str] | None:
+        path = Path(storage_path).resolve()
+        if path.parent.parent != self._render_dir.resolve():
+            return None
+        match = _RENDER_NAME.fullmatch(path.name)
+        if match is None or path.parent.name != match["document_id"][:2]:
+            return None
+        return match["document_id"], self._format_for(match["extension"])
+
+    def artifact_exists(self, storage_path: str) -> bool:
+        return Path(storage_path).is_file()
+
+    def save_deferred_artifact(self, *, storage_path: str, write: Callable[[BinaryIO], None]) -> None:
+        target = Path(storage_path)
+        if self.find_deferred(storage_path) is None:
+            raise FileNotFoundError(storage_path)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = target.with_name(f".{target.name}.{uuid4().hex}.tmp")
+        try:
+            with temp_path.open("wb") as handle:
+                compressed = open_compressed_writer(handle, content_encoding(target))
+                write(compressed)
+                if compressed is not handle:
+                    compressed.close()
+            # Renders are a pure function of the stored document, so a concurrent writer produces the same bytes.
+            os.replace(temp_path, target)
+        finally:
+            temp_path.unlink(missing_ok=True)
+
+    def release(self, storage_path: str) -> None:
+        blob_path = self._resolve_blob_path(storage_path)
+        with self._locked_refcount(blob_path) as refcount:
+            count = max(0, refcount.read() - 1)
+            refcount.write(count)
+            if count == 0:
+                blob_path.unlink(missing_ok=True)
+
+    def reference_count(self, storage_path: str) -> int:
+        blob_path = self._resolve_blob_path(storage_path)
+        with self._locked_refcount(blob_path) as refcount:
+            return refcount.read()
+
+    def purge_expired(self, *, now: float | None = None) -> int:
+        if self._retention_seconds <= 0:
+            return 0
+        cutoff = (now if now is not None else time.time()) - self._retention_seconds
+        try:
+            buckets = sorted(path for path in self._lease_dir.iterdir() if path.name.isdigit())
+        except FileNotFoundError:
+            return 0
+        released = 0
+        for bucket in buckets:
+            if int(bucket.name) * _LEASE_BUCKET_SECONDS > cutoff:
+                break
+            for lease in bucket.iterdir():
+                try:
+                    if lease.stat().st_mtime >= cutoff:
+                        continue
+                    storage_path = lease.read_text(encoding="utf-8")
+                    # Whoever unlinks the lease owns its reference, so concurrent purges release it once.
+                    lease.unlink()
+                except FileNotFoundError:
+                    continue
+                try:
+                    if lease.suffix == ".document":
+                        self._release_document(storage_path)
+                    else:
+                        self.release(storage_path)
+                except FileNotFoundError:
+                    pass
+                released += 1
+            try:
+                bucket.rmdir()
+            except OSError:
+                pass
+        return released
+
+    def _release_document(self, storage_path: str) -> None:
+        blob_path = self._resolve_blob_path(storage_path)
+        with self._locked_refcount(blob_path) as refcount:
+            count = max(0, refcount.read() - 1)
+            refcount.write(count)
+            try:
+                with open_decompressed(blob_path) as handle:
+                    document = decode_canonical_document(json.load(handle), payload_exists=lambda _: True)
+            except (OSError, ValueError, KeyError, TypeError):
+                document = None
+            if count == 0:
+                blob_path.unlink(missing_ok=True)
+        # Every save of a snapshot, deduplicated or not, handed it one reference to each engine payload.
+        for ref in payload_refs(document.extensions if document is not None else {}):
+            try:
+                self.delete_payload(ref)
+            except FileNotFoundError:
+                continue
+        if count:
+            return
+        document_id = blob_path.name.split(".", 1)[0]
+        for render in (self._render_dir / document_id[:2]).glob(f"{document_id}.*"):
+            render.unlink(missing_ok=True)
+
+    def _lease(self, kind: str, blob_path: Path) -> None:
+        if self._retention_seconds <= 0:
+            return
+        bucket = self._lease_dir / str(int(time.time()) // _LEASE_BUCKET_SECONDS)
+        bucket.mkdir(parents=True, exist_ok=True)
+        (bucket / f"{uuid4().hex}.{kind}").write_text(str(blob_path), encoding="utf-8")
+
+    def _write_blob(self, extension: str, write: Callable[[BinaryIO], None]) -> tuple[Path, int]:
+        temp_path = self._blob_dir / f".{uuid4().hex}.tmp"
+        try:
+            with temp_path.open("wb") as handle:
+                compressed = open_compressed_writer(handle, self._compression)
+                hashing = _HashingWriter(compressed)
+                write(hashing)  # type: ignore[arg-type]
+                if compressed is not handle:
+                    compressed.close()
+
+            blob_path = self._blob_path(hashing.digest.hexdigest(), extension)
+            blob_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._locked_refcount(blob_path) as refcount:
+                # Identical renders share one blob; the refcount tracks how many results point at it.
+                if not blob_path.exists():
+                    os.replace(temp_path, blob_path)
+                refcount.write(refcount.read() + 1)
+        finally:
+            temp_path.unlink(missing_ok=True)
+        return blob_path, hashing.size_bytes
+
+    def _blob_path(self, digest: str, extension: str) -> Path:
+        suffix = SUFFIX_BY_ENCODING.get(self._compression or "", "")
+        return self._blob_dir / digest[:2] / digest[2:4] / f"{digest}.{extension}{suffix}"
+
+    def _locked_refcount(self, blob_path: Path) -> "_RefcountLock":
+        return _RefcountLock(blob_path.with_name(f"{blob_path.name}.refs"))
+
+    def _resolve_blob_path(self, storage_path: str) -> Path:
+        blob_dir = self._blob_dir.resolve()
+        path = Path(storage_path).resolve()
+        if blob_dir not in path.parents or path.name.endswith((".refs", ".tmp")):
+            raise FileNotFoundError(storage_path)
+        return path
+
+    def _format_for(self, extension: str) -> str:
+        if extension == "md":
+            return "markdown"
+        return extension
+
+    def _download_name(self, source_document: InputDocument, output_format: str) -> str:
+        # Blobs are named by content hash; downloads keep the name the user uploaded.
+        stem = re.sub(r"[^A-Za-z0-9._-]", "_", Path(source_document.original_name).stem.strip()) or "document"
+        return f"{stem}.{self._extension_for(output_format)}"
+
     def _extension_for(self, output_format: str) -> str:
         if output_format == "markdown":
             return "md"
@@ -36,6 +309,43 @@ class LocalArtifactStore:
             return "json"
         return output_format
 
-    def _sanitize(self, value: str) -> str:
-        sanitized = re.sub(r"[^A-Za-z0-9._-]", "_", value)
-        return sanitized or "document"
+
+class _RefcountLock:
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._handle: Any = None
+        self._count: int | None = None
+
+    def __enter__(self) -> "_RefcountLock":
+        while True:
+            handle = self._path.open("a+", encoding="ascii")
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                if os.fstat(handle.fileno()).st_ino == os.stat(self._path).st_ino:
+                    self._handle = handle
+                    return self
+            except FileNotFoundError:
+                pass
+            # The counter was unlinked at zero while this process waited; lock the file that replaced it.
+            fcntl.flock(handle, fcntl.LOCK_UN)
+            handle.close()
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._count == 0:
+            # Unlinked while locked: waiters notice the stale inode and reopen the path.
+            self._path.unlink(missing_ok=True)
+        fcntl.flock(self._handle, fcntl.LOCK_UN)
+        self._handle.close()
+
+    def read(self) -> int:
+        self._handle.seek(0)
+        raw = self._handle.read().strip()
+        self._count = int(raw) if raw.isdigit() else 0
+        return self._count
+
+    def write(self, count: int) -> None:
+        self._handle.seek(0)
+        self._handle.truncate()
+        self._handle.write(str(count))
+        self._handle.flush()
+        self._count = count
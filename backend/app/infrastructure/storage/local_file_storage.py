@@ -1,17 +1,33 @@
+import hashlib
+import io
+import os
 import re
+import stat
+import tempfile
 from pathlib import Path
 from typing import BinaryIO
 from uuid import uuid4
 
+from app.core.telemetry import start_span
 from app.domain.models.stored_file import StoredFile
 from app.domain.services.file_storage import FileTooLargeError
+from app.infrastructure.storage.media_type_sniffer import SNIFF_BYTES, sniff_media_type
+
+
+TRANSIENT_UPLOADS = "transient"
+GROUND_SOURCE_UPLOADS = "ground_source"
 
 
 class LocalFileStorage:
-    def __init__(self, upload_dir: str, chunk_size: int = 1024 * 1024) -> None:
+    def __init__(self, upload_dir: str, chunk_size: int = 1024 * 1024, *, purpose: str = TRANSIENT_UPLOADS) -> None:
         self._upload_dir = Path(upload_dir).resolve()
         self._chunk_size = chunk_size
-        self._upload_dir.mkdir(parents=True, exist_ok=True)
+        self._purpose_dir = self._upload_dir / purpose
+        self._purpose_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def upload_dir(self) -> Path:
+        return self._upload_dir
 
     def save_from_stream(
         self,
@@ -22,33 +38,82 @@ class LocalFileStorage:
         max_size_bytes: int,
     ) -> StoredFile:
         safe_name = self._sanitize_filename(original_name)
-        stored_name = f"{uuid4().hex}_{safe_name}"
-        target_path = self._upload_dir / stored_name
-
-        total_size = 0
-        try:
-            with target_path.open("wb") as target:
-                while True:
-                    chunk = stream.read(self._chunk_size)
-                    if not chunk:
-                        break
-
-                    total_size += len(chunk)
-                    if total_size > max_size_bytes:
-                        raise FileTooLargeError("File is too large")
+        file_id = uuid4().hex
+        # Two levels of 256 shards keep every directory small however many uploads accumulate.
+        shard_dir = self._purpose_dir / file_id[:2] / file_id[2:4]
+        shard_dir.mkdir(parents=True, exist_ok=True)
+        target_path = shard_dir / f"{file_id}_{safe_name}"
 
-                    target.write(chunk)
-        except FileTooLargeError:
-            target_path.unlink(missing_ok=True)
-            raise
+        with start_span("storage.save_upload", attributes={"content_type": content_type}) as span:
+            source_fd = _backing_file_descriptor(stream)
+            try:
+                if source_fd is None:
+                    total_size, digest, head = self._copy_stream(stream, target_path, max_size_bytes)
+                else:
+                    total_size, digest, head = self._clone_file(stream, source_fd, target_path, max_size_bytes)
+            except FileTooLargeError:
+                target_path.unlink(missing_ok=True)
+                raise
+            detected_media_type = sniff_media_type(head)
+            span.set_attribute("size_bytes", total_size)
+            span.set_attribute("detected_media_type", detected_media_type or "unknown")
+            span.set_attribute("copy_mode", "stream" if source_fd is None else "spooled_file")
 
         return StoredFile(
             original_name=safe_name,
             content_type=content_type,
             size_bytes=total_size,
             storage_path=target_path,
+            sha256=digest,
+            detected_media_type=detected_media_type,
         )
 
+    def _copy_stream(self, stream: BinaryIO, target_path: Path, max_size_bytes: int) -> tuple[int, str, bytes]:
+        total_size = 0
+        digest = hashlib.sha256()
+        head = b""
+        with target_path.open("wb") as target:
+            while True:
+                chunk = stream.read(self._chunk_size)
+                if not chunk:
+                    break
+
+                total_size += len(chunk)
+                if total_size > max_size_bytes:
+                    raise FileTooLargeError("File is too large")
+
+                if len(head) < SNIFF_BYTES:
+                    head += chunk[: SNIFF_BYTES - len(head)]
+                digest.update(chunk)
+                target.write(chunk)
+        return total_size, digest.hexdigest(), head
+
+    def _clone_file(
+        self,
+        stream: BinaryIO,
+        source_fd: int,
+        target_path: Path,
+        max_size_bytes: int,
+    ) -> tuple[int, str, bytes]:
+        # The upload is already a file on disk (a rolled-over spool): its size is known without
+        # reading it, and a single chunked pass hashes the bytes while writing them out.
+        start = stream.tell()
+        total_size = os.fstat(source_fd).st_size - start
+        if total_size > max_size_bytes:
+            raise FileTooLargeError("File is too large")
+
+        digest = hashlib.sha256()
+        head = b""
+        buffer = memoryview(bytearray(self._chunk_size))
+        with target_path.open("wb") as target:
+            while read := stream.readinto(buffer):  # type: ignore[attr-defined]
+                chunk = buffer[:read]
+                if len(head) < SNIFF_BYTES:
+                    head += bytes(chunk[: SNIFF_BYTES - len(head)])
+                digest.update(chunk)
+                target.write(chunk)
+        return total_size, digest.hexdigest(), head
+
     def _sanitize_filename(self, filename: str) -> str:
         candidate = Path(filename).name.strip()
         if not candidate:
@@ -57,6 +122,10 @@ class LocalFileStorage:
         sanitized = re.sub(r"[^A-Za-z0-9._-]", "_", candidate)
         return sanitized or "uploaded_file"
 
+    def persist(self, *, stored_file: StoredFile) -> None:
+        # The saved file already is the durable copy.
+        pass
+
     def delete(self, *, storage_path: str) -> None:
         try:
             resolved_path = Path(storage_path).resolve()
@@ -67,3 +136,15 @@ class LocalFileStorage:
             return
 
         resolved_path.unlink(missing_ok=True)
+
+
+def _backing_file_descriptor(stream: BinaryIO) -> int | None:
+    # fileno() on an in-memory spool would force it to disk, so only rolled-over spools qualify.
+    if isinstance(stream, tempfile.SpooledTemporaryFile) and not stream._rolled:  # type: ignore[attr-defined]
+        return None
+    try:
+        descriptor = stream.fileno()
+        return descriptor if stat.S_ISREG(os.fstat(descriptor).st_mode) else None
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
@@ -0,0 +1,47 @@
+SNIFF_BYTES = 4096
+
+_BMP_DIB_HEADER_SIZES = {12, 40, 56, 108, 124}
+
+_SIGNATURES: tuple[tuple[bytes, str], ...] = (
+    (b"%PDF-", "application/pdf"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"II*\x00", "image/tiff"),
+    (b"MM\x00*", "image/tiff"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+    (b"PK\x03\x04", "application/zip"),
+)
+
+
+def sniff_media_type(head: bytes) -> str | None:
+    # Some PDF writers put a few bytes of junk before the header; readers accept it within 1 KiB.
+    if b"%PDF-" in head[:1024]:
+        return "application/pdf"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    if _looks_like_bmp(head):
+        return "image/bmp"
+    for signature, media_type in _SIGNATURES:
+        if head.startswith(signature):
+            return media_type
+    if head and _looks_like_text(head):
+        return "text/plain"
+    return None
+
+
+def _looks_like_bmp(head: bytes) -> bool:
+    # "BM" alone also starts plain text ("BMW Group ..."), so the DIB header size must be a known one.
+    return head[:2] == b"BM" and int.from_bytes(head[14:18], "little") in _BMP_DIB_HEADER_SIZES
+
+
+def _looks_like_text(head: bytes) -> bool:
+    if b"\x00" in head:
+        return False
+    try:
+        head.decode("utf-8")
+    except UnicodeDecodeError as exc:
+        # The sample may end in the middle of a multi-byte character.
+        if exc.start < len(head) - 3:
+            return False
+    return True
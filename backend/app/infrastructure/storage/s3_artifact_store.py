@@ -0,0 +1,166 @@
+import json
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any, BinaryIO
+
+from app.domain.models.document_pipeline import CanonicalDocument, InputDocument, PayloadRef, RenderedArtifact
+from app.infrastructure.storage.blob_compression import content_encoding, wrap_decompressed
+from app.infrastructure.storage.canonical_document_codec import decode_canonical_document, payload_refs
+from app.infrastructure.storage.local_artifact_store import LocalArtifactStore
+from app.infrastructure.storage.s3_client import S3Client, S3Error
+
+
+class S3ArtifactStore:
+    def __init__(
+        self,
+        local: LocalArtifactStore,
+        client: S3Client,
+        *,
+        key_prefix: str = "artifacts/",
+        presign_ttl_seconds: int = 300,
+    ) -> None:
+        # Local disk is a write-through cache; the bucket is what every node can read back.
+        self._local = local
+        self._client = client
+        self._key_prefix = key_prefix
+        self._presign_ttl_seconds = presign_ttl_seconds
+
+    def save_artifact(
+        self,
+        *,
+        source_document: InputDocument,
+        output_format: str,
+        media_type: str,
+        content: str,
+    ) -> RenderedArtifact:
+        return self.save_artifact_stream(
+            source_document=source_document,
+            output_format=output_format,
+            media_type=media_type,
+            write=lambda sink: sink.write(content.encode("utf-8")),
+        )
+
+    def save_artifact_stream(
+        self,
+        *,
+        source_document: InputDocument,
+        output_format: str,
+        media_type: str,
+        write: Callable[[BinaryIO], None],
+    ) -> RenderedArtifact:
+        artifact = self._local.save_artifact_stream(
+            source_document=source_document,
+            output_format=output_format,
+            media_type=media_type,
+            write=write,
+        )
+        self._upload(Path(artifact.storage_path), media_type=media_type)
+        return artifact
+
+    def save_payload(self, *, source_document: InputDocument, payload: Any) -> PayloadRef:
+        ref = self._local.save_payload(source_document=source_document, payload=payload)
+        self._upload(Path(ref.storage_path), media_type=ref.media_type)
+        return ref
+
+    def save_payload_stream(self, *, source_document: InputDocument, write: Callable[[BinaryIO], None]) -> PayloadRef:
+        ref = self._local.save_payload_stream(source_document=source_document, write=write)
+        self._upload(Path(ref.storage_path), media_type=ref.media_type)
+        return ref
+
+    def open_payload(self, ref: PayloadRef) -> BinaryIO:
+        return self.open_artifact(ref.storage_path)
+
+    def retain_payload(self, ref: PayloadRef) -> None:
+        self._local.retain_payload(ref)
+
+    def delete_payload(self, ref: PayloadRef) -> None:
+        # Blobs are content-addressed and may be shared by other nodes, so only the local copy is released;
+        # remote expiry belongs to the bucket lifecycle policy.
+        self._local.delete_payload(ref)
+
+    def save_document(self, *, source_document: InputDocument, document: CanonicalDocument) -> str:
+        document_id = self._local.save_document(source_document=source_document, document=document)
+        for ref in payload_refs(document.extensions):
+            # Payloads written by ingestion workers bypass this store; the snapshot must not outlive them remotely.
+            self._upload(Path(ref.storage_path), media_type=ref.media_type)
+        self._upload(self._local.document_path(document_id), media_type="application/json")
+        return document_id
+
+    def load_document(self, document_id: str) -> CanonicalDocument:
+        try:
+            return self._local.load_document(document_id)
+        except FileNotFoundError:
+            pass
+        with self.open_artifact(str(self._local.document_path(document_id))) as handle:
+            return decode_canonical_document(json.load(handle), payload_exists=self.artifact_exists)
+
+    def deferred_artifact(
+        self,
+        *,
+        source_document: InputDocument,
+        document_id: str,
+        output_format: str,
+        media_type: str,
+    ) -> RenderedArtifact:
+        return self._local.deferred_artifact(
+            source_document=source_document,
+            document_id=document_id,
+            output_format=output_format,
+            media_type=media_type,
+        )
+
+    def find_deferred(self, storage_path: str) -> tuple[str, str] | None:
+        return self._local.find_deferred(storage_path)
+
+    def artifact_exists(self, storage_path: str) -> bool:
+        return self._local.artifact_exists(storage_path) or self._client.head_object(self._key(storage_path)) is not None
+
+    def save_deferred_artifact(self, *, storage_path: str, write: Callable[[BinaryIO], None]) -> None:
+        self._local.save_deferred_artifact(storage_path=storage_path, write=write)
+        self._upload(Path(storage_path), media_type=None)
+
+    def purge_expired(self, *, now: float | None = None) -> int:
+        # Only the local cache expires here; remote copies follow the bucket lifecycle policy.
+        return self._local.purge_expired(now=now)
+
+    def open_artifact(self, storage_path: str) -> BinaryIO:
+        path = Path(storage_path)
+        key = self._key(storage_path)
+        if path.is_file():
+            return wrap_decompressed(path.open("rb"), content_encoding(path))
+        try:
+            source = self._client.get_object(key)
+        except S3Error as exc:
+            if exc.status == 404:
+                raise FileNotFoundError(storage_path) from exc
+            raise
+        return wrap_decompressed(source, content_encoding(path))
+
+    def presigned_download_url(self, storage_path: str, *, filename: str, media_type: str) -> str:
+        return self._client.presign_get(
+            self._key(storage_path),
+            expires_seconds=self._presign_ttl_seconds,
+            content_type=media_type,
+            content_disposition=f'attachment; filename="{filename}"',
+        )
+
+    def _upload(self, path: Path, *, media_type: str | None) -> None:
+        key = self._key(str(path))
+        if key.startswith(f"{self._key_prefix}blobs/") and self._client.head_object(key) is not None:
+            # Content-addressed: an existing object already holds exactly these bytes.
+            return
+        with path.open("rb") as source:
+            self._client.upload_fileobj(
+                key,
+                source,
+                content_type=media_type,
+                content_encoding=content_encoding(path),
+            )
+
+    def _key(self, storage_path: str) -> str:
+        base_dir = self._local.base_dir.resolve()
+        path = Path(storage_path).resolve()
+        if base_dir not in path.parents:
+            raise FileNotFoundError(storage_path)
+        return self._key_prefix + path.relative_to(base_dir).as_posix()
+
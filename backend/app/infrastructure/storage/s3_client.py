@@ -0,0 +1,163 @@
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, BinaryIO
+
+MIN_PART_SIZE = 5 * 1024 * 1024
+
+
+class S3Error(Exception):
+    def __init__(self, status: int, code: str, message: str = "") -> None:
+        super().__init__(f"S3 request failed with {status} {code}: {message}".rstrip(": "))
+        self.status = status
+        self.code = code
+
+
+class S3Client:
+    def __init__(
+        self,
+        *,
+        endpoint_url: str,
+        bucket: str,
+        access_key_id: str,
+        secret_access_key: str,
+        region: str = "us-east-1",
+        addressing_style: str = "path",
+        timeout_seconds: float = 30.0,
+        max_attempts: int = 3,
+    ) -> None:
+        try:
+            import boto3
+            from boto3.s3.transfer import TransferConfig
+            from botocore.config import Config
+        except ImportError as exc:
+            raise ValueError("STORAGE_BACKEND=s3 requires the boto3 package") from exc
+
+        self._bucket = bucket
+        self._transfer_config = TransferConfig
+        self._client = boto3.client(
+            "s3",
+            endpoint_url=endpoint_url,
+            aws_access_key_id=access_key_id,
+            aws_secret_access_key=secret_access_key,
+            region_name=region,
+            config=Config(
+                signature_version="s3v4",
+                s3={"addressing_style": addressing_style},
+                connect_timeout=timeout_seconds,
+                read_timeout=timeout_seconds,
+                retries={"mode": "standard", "max_attempts": max_attempts},
+                # Several S3-compatible stores reject the streamed trailing checksums sent by default.
+                request_checksum_calculation="when_required",
+                response_checksum_validation="when_required",
+            ),
+        )
+
+    def put_object(
+        self,
+        key: str,
+        body: bytes,
+        *,
+        content_type: str | None = None,
+        content_encoding: str | None = None,
+    ) -> None:
+        with self._errors():
+            self._client.put_object(
+                Bucket=self._bucket,
+                Key=key,
+                Body=body,
+                **_content_args(content_type, content_encoding),
+            )
+
+    def upload_fileobj(
+        self,
+        key: str,
+        source: BinaryIO,
+        *,
+        content_type: str | None = None,
+        content_encoding: str | None = None,
+        part_size: int = 8 * 1024 * 1024,
+    ) -> None:
+        part_size = max(MIN_PART_SIZE, part_size)
+        # Bodies above one part go up as a multipart upload that is aborted if any part fails.
+        config = self._transfer_config(multipart_threshold=part_size, multipart_chunksize=part_size)
+        with self._errors():
+            self._client.upload_fileobj(
+                source,
+                self._bucket,
+                key,
+                ExtraArgs=_content_args(content_type, content_encoding),
+                Config=config,
+            )
+
+    def get_object(self, key: str, *, byte_range: tuple[int, int | None] | None = None) -> BinaryIO:
+        extra = {}
+        if byte_range is not None:
+            start, end = byte_range
+            extra["Range"] = f"bytes={start}-{'' if end is None else end}"
+        with self._errors():
+            return self._client.get_object(Bucket=self._bucket, Key=key, **extra)["Body"]
+
+    def head_object(self, key: str) -> int | None:
+        try:
+            with self._errors():
+                response = self._client.head_object(Bucket=self._bucket, Key=key)
+        except S3Error as exc:
+            if exc.status == 404:
+                return None
+            raise
+        return int(response["ContentLength"])
+
+    def delete_object(self, key: str) -> None:
+        try:
+            with self._errors():
+                self._client.delete_object(Bucket=self._bucket, Key=key)
+        except S3Error as exc:
+            if exc.status != 404:
+                raise
+
+    def presign_get(
+        self,
+        key: str,
+        *,
+        expires_seconds: int,
+        content_type: str | None = None,
+        content_disposition: str | None = None,
+    ) -> str:
+        params = {"Bucket": self._bucket, "Key": key}
+        if content_type:
+            params["ResponseContentType"] = content_type
+        if content_disposition:
+            params["ResponseContentDisposition"] = content_disposition
+        return self._client.generate_presigned_url("get_object", Params=params, ExpiresIn=expires_seconds)
+
+    @contextmanager
+    def _errors(self) -> Iterator[None]:
+        from boto3.exceptions import S3UploadFailedError
+        from botocore.exceptions import BotoCoreError, ClientError
+
+        try:
+            yield
+        except ClientError as exc:
+            raise _s3_error(exc) from exc
+        except S3UploadFailedError as exc:
+            cause = exc.__context__
+            if isinstance(cause, ClientError):
+                raise _s3_error(cause) from exc
+            raise S3Error(0, "UploadFailed", str(exc)) from exc
+        except BotoCoreError as exc:
+            raise S3Error(0, type(exc).__name__, str(exc)) from exc
+
+
+def _s3_error(exc: Any) -> S3Error:
+    error = exc.response.get("Error", {})
+    status = int(exc.response.get("ResponseMetadata", {}).get("HTTPStatusCode") or 0)
+    return S3Error(status, str(error.get("Code", "")), str(error.get("Message", "")))
+
+
+def _content_args(content_type: str | None, content_encoding: str | None) -> dict[str, str]:
+    args = {}
+    if content_type:
+        args["ContentType"] = content_type
+    if content_encoding:
+        args["ContentEncoding"] = content_encoding
+    return args
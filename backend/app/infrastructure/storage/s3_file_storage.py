@@ -0,0 +1,56 @@
+from pathlib import Path
+from typing import BinaryIO
+
+from app.core.telemetry import start_span
+from app.domain.models.stored_file import StoredFile
+from app.domain.services.file_storage import FileStorageError
+from app.infrastructure.storage.local_file_storage import LocalFileStorage
+from app.infrastructure.storage.s3_client import S3Client
+
+
+class S3FileStorage:
+    def __init__(self, local: LocalFileStorage, client: S3Client, *, key_prefix: str = "uploads/") -> None:
+        # Ingestion needs a real file, so the local copy stays as scratch and the bucket holds the durable one.
+        self._local = local
+        self._client = client
+        self._key_prefix = key_prefix
+
+    def save_from_stream(
+        self,
+        *,
+        stream: BinaryIO,
+        original_name: str,
+        content_type: str,
+        max_size_bytes: int,
+    ) -> StoredFile:
+        # Only the local scratch copy is written here; nothing reaches the bucket before persist().
+        return self._local.save_from_stream(
+            stream=stream,
+            original_name=original_name,
+            content_type=content_type,
+            max_size_bytes=max_size_bytes,
+        )
+
+    def persist(self, *, stored_file: StoredFile) -> None:
+        path = Path(stored_file.storage_path)
+        try:
+            with start_span("storage.upload_object", attributes={"size_bytes": stored_file.size_bytes}):
+                with path.open("rb") as source:
+                    self._client.upload_fileobj(self._key(str(path)), source, content_type=stored_file.content_type)
+        except Exception as exc:
+            raise FileStorageError("Failed to store uploaded file") from exc
+
+    def delete(self, *, storage_path: str) -> None:
+        self._local.delete(storage_path=storage_path)
+        try:
+            key = self._key(storage_path)
+        except FileNotFoundError:
+            return
+        self._client.delete_object(key)
+
+    def _key(self, storage_path: str) -> str:
+        upload_dir = self._local.upload_dir
+        path = Path(storage_path).resolve()
+        if upload_dir not in path.parents:
+            raise FileNotFoundError(storage_path)
+        return self._key_prefix + path.relative_to(upload_dir).as_posix()
@@ -0,0 +1,68 @@
+import os
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+
+class UploadSweeper:
+    def __init__(
+        self,
+        upload_dir: str,
+        *,
+        retention_hours: dict[str, float],
+        batch_size: int = 500,
+        max_deletes_per_run: int = 10000,
+        batch_pause_seconds: float = 0.05,
+    ) -> None:
+        self._upload_dir = Path(upload_dir)
+        # Purposes without a positive retention (ground sources) are never swept.
+        self._retention_seconds = {purpose: hours * 3600 for purpose, hours in retention_hours.items() if hours > 0}
+        self._batch_size = max(1, batch_size)
+        self._max_deletes_per_run = max(1, max_deletes_per_run)
+        self._batch_pause_seconds = batch_pause_seconds
+
+    def sweep(self, *, now: float | None = None) -> int:
+        current_time = now if now is not None else time.time()
+        removed = 0
+        for purpose, retention_seconds in self._retention_seconds.items():
+            cutoff = current_time - retention_seconds
+            batch: list[str] = []
+            for path in self._expired(self._upload_dir / purpose, cutoff):
+                batch.append(path)
+                if len(batch) >= self._batch_size:
+                    removed += self._delete(batch)
+                    batch = []
+                    if removed >= self._max_deletes_per_run:
+                        return removed
+                    # Spreads the unlink load so request-path file operations keep a steady latency.
+                    time.sleep(self._batch_pause_seconds)
+            removed += self._delete(batch)
+            if removed >= self._max_deletes_per_run:
+                return removed
+        return removed
+
+    def _expired(self, root: Path, cutoff: float) -> Iterator[str]:
+        try:
+            shards = [entry.path for entry in os.scandir(root) if entry.is_dir(follow_symlinks=False)]
+        except FileNotFoundError:
+            return
+        for shard in shards:
+            for sub_shard in os.scandir(shard):
+                if not sub_shard.is_dir(follow_symlinks=False):
+                    continue
+                for entry in os.scandir(sub_shard.path):
+                    try:
+                        if entry.is_file(follow_symlinks=False) and entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                            yield entry.path
+                    except FileNotFoundError:
+                        continue
+
+    def _delete(self, paths: list[str]) -> int:
+        removed = 0
+        for path in paths:
+            try:
+                os.unlink(path)
+                removed += 1
+            except FileNotFoundError:
+                continue
+        return removed
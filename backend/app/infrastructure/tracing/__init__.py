@@ -1,3 +1,13 @@
+from app.infrastructure.tracing.buffered_jsonl_trace_store import BufferedJsonlTraceStore
 from app.infrastructure.tracing.local_jsonl_trace_store import LocalJsonlTraceStore
+from app.infrastructure.tracing.span_exporters import InMemorySpanExporter, JsonlSpanExporter, OtlpHttpSpanExporter
+from app.infrastructure.tracing.sqlalchemy_trace_store import SQLAlchemyTraceStore
 
-__all__ = ["LocalJsonlTraceStore"]
+__all__ = [
+    "BufferedJsonlTraceStore",
+    "InMemorySpanExporter",
+    "JsonlSpanExporter",
+    "LocalJsonlTraceStore",
+    "OtlpHttpSpanExporter",
+    "SQLAlchemyTraceStore",
+]
@@ -0,0 +1,106 @@
+import atexit
+import queue
+import threading
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+_STOP = object()
+
+T = TypeVar("T")
+
+
+class BackgroundBatchWriter(Generic[T]):
+    def __init__(
+        self,
+        *,
+        write_batch: Callable[[list[T]], None],
+        on_stop: Callable[[], None] | None = None,
+        max_queue_size: int = 10000,
+        batch_size: int = 256,
+        close_timeout_seconds: float = 5.0,
+        thread_name: str = "trace-writer",
+    ) -> None:
+        self._write_batch = write_batch
+        self._on_stop = on_stop
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=max_queue_size)
+        self._batch_size = max(1, batch_size)
+        self._close_timeout_seconds = close_timeout_seconds
+        self._dropped_events = 0
+        self._dropped_lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name=thread_name, daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    @property
+    def dropped_events(self) -> int:
+        return self._dropped_events
+
+    def submit(self, event: T) -> None:
+        if self._closed:
+            self._count_dropped(1)
+            return
+        try:
+            self._queue.put_nowait(event)
+        except queue.Full:
+            self._count_dropped(1)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        if self._closed:
+            return True
+        marker = threading.Event()
+        try:
+            self._queue.put(marker, timeout=timeout)
+        except queue.Full:
+            return False
+        return marker.wait(timeout)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        atexit.unregister(self.close)
+        try:
+            self._queue.put(_STOP, timeout=self._close_timeout_seconds)
+        except queue.Full:
+            return
+        self._thread.join(self._close_timeout_seconds)
+
+    def _run(self) -> None:
+        while True:
+            batch: list[T] = []
+            markers: list[threading.Event] = []
+            stop = self._collect(self._queue.get(), batch, markers)
+            while not stop and len(batch) < self._batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                stop = self._collect(item, batch, markers)
+
+            if batch:
+                try:
+                    self._write_batch(batch)
+                except Exception:
+                    # The writer thread must survive sink errors; lost events are reported as dropped.
+                    self._count_dropped(len(batch))
+
+            for marker in markers:
+                marker.set()
+            if stop:
+                if self._on_stop is not None:
+                    self._on_stop()
+                return
+
+    def _collect(self, item: object, batch: list[T], markers: list[threading.Event]) -> bool:
+        if item is _STOP:
+            return True
+        if isinstance(item, threading.Event):
+            markers.append(item)
+        else:
+            batch.append(item)  # type: ignore[arg-type]
+        return False
+
+    def _count_dropped(self, count: int) -> None:
+        with self._dropped_lock:
+            self._dropped_events += count
@@ -0,0 +1,76 @@
+from collections import OrderedDict
+from pathlib import Path
+from typing import TextIO
+
+from app.domain.services.trace_store import TraceEvent, TraceStore
+from app.infrastructure.tracing.background_batch_writer import BackgroundBatchWriter
+from app.infrastructure.tracing.local_jsonl_trace_store import LocalJsonlTraceStore
+
+
+class BufferedJsonlTraceStore(TraceStore):
+    def __init__(
+        self,
+        base_dir: str | Path,
+        *,
+        max_queue_size: int = 10000,
+        batch_size: int = 256,
+        max_open_files: int = 32,
+        close_timeout_seconds: float = 5.0,
+        layout: LocalJsonlTraceStore | None = None,
+    ) -> None:
+        self._layout = layout or LocalJsonlTraceStore(base_dir)
+        self._max_open_files = max(1, max_open_files)
+        self._handles: OrderedDict[Path, TextIO] = OrderedDict()
+        self._writer = BackgroundBatchWriter(
+            write_batch=self._write_batch,
+            on_stop=self._close_handles,
+            max_queue_size=max_queue_size,
+            batch_size=batch_size,
+            close_timeout_seconds=close_timeout_seconds,
+            thread_name="jsonl-trace-writer",
+        )
+
+    @property
+    def dropped_events(self) -> int:
+        return self._writer.dropped_events
+
+    def record(self, event: TraceEvent) -> None:
+        self._writer.submit(event)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        return self._writer.flush(timeout)
+
+    def close(self) -> None:
+        self._writer.close()
+
+    def _write_batch(self, batch: list[TraceEvent]) -> None:
+        lines_by_path: dict[Path, list[str]] = {}
+        for event in batch:
+            path = self._layout.resolve_path(event.run_id)
+            lines_by_path.setdefault(path, []).append(self._layout.encode(event))
+
+        for path, lines in lines_by_path.items():
+            handle = self._handle_for(path)
+            handle.write("".join(lines))
+            handle.flush()
+
+    def _handle_for(self, path: Path) -> TextIO:
+        handle = self._handles.get(path)
+        if handle is not None:
+            self._handles.move_to_end(path)
+            return handle
+
+        handle = path.open("a", encoding="utf-8")
+        self._handles[path] = handle
+        while len(self._handles) > self._max_open_files:
+            _, evicted = self._handles.popitem(last=False)
+            evicted.close()
+        return handle
+
+    def _close_handles(self) -> None:
+        while self._handles:
+            _, handle = self._handles.popitem(last=False)
+            try:
+                handle.close()
+            except OSError:
+                pass
@@ -1,16 +1,48 @@
+import fcntl
+import gzip
 import json
+from collections.abc import Iterator
+from datetime import UTC, datetime, timedelta
+from hashlib import sha256
 from pathlib import Path
+from typing import Any
 
 from app.domain.services.trace_store import TraceEvent, TraceStore
 
 
 class LocalJsonlTraceStore(TraceStore):
-    def __init__(self, base_dir: str | Path) -> None:
+    def __init__(
+        self,
+        base_dir: str | Path,
+        *,
+        shard_prefix_length: int = 2,
+        compact_after_seconds: int = 3600,
+        retention_days: int = 30,
+    ) -> None:
         self._base_dir = Path(base_dir)
-        self._base_dir.mkdir(parents=True, exist_ok=True)
+        self._active_dir = self._base_dir / "active"
+        self._archive_dir = self._base_dir / "archive"
+        self._shard_prefix_length = max(1, shard_prefix_length)
+        self._compact_after = timedelta(seconds=compact_after_seconds)
+        self._retention = timedelta(days=retention_days) if retention_days > 0 else None
+        self._known_shards: set[Path] = set()
+        self._active_dir.mkdir(parents=True, exist_ok=True)
+        self._archive_dir.mkdir(parents=True, exist_ok=True)
 
     def record(self, event: TraceEvent) -> None:
-        path = self._base_dir / f"{event.run_id}.jsonl"
+        path = self.resolve_path(event.run_id)
+        with path.open("a", encoding="utf-8") as handle:
+            handle.write(self.encode(event))
+
+    def resolve_path(self, run_id: str) -> Path:
+        shard = sha256(run_id.encode("utf-8")).hexdigest()[: self._shard_prefix_length]
+        shard_dir = self._active_dir / shard
+        if shard_dir not in self._known_shards:
+            shard_dir.mkdir(parents=True, exist_ok=True)
+            self._known_shards.add(shard_dir)
+        return shard_dir / f"{run_id}.jsonl"
+
+    def encode(self, event: TraceEvent) -> str:
         payload = {
             "run_id": event.run_id,
             "stage": event.stage,
@@ -18,5 +50,114 @@ class LocalJsonlTraceStore(TraceStore):
             "timestamp": event.timestamp.isoformat(),
             "payload": event.payload,
         }
-        with path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        if event.user_id is not None:
+            payload["user_id"] = event.user_id
+        return json.dumps(payload, ensure_ascii=False) + "\n"
+
+    def read_run(self, run_id: str) -> list[dict[str, Any]]:
+        for path in (self.resolve_path(run_id), self._base_dir / f"{run_id}.jsonl"):
+            if path.is_file():
+                return _decode_lines(path.read_bytes())
+
+        for index_path in sorted(self._archive_dir.glob("*.idx"), reverse=True):
+            location = _find_in_index(index_path, run_id)
+            if location is None:
+                continue
+            offset, length = location
+            segment_path = index_path.with_suffix(".jsonl.gz")
+            with segment_path.open("rb") as segment:
+                segment.seek(offset)
+                return _decode_lines(gzip.decompress(segment.read(length)))
+        return []
+
+    def compact_closed_runs(self, *, now: datetime | None = None) -> int:
+        current_time = now or datetime.now(UTC)
+        compacted = 0
+        with self._maintenance_lock() as acquired:
+            if not acquired:
+                return 0
+            for path in self._iter_active_files():
+                modified_at = datetime.fromtimestamp(path.stat().st_mtime, UTC)
+                if current_time - modified_at < self._compact_after:
+                    continue
+                self._append_to_segment(path, day=modified_at.date().isoformat())
+                path.unlink(missing_ok=True)
+                compacted += 1
+        return compacted
+
+    def purge_expired(self, *, now: datetime | None = None) -> int:
+        if self._retention is None:
+            return 0
+        cutoff = (now or datetime.now(UTC)) - self._retention
+        purged = 0
+        with self._maintenance_lock() as acquired:
+            if not acquired:
+                return 0
+            for index_path in self._archive_dir.glob("*.idx"):
+                try:
+                    day = datetime.fromisoformat(index_path.stem).replace(tzinfo=UTC)
+                except ValueError:
+                    continue
+                if day + timedelta(days=1) > cutoff:
+                    continue
+                index_path.with_suffix(".jsonl.gz").unlink(missing_ok=True)
+                index_path.unlink(missing_ok=True)
+                purged += 1
+        return purged
+
+    def run_maintenance(self) -> None:
+        self.compact_closed_runs()
+        self.purge_expired()
+
+    def _iter_active_files(self) -> Iterator[Path]:
+        yield from self._base_dir.glob("*.jsonl")
+        yield from self._active_dir.glob("*/*.jsonl")
+
+    def _append_to_segment(self, path: Path, *, day: str) -> None:
+        member = gzip.compress(path.read_bytes())
+        segment_path = self._archive_dir / f"{day}.jsonl.gz"
+        with segment_path.open("ab") as segment:
+            offset = segment.tell()
+            segment.write(member)
+        with (self._archive_dir / f"{day}.idx").open("a", encoding="utf-8") as index:
+            index.write(f"{path.stem}\t{offset}\t{len(member)}\n")
+
+    def _maintenance_lock(self) -> "_FileLock":
+        return _FileLock(self._base_dir / ".maintenance.lock")
+
+
+class _FileLock:
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._handle = None
+
+    def __enter__(self) -> bool:
+        self._handle = self._path.open("a")
+        try:
+            fcntl.flock(self._handle, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            # Another worker process is already compacting this directory.
+            self._handle.close()
+            self._handle = None
+            return False
+        return True
+
+    def __exit__(self, *exc_info: object) -> None:
+        if self._handle is not None:
+            fcntl.flock(self._handle, fcntl.LOCK_UN)
+            self._handle.close()
+            self._handle = None
+
+
+def _find_in_index(index_path: Path, run_id: str) -> tuple[int, int] | None:
+    prefix = f"{run_id}\t"
+    with index_path.open("r", encoding="utf-8") as index:
+        for line in index:
+            if line.startswith(prefix):
+                _, offset, length = line.rstrip("\n").split("\t")
+                return int(offset), int(length)
+    return None
+
+
+def _decode_lines(raw: bytes) -> list[dict[str, Any]]:
+    return [json.loads(line) for line in raw.decode("utf-8").splitlines() if line.strip()]
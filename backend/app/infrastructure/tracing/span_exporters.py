@@ -0,0 +1,153 @@
+import json
+import threading
+import urllib.request
+from collections import deque
+from pathlib import Path
+from typing import Any
+
+from app.core.telemetry import Span
+from app.infrastructure.tracing.background_batch_writer import BackgroundBatchWriter
+
+
+class InMemorySpanExporter:
+    def __init__(self, *, max_spans: int = 10000) -> None:
+        self._spans: deque[Span] = deque(maxlen=max(1, max_spans))
+        self._lock = threading.Lock()
+
+    def export(self, span: Span) -> None:
+        with self._lock:
+            self._spans.append(span)
+
+    def spans(self, *, trace_id: str | None = None) -> list[Span]:
+        with self._lock:
+            snapshot = list(self._spans)
+        if trace_id is None:
+            return snapshot
+        return [span for span in snapshot if span.trace_id == trace_id]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._spans.clear()
+
+    def close(self) -> None:
+        return None
+
+
+class JsonlSpanExporter:
+    def __init__(self, path: str | Path, *, max_queue_size: int = 10000, batch_size: int = 256) -> None:
+        self._path = Path(path)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._writer: BackgroundBatchWriter[Span] = BackgroundBatchWriter(
+            write_batch=self._write_batch,
+            max_queue_size=max_queue_size,
+            batch_size=batch_size,
+            thread_name="jsonl-span-exporter",
+        )
+
+    def export(self, span: Span) -> None:
+        self._writer.submit(span)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        return self._writer.flush(timeout)
+
+    def close(self) -> None:
+        self._writer.close()
+
+    def _write_batch(self, batch: list[Span]) -> None:
+        lines = [json.dumps(_span_to_dict(span), ensure_ascii=False, default=str) + "\n" for span in batch]
+        with self._path.open("a", encoding="utf-8") as handle:
+            handle.write("".join(lines))
+
+
+class OtlpHttpSpanExporter:
+    def __init__(
+        self,
+        endpoint: str,
+        *,
+        service_name: str,
+        headers: dict[str, str] | None = None,
+        timeout_seconds: float = 5.0,
+        max_queue_size: int = 10000,
+        batch_size: int = 512,
+    ) -> None:
+        self._url = endpoint.rstrip("/") + "/v1/traces"
+        self._service_name = service_name
+        self._headers = {"Content-Type": "application/json", **(headers or {})}
+        self._timeout_seconds = timeout_seconds
+        self._writer: BackgroundBatchWriter[Span] = BackgroundBatchWriter(
+            write_batch=self._write_batch,
+            max_queue_size=max_queue_size,
+            batch_size=batch_size,
+            thread_name="otlp-span-exporter",
+        )
+
+    def export(self, span: Span) -> None:
+        self._writer.submit(span)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        return self._writer.flush(timeout)
+
+    def close(self) -> None:
+        self._writer.close()
+
+    def encode(self, batch: list[Span]) -> bytes:
+        payload = {
+            "resourceSpans": [
+                {
+                    "resource": {"attributes": [_otlp_attribute("service.name", self._service_name)]},
+                    "scopeSpans": [
+                        {
+                            "scope": {"name": "cv_optimizer"},
+                            "spans": [_span_to_otlp(span) for span in batch],
+                        }
+                    ],
+                }
+            ]
+        }
+        return json.dumps(payload).encode("utf-8")
+
+    def _write_batch(self, batch: list[Span]) -> None:
+        request = urllib.request.Request(self._url, data=self.encode(batch), headers=self._headers, method="POST")
+        with urllib.request.urlopen(request, timeout=self._timeout_seconds) as response:  # noqa: S310
+            response.read()
+
+
+def _span_to_dict(span: Span) -> dict[str, Any]:
+    return {
+        "trace_id": span.trace_id,
+        "span_id": span.span_id,
+        "parent_span_id": span.parent_span_id,
+        "name": span.name,
+        "start_time_ns": span.start_time_ns,
+        "end_time_ns": span.end_time_ns,
+        "duration_ms": span.duration_ms,
+        "status": span.status,
+        "error": span.error,
+        "attributes": span.attributes,
+    }
+
+
+def _span_to_otlp(span: Span) -> dict[str, Any]:
+    encoded: dict[str, Any] = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": 1,
+        "startTimeUnixNano": str(span.start_time_ns),
+        "endTimeUnixNano": str(span.end_time_ns or span.start_time_ns),
+        "attributes": [_otlp_attribute(key, value) for key, value in span.attributes.items()],
+        "status": {"code": 2, "message": span.error or ""} if span.status == "error" else {"code": 1},
+    }
+    if span.parent_span_id:
+        encoded["parentSpanId"] = span.parent_span_id
+    return encoded
+
+
+def _otlp_attribute(key: str, value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
@@ -0,0 +1,56 @@
+from collections.abc import Callable
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.domain.services.trace_store import TraceEvent, TraceStore
+from app.infrastructure.persistence.models import TraceEventORM
+from app.infrastructure.tracing.background_batch_writer import BackgroundBatchWriter
+
+
+class SQLAlchemyTraceStore(TraceStore):
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        *,
+        max_queue_size: int = 10000,
+        batch_size: int = 256,
+        close_timeout_seconds: float = 5.0,
+    ) -> None:
+        self._session_factory = session_factory
+        self._writer = BackgroundBatchWriter(
+            write_batch=self._write_batch,
+            max_queue_size=max_queue_size,
+            batch_size=batch_size,
+            close_timeout_seconds=close_timeout_seconds,
+            thread_name="sql-trace-writer",
+        )
+
+    @property
+    def dropped_events(self) -> int:
+        return self._writer.dropped_events
+
+    def record(self, event: TraceEvent) -> None:
+        self._writer.submit(event)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        return self._writer.flush(timeout)
+
+    def close(self) -> None:
+        self._writer.close()
+
+    def _write_batch(self, batch: list[TraceEvent]) -> None:
+        rows = [
+            {
+                "run_id": event.run_id,
+                "user_id": event.user_id,
+                "stage": event.stage,
+                "event": event.event,
+                "timestamp": event.timestamp,
+                "payload": event.payload,
+            }
+            for event in batch
+        ]
+        with self._session_factory() as session:
+            session.execute(insert(TraceEventORM), rows)
+            session.commit()
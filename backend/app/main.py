@@ -1,15 +1,50 @@
-from fastapi import FastAPI
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
+from anyio import to_thread
+from fastapi import FastAPI, Response
+
+from app.api.middleware.request_metrics import RequestMetricsMiddleware, sample_threadpool
+from app.api.middleware.request_tracing import RequestTracingMiddleware
+from app.api.middleware.upload_size_limit import UploadSizeLimitMiddleware
+from app.api.v1.dependencies.background_jobs import get_background_workers
+from app.api.v1.dependencies.document_pipeline import stop_docling_ingestion, warm_docling_converters
+from app.api.v1.dependencies.metrics import render_metrics
+from app.api.v1.dependencies.telemetry import get_span_exporter
 from app.api.v1.routes.account import router as account_router
 from app.api.v1.routes.auth import router as auth_router
 from app.api.v1.routes.cv import router as cv_router
 from app.api.v1.routes.cv_generation import router as cv_generation_router
 from app.api.v1.routes.documents import router as documents_router
 from app.api.v1.routes.sources import router as sources_router
+from app.core.settings import settings
+from app.core.telemetry import configure_span_exporter
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
+    await to_thread.run_sync(warm_docling_converters)
+    workers = get_background_workers()
+    for worker in workers:
+        worker.start()
+    try:
+        yield
+    finally:
+        for worker in workers:
+            worker.stop()
+        stop_docling_ingestion()
 
 
 def create_app() -> FastAPI:
-    app = FastAPI(title="CV Optimizer API", version="1.0.0")
+    configure_span_exporter(get_span_exporter())
+    app = FastAPI(title="CV Optimizer API", version="1.0.0", lifespan=lifespan)
+    app.add_middleware(
+        UploadSizeLimitMiddleware,
+        max_body_bytes=settings.max_upload_size_bytes + settings.max_upload_request_overhead_bytes,
+    )
+    app.add_middleware(RequestTracingMiddleware)
+    if settings.metrics_enabled:
+        app.add_middleware(RequestMetricsMiddleware)
     app.include_router(cv_router, prefix="/api/v1")
     app.include_router(cv_generation_router, prefix="/api/v1")
     app.include_router(documents_router, prefix="/api/v1")
@@ -21,6 +56,13 @@ def create_app() -> FastAPI:
     def healthcheck() -> dict[str, str]:
         return {"status": "ok"}
 
+    if settings.metrics_enabled:
+
+        @app.get("/metrics", include_in_schema=False)
+        async def metrics() -> Response:
+            sample_threadpool()
+            return Response(content=render_metrics(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
     return app
 
 
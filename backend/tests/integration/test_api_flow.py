@@ -232,6 +232,7 @@ stages:
         source_list_payload = source_list_response.json()
         assert len(source_list_payload["items"]) == 1
         assert source_list_payload["items"][0]["id"] == source_id
+        assert source_list_payload["next_cursor"] is None
 
         process_response = client.post(
             "/api/v1/documents/process",
@@ -259,6 +260,21 @@ stages:
         )
         assert artifact_download_response.status_code == 200
         assert artifact_download_response.content
+        assert first_artifact["filename"].startswith("resume.")
+        assert f'filename="{first_artifact["filename"]}"' in artifact_download_response.headers["content-disposition"]
+        assert artifact_download_response.headers["content-encoding"] == "gzip"
+
+        identity_download_response = client.get(
+            "/api/v1/documents/artifacts/download",
+            params={
+                "storage_path": first_artifact["storage_path"],
+                "token": first_artifact["download_token"],
+            },
+            headers={"Authorization": f"Bearer {token}", "Accept-Encoding": "identity"},
+        )
+        assert identity_download_response.status_code == 200
+        assert "content-encoding" not in identity_download_response.headers
+        assert identity_download_response.content == artifact_download_response.content
 
         missing_artifact_token_response = client.get(
             "/api/v1/documents/artifacts/download",
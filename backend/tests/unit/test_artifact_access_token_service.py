@@ -11,6 +11,15 @@ def test_artifact_access_token_round_trip() -> None:
 
     assert payload.user_id == "user_1"
     assert payload.storage_path == "/tmp/file.md"
+    assert payload.filename is None
+
+
+def test_artifact_access_token_carries_download_name() -> None:
+    service = ArtifactAccessTokenService(secret_key="test-secret", algorithm="HS256", ttl_seconds=300)
+
+    token = service.create_token(user_id="user_1", storage_path="/tmp/file.md", filename="resume.md")
+
+    assert service.verify_token(token).filename == "resume.md"
 
 
 def test_artifact_access_token_rejects_tampering() -> None:
@@ -0,0 +1,91 @@
+import random
+import re
+
+import pytest
+
+from app.domain.models.document_pipeline import CanonicalDocument
+from app.domain.services.ingestion_quality_validator import IngestionQualityAssessment
+from app.infrastructure.ingestion.basic_ingestion_quality_validator import (
+    BasicIngestionQualityValidator,
+    QualitySignalAccumulator,
+)
+
+LEGACY_FLAGS = {"empty_text", "pdf_internal_markers", "non_printable_ratio_high", "low_lexical_density"}
+ALPHABET = (
+    "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    "      \n\n\t\r\x00\x01\x07\x0b\x0c\x1c\x1f"
+    "0123456789.,;:-_/%()[]"
+    "éèàçÃ©â€Â  　�жщ中文"
+)
+
+
+def reference_assess(text: str) -> IngestionQualityAssessment:
+    # The multi-pass implementation the streaming accumulator replaced.
+    if not text.strip():
+        return IngestionQualityAssessment(accepted=False, score=0.0, flags=["empty_text"])
+    flags: list[str] = []
+    if sum(1 for marker in ["%PDF-", "endobj", "xref", "stream", "endstream"] if marker in text) >= 3:
+        flags.append("pdf_internal_markers")
+    non_printable_count = sum(1 for char in text if ord(char) < 32 and char not in "\n\r\t")
+    if non_printable_count / max(1, len(text)) > 0.02:
+        flags.append("non_printable_ratio_high")
+    if len(re.findall(r"[A-Za-z]{2,}", text)) / max(1, len(text.split())) < 0.4:
+        flags.append("low_lexical_density")
+    score = 1.0
+    if "pdf_internal_markers" in flags:
+        score -= 0.6
+    if "non_printable_ratio_high" in flags:
+        score -= 0.25
+    if "low_lexical_density" in flags:
+        score -= 0.2
+    accepted = not ({"pdf_internal_markers", "non_printable_ratio_high"} & set(flags))
+    return IngestionQualityAssessment(accepted=accepted, score=max(0.0, round(score, 3)), flags=flags)
+
+
+def _document(text: str) -> CanonicalDocument:
+    return CanonicalDocument(schema_version="1.0", source_media_type="application/pdf", text=text)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_streaming_assessment_matches_reference_for_any_chunking(seed: int) -> None:
+    rng = random.Random(seed)
+    pieces = [rng.choice(ALPHABET) for _ in range(rng.randint(0, 400))]
+    for marker in rng.sample(["%PDF-", "endobj", "xref", "stream", "endstream"], k=rng.randint(0, 5)):
+        pieces.insert(rng.randint(0, len(pieces)), marker)
+    text = "".join(pieces)
+    cuts = sorted(rng.sample(range(len(text) + 1), k=min(len(text) + 1, rng.randint(0, 12))))
+    chunks = [text[start:end] for start, end in zip([0, *cuts], [*cuts, len(text)], strict=True)]
+    validator = BasicIngestionQualityValidator()
+
+    expected = reference_assess(text)
+    for assessment in (validator.assess(_document(text)), validator.assess_chunks(chunks)):
+        assert assessment.accepted == expected.accepted
+        assert assessment.score == expected.score
+        assert [flag for flag in assessment.flags if flag in LEGACY_FLAGS] == expected.flags
+
+
+def test_mojibake_and_non_latin_script_are_flagged_without_rejecting() -> None:
+    validator = BasicIngestionQualityValidator()
+
+    mojibake = validator.assess(_document("DÃ©veloppeur Python â€“ ExpÃ©rience de cinq ans " * 5))
+    cyrillic = validator.assess(_document("Разработчик программного обеспечения с опытом работы " * 5))
+
+    assert "mojibake_suspected" in mojibake.flags
+    assert mojibake.accepted
+    assert "non_latin_script" in cyrillic.flags
+    assert "mojibake_suspected" not in cyrillic.flags
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_streamed_signal_counts_match_whole_text_counts(seed: int) -> None:
+    rng = random.Random(seed)
+    text = "".join(rng.choice(ALPHABET) for _ in range(rng.randint(1, 300))) + "Ã©Â â€“" * rng.randint(1, 5)
+    cuts = sorted(rng.sample(range(len(text) + 1), k=min(len(text) + 1, rng.randint(1, 40))))
+    whole = QualitySignalAccumulator()
+    whole.feed(text)
+    streamed = QualitySignalAccumulator()
+    for start, end in zip([0, *cuts], [*cuts, len(text)], strict=True):
+        streamed.feed(text[start:end])
+
+    assert streamed.mojibake_count == whole.mojibake_count == sum(text.count(marker) for marker in ("Ã", "Â", "â€"))
+    assert vars(streamed) == vars(whole)
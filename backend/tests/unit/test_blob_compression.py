@@ -0,0 +1,41 @@
+import gzip
+
+import pytest
+
+from app.infrastructure.storage.blob_compression import (
+    accepts_encoding,
+    content_encoding,
+    iter_decompressed,
+    resolve_compression,
+)
+
+
+@pytest.mark.parametrize(
+    ("header", "expected"),
+    [
+        ("gzip, deflate, br", True),
+        ("br;q=1.0, gzip;q=0.5", True),
+        ("gzip;q=0", False),
+        ("*", True),
+        ("identity", False),
+        ("", False),
+    ],
+)
+def test_accepts_encoding_honours_quality_values(header: str, expected: bool) -> None:
+    assert accepts_encoding(header, "gzip") is expected
+
+
+def test_gzip_blob_is_recognised_and_streamed_back_decompressed(tmp_path) -> None:
+    blob = tmp_path / "abc.md.gz"
+    blob.write_bytes(gzip.compress(b"# CV\n" * 50_000))
+
+    assert content_encoding(blob) == "gzip"
+    assert content_encoding(tmp_path / "abc.md") is None
+    assert b"".join(iter_decompressed(blob)) == b"# CV\n" * 50_000
+
+
+def test_resolve_compression_rejects_unknown_codecs() -> None:
+    assert resolve_compression("none") is None
+    assert resolve_compression("gzip") == "gzip"
+    with pytest.raises(ValueError):
+        resolve_compression("lz4")
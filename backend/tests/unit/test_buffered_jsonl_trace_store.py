@@ -0,0 +1,64 @@
+import threading
+from datetime import UTC, datetime
+
+from app.domain.services.trace_store import TraceEvent
+from app.infrastructure.tracing.buffered_jsonl_trace_store import BufferedJsonlTraceStore
+from app.infrastructure.tracing.local_jsonl_trace_store import LocalJsonlTraceStore
+
+
+def _event(run_id: str, stage: str = "ats_pass", event: str = "stage_started") -> TraceEvent:
+    return TraceEvent(
+        run_id=run_id,
+        stage=stage,
+        event=event,
+        timestamp=datetime(2026, 1, 1, tzinfo=UTC),
+        payload={"graph_id": "cv_rewrite_v1"},
+    )
+
+
+def test_buffered_store_writes_events_per_run(tmp_path) -> None:
+    store = BufferedJsonlTraceStore(tmp_path, max_open_files=1)
+    store.record(_event("run_a"))
+    store.record(_event("run_b"))
+    store.record(_event("run_a", event="stage_completed"))
+
+    assert store.flush(timeout=5)
+    store.close()
+
+    layout = LocalJsonlTraceStore(tmp_path)
+    assert [line["event"] for line in layout.read_run("run_a")] == ["stage_started", "stage_completed"]
+    assert len(layout.read_run("run_b")) == 1
+    assert store.dropped_events == 0
+
+
+def test_buffered_store_counts_dropped_events_when_queue_is_full(tmp_path) -> None:
+    writing = threading.Event()
+    release = threading.Event()
+
+    class BlockingStore(BufferedJsonlTraceStore):
+        def _write_batch(self, batch: list[TraceEvent]) -> None:
+            writing.set()
+            release.wait(5)
+            super()._write_batch(batch)
+
+    store = BlockingStore(tmp_path, max_queue_size=1)
+    store.record(_event("run_a"))
+    assert writing.wait(5)
+
+    store.record(_event("run_a"))
+    store.record(_event("run_a"))
+    release.set()
+    store.close()
+
+    assert store.dropped_events == 1
+    assert len(LocalJsonlTraceStore(tmp_path).read_run("run_a")) == 2
+
+
+def test_buffered_store_drops_events_after_close(tmp_path) -> None:
+    store = BufferedJsonlTraceStore(tmp_path)
+    store.close()
+
+    store.record(_event("run_a"))
+
+    assert store.dropped_events == 1
+    assert LocalJsonlTraceStore(tmp_path).read_run("run_a") == []
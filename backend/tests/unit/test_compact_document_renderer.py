@@ -0,0 +1,67 @@
+import io
+import json
+from pathlib import Path
+
+import msgpack
+import pytest
+
+from app.domain.models.document_pipeline import CanonicalDocument, DocumentPage, InputDocument
+from app.infrastructure.rendering.compact_document_renderer import CompactDocumentRenderer, load_compact_document
+from app.infrastructure.rendering.json_renderer import JsonRenderer
+from app.infrastructure.storage.local_artifact_store import LocalArtifactStore
+
+DOCLING_PAYLOAD = {
+    "schema_name": "DoclingDocument",
+    "texts": [{"self_ref": f"#/texts/{index}", "text": f"Émilie — ligne {index}", "prov": [{"page_no": 1}]} for index in range(300)],
+}
+
+
+def _document(extensions: dict) -> CanonicalDocument:
+    return CanonicalDocument(
+        schema_version="1.0",
+        source_media_type="application/pdf",
+        text="# Émilie\n\nIngénieure 🚀",
+        metadata={"original_name": "cv.pdf"},
+        extensions=extensions,
+        pages=[DocumentPage(page_no=1, text="# Émilie"), DocumentPage(page_no=2, text="Ingénieure 🚀")],
+    )
+
+
+def _render(renderer: CompactDocumentRenderer, document: CanonicalDocument) -> bytes:
+    sink = io.BytesIO()
+    renderer.render_to(document, sink)
+    return sink.getvalue()
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_round_trip_resolves_stored_payloads(tmp_path, compress: bool) -> None:
+    store = LocalArtifactStore(base_dir=str(tmp_path / "artifacts"))
+    source = InputDocument(source_path=Path("/tmp/cv.pdf"), original_name="cv.pdf", media_type="application/pdf")
+    ref = store.save_payload(source_document=source, payload=DOCLING_PAYLOAD)
+
+    encoded = _render(CompactDocumentRenderer(artifact_store=store, compress=compress), _document({"docling": ref}))
+
+    assert load_compact_document(encoded) == _document({"docling": DOCLING_PAYLOAD})
+    assert len(encoded) < len(JsonRenderer(artifact_store=store).render(_document({"docling": ref})).encode("utf-8"))
+
+
+def test_encoding_is_standard_msgpack() -> None:
+    document = _document({})
+
+    decoded = msgpack.unpackb(_render(CompactDocumentRenderer(), document)[6:], raw=False)
+
+    assert decoded["text"] == document.text
+    assert decoded["pages"] == [[1, "# Émilie"], [2, "Ingénieure 🚀"]]
+
+
+def test_render_bytes_matches_the_streamed_encoding() -> None:
+    renderer = CompactDocumentRenderer(compress=True)
+
+    assert renderer.render_bytes(_document({})) == _render(renderer, _document({}))
+
+
+def test_loader_rejects_foreign_or_newer_payloads() -> None:
+    with pytest.raises(ValueError):
+        load_compact_document(json.dumps({"text": "x"}).encode("utf-8"))
+    with pytest.raises(ValueError):
+        load_compact_document(b"CDOC\x09\x00\x80")
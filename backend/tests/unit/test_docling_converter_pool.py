@@ -0,0 +1,64 @@
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from app.application.errors import IngestionFailedError
+from app.domain.models.document_pipeline import IngestionPolicy, InputDocument
+from app.infrastructure.ingestion.docling_converter_pool import DoclingConverterPool
+from app.infrastructure.ingestion.docling_document_ingestor import DoclingDocumentIngestor
+
+
+class FakeDocument:
+    def export_to_markdown(self) -> str:
+        return "# CV"
+
+    def export_to_dict(self) -> dict[str, str]:
+        return {"name": "cv"}
+
+
+class FakeConverter:
+    def __init__(self, ocr_enabled: bool) -> None:
+        self.ocr_enabled = ocr_enabled
+        self.converted: list[str] = []
+
+    def convert(self, path: str) -> FakeDocument:
+        self.converted.append(path)
+        return FakeDocument()
+
+
+def test_pool_reuses_converters_per_ocr_config() -> None:
+    built: list[FakeConverter] = []
+
+    def factory(ocr_enabled: bool) -> FakeConverter:
+        converter = FakeConverter(ocr_enabled)
+        built.append(converter)
+        return converter
+
+    pool = DoclingConverterPool(factory=factory)
+    pool.warm()
+    ingestor = DoclingDocumentIngestor(converter_pool=pool)
+    document = InputDocument(source_path=Path("/tmp/cv.pdf"), original_name="cv.pdf", media_type="application/pdf")
+
+    result = ingestor.ingest(replace(document, export_engine_payload=True), policy=IngestionPolicy(ocr_enabled=True))
+    text_only = ingestor.ingest(document, policy=IngestionPolicy(ocr_enabled=True))
+
+    assert [converter.ocr_enabled for converter in built] == [False, True]
+    assert built[1].converted == ["/tmp/cv.pdf", "/tmp/cv.pdf"]
+    assert result.canonical_document.text == "# CV"
+    assert result.canonical_document.extensions["docling"] == {"name": "cv"}
+    assert text_only.canonical_document.extensions == {}
+
+
+def test_pool_is_bounded_per_config() -> None:
+    pool = DoclingConverterPool(max_converters_per_config=1, checkout_timeout_seconds=0.05, factory=FakeConverter)
+
+    with pool.checkout(ocr_enabled=False) as first:
+        with pytest.raises(IngestionFailedError):
+            with pool.checkout(ocr_enabled=False):
+                pass
+        with pool.checkout(ocr_enabled=True) as other_config:
+            assert other_config is not first
+
+    with pool.checkout(ocr_enabled=False) as again:
+        assert again is first
@@ -0,0 +1,200 @@
+import gzip
+import hashlib
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from app.domain.models.document_pipeline import (
+    CanonicalDocument,
+    IngestionResult,
+    InputDocument,
+    PayloadRef,
+    ProcessingReport,
+)
+from app.infrastructure.ingestion.local_ingestion_cache import LocalIngestionCache
+from app.infrastructure.rendering.json_renderer import JsonRenderer
+from app.infrastructure.storage.local_artifact_store import LocalArtifactStore
+
+DOCLING_PAYLOAD = {"schema_name": "DoclingDocument", "texts": [{"self_ref": "#/texts/0", "text": "Émilie — CV"}]}
+
+
+def _source() -> InputDocument:
+    return InputDocument(source_path=Path("/tmp/cv.pdf"), original_name="cv.pdf", media_type="application/pdf")
+
+
+def _document(extensions: dict) -> CanonicalDocument:
+    return CanonicalDocument(
+        schema_version="1.0",
+        source_media_type="application/pdf",
+        text="# Émilie",
+        metadata={"original_name": "cv.pdf"},
+        extensions=extensions,
+    )
+
+
+def test_json_renderer_splices_stored_payload_like_an_inline_one(tmp_path) -> None:
+    store = LocalArtifactStore(base_dir=str(tmp_path / "artifacts"))
+    ref = store.save_payload(source_document=_source(), payload=DOCLING_PAYLOAD)
+
+    inline = JsonRenderer().render(_document({"docling": DOCLING_PAYLOAD}))
+    lazy = JsonRenderer(artifact_store=store).render(_document({"docling": ref, "ocr_pages": {"2-2": {"docling": ref}}}))
+
+    assert ref.size_bytes == len(json.dumps(DOCLING_PAYLOAD, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    assert JsonRenderer(artifact_store=store).render(_document({"docling": ref})) == inline
+    assert json.loads(lazy)["extensions"] == {"docling": DOCLING_PAYLOAD, "ocr_pages": {"2-2": {"docling": DOCLING_PAYLOAD}}}
+
+
+def test_delete_payload_only_touches_the_payload_directory(tmp_path) -> None:
+    store = LocalArtifactStore(base_dir=str(tmp_path / "artifacts"))
+    ref = store.save_payload(source_document=_source(), payload=DOCLING_PAYLOAD)
+    outside = tmp_path / "keep.json"
+    outside.write_text("{}", encoding="utf-8")
+
+    store.delete_payload(ref)
+
+    assert not Path(ref.storage_path).exists()
+    with pytest.raises(FileNotFoundError):
+        store.delete_payload(PayloadRef(storage_path=str(outside), media_type="application/json", size_bytes=2))
+    assert outside.exists()
+
+
+def test_ingestion_cache_keeps_payload_refs_and_drops_entries_whose_payload_is_gone(tmp_path) -> None:
+    store = LocalArtifactStore(base_dir=str(tmp_path / "artifacts"))
+    cache = LocalIngestionCache(tmp_path / "cache")
+    ref = store.save_payload(source_document=_source(), payload=DOCLING_PAYLOAD)
+    result = IngestionResult(
+        canonical_document=_document({"docling": ref}),
+        report=ProcessingReport(engine_name="docling"),
+    )
+    cache.put("cd" * 32, result)
+
+    assert cache.get("cd" * 32) == result
+
+    store.delete_payload(ref)
+
+    assert cache.get("cd" * 32) is None
+
+
+def test_ingestion_cache_entries_own_a_payload_reference_until_purged(tmp_path) -> None:
+    store = LocalArtifactStore(base_dir=str(tmp_path / "artifacts"))
+    cache = LocalIngestionCache(tmp_path / "cache", max_age_days=1, artifact_store=store)
+    ref = store.save_payload(source_document=_source(), payload=DOCLING_PAYLOAD)
+    result = IngestionResult(
+        canonical_document=_document({"docling": ref}),
+        report=ProcessingReport(engine_name="docling"),
+    )
+
+    cache.put("cd" * 32, result)
+    cache.put("cd" * 32, result)
+    store.delete_payload(ref)
+    assert store.reference_count(ref.storage_path) == 1
+
+    hit = cache.get("cd" * 32)
+    assert hit == result
+    assert store.reference_count(ref.storage_path) == 2
+    store.delete_payload(hit.canonical_document.extensions["docling"])
+
+    assert cache.purge_expired(now=time.time() + 2 * 86400) == 1
+    assert not Path(ref.storage_path).exists()
+
+
+def test_streamed_json_artifact_matches_in_memory_rendering(tmp_path) -> None:
+    store = LocalArtifactStore(base_dir=str(tmp_path / "artifacts"))
+    ref = store.save_payload(source_document=_source(), payload=DOCLING_PAYLOAD)
+    document = _document({"docling": ref})
+    renderer = JsonRenderer(artifact_store=store)
+
+    artifact = store.save_artifact_stream(
+        source_document=_source(),
+        output_format="json",
+        media_type=renderer.media_type,
+        write=lambda sink: renderer.render_to(document, sink),
+    )
+
+    assert gzip.decompress(Path(artifact.storage_path).read_bytes()).decode("utf-8") == renderer.render(document)
+    assert not list((tmp_path / "artifacts").rglob(".*.tmp"))
+
+
+def test_identical_artifacts_share_one_reference_counted_blob(tmp_path) -> None:
+    store = LocalArtifactStore(base_dir=str(tmp_path / "artifacts"))
+    content = "# Émilie\n" * 200
+
+    first = store.save_artifact(source_document=_source(), output_format="markdown", media_type="text/markdown", content=content)
+    second = store.save_artifact(source_document=_source(), output_format="markdown", media_type="text/markdown", content=content)
+    blob = Path(first.storage_path)
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    assert first.storage_path == second.storage_path
+    assert first.filename == "cv.md"
+    assert blob.relative_to(tmp_path / "artifacts") == Path("blobs", digest[:2], digest[2:4], f"{digest}.md.gz")
+    assert blob.stat().st_size < len(content.encode("utf-8"))
+    assert store.reference_count(first.storage_path) == 2
+
+    store.release(first.storage_path)
+    assert blob.exists()
+    store.release(second.storage_path)
+    assert not blob.exists()
+    assert store.reference_count(first.storage_path) == 0
+
+
+def test_uncompressed_store_writes_plain_blobs(tmp_path) -> None:
+    store = LocalArtifactStore(base_dir=str(tmp_path / "artifacts"), compression=None)
+
+    artifact = store.save_artifact(source_document=_source(), output_format="json", media_type="application/json", content="{}")
+
+    assert artifact.storage_path.endswith(".json")
+    assert Path(artifact.storage_path).read_text(encoding="utf-8") == "{}"
+
+
+def test_counter_file_is_removed_with_the_last_reference(tmp_path) -> None:
+    store = LocalArtifactStore(base_dir=str(tmp_path / "artifacts"))
+    artifact = store.save_artifact(source_document=_source(), output_format="json", media_type="application/json", content="{}")
+    counter = Path(f"{artifact.storage_path}.refs")
+
+    assert counter.read_text(encoding="ascii") == "1"
+    store.release(artifact.storage_path)
+
+    assert not counter.exists()
+    assert store.reference_count(artifact.storage_path) == 0
+    assert not counter.exists()
+
+
+def test_expired_leases_release_artifacts_and_document_snapshots(tmp_path) -> None:
+    store = LocalArtifactStore(base_dir=str(tmp_path / "artifacts"), retention_hours=1)
+    artifact = store.save_artifact(source_document=_source(), output_format="markdown", media_type="text/markdown", content="# CV")
+    ref = store.save_payload(source_document=_source(), payload=DOCLING_PAYLOAD)
+    document_id = store.save_document(source_document=_source(), document=_document({"docling": ref}))
+    render = store.deferred_artifact(
+        source_document=_source(),
+        document_id=document_id,
+        output_format="json",
+        media_type="application/json",
+    )
+    store.save_deferred_artifact(storage_path=render.storage_path, write=lambda sink: sink.write(b"{}"))
+
+    assert store.purge_expired() == 0
+    assert store.purge_expired(now=time.time() + 3 * 3600) == 2
+
+    assert not Path(artifact.storage_path).exists()
+    assert not store.document_path(document_id).exists()
+    assert not Path(ref.storage_path).exists()
+    assert not Path(render.storage_path).exists()
+    assert not list((tmp_path / "artifacts" / "blobs").rglob("*.refs"))
+
+
+def test_deduplicated_snapshots_release_every_payload_reference(tmp_path) -> None:
+    store = LocalArtifactStore(base_dir=str(tmp_path / "artifacts"), retention_hours=1)
+    first_ref = store.save_payload(source_document=_source(), payload=DOCLING_PAYLOAD)
+    second_ref = store.save_payload(source_document=_source(), payload=DOCLING_PAYLOAD)
+    first_id = store.save_document(source_document=_source(), document=_document({"docling": first_ref}))
+    second_id = store.save_document(source_document=_source(), document=_document({"docling": second_ref}))
+
+    assert first_id == second_id
+    assert store.reference_count(first_ref.storage_path) == 2
+    assert store.purge_expired(now=time.time() + 3 * 3600) == 2
+
+    assert not store.document_path(first_id).exists()
+    assert not Path(first_ref.storage_path).exists()
+    assert not list((tmp_path / "artifacts" / "blobs").rglob("*.refs"))
@@ -28,6 +28,8 @@ class FakeStorage:
                 "content_type": content_type,
                 "size_bytes": len(payload),
                 "storage_path": Path("/tmp/input.txt"),
+                "sha256": None,
+                "detected_media_type": None,
             },
         )
 
@@ -50,7 +52,14 @@ class FakePipeline:
 
 
 class FakeOrchestrator:
-    def generate(self, *, cv_text: str, job_description: str, graph_id: str | None = None) -> CvGenerationResult:
+    def generate(
+        self,
+        *,
+        cv_text: str,
+        job_description: str,
+        graph_id: str | None = None,
+        user_id: str | None = None,
+    ) -> CvGenerationResult:
         assert cv_text == "source cv text"
         assert job_description == "Data platform architect"
         assert graph_id in {None, "cv_rewrite_v1"}
@@ -69,7 +78,14 @@ class FakeOrchestrator:
 
 
 class FailingOrchestrator:
-    def generate(self, *, cv_text: str, job_description: str, graph_id: str | None = None) -> CvGenerationResult:
+    def generate(
+        self,
+        *,
+        cv_text: str,
+        job_description: str,
+        graph_id: str | None = None,
+        user_id: str | None = None,
+    ) -> CvGenerationResult:
         raise RuntimeError("orchestrator failed")
 
 
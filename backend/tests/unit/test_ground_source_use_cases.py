@@ -1,4 +1,5 @@
 from datetime import UTC, datetime
+from hashlib import sha256
 from io import BytesIO
 from pathlib import Path
 
@@ -8,6 +9,7 @@ from app.application.errors import (
     GroundSourceNotFoundError,
     InvalidGroundSourceNameError,
     InvalidJobDescriptionError,
+    InvalidPageCursorError,
     MissingFileNameError,
     UploadedFileTooLargeError,
 )
@@ -17,7 +19,7 @@ from app.application.use_cases.generate_targeted_cv_from_source import GenerateT
 from app.application.use_cases.list_ground_sources import ListGroundSourcesUseCase
 from app.domain.models.cv_generation import CvGenerationResult, OrientationDecision
 from app.domain.models.document_pipeline import CanonicalDocument, DocumentProcessingResult, ProcessingReport
-from app.domain.models.ground_source import GroundSource
+from app.domain.models.ground_source import GroundSource, GroundSourceDeletion
 from app.domain.services.file_storage import FileTooLargeError
 
 
@@ -25,12 +27,15 @@ class FakeStorage:
     def __init__(self, should_raise_too_large: bool = False) -> None:
         self.should_raise_too_large = should_raise_too_large
         self.deleted_paths: list[str] = []
+        self.persisted_paths: list[str] = []
+        self.saved = 0
 
     def save_from_stream(self, *, stream, original_name: str, content_type: str, max_size_bytes: int):
         if self.should_raise_too_large:
             raise FileTooLargeError("File is too large")
 
         payload = stream.read()
+        self.saved += 1
         return type(
             "StoredFile",
             (),
@@ -38,10 +43,15 @@ class FakeStorage:
                 "original_name": original_name,
                 "content_type": content_type,
                 "size_bytes": len(payload),
-                "storage_path": Path("/tmp/fake_source.txt"),
+                "storage_path": Path(f"/tmp/fake_source_{self.saved}.txt"),
+                "sha256": sha256(payload).hexdigest(),
+                "detected_media_type": None,
             },
         )
 
+    def persist(self, *, stored_file) -> None:
+        self.persisted_paths.append(str(stored_file.storage_path))
+
     def delete(self, *, storage_path: str) -> None:
         self.deleted_paths.append(storage_path)
 
@@ -52,8 +62,12 @@ class FailingCleanupStorage:
 
 
 class FakePipeline:
+    def __init__(self) -> None:
+        self.calls = 0
+
     def execute(self, *, source_document, output_formats):
         assert output_formats == ()
+        self.calls += 1
         return DocumentProcessingResult(
             canonical_document=CanonicalDocument(
                 schema_version="1.0",
@@ -86,6 +100,7 @@ class FakeSourceRepository:
         storage_path: str,
         canonical_text: str,
         content_hash: str,
+        source_sha256: str | None = None,
     ) -> GroundSource:
         self._counter += 1
         created = GroundSource(
@@ -100,12 +115,50 @@ class FakeSourceRepository:
             content_hash=content_hash,
             created_at=datetime.now(UTC),
             updated_at=datetime.now(UTC),
+            source_sha256=source_sha256,
         )
         self.items[created.id] = created
         return created
 
-    def list_for_user(self, *, user_id: str) -> list[GroundSource]:
-        return [item for item in self.items.values() if item.user_id == user_id]
+    def list_for_user(self, *, user_id: str, limit: int, after=None) -> list[GroundSource]:
+        items = sorted(
+            (item for item in self.items.values() if item.user_id == user_id),
+            key=lambda item: (item.created_at, item.id),
+            reverse=True,
+        )
+        if after is not None:
+            items = [item for item in items if (item.created_at, item.id) < after]
+        return items[:limit]
+
+    def find_by_source_sha256(self, *, user_id: str, source_sha256: str) -> GroundSource | None:
+        for item in self.items.values():
+            if item.user_id == user_id and item.source_sha256 == source_sha256:
+                return item
+        return None
+
+    def create_from_existing(
+        self,
+        *,
+        source_id: str,
+        user_id: str,
+        name: str,
+        original_filename: str,
+        content_type: str,
+    ) -> GroundSource | None:
+        existing = self.items.get(source_id)
+        if existing is None or existing.user_id != user_id:
+            return None
+        return self.create(
+            user_id=user_id,
+            name=name,
+            original_filename=original_filename,
+            content_type=content_type,
+            size_bytes=existing.size_bytes,
+            storage_path=existing.storage_path,
+            canonical_text=existing.canonical_text,
+            content_hash=existing.content_hash,
+            source_sha256=existing.source_sha256,
+        )
 
     def get_for_user(self, *, source_id: str, user_id: str) -> GroundSource | None:
         source = self.items.get(source_id)
@@ -113,19 +166,29 @@ class FakeSourceRepository:
             return None
         return source
 
-    def delete_for_user(self, *, source_id: str, user_id: str) -> bool:
+    def delete_for_user(self, *, source_id: str, user_id: str) -> GroundSourceDeletion | None:
         source = self.items.get(source_id)
         if source is None or source.user_id != user_id:
-            return False
+            return None
         del self.items[source_id]
-        return True
+        shared = any(
+            item.user_id == user_id and item.storage_path == source.storage_path for item in self.items.values()
+        )
+        return GroundSourceDeletion(storage_path=source.storage_path, storage_shared=shared)
 
 
 class FakeOrchestrator:
     def __init__(self) -> None:
         self.last_call: tuple[str, str, str | None] | None = None
 
-    def generate(self, *, cv_text: str, job_description: str, graph_id: str | None = None) -> CvGenerationResult:
+    def generate(
+        self,
+        *,
+        cv_text: str,
+        job_description: str,
+        graph_id: str | None = None,
+        user_id: str | None = None,
+    ) -> CvGenerationResult:
         self.last_call = (cv_text, job_description, graph_id)
         return CvGenerationResult(
             run_id="run_123",
@@ -164,6 +227,87 @@ def test_create_ground_source_success() -> None:
     assert result.processing_report.engine_name == "fake_ingestor"
 
 
+def test_create_ground_source_reuses_identical_upload_without_ingestion() -> None:
+    repository = FakeSourceRepository()
+    storage = FakeStorage()
+    pipeline = FakePipeline()
+    use_case = CreateGroundSourceUseCase(
+        sources=repository,
+        storage=storage,
+        max_upload_size_bytes=1024,
+        document_pipeline=pipeline,
+    )
+
+    first = use_case.execute(
+        user_id="user_1",
+        name="Primary resume",
+        filename="resume.txt",
+        content_type="text/plain",
+        stream=BytesIO(b"hello"),
+    )
+    second = use_case.execute(
+        user_id="user_1",
+        name="Same resume again",
+        filename="copy.txt",
+        content_type="text/plain",
+        stream=BytesIO(b"hello"),
+    )
+    use_case.execute(
+        user_id="user_2",
+        name="Someone else",
+        filename="resume.txt",
+        content_type="text/plain",
+        stream=BytesIO(b"hello"),
+    )
+
+    assert pipeline.calls == 2
+    assert second.processing_report.engine_name == "ground_source_reuse"
+    assert second.source.id != first.source.id
+    assert second.source.name == "Same resume again"
+    assert second.source.original_filename == "copy.txt"
+    assert second.source.canonical_text == first.source.canonical_text
+    assert second.source.storage_path == first.source.storage_path
+    assert storage.deleted_paths == ["/tmp/fake_source_2.txt"]
+    assert storage.persisted_paths == ["/tmp/fake_source_1.txt", "/tmp/fake_source_3.txt"]
+    assert second.processing_report.warnings == [f"ground_source_reused: source_id={first.source.id}"]
+
+
+def test_create_ground_source_ingests_upload_when_the_duplicate_was_just_deleted() -> None:
+    repository = FakeSourceRepository()
+    storage = FakeStorage()
+    pipeline = FakePipeline()
+    use_case = CreateGroundSourceUseCase(
+        sources=repository,
+        storage=storage,
+        max_upload_size_bytes=1024,
+        document_pipeline=pipeline,
+    )
+    first = use_case.execute(
+        user_id="user_1",
+        name="Primary resume",
+        filename="resume.txt",
+        content_type="text/plain",
+        stream=BytesIO(b"hello"),
+    )
+    stale = first.source
+    repository.find_by_source_sha256 = lambda **_: stale
+    repository.delete_for_user(source_id=stale.id, user_id="user_1")
+
+    second = use_case.execute(
+        user_id="user_1",
+        name="Again",
+        filename="resume.txt",
+        content_type="text/plain",
+        stream=BytesIO(b"hello"),
+    )
+
+    assert pipeline.calls == 2
+    assert second.processing_report.engine_name == "fake_ingestor"
+    assert second.source.storage_path == "/tmp/fake_source_2.txt"
+    assert storage.persisted_paths == ["/tmp/fake_source_1.txt", "/tmp/fake_source_2.txt"]
+    assert storage.deleted_paths == []
+
+
 def test_create_ground_source_rejects_missing_filename() -> None:
     use_case = CreateGroundSourceUseCase(
         sources=FakeSourceRepository(),
@@ -236,7 +380,8 @@ def test_create_ground_source_cleans_up_file_on_pipeline_failure() -> None:
             stream=BytesIO(b"x"),
         )
 
-    assert storage.deleted_paths == ["/tmp/fake_source.txt"]
+    assert storage.deleted_paths == ["/tmp/fake_source_1.txt"]
+    assert storage.persisted_paths == []
 
 
 def test_list_ground_sources_for_user() -> None:
@@ -265,8 +410,73 @@ def test_list_ground_sources_for_user() -> None:
     use_case = ListGroundSourcesUseCase(sources=repository)
     result = use_case.execute(user_id="user_1")
 
-    assert len(result) == 1
-    assert result[0].name == "Source A"
+    assert len(result.items) == 1
+    assert result.items[0].name == "Source A"
+    assert result.next_cursor is None
+
+
+def test_list_ground_sources_pages_with_cursor() -> None:
+    repository = FakeSourceRepository()
+    for index in range(5):
+        repository.create(
+            user_id="user_1",
+            name=f"Source {index}",
+            original_filename="a.txt",
+            content_type="text/plain",
+            size_bytes=1,
+            storage_path="/tmp/a.txt",
+            canonical_text="A",
+            content_hash=f"h{index}",
+        )
+    use_case = ListGroundSourcesUseCase(sources=repository)
+
+    names: list[str] = []
+    cursor = None
+    while True:
+        page = use_case.execute(user_id="user_1", limit=2, cursor=cursor)
+        names.extend(item.name for item in page.items)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert sorted(names) == [f"Source {index}" for index in range(5)]
+    assert len(names) == 5
+
+
+def test_list_ground_sources_rejects_malformed_cursor() -> None:
+    use_case = ListGroundSourcesUseCase(sources=FakeSourceRepository())
+
+    with pytest.raises(InvalidPageCursorError):
+        use_case.execute(user_id="user_1", cursor="not-a-cursor")
+
+
+def test_delete_ground_source_keeps_file_shared_with_another_source() -> None:
+    repository = FakeSourceRepository()
+    storage = FakeStorage()
+    create = CreateGroundSourceUseCase(
+        sources=repository,
+        storage=storage,
+        max_upload_size_bytes=1024,
+        document_pipeline=FakePipeline(),
+    )
+    sources = [
+        create.execute(
+            user_id="user_1",
+            name=name,
+            filename="resume.txt",
+            content_type="text/plain",
+            stream=BytesIO(b"hello"),
+        ).source
+        for name in ("First", "Second")
+    ]
+    storage.deleted_paths.clear()
+    delete = DeleteGroundSourceUseCase(sources=repository, storage=storage)
+
+    delete.execute(user_id="user_1", source_id=sources[0].id)
+    assert storage.deleted_paths == []
+
+    delete.execute(user_id="user_1", source_id=sources[1].id)
+    assert storage.deleted_paths == [sources[0].storage_path]
 
 
 def test_delete_ground_source_not_found() -> None:
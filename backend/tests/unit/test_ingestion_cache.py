@@ -0,0 +1,162 @@
+import hashlib
+import threading
+import time
+from pathlib import Path
+
+from app.domain.models.document_pipeline import (
+    CanonicalDocument,
+    IngestionPolicy,
+    IngestionResult,
+    InputDocument,
+    ProcessingReport,
+)
+from app.infrastructure.ingestion.caching_document_ingestor import CachingDocumentIngestor
+from app.infrastructure.ingestion.local_ingestion_cache import LocalIngestionCache
+
+
+class SlowIngestor:
+    def __init__(self, delay_seconds: float = 0.0) -> None:
+        self.delay_seconds = delay_seconds
+        self.calls: list[bool] = []
+        self._lock = threading.Lock()
+
+    def supports(self, media_type: str) -> bool:
+        return media_type == "application/pdf"
+
+    def ingest(self, document: InputDocument, *, policy: IngestionPolicy | None = None) -> IngestionResult:
+        with self._lock:
+            self.calls.append(policy.ocr_enabled if policy else False)
+        time.sleep(self.delay_seconds)
+        return IngestionResult(
+            canonical_document=CanonicalDocument(
+                schema_version="1.0",
+                source_media_type=document.media_type,
+                text="# CV",
+                metadata={"original_name": document.original_name},
+                extensions={"docling": {"pages": [1, 2]}},
+            ),
+            report=ProcessingReport(engine_name="docling", engine_version="2.0"),
+        )
+
+
+def _document(tmp_path: Path, content: bytes = b"%PDF-1.7 cv") -> InputDocument:
+    source = tmp_path / "cv.pdf"
+    source.write_bytes(content)
+    return InputDocument(source_path=source, original_name="cv.pdf", media_type="application/pdf")
+
+
+def _ingestor(tmp_path: Path, delegate: SlowIngestor) -> CachingDocumentIngestor:
+    return CachingDocumentIngestor(
+        delegate=delegate,
+        cache=LocalIngestionCache(tmp_path / "cache"),
+        engine_name="docling",
+        engine_version="2.0",
+    )
+
+
+def test_second_ingestion_of_same_content_and_policy_is_served_from_cache(tmp_path) -> None:
+    delegate = SlowIngestor()
+    ingestor = _ingestor(tmp_path, delegate)
+    document = _document(tmp_path)
+
+    first = ingestor.ingest(document, policy=IngestionPolicy(ocr_enabled=False))
+    second = ingestor.ingest(document, policy=IngestionPolicy(ocr_enabled=False))
+    with_ocr = ingestor.ingest(document, policy=IngestionPolicy(ocr_enabled=True))
+
+    assert delegate.calls == [False, True]
+    assert second.canonical_document == first.canonical_document
+    assert second.report.warnings == []
+    assert with_ocr.report.warnings == []
+
+
+def test_concurrent_ingestions_of_same_file_share_one_conversion(tmp_path) -> None:
+    delegate = SlowIngestor(delay_seconds=0.2)
+    ingestor = _ingestor(tmp_path, delegate)
+    document = _document(tmp_path)
+    results: list[IngestionResult] = []
+
+    threads = [threading.Thread(target=lambda: results.append(ingestor.ingest(document))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(delegate.calls) == 1
+    assert len(results) == 4
+    assert {result.canonical_document.text for result in results} == {"# CV"}
+
+
+def test_follower_ingests_directly_when_the_leader_hangs(tmp_path) -> None:
+    release = threading.Event()
+
+    class HangingIngestor(SlowIngestor):
+        def ingest(self, document, *, policy=None):
+            result = super().ingest(document, policy=policy)
+            if len(self.calls) == 1:
+                release.wait(5)
+            return result
+
+    delegate = HangingIngestor()
+    ingestor = CachingDocumentIngestor(
+        delegate=delegate,
+        cache=LocalIngestionCache(tmp_path / "cache"),
+        engine_name="docling",
+        flight_timeout_seconds=0.05,
+    )
+    document = _document(tmp_path)
+    leader = threading.Thread(target=ingestor.ingest, args=(document,))
+    leader.start()
+    while not delegate.calls:
+        time.sleep(0.01)
+
+    follower_result = ingestor.ingest(document)
+    release.set()
+    leader.join()
+
+    assert follower_result.canonical_document.text == "# CV"
+    assert len(delegate.calls) == 2
+
+
+def test_cache_write_failure_does_not_fail_ingestion(tmp_path) -> None:
+    class FullDiskCache(LocalIngestionCache):
+        def put(self, key, result):
+            raise OSError(28, "No space left on device")
+
+    ingestor = CachingDocumentIngestor(
+        delegate=SlowIngestor(),
+        cache=FullDiskCache(tmp_path / "cache"),
+        engine_name="docling",
+    )
+
+    assert ingestor.ingest(_document(tmp_path)).canonical_document.text == "# CV"
+
+
+def test_cache_key_prefers_upload_hash_and_changes_with_engine_version(tmp_path) -> None:
+    document = _document(tmp_path)
+    hashed = InputDocument(
+        source_path=document.source_path,
+        original_name=document.original_name,
+        media_type=document.media_type,
+        content_sha256=hashlib.sha256(b"%PDF-1.7 cv").hexdigest(),
+    )
+    ingestor = _ingestor(tmp_path, SlowIngestor())
+    upgraded = CachingDocumentIngestor(
+        delegate=SlowIngestor(),
+        cache=LocalIngestionCache(tmp_path / "cache"),
+        engine_name="docling",
+        engine_version="2.1",
+    )
+
+    assert ingestor.cache_key(document) == ingestor.cache_key(hashed)
+    assert ingestor.cache_key(document) != upgraded.cache_key(document)
+
+
+def test_purge_expired_removes_old_entries(tmp_path) -> None:
+    cache = LocalIngestionCache(tmp_path / "cache", max_age_days=1)
+    result = SlowIngestor().ingest(_document(tmp_path))
+    cache.put("ab" * 32, result)
+
+    assert cache.get("ab" * 32) == result
+    assert cache.purge_expired(now=time.time() + 2 * 86400) == 1
+    assert cache.get("ab" * 32) is None
+
@@ -1,3 +1,10 @@
+import hashlib
+import io
+import tempfile
+
+import pytest
+
+from app.domain.services.file_storage import FileTooLargeError
 from app.infrastructure.storage.local_file_storage import LocalFileStorage
 
 
@@ -21,3 +28,78 @@ def test_delete_ignores_file_outside_upload_dir(tmp_path) -> None:
     storage.delete(storage_path=str(outside))
 
     assert outside.exists()
+
+
+def test_uploads_are_sharded_under_their_purpose(tmp_path) -> None:
+    storage = LocalFileStorage(upload_dir=str(tmp_path / "uploads"), purpose="ground_source")
+
+    stored = storage.save_from_stream(
+        stream=io.BytesIO(b"cv"),
+        original_name="my cv.txt",
+        content_type="text/plain",
+        max_size_bytes=1024,
+    )
+
+    relative = stored.storage_path.relative_to((tmp_path / "uploads").resolve())
+    file_id = relative.name.split("_", 1)[0]
+    assert relative.parts == ("ground_source", file_id[:2], file_id[2:4], f"{file_id}_my_cv.txt")
+
+
+def test_save_from_stream_records_content_hash(tmp_path) -> None:
+    storage = LocalFileStorage(upload_dir=str(tmp_path / "uploads"))
+
+    stored = storage.save_from_stream(
+        stream=io.BytesIO(b"%PDF-1.7 cv"),
+        original_name="cv.pdf",
+        content_type="application/pdf",
+        max_size_bytes=1024,
+    )
+
+    assert stored.sha256 == hashlib.sha256(b"%PDF-1.7 cv").hexdigest()
+
+
+def test_save_from_stream_detects_media_type_from_magic_bytes(tmp_path) -> None:
+    storage = LocalFileStorage(upload_dir=str(tmp_path / "uploads"), chunk_size=3)
+
+    stored = storage.save_from_stream(
+        stream=io.BytesIO(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n1 0 obj"),
+        original_name="cv.bin",
+        content_type="application/octet-stream",
+        max_size_bytes=1024,
+    )
+
+    assert stored.content_type == "application/octet-stream"
+    assert stored.detected_media_type == "application/pdf"
+
+
+def test_rolled_over_spool_is_copied_from_its_file_and_hashed(tmp_path) -> None:
+    storage = LocalFileStorage(upload_dir=str(tmp_path / "uploads"), chunk_size=4096)
+    content = b"%PDF-1.7\n" + bytes(range(256)) * 400
+    spool = tempfile.SpooledTemporaryFile(max_size=1024)
+    spool.write(content)
+    spool.seek(0)
+
+    stored = storage.save_from_stream(
+        stream=spool,
+        original_name="cv.pdf",
+        content_type="application/pdf",
+        max_size_bytes=len(content),
+    )
+
+    assert stored.storage_path.read_bytes() == content
+    assert stored.size_bytes == len(content)
+    assert stored.sha256 == hashlib.sha256(content).hexdigest()
+    assert stored.detected_media_type == "application/pdf"
+
+
+def test_oversize_file_backed_upload_is_rejected_before_copying(tmp_path) -> None:
+    storage = LocalFileStorage(upload_dir=str(tmp_path / "uploads"))
+    with tempfile.TemporaryFile() as upload:
+        upload.write(b"x" * 2048)
+        upload.seek(0)
+
+        with pytest.raises(FileTooLargeError):
+            storage.save_from_stream(stream=upload, original_name="big.txt", content_type="text/plain", max_size_bytes=1024)
+
+        assert upload.tell() == 0
+    assert not [path for path in (tmp_path / "uploads").rglob("*") if path.is_file()]
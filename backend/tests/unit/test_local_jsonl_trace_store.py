@@ -0,0 +1,61 @@
+import os
+from datetime import UTC, datetime, timedelta
+
+from app.domain.services.trace_store import TraceEvent
+from app.infrastructure.tracing.local_jsonl_trace_store import LocalJsonlTraceStore
+
+
+def _event(run_id: str, event: str = "stage_started") -> TraceEvent:
+    return TraceEvent(
+        run_id=run_id,
+        stage="ats_pass",
+        event=event,
+        timestamp=datetime(2026, 1, 1, tzinfo=UTC),
+    )
+
+
+def _age(path, seconds: int) -> None:
+    past = (datetime.now(UTC) - timedelta(seconds=seconds)).timestamp()
+    os.utime(path, (past, past))
+
+
+def test_store_shards_run_files_by_hash_prefix(tmp_path) -> None:
+    store = LocalJsonlTraceStore(tmp_path)
+    store.record(_event("run_a"))
+
+    path = store.resolve_path("run_a")
+    assert path.parent.parent == tmp_path / "active"
+    assert len(path.parent.name) == 2
+    assert [line["event"] for line in store.read_run("run_a")] == ["stage_started"]
+
+
+def test_compaction_moves_closed_runs_into_indexed_segments(tmp_path) -> None:
+    store = LocalJsonlTraceStore(tmp_path, compact_after_seconds=60)
+    for run_id in ("run_a", "run_b", "run_open"):
+        store.record(_event(run_id))
+        store.record(_event(run_id, event="stage_completed"))
+    _age(store.resolve_path("run_a"), 120)
+    _age(store.resolve_path("run_b"), 120)
+    legacy = tmp_path / "run_legacy.jsonl"
+    legacy.write_text(store.encode(_event("run_legacy")), encoding="utf-8")
+    _age(legacy, 120)
+
+    assert store.compact_closed_runs() == 3
+
+    assert not store.resolve_path("run_a").exists()
+    assert store.resolve_path("run_open").exists()
+    assert not legacy.exists()
+    assert len(list((tmp_path / "archive").glob("*.jsonl.gz"))) == 1
+    assert [line["event"] for line in store.read_run("run_b")] == ["stage_started", "stage_completed"]
+    assert [line["run_id"] for line in store.read_run("run_legacy")] == ["run_legacy"]
+    assert store.read_run("missing") == []
+
+
+def test_purge_expired_removes_old_segments(tmp_path) -> None:
+    store = LocalJsonlTraceStore(tmp_path, compact_after_seconds=0, retention_days=7)
+    store.record(_event("run_a"))
+    store.compact_closed_runs()
+
+    assert store.purge_expired(now=datetime.now(UTC) + timedelta(days=3)) == 0
+    assert store.purge_expired(now=datetime.now(UTC) + timedelta(days=9)) == 1
+    assert store.read_run("run_a") == []
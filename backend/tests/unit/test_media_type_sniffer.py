@@ -0,0 +1,25 @@
+import pytest
+
+from app.infrastructure.storage.media_type_sniffer import sniff_media_type
+
+
+@pytest.mark.parametrize(
+    ("head", "expected"),
+    [
+        (b"%PDF-1.4\n", "application/pdf"),
+        (b"\x89PNG\r\n\x1a\n\x00\x00", "image/png"),
+        (b"\xff\xd8\xff\xe0\x00\x10JFIF", "image/jpeg"),
+        (b"RIFF\x24\x00\x00\x00WEBPVP8 ", "image/webp"),
+        (b"II*\x00\x08\x00", "image/tiff"),
+        (b"PK\x03\x04\x14\x00", "application/zip"),
+        (b"BM" + (70).to_bytes(4, "little") + bytes(8) + (40).to_bytes(4, "little"), "image/bmp"),
+        (b"BMW Group - Senior Engineer, Munich", "text/plain"),
+        (b"BM", "text/plain"),
+        ("Jane Doe — Développeuse".encode("utf-8"), "text/plain"),
+        ("Résumé".encode("utf-8")[:-1], "text/plain"),
+        (b"\x00\x01\x02\x03binary", None),
+        (b"", None),
+    ],
+)
+def test_sniff_media_type(head: bytes, expected: str | None) -> None:
+    assert sniff_media_type(head) == expected
@@ -0,0 +1,69 @@
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.middleware.request_metrics import RequestMetricsMiddleware
+from app.core.metrics import HTTP_REQUEST_DURATION, MetricsRegistry, registry
+from app.infrastructure.metrics.multiprocess_metrics_store import MultiprocessMetricsStore
+
+
+def test_registry_renders_prometheus_text_format() -> None:
+    metrics = MetricsRegistry()
+    requests = metrics.counter("requests_total", "Requests.", ("route",))
+    latency = metrics.histogram("latency_seconds", "Latency.", buckets=(0.1, 1.0))
+    requests.inc(route='/a"b')
+    requests.inc(2, route='/a"b')
+    latency.observe(0.05)
+    latency.observe(0.5)
+    latency.observe(3)
+
+    rendered = metrics.render()
+
+    assert "# TYPE requests_total counter" in rendered
+    assert 'requests_total{route="/a\\"b"} 3' in rendered
+    assert 'latency_seconds_bucket{le="0.1"} 1' in rendered
+    assert 'latency_seconds_bucket{le="1"} 2' in rendered
+    assert 'latency_seconds_bucket{le="+Inf"} 3' in rendered
+    assert "latency_seconds_sum 3.55" in rendered
+    assert "latency_seconds_count 3" in rendered
+
+
+def test_multiprocess_store_merges_worker_snapshots(tmp_path) -> None:
+    metrics = MetricsRegistry()
+    requests = metrics.counter("requests_total", "Requests.")
+    in_flight = metrics.gauge("in_flight", "In flight.")
+    requests.inc(2)
+    in_flight.set(1)
+
+    exited_worker = MetricsRegistry()
+    exited_worker.counter("requests_total", "Requests.").inc(5)
+    exited_worker.gauge("in_flight", "In flight.").set(7)
+    (tmp_path / "999999999-exited.json").write_text(
+        json.dumps({"pid": 999999999, "metrics": exited_worker.snapshot()}),
+        encoding="utf-8",
+    )
+
+    rendered = MultiprocessMetricsStore(tmp_path, registry=metrics).render()
+
+    assert "requests_total 7" in rendered
+    assert "in_flight 1" in rendered
+
+
+def test_request_metrics_use_route_templates() -> None:
+    app = FastAPI()
+    app.add_middleware(RequestMetricsMiddleware)
+
+    @app.get("/items/{item_id}")
+    def read_item(item_id: str) -> dict[str, str]:
+        return {"item_id": item_id}
+
+    client = TestClient(app)
+    client.get("/items/1")
+    client.get("/items/2")
+    client.get("/missing")
+
+    series = HTTP_REQUEST_DURATION.snapshot()
+    assert sum(series[("GET", "/items/{item_id}", "200")][:-1]) == 2
+    assert ("GET", "unmatched", "404") in series
+    assert "threadpool_queue_depth" in registry.render()
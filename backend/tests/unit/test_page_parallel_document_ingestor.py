@@ -0,0 +1,308 @@
+import io
+import json
+import threading
+import time
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+
+from app.application.errors import IngestionFailedError
+from app.core import telemetry
+from app.domain.models.document_pipeline import (
+    CanonicalDocument,
+    IngestionPolicy,
+    IngestionResult,
+    InputDocument,
+    ProcessingReport,
+)
+from app.infrastructure.ingestion.docling_payload import (
+    merge_docling_payloads,
+    replace_docling_pages,
+    write_merged_docling_payloads,
+)
+from app.infrastructure.ingestion.page_parallel_document_ingestor import PageParallelDocumentIngestor
+from app.infrastructure.storage.local_artifact_store import LocalArtifactStore
+from app.infrastructure.tracing.span_exporters import InMemorySpanExporter
+
+
+class PageRangeIngestor:
+    def __init__(self, *, delay_seconds: float = 0.0, fail_on_page: int | None = None) -> None:
+        self.delay_seconds = delay_seconds
+        self.fail_on_page = fail_on_page
+        self.page_ranges: list[tuple[int, int] | None] = []
+        self._lock = threading.Lock()
+
+    def supports(self, media_type: str) -> bool:
+        return True
+
+    def ingest(self, document: InputDocument, *, policy: IngestionPolicy | None = None) -> IngestionResult:
+        with self._lock:
+            self.page_ranges.append(document.page_range)
+        start, end = document.page_range or (1, 1)
+        time.sleep(self.delay_seconds * (end - start + 1))
+        if self.fail_on_page is not None and start <= self.fail_on_page <= end:
+            raise IngestionFailedError(f"page {self.fail_on_page} is broken")
+        pages = range(start, end + 1)
+        payload = {
+            "body": {"self_ref": "#/body", "children": [{"$ref": f"#/texts/{index}"} for index, _ in enumerate(pages)]},
+            "texts": [
+                {"self_ref": f"#/texts/{index}", "parent": {"$ref": "#/body"}, "text": f"page {page}"}
+                for index, page in enumerate(pages)
+            ],
+            "pages": {str(page): {"page_no": page} for page in pages},
+        }
+        return IngestionResult(
+            canonical_document=CanonicalDocument(
+                schema_version="1.0",
+                source_media_type=document.media_type,
+                text="\n\n".join(f"page {page}" for page in pages),
+                metadata={"original_name": document.original_name},
+                extensions={"docling": payload},
+            ),
+            report=ProcessingReport(engine_name="docling", engine_version="2.56.0"),
+        )
+
+
+class StoringIngestor(PageRangeIngestor):
+    def __init__(self, store: LocalArtifactStore, *, inline_pages: set[int] = frozenset(), **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.store = store
+        self.inline_pages = inline_pages
+        self.refs: list = []
+
+    def ingest(self, document: InputDocument, *, policy: IngestionPolicy | None = None) -> IngestionResult:
+        result = super().ingest(document, policy=policy)
+        payload = result.canonical_document.extensions["docling"]
+        if document.page_range[0] in self.inline_pages:
+            return result
+        ref = self.store.save_payload(source_document=document, payload=payload)
+        with self._lock:
+            self.refs.append((document.page_range, ref, payload))
+        result.canonical_document.extensions["docling"] = ref
+        return result
+
+
+def _document(tmp_path: Path) -> InputDocument:
+    source = tmp_path / "cv.pdf"
+    source.write_bytes(b"%PDF-1.7")
+    return InputDocument(source_path=source, original_name="cv.pdf", media_type="application/pdf")
+
+
+@pytest.fixture
+def exporter() -> Iterator[InMemorySpanExporter]:
+    previous = telemetry._exporter
+    memory = InMemorySpanExporter()
+    telemetry.configure_span_exporter(memory)
+    yield memory
+    telemetry.configure_span_exporter(previous)
+
+
+def test_large_pdf_is_converted_in_concurrent_page_ranges_and_merged_in_order(tmp_path, exporter) -> None:
+    delegate = PageRangeIngestor(delay_seconds=0.05)
+    ingestor = PageParallelDocumentIngestor(delegate=delegate, max_parallel=3, min_pages=4, page_counter=lambda _: 6)
+
+    started = time.perf_counter()
+    result = ingestor.ingest(_document(tmp_path))
+    elapsed = time.perf_counter() - started
+
+    assert sorted(delegate.page_ranges) == [(1, 2), (3, 4), (5, 6)]
+    assert elapsed < 0.25
+    assert result.canonical_document.text == "\n\n".join(f"page {page}" for page in range(1, 7))
+    payload = result.canonical_document.extensions["docling"]
+    assert [item["text"] for item in payload["texts"]] == [f"page {page}" for page in range(1, 7)]
+    assert [child["$ref"] for child in payload["body"]["children"]] == [f"#/texts/{index}" for index in range(6)]
+    assert [item["self_ref"] for item in payload["texts"]] == [f"#/texts/{index}" for index in range(6)]
+    assert sorted(payload["pages"], key=int) == [str(page) for page in range(1, 7)]
+    assert result.report.warnings == []
+    spans = [span for span in exporter.spans() if span.name == "ingestion.page_parallel"]
+    assert spans[-1].attributes["pages"] == 6
+    assert spans[-1].attributes["chunks"] == 3
+
+
+def test_short_pdf_uses_a_single_conversion(tmp_path) -> None:
+    delegate = PageRangeIngestor()
+    ingestor = PageParallelDocumentIngestor(delegate=delegate, max_parallel=3, min_pages=4, page_counter=lambda _: 3)
+
+    result = ingestor.ingest(_document(tmp_path))
+
+    assert delegate.page_ranges == [None]
+    assert result.report.warnings == []
+
+
+def test_close_stops_accepting_page_ranges(tmp_path) -> None:
+    ingestor = PageParallelDocumentIngestor(
+        delegate=PageRangeIngestor(),
+        max_parallel=2,
+        min_pages=4,
+        page_counter=lambda _: 6,
+    )
+
+    ingestor.close()
+
+    with pytest.raises(RuntimeError):
+        ingestor.ingest(_document(tmp_path))
+
+
+def test_failing_page_range_fails_the_whole_ingestion(tmp_path) -> None:
+    delegate = PageRangeIngestor(fail_on_page=5)
+    ingestor = PageParallelDocumentIngestor(delegate=delegate, max_parallel=2, min_pages=4, page_counter=lambda _: 6)
+
+    with pytest.raises(IngestionFailedError, match="page 5"):
+        ingestor.ingest(_document(tmp_path))
+
+
+def test_merge_shifts_nested_references_of_later_parts() -> None:
+    first = {"texts": [{"self_ref": "#/texts/0"}], "tables": [], "body": {"children": [{"$ref": "#/texts/0"}]}}
+    second = {
+        "texts": [{"self_ref": "#/texts/0", "parent": {"$ref": "#/tables/0"}}],
+        "tables": [{"self_ref": "#/tables/0", "children": [{"$ref": "#/texts/0"}]}],
+        "body": {"children": [{"$ref": "#/tables/0"}]},
+    }
+
+    merged = merge_docling_payloads([first, second])
+
+    assert merged["texts"][1] == {"self_ref": "#/texts/1", "parent": {"$ref": "#/tables/0"}}
+    assert merged["tables"][0]["children"] == [{"$ref": "#/texts/1"}]
+    assert merged["body"]["children"] == [{"$ref": "#/texts/0"}, {"$ref": "#/tables/0"}]
+
+
+def test_streamed_merge_matches_the_in_memory_merge() -> None:
+    first = {
+        "schema_name": "DoclingDocument",
+        "texts": [{"self_ref": "#/texts/0", "text": "Émilie"}],
+        "tables": [],
+        "body": {"self_ref": "#/body", "children": [{"$ref": "#/texts/0"}]},
+        "pages": {"1": {"page_no": 1}},
+        "content": "one",
+    }
+    second = {
+        "texts": [{"self_ref": "#/texts/0", "parent": {"$ref": "#/tables/0"}}],
+        "tables": [{"self_ref": "#/tables/0", "children": [{"$ref": "#/texts/0"}]}],
+        "body": {"children": [{"$ref": "#/tables/0"}]},
+        "furniture": {"children": [{"$ref": "#/texts/0"}]},
+        "pages": {"2": {"page_no": 2}},
+        "content": "two",
+    }
+    third = {"texts": [], "pictures": [{"self_ref": "#/pictures/0"}], "pages": {"3": {"page_no": 3}}}
+    sink = io.BytesIO()
+
+    write_merged_docling_payloads(iter([first, second, third]), sink)
+
+    assert json.loads(sink.getvalue()) == merge_docling_payloads([first, second, third])
+
+
+def test_stored_page_payloads_are_merged_into_one_blob_and_released(tmp_path) -> None:
+    store = LocalArtifactStore(base_dir=str(tmp_path / "artifacts"))
+    delegate = StoringIngestor(store)
+    refs = delegate.refs
+
+    ingestor = PageParallelDocumentIngestor(
+        delegate=delegate,
+        max_parallel=2,
+        min_pages=4,
+        page_counter=lambda _: 4,
+        artifact_store=store,
+    )
+
+    merged = ingestor.ingest(_document(tmp_path)).canonical_document.extensions["docling"]
+
+    parts = [payload for _, _, payload in sorted(refs, key=lambda entry: entry[0])]
+    with store.open_payload(merged) as handle:
+        assert json.load(handle) == merge_docling_payloads(parts)
+    assert [store.reference_count(ref.storage_path) for _, ref, _ in refs] == [0, 0]
+    assert store.reference_count(merged.storage_path) == 1
+
+
+def test_failing_page_range_releases_the_payloads_of_the_other_chunks(tmp_path) -> None:
+    store = LocalArtifactStore(base_dir=str(tmp_path / "artifacts"))
+    delegate = StoringIngestor(store, fail_on_page=4, delay_seconds=0.02)
+    ingestor = PageParallelDocumentIngestor(
+        delegate=delegate,
+        max_parallel=3,
+        min_pages=4,
+        page_counter=lambda _: 6,
+        artifact_store=store,
+    )
+
+    with pytest.raises(IngestionFailedError, match="page 4"):
+        ingestor.ingest(_document(tmp_path))
+
+    assert [page_range for page_range, _, _ in sorted(delegate.refs, key=lambda entry: entry[0])] == [(1, 2), (5, 6)]
+    assert [store.reference_count(ref.storage_path) for _, ref, _ in delegate.refs] == [0, 0]
+
+
+def test_mixed_inline_and_stored_payloads_are_merged_through_the_store(tmp_path) -> None:
+    store = LocalArtifactStore(base_dir=str(tmp_path / "artifacts"))
+    delegate = StoringIngestor(store, inline_pages={1})
+    ingestor = PageParallelDocumentIngestor(
+        delegate=delegate,
+        max_parallel=2,
+        min_pages=4,
+        page_counter=lambda _: 4,
+        artifact_store=store,
+    )
+
+    merged = ingestor.ingest(_document(tmp_path)).canonical_document.extensions["docling"]
+
+    with store.open_payload(merged) as handle:
+        assert [item["text"] for item in json.load(handle)["texts"]] == [f"page {page}" for page in range(1, 5)]
+    assert [store.reference_count(ref.storage_path) for _, ref, _ in delegate.refs] == [0]
+    assert store.reference_count(merged.storage_path) == 1
+
+
+def test_stored_payloads_without_an_artifact_store_are_rejected(tmp_path) -> None:
+    store = LocalArtifactStore(base_dir=str(tmp_path / "artifacts"))
+    ingestor = PageParallelDocumentIngestor(
+        delegate=StoringIngestor(store),
+        max_parallel=2,
+        min_pages=4,
+        page_counter=lambda _: 4,
+    )
+
+    with pytest.raises(IngestionFailedError, match="cannot be merged"):
+        ingestor.ingest(_document(tmp_path))
+
+
+def test_chunk_spans_stay_in_the_request_trace(tmp_path, exporter) -> None:
+    class SpanningIngestor(PageRangeIngestor):
+        def ingest(self, document, *, policy=None):
+            with telemetry.start_span("ingestion.docling.convert"):
+                return super().ingest(document, policy=policy)
+
+    ingestor = PageParallelDocumentIngestor(
+        delegate=SpanningIngestor(), max_parallel=2, min_pages=4, page_counter=lambda _: 4
+    )
+
+    with telemetry.start_span("request") as request:
+        ingestor.ingest(_document(tmp_path))
+
+    parallel = next(span for span in exporter.spans() if span.name == "ingestion.page_parallel")
+    chunks = [span for span in exporter.spans() if span.name == "ingestion.docling.convert"]
+    assert len(chunks) == 2
+    assert {span.trace_id for span in chunks} == {request.trace_id}
+    assert {span.parent_span_id for span in chunks} == {parallel.span_id}
+
+
+def test_replace_pages_drops_items_of_replaced_pages_and_renumbers_the_rest() -> None:
+    first_pass = {
+        "texts": [
+            {"self_ref": "#/texts/0", "prov": [{"page_no": 1}], "text": "one"},
+            {"self_ref": "#/texts/1", "prov": [{"page_no": 2}], "text": "garbled"},
+            {"self_ref": "#/texts/2", "prov": [{"page_no": 3}], "text": "three"},
+        ],
+        "body": {"children": [{"$ref": "#/texts/0"}, {"$ref": "#/texts/1"}, {"$ref": "#/texts/2"}]},
+        "pages": {"1": {"page_no": 1}, "2": {"page_no": 2}, "3": {"page_no": 3}},
+    }
+    retried = {
+        "texts": [{"self_ref": "#/texts/0", "prov": [{"page_no": 2}], "text": "two"}],
+        "body": {"children": [{"$ref": "#/texts/0"}]},
+        "pages": {"2": {"page_no": 2, "ocr": True}},
+    }
+
+    merged = replace_docling_pages(first_pass, [retried], page_numbers={2})
+
+    assert [item["text"] for item in merged["texts"]] == ["one", "three", "two"]
+    assert [item["self_ref"] for item in merged["texts"]] == ["#/texts/0", "#/texts/1", "#/texts/2"]
+    assert merged["body"]["children"] == [{"$ref": "#/texts/0"}, {"$ref": "#/texts/1"}, {"$ref": "#/texts/2"}]
+    assert merged["pages"]["2"] == {"page_no": 2, "ocr": True}
@@ -0,0 +1,34 @@
+import pytest
+from fpdf import FPDF
+
+from app.domain.models.document_pipeline import InputDocument
+from app.infrastructure.ingestion.pdf_text_layer_prober import PdfTextLayerProber
+
+
+def test_probe_counts_pages_without_text_layer(tmp_path) -> None:
+    pytest.importorskip("pypdfium2")
+    pdf = FPDF()
+    pdf.set_font("Helvetica", size=12)
+    pdf.add_page()
+    pdf.multi_cell(0, 8, "Senior engineer with ten years of backend experience in Python and Go.")
+    pdf.add_page()
+    source = tmp_path / "cv.pdf"
+    pdf.output(str(source))
+
+    probe = PdfTextLayerProber().probe(
+        InputDocument(source_path=source, original_name="cv.pdf", media_type="application/pdf")
+    )
+
+    assert probe is not None
+    assert probe.page_count == 2
+    assert probe.pages_without_text == 1
+    assert probe.text_chars > 16
+
+
+def test_probe_ignores_non_pdf_documents(tmp_path) -> None:
+    source = tmp_path / "cv.txt"
+    source.write_text("hello", encoding="utf-8")
+
+    assert PdfTextLayerProber().probe(
+        InputDocument(source_path=source, original_name="cv.txt", media_type="text/plain")
+    ) is None
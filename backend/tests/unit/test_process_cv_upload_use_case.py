@@ -26,6 +26,8 @@ class FakeStorage:
                 "content_type": content_type,
                 "size_bytes": len(payload),
                 "storage_path": Path("/tmp/fake.txt"),
+                "sha256": None,
+                "detected_media_type": None,
             },
         )
 
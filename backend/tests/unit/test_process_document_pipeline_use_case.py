@@ -1,3 +1,9 @@
+import io
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from pathlib import Path
 
 import pytest
@@ -5,15 +11,22 @@ import pytest
 from app.application.errors import IngestionFailedError, IngestorNotFoundError, LowQualityExtractionError, UnsupportedOutputFormatError
 from app.application.services.ocr_policy_strategy import RuleBasedOcrPolicyStrategy
 from app.application.use_cases.process_document_pipeline import ProcessDocumentPipelineUseCase
+from app.core.metrics import DOCUMENT_OCR_RETRIES
 from app.domain.models.document_pipeline import (
     CanonicalDocument,
+    DocumentPage,
+    DocumentProbe,
     IngestionResult,
     IngestionPolicy,
     InputDocument,
+    PayloadRef,
     ProcessingReport,
     RenderedArtifact,
 )
 from app.domain.services.ingestion_quality_validator import IngestionQualityAssessment
+from app.infrastructure.ingestion.docling_payload import DoclingPayloadMerger
+from app.infrastructure.rendering.compact_document_renderer import CompactDocumentRenderer
+from app.infrastructure.storage.local_artifact_store import LocalArtifactStore
 
 
 class FakeIngestor:
@@ -137,6 +150,24 @@ def test_pipeline_fails_when_output_format_missing() -> None:
         )
 
 
+def test_binary_formats_are_rejected_without_a_streaming_store() -> None:
+    use_case = ProcessDocumentPipelineUseCase(
+        ingestors=[FakeIngestor({"application/pdf"})],
+        renderers=[FakeRenderer("markdown", "text/markdown"), CompactDocumentRenderer()],
+        artifact_store=FakeArtifactStore(),
+    )
+
+    with pytest.raises(UnsupportedOutputFormatError):
+        use_case.execute(
+            source_document=InputDocument(
+                source_path=Path("/tmp/resume.pdf"),
+                original_name="resume.pdf",
+                media_type="application/pdf",
+            ),
+            output_formats=("markdown", "cdoc"),
+        )
+
+
 def test_pipeline_fails_when_all_ingestors_fail() -> None:
     class FailingIngestor(FakeIngestor):
         def ingest(self, document: InputDocument, *, policy: IngestionPolicy | None = None) -> IngestionResult:
@@ -222,3 +253,348 @@ def test_pipeline_retries_with_ocr_when_quality_fails() -> None:
         "OcrAwareIngestor(ocr=off)",
         "OcrAwareIngestor(ocr=on)",
     ]
+
+
+def test_pipeline_retries_only_failing_pages_with_ocr() -> None:
+    class PagedIngestor(FakeIngestor):
+        def __init__(self) -> None:
+            super().__init__({"application/pdf"})
+            self.calls: list[tuple[bool, tuple[int, int] | None]] = []
+
+        def ingest(self, document: InputDocument, *, policy: IngestionPolicy | None = None) -> IngestionResult:
+            ocr_on = bool(policy and policy.ocr_enabled)
+            self.calls.append((ocr_on, document.page_range))
+            first, last = document.page_range or (1, 3)
+            pages = [
+                DocumentPage(page_no=page_no, text="" if page_no == 2 and not ocr_on else f"Experience on page {page_no}")
+                for page_no in range(first, last + 1)
+            ]
+            canonical = CanonicalDocument(
+                schema_version="1.0",
+                source_media_type=document.media_type,
+                text="\n\n".join(page.text for page in pages),
+                pages=pages,
+            )
+            return IngestionResult(
+                canonical_document=canonical,
+                report=ProcessingReport(engine_name="paged", engine_version="1"),
+            )
+
+    class PageQualityValidator:
+        def assess(self, document: CanonicalDocument) -> IngestionQualityAssessment:
+            if not document.text.strip():
+                return IngestionQualityAssessment(accepted=False, score=0.0, flags=["empty_text"])
+            return IngestionQualityAssessment(accepted=True, score=0.95, flags=[])
+
+    ingestor = PagedIngestor()
+    use_case = ProcessDocumentPipelineUseCase(
+        ingestors=[ingestor],
+        renderers=[FakeRenderer("json", "application/json")],
+        artifact_store=FakeArtifactStore(),
+        quality_validator=PageQualityValidator(),
+        ocr_policy_strategy=RuleBasedOcrPolicyStrategy(default_ocr_enabled=False, auto_retry_on_quality_failure=True),
+    )
+
+    result = use_case.execute(
+        source_document=InputDocument(
+            source_path=Path("/tmp/resume.pdf"),
+            original_name="resume.pdf",
+            media_type="application/pdf",
+        ),
+        output_formats=("json",),
+    )
+
+    assert ingestor.calls == [(False, None), (True, (2, 2))]
+    assert [page.text for page in result.canonical_document.pages] == [
+        "Experience on page 1",
+        "Experience on page 2",
+        "Experience on page 3",
+    ]
+    assert "Experience on page 2" in result.canonical_document.text
+    assert result.report.engine_attempts == ["PagedIngestor(ocr=off)", "PagedIngestor(ocr=on, pages=2-2)"]
+    assert "ocr_pages: 2" in result.report.warnings
+    assert "ocr_policy: enabled=true, reason=page_quality_retry" in result.report.warnings
+
+
+class StoredPayloadIngestor(FakeIngestor):
+    def __init__(self, store: LocalArtifactStore, *, retry_pages: bool = True) -> None:
+        super().__init__({"application/pdf"})
+        self.store = store
+        self.retry_pages = retry_pages
+        self.refs: list[PayloadRef] = []
+
+    def ingest(self, document: InputDocument, *, policy: IngestionPolicy | None = None) -> IngestionResult:
+        ocr_on = bool(policy and policy.ocr_enabled)
+        first, last = document.page_range or (1, 3)
+        if ocr_on and not self.retry_pages:
+            first, last = 0, -1
+        pages = [
+            DocumentPage(page_no=page_no, text="" if page_no == 2 and not ocr_on else f"Page {page_no} ocr={ocr_on}")
+            for page_no in range(first, last + 1)
+        ]
+        ref = self.store.save_payload(
+            source_document=document,
+            payload={
+                "texts": [
+                    {"self_ref": f"#/texts/{index}", "prov": [{"page_no": page.page_no}], "text": page.text}
+                    for index, page in enumerate(pages)
+                ],
+            },
+        )
+        self.refs.append(ref)
+        canonical = CanonicalDocument(
+            schema_version="1.0",
+            source_media_type=document.media_type,
+            text="\n\n".join(page.text for page in pages),
+            extensions={"docling": ref},
+            pages=pages,
+        )
+        return IngestionResult(canonical_document=canonical, report=ProcessingReport(engine_name="stored"))
+
+
+class NonEmptyTextValidator:
+    def assess(self, document: CanonicalDocument) -> IngestionQualityAssessment:
+        if not document.text.strip():
+            return IngestionQualityAssessment(accepted=False, score=0.0, flags=["empty_text"])
+        return IngestionQualityAssessment(accepted=True, score=0.95, flags=[])
+
+
+def _page_retry_use_case(ingestor: StoredPayloadIngestor) -> ProcessDocumentPipelineUseCase:
+    return ProcessDocumentPipelineUseCase(
+        ingestors=[ingestor],
+        renderers=[FakeRenderer("json", "application/json")],
+        artifact_store=ingestor.store,
+        quality_validator=NonEmptyTextValidator(),
+        ocr_policy_strategy=RuleBasedOcrPolicyStrategy(default_ocr_enabled=False, auto_retry_on_quality_failure=True),
+        deferred_rendering=True,
+        payload_merger=DoclingPayloadMerger(),
+    )
+
+
+def test_page_retry_splices_ocr_pages_into_the_stored_engine_payload(tmp_path) -> None:
+    store = LocalArtifactStore(base_dir=str(tmp_path / "artifacts"))
+    ingestor = StoredPayloadIngestor(store)
+
+    result = _page_retry_use_case(ingestor).execute(
+        source_document=InputDocument(source_path=tmp_path / "cv.pdf", original_name="cv.pdf", media_type="application/pdf"),
+        output_formats=("json",),
+    )
+
+    merged = result.canonical_document.extensions["docling"]
+    with store.open_payload(merged) as handle:
+        texts = [item["text"] for item in json.load(handle)["texts"]]
+    assert texts == ["Page 1 ocr=False", "Page 3 ocr=False", "Page 2 ocr=True"]
+    assert [store.reference_count(ref.storage_path) for ref in ingestor.refs] == [0, 0]
+    assert store.reference_count(merged.storage_path) == 1
+
+
+def test_unusable_page_retry_releases_its_payload_and_records_no_attempt(tmp_path) -> None:
+    store = LocalArtifactStore(base_dir=str(tmp_path / "artifacts"))
+    ingestor = StoredPayloadIngestor(store, retry_pages=False)
+    retries_before = DOCUMENT_OCR_RETRIES.snapshot().get(("application/pdf",), 0.0)
+
+    result = _page_retry_use_case(ingestor).execute(
+        source_document=InputDocument(source_path=tmp_path / "cv.pdf", original_name="cv.pdf", media_type="application/pdf"),
+        output_formats=("json",),
+    )
+
+    assert result.report.engine_attempts == ["StoredPayloadIngestor(ocr=off)"]
+    assert DOCUMENT_OCR_RETRIES.snapshot().get(("application/pdf",), 0.0) == retries_before
+    assert result.canonical_document.extensions["docling"] == ingestor.refs[0]
+    assert store.reference_count(ingestor.refs[0].storage_path) == 1
+    assert store.reference_count(ingestor.refs[1].storage_path) == 0
+
+
+def test_engine_payload_is_exported_only_for_structured_formats_and_released_after_rendering(tmp_path) -> None:
+    class ExportRecordingIngestor(StoredPayloadIngestor):
+        def __init__(self, store: LocalArtifactStore) -> None:
+            super().__init__(store)
+            self.exports: list[bool] = []
+
+        def ingest(self, document: InputDocument, *, policy: IngestionPolicy | None = None) -> IngestionResult:
+            self.exports.append(document.export_engine_payload)
+            return super().ingest(replace(document, page_range=(1, 1)), policy=policy)
+
+    store = LocalArtifactStore(base_dir=str(tmp_path / "artifacts"))
+    ingestor = ExportRecordingIngestor(store)
+    use_case = ProcessDocumentPipelineUseCase(
+        ingestors=[ingestor],
+        renderers=[FakeRenderer("markdown", "text/markdown"), FakeRenderer("json", "application/json")],
+        artifact_store=store,
+    )
+    source = InputDocument(source_path=tmp_path / "cv.pdf", original_name="cv.pdf", media_type="application/pdf")
+
+    use_case.execute(source_document=source, output_formats=())
+    use_case.execute(source_document=source, output_formats=("markdown",))
+    use_case.execute(source_document=source, output_formats=("markdown", "json"))
+
+    assert ingestor.exports == [False, False, True]
+    assert [store.reference_count(ref.storage_path) for ref in ingestor.refs] == [0, 0, 0]
+
+
+def test_pipeline_enables_ocr_up_front_when_probe_finds_scanned_pages() -> None:
+    class RecordingIngestor(FakeIngestor):
+        def __init__(self) -> None:
+            super().__init__({"application/pdf"})
+            self.policies: list[bool] = []
+
+        def ingest(self, document: InputDocument, *, policy: IngestionPolicy | None = None) -> IngestionResult:
+            self.policies.append(bool(policy and policy.ocr_enabled))
+            return super().ingest(document, policy=policy)
+
+    class ScannedProber:
+        def probe(self, document: InputDocument) -> DocumentProbe:
+            return DocumentProbe(page_count=2, pages_without_text=2, pages_with_images=2, text_chars=0)
+
+    ingestor = RecordingIngestor()
+    use_case = ProcessDocumentPipelineUseCase(
+        ingestors=[ingestor],
+        renderers=[FakeRenderer("json", "application/json")],
+        artifact_store=FakeArtifactStore(),
+        quality_validator=FakeQualityValidator(accepted=True),
+        ocr_policy_strategy=RuleBasedOcrPolicyStrategy(default_ocr_enabled=False),
+        document_prober=ScannedProber(),
+    )
+
+    result = use_case.execute(
+        source_document=InputDocument(
+            source_path=Path("/tmp/scan.pdf"),
+            original_name="scan.pdf",
+            media_type="application/pdf",
+        ),
+        output_formats=("json",),
+    )
+
+    assert ingestor.policies == [True]
+    assert "ocr_policy: enabled=true, reason=probe_scanned_pages=2/2" in result.report.warnings
+
+
+def test_probe_with_text_layer_keeps_ocr_off() -> None:
+    strategy = RuleBasedOcrPolicyStrategy(default_ocr_enabled=False, probe_scanned_page_ratio=0.5)
+    document = InputDocument(source_path=Path("/tmp/cv.pdf"), original_name="cv.pdf", media_type="application/pdf")
+
+    policy = strategy.initial_policy(
+        document,
+        probe=DocumentProbe(page_count=4, pages_without_text=1, pages_with_images=1, text_chars=5400),
+    )
+
+    assert policy == IngestionPolicy(ocr_enabled=False, decision_reason="probe_text_layer_pages_without_text=1/4")
+
+
+def test_pipeline_routes_by_detected_media_type() -> None:
+    use_case = ProcessDocumentPipelineUseCase(
+        ingestors=[FakeIngestor({"text/plain"}), FakeIngestor({"application/pdf"})],
+        renderers=[FakeRenderer("json", "application/json")],
+        artifact_store=FakeArtifactStore(),
+    )
+
+    result = use_case.execute(
+        source_document=InputDocument(
+            source_path=Path("/tmp/resume.bin"),
+            original_name="resume.bin",
+            media_type="application/octet-stream",
+            detected_media_type="application/pdf",
+        ),
+        output_formats=("json",),
+    )
+
+    assert result.report.engine_attempts == ["FakeIngestor(ocr=off)"]
+    assert "media_type_sniffed: declared=application/octet-stream, detected=application/pdf" in result.report.warnings
+
+
+def test_racing_returns_first_accepted_result_and_lists_every_engine() -> None:
+    release_slow = threading.Event()
+
+    class SlowIngestor(FakeIngestor):
+        def ingest(self, document: InputDocument, *, policy: IngestionPolicy | None = None) -> IngestionResult:
+            release_slow.wait(5)
+            raise IngestionFailedError("slow engine gave up")
+
+    class BrokenIngestor(FakeIngestor):
+        def ingest(self, document: InputDocument, *, policy: IngestionPolicy | None = None) -> IngestionResult:
+            raise IngestionFailedError("broken")
+
+    class SteadyIngestor(FakeIngestor):
+        def ingest(self, document: InputDocument, *, policy: IngestionPolicy | None = None) -> IngestionResult:
+            time.sleep(0.1)
+            return super().ingest(document, policy=policy)
+
+    use_case = ProcessDocumentPipelineUseCase(
+        ingestors=[SlowIngestor({"application/pdf"}), BrokenIngestor({"application/pdf"}), SteadyIngestor({"application/pdf"})],
+        renderers=[FakeRenderer("json", "application/json")],
+        artifact_store=FakeArtifactStore(),
+        quality_validator=FakeQualityValidator(accepted=True),
+        racing_executor=ThreadPoolExecutor(max_workers=3),
+    )
+
+    try:
+        result = use_case.execute(
+            source_document=InputDocument(
+                source_path=Path("/tmp/resume.pdf"),
+                original_name="resume.pdf",
+                media_type="application/pdf",
+            ),
+            output_formats=("json",),
+        )
+    finally:
+        release_slow.set()
+
+    assert result.canonical_document.text == "Hello"
+    assert result.report.engine_attempts == [
+        "SlowIngestor(ocr=off, race=abandoned)",
+        "BrokenIngestor(ocr=off, race=failed)",
+        "SteadyIngestor(ocr=off, race=won)",
+    ]
+
+
+def test_pipeline_streams_formats_concurrently_in_request_order() -> None:
+    class SlowStreamingRenderer(FakeRenderer):
+        def render_to(self, document: CanonicalDocument, sink) -> None:
+            time.sleep(0.15)
+            sink.write(f"{self.output_format}:{document.text}".encode("utf-8"))
+
+    class InMemoryStreamingStore(FakeArtifactStore):
+        def __init__(self) -> None:
+            self.contents: dict[str, bytes] = {}
+
+        def save_artifact_stream(self, *, source_document, output_format, media_type, write) -> RenderedArtifact:
+            buffer = io.BytesIO()
+            write(buffer)
+            self.contents[output_format] = buffer.getvalue()
+            return RenderedArtifact(format=output_format, media_type=media_type, storage_path=f"/tmp/out.{output_format}")
+
+        def save_payload(self, *, source_document, payload):
+            raise NotImplementedError
+
+        def save_payload_stream(self, *, source_document, write):
+            raise NotImplementedError
+
+        def open_payload(self, ref):
+            raise NotImplementedError
+
+        def retain_payload(self, ref) -> None:
+            raise NotImplementedError
+
+        def delete_payload(self, ref) -> None:
+            raise NotImplementedError
+
+    store = InMemoryStreamingStore()
+    use_case = ProcessDocumentPipelineUseCase(
+        ingestors=[FakeIngestor({"text/plain"})],
+        renderers=[
+            SlowStreamingRenderer("markdown", "text/markdown"),
+            SlowStreamingRenderer("json", "application/json"),
+        ],
+        artifact_store=store,
+        render_executor=ThreadPoolExecutor(max_workers=2),
+    )
+
+    started = time.perf_counter()
+    result = use_case.execute(
+        source_document=InputDocument(source_path=Path("/tmp/cv.txt"), original_name="cv.txt", media_type="text/plain"),
+        output_formats=("markdown", "json"),
+    )
+
+    assert time.perf_counter() - started < 0.28
+    assert [artifact.format for artifact in result.artifacts] == ["markdown", "json"]
+    assert store.contents == {"markdown": b"markdown:Hello", "json": b"json:Hello"}
@@ -32,6 +32,8 @@ class FakeStorage:
                 "content_type": content_type,
                 "size_bytes": len(payload),
                 "storage_path": Path("/tmp/fake.pdf"),
+                "sha256": None,
+                "detected_media_type": None,
             },
         )
 
@@ -0,0 +1,117 @@
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from app.application.errors import IngestionFailedError
+from app.core.metrics import DOCLING_INGESTION_DURATION
+from app.core.telemetry import configure_span_exporter, start_span
+from app.domain.models.document_pipeline import (
+    CanonicalDocument,
+    IngestionPolicy,
+    IngestionResult,
+    InputDocument,
+    ProcessingReport,
+)
+from app.infrastructure.ingestion.process_pool_document_ingestor import ProcessPoolDocumentIngestor
+
+
+class PidIngestor:
+    def supports(self, media_type: str) -> bool:
+        return media_type == "application/pdf"
+
+    def ingest(self, document: InputDocument, *, policy: IngestionPolicy | None = None) -> IngestionResult:
+        if document.original_name == "crash.pdf":
+            os._exit(1)
+        if document.original_name == "slow.pdf":
+            time.sleep(5)
+        if document.original_name == "broken.pdf":
+            raise ValueError("unreadable")
+        with start_span("ingestion.docling.convert"), DOCLING_INGESTION_DURATION.time(media_type="pool/test", ocr="false"):
+            pass
+        return IngestionResult(
+            canonical_document=CanonicalDocument(
+                schema_version="1.0",
+                source_media_type=document.media_type,
+                text=f"pid={os.getpid()} ocr={policy.ocr_enabled if policy else False}",
+            ),
+            report=ProcessingReport(engine_name="fake"),
+        )
+
+
+def _document(name: str) -> InputDocument:
+    return InputDocument(source_path=Path(f"/tmp/{name}"), original_name=name, media_type="application/pdf")
+
+
+def _worker_pid(result: IngestionResult) -> str:
+    return result.canonical_document.text.split()[0]
+
+
+@pytest.fixture
+def pool():
+    ingestor = ProcessPoolDocumentIngestor(
+        ingestor_factory=PidIngestor,
+        local_ingestor=PidIngestor(),
+        max_workers=1,
+        task_timeout_seconds=1,
+        max_tasks_per_worker=2,
+        start_method="fork",
+    )
+    yield ingestor
+    ingestor.close()
+
+
+def test_ingestion_runs_in_worker_and_recycles_after_max_tasks(pool: ProcessPoolDocumentIngestor) -> None:
+    first = pool.ingest(_document("a.pdf"), policy=IngestionPolicy(ocr_enabled=True))
+    second = pool.ingest(_document("b.pdf"))
+    third = pool.ingest(_document("c.pdf"))
+
+    assert pool.supports("application/pdf")
+    assert first.canonical_document.text.endswith("ocr=True")
+    assert _worker_pid(first) != f"pid={os.getpid()}"
+    assert _worker_pid(first) == _worker_pid(second)
+    assert _worker_pid(third) != _worker_pid(second)
+
+
+def test_worker_failures_are_isolated_from_the_api_process(pool: ProcessPoolDocumentIngestor) -> None:
+    with pytest.raises(IngestionFailedError, match="ValueError: unreadable"):
+        pool.ingest(_document("broken.pdf"))
+    with pytest.raises(IngestionFailedError, match="crashed"):
+        pool.ingest(_document("crash.pdf"))
+    with pytest.raises(IngestionFailedError, match="timed out"):
+        pool.ingest(_document("slow.pdf"))
+
+    assert pool.ingest(_document("ok.pdf")).canonical_document.text.startswith("pid=")
+
+
+class _Spans:
+    def __init__(self) -> None:
+        self.spans = []
+
+    def export(self, span) -> None:
+        self.spans.append(span)
+
+
+def _pool_observations() -> float:
+    series = DOCLING_INGESTION_DURATION.snapshot().get(("pool/test", "false"))
+    return sum(series[:-1]) if series else 0
+
+
+def test_worker_metrics_and_spans_are_replayed_in_the_parent(pool):
+    exporter = _Spans()
+    configure_span_exporter(exporter)
+    try:
+        before = _pool_observations()
+        with start_span("ingest", attributes={"request_id": "req-1"}) as parent:
+            pool.ingest(_document("one.pdf"))
+            pool.ingest(_document("two.pdf"))
+    finally:
+        configure_span_exporter(None)
+
+    assert _pool_observations() == before + 2
+    converts = [span for span in exporter.spans if span.name == "ingestion.docling.convert"]
+    assert len(converts) == 2
+    assert {span.trace_id for span in converts} == {parent.trace_id}
+    assert {span.parent_span_id for span in converts} == {parent.span_id}
+    assert {span.attributes.get("request_id") for span in converts} == {"req-1"}
@@ -0,0 +1,129 @@
+import gzip
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO
+
+import pytest
+
+from app.application.errors import ArtifactNotFoundError
+from app.application.use_cases.process_document_pipeline import ProcessDocumentPipelineUseCase
+from app.application.use_cases.render_deferred_artifact import RenderDeferredArtifactUseCase
+from app.domain.models.document_pipeline import (
+    CanonicalDocument,
+    IngestionPolicy,
+    IngestionResult,
+    InputDocument,
+    ProcessingReport,
+)
+from app.infrastructure.rendering.markdown_renderer import MarkdownRenderer
+from app.infrastructure.storage.local_artifact_store import LocalArtifactStore
+
+
+class TextIngestor:
+    def supports(self, media_type: str) -> bool:
+        return media_type == "text/plain"
+
+    def ingest(self, document: InputDocument, *, policy: IngestionPolicy | None = None) -> IngestionResult:
+        return IngestionResult(
+            canonical_document=CanonicalDocument(schema_version="1.0", source_media_type="text/plain", text="# Émilie"),
+            report=ProcessingReport(engine_name="text"),
+        )
+
+
+class CountingRenderer(MarkdownRenderer):
+    def __init__(self) -> None:
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def render_to(self, document: CanonicalDocument, sink: BinaryIO) -> None:
+        with self._lock:
+            self.calls += 1
+        time.sleep(0.05)
+        super().render_to(document, sink)
+
+
+def _process(store: LocalArtifactStore, renderer: CountingRenderer, tmp_path: Path):
+    source = tmp_path / "cv.txt"
+    source.write_text("# Émilie", encoding="utf-8")
+    pipeline = ProcessDocumentPipelineUseCase(
+        ingestors=[TextIngestor()],
+        renderers=[renderer],
+        artifact_store=store,
+        deferred_rendering=True,
+    )
+    return pipeline.execute(
+        source_document=InputDocument(source_path=source, original_name="cv.txt", media_type="text/plain"),
+        output_formats=["markdown"],
+    )
+
+
+def test_pipeline_returns_descriptors_without_rendering(tmp_path) -> None:
+    store = LocalArtifactStore(base_dir=str(tmp_path / "artifacts"))
+    renderer = CountingRenderer()
+
+    result = _process(store, renderer, tmp_path)
+
+    artifact = result.artifacts[0]
+    assert (artifact.format, artifact.media_type) == ("markdown", "text/markdown")
+    assert not Path(artifact.storage_path).exists()
+    assert store.find_deferred(artifact.storage_path) is not None
+    assert renderer.calls == 0
+
+
+def test_first_downloads_share_one_render(tmp_path) -> None:
+    store = LocalArtifactStore(base_dir=str(tmp_path / "artifacts"))
+    renderer = CountingRenderer()
+    artifact = _process(store, renderer, tmp_path).artifacts[0]
+    use_case = RenderDeferredArtifactUseCase(artifact_store=store, renderers=[renderer])
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(lambda _: use_case.execute(storage_path=artifact.storage_path), range(4)))
+    use_case.execute(storage_path=artifact.storage_path)
+
+    assert renderer.calls == 1
+    assert gzip.decompress(Path(artifact.storage_path).read_bytes()).decode("utf-8") == "# Émilie"
+
+
+def test_follower_renders_directly_when_the_leader_is_stuck(tmp_path) -> None:
+    store = LocalArtifactStore(base_dir=str(tmp_path / "artifacts"))
+    artifact = _process(store, CountingRenderer(), tmp_path).artifacts[0]
+    release = threading.Event()
+    started = threading.Event()
+
+    class StuckOnceRenderer(CountingRenderer):
+        def render_to(self, document: CanonicalDocument, sink: BinaryIO) -> None:
+            if not started.is_set():
+                started.set()
+                release.wait(5)
+            super().render_to(document, sink)
+
+    renderer = StuckOnceRenderer()
+    use_case = RenderDeferredArtifactUseCase(artifact_store=store, renderers=[renderer], flight_timeout_seconds=0.05)
+
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        leader = pool.submit(use_case.execute, storage_path=artifact.storage_path)
+        assert started.wait(5)
+        use_case.execute(storage_path=artifact.storage_path)
+        assert gzip.decompress(Path(artifact.storage_path).read_bytes()).decode("utf-8") == "# Émilie"
+        release.set()
+        leader.result(timeout=5)
+
+    assert renderer.calls == 2
+
+
+def test_paths_outside_the_render_area_are_not_rendered(tmp_path) -> None:
+    store = LocalArtifactStore(base_dir=str(tmp_path / "artifacts"))
+    use_case = RenderDeferredArtifactUseCase(artifact_store=store, renderers=[CountingRenderer()])
+    missing_document = store.deferred_artifact(
+        source_document=InputDocument(source_path=tmp_path / "cv.txt", original_name="cv.txt", media_type="text/plain"),
+        document_id="ab" * 32,
+        output_format="markdown",
+        media_type="text/markdown",
+    )
+
+    with pytest.raises(ArtifactNotFoundError):
+        use_case.execute(storage_path=str(tmp_path / "artifacts" / "notes.md"))
+    with pytest.raises(ArtifactNotFoundError):
+        use_case.execute(storage_path=missing_document.storage_path)
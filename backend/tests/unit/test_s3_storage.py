@@ -0,0 +1,294 @@
+import gzip
+import io
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+pytest.importorskip("boto3")
+
+from app.domain.models.document_pipeline import CanonicalDocument, InputDocument
+from app.domain.services.artifact_store import PresignedArtifactStore
+from app.domain.services.file_storage import FileStorageError
+from app.infrastructure.storage.local_artifact_store import LocalArtifactStore
+from app.infrastructure.storage.local_file_storage import GROUND_SOURCE_UPLOADS, LocalFileStorage
+from app.infrastructure.storage.s3_artifact_store import S3ArtifactStore
+from app.infrastructure.storage.s3_client import S3Client, S3Error
+from app.infrastructure.storage.s3_file_storage import S3FileStorage
+
+
+class _FakeS3:
+    def __init__(self) -> None:
+        self.objects: dict[str, tuple[bytes, dict[str, str]]] = {}
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.requests: list[tuple[str, str]] = []
+        self.fail_puts = False
+
+
+def _handler(state: _FakeS3) -> type[BaseHTTPRequestHandler]:
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+        def _target(self) -> tuple[str, dict[str, str]]:
+            parts = urlsplit(self.path)
+            query = {name: values[0] for name, values in parse_qs(parts.query, keep_blank_values=True).items()}
+            bucket, _, key = parts.path.lstrip("/").partition("/")
+            assert bucket == "cv-bucket"
+            assert self.headers["Authorization"].startswith("AWS4-HMAC-SHA256 Credential=minio/")
+            state.requests.append((self.command, key))
+            return key, query
+
+        def _body(self) -> bytes:
+            return self.rfile.read(int(self.headers.get("Content-Length", "0")))
+
+        def _reply(self, status: int, body: bytes = b"", headers: dict[str, str] | None = None) -> None:
+            self.send_response(status)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if self.command != "HEAD":
+                self.wfile.write(body)
+
+        def do_PUT(self) -> None:
+            key, query = self._target()
+            body = self._body()
+            if state.fail_puts:
+                self._reply(500, b"<Error><Code>InternalError</Code><Message>boom</Message></Error>")
+                return
+            if "uploadId" in query:
+                state.uploads[query["uploadId"]][int(query["partNumber"])] = body
+                self._reply(200, headers={"ETag": f'"etag-{query["partNumber"]}"'})
+                return
+            headers = {name: self.headers[name] for name in ("Content-Type", "Content-Encoding") if self.headers[name]}
+            state.objects[key] = (body, headers)
+            self._reply(200)
+
+        def do_POST(self) -> None:
+            key, query = self._target()
+            body = self._body()
+            if "uploads" in query:
+                upload_id = f"upload-{len(state.uploads) + 1}"
+                state.uploads[upload_id] = {}
+                self._reply(200, f"<InitiateMultipartUploadResult><UploadId>{upload_id}</UploadId></InitiateMultipartUploadResult>".encode())
+                return
+            parts = state.uploads.pop(query["uploadId"])
+            assert re.findall(rb"<PartNumber>(\d+)</PartNumber>", body) == [str(n).encode() for n in sorted(parts)]
+            state.objects[key] = (b"".join(parts[number] for number in sorted(parts)), {})
+            self._reply(200, b"<CompleteMultipartUploadResult/>")
+
+        def do_GET(self) -> None:
+            key, _ = self._target()
+            if key not in state.objects:
+                self._reply(404, b"<Error><Code>NoSuchKey</Code><Message>missing</Message></Error>")
+                return
+            body, headers = state.objects[key]
+            byte_range = self.headers["Range"]
+            if byte_range:
+                start, _, end = byte_range.removeprefix("bytes=").partition("-")
+                body = body[int(start) : int(end) + 1 if end else None]
+                self._reply(206, body, headers)
+                return
+            self._reply(200, body, headers)
+
+        def do_HEAD(self) -> None:
+            key, _ = self._target()
+            if key not in state.objects:
+                self._reply(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(state.objects[key][0])))
+            self.end_headers()
+
+        def do_DELETE(self) -> None:
+            key, query = self._target()
+            if "uploadId" in query:
+                state.uploads.pop(query["uploadId"], None)
+            elif key not in state.objects:
+                self._reply(404, b"<Error><Code>NoSuchKey</Code></Error>")
+                return
+            state.objects.pop(key, None)
+            self._reply(204)
+
+    return Handler
+
+
+@pytest.fixture
+def fake_s3():
+    state = _FakeS3()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _handler(state))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client = S3Client(
+        endpoint_url=f"http://127.0.0.1:{server.server_address[1]}",
+        bucket="cv-bucket",
+        access_key_id="minio",
+        secret_access_key="minio-secret",
+        max_attempts=1,
+    )
+    try:
+        yield state, client
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_client_round_trips_objects_and_ranged_reads(fake_s3) -> None:
+    state, client = fake_s3
+
+    client.put_object("cv/notes.txt", b"0123456789", content_type="text/plain")
+
+    assert client.head_object("cv/notes.txt") == 10
+    with client.get_object("cv/notes.txt", byte_range=(2, 5)) as response:
+        assert response.read() == b"2345"
+    client.delete_object("cv/notes.txt")
+    client.delete_object("cv/notes.txt")
+    assert client.head_object("cv/notes.txt") is None
+    with pytest.raises(S3Error) as exc_info:
+        client.get_object("cv/notes.txt")
+    assert exc_info.value.status == 404
+    assert exc_info.value.code == "NoSuchKey"
+
+
+def test_large_uploads_are_streamed_as_multipart(fake_s3) -> None:
+    state, client = fake_s3
+    payload = b"abcdefghij" * (1024 * 1024 + 1)
+
+    client.upload_fileobj("big.bin", io.BytesIO(payload), part_size=4 * 1024 * 1024)
+
+    assert state.objects["big.bin"][0] == payload
+    assert [method for method, _ in state.requests].count("PUT") == 3
+    assert state.uploads == {}
+
+
+def test_failed_multipart_upload_is_aborted(fake_s3) -> None:
+    state, client = fake_s3
+    state.fail_puts = True
+
+    with pytest.raises(S3Error):
+        client.upload_fileobj("big.bin", io.BytesIO(b"x" * (11 * 1024 * 1024)))
+
+    assert state.uploads == {}
+    assert ("DELETE", "big.bin") in state.requests
+
+
+def test_file_storage_uploads_only_persisted_files(tmp_path, fake_s3) -> None:
+    state, client = fake_s3
+    upload_dir = tmp_path / "uploads"
+    storage = S3FileStorage(LocalFileStorage(str(upload_dir), purpose=GROUND_SOURCE_UPLOADS), client)
+
+    stored = storage.save_from_stream(
+        stream=io.BytesIO(b"%PDF-1.7 resume"),
+        original_name="cv.pdf",
+        content_type="application/pdf",
+        max_size_bytes=1024,
+    )
+
+    assert state.objects == {}
+    storage.persist(stored_file=stored)
+
+    key = "uploads/" + Path(stored.storage_path).relative_to(upload_dir.resolve()).as_posix()
+    assert key.startswith("uploads/ground_source/")
+    assert state.objects[key] == (b"%PDF-1.7 resume", {"Content-Type": "application/pdf"})
+    assert Path(stored.storage_path).read_bytes() == b"%PDF-1.7 resume"
+
+    storage.delete(storage_path=str(stored.storage_path))
+
+    assert key not in state.objects
+    assert not Path(stored.storage_path).exists()
+
+
+def test_file_storage_reports_failed_uploads(tmp_path, fake_s3) -> None:
+    state, client = fake_s3
+    state.fail_puts = True
+    storage = S3FileStorage(LocalFileStorage(str(tmp_path / "uploads")), client)
+    stored = storage.save_from_stream(
+        stream=io.BytesIO(b"data"),
+        original_name="cv.txt",
+        content_type="text/plain",
+        max_size_bytes=1024,
+    )
+
+    with pytest.raises(FileStorageError):
+        storage.persist(stored_file=stored)
+
+
+def _source() -> InputDocument:
+    return InputDocument(source_path=Path("/tmp/cv.pdf"), original_name="cv.pdf", media_type="application/pdf")
+
+
+def test_artifact_store_writes_through_and_reads_back_from_the_bucket(tmp_path, fake_s3) -> None:
+    state, client = fake_s3
+    writer = S3ArtifactStore(LocalArtifactStore(str(tmp_path / "node-a")), client)
+
+    artifact = writer.save_artifact(
+        source_document=_source(),
+        output_format="markdown",
+        media_type="text/markdown",
+        content="# CV",
+    )
+    ref = writer.save_payload(source_document=_source(), payload={"texts": ["Émilie"]})
+    document_id = writer.save_document(
+        source_document=_source(),
+        document=CanonicalDocument(
+            schema_version="1.0",
+            source_media_type="application/pdf",
+            text="# CV",
+            metadata={},
+            extensions={"docling": ref},
+        ),
+    )
+
+    key = "artifacts/" + Path(artifact.storage_path).relative_to((tmp_path / "node-a").resolve()).as_posix()
+    body, headers = state.objects[key]
+    assert gzip.decompress(body) == b"# CV"
+    assert headers == {"Content-Type": "text/markdown", "Content-Encoding": "gzip"}
+
+    # Another node shares the configuration but none of the local files.
+    (tmp_path / "node-a").rename(tmp_path / "moved")
+    reader = S3ArtifactStore(LocalArtifactStore(str(tmp_path / "node-a")), client)
+    assert reader.artifact_exists(artifact.storage_path)
+    with reader.open_artifact(artifact.storage_path) as handle:
+        assert handle.read() == b"# CV"
+    with reader.open_payload(ref) as handle:
+        assert handle.read().decode("utf-8") == '{"texts":["Émilie"]}'
+    assert reader.load_document(document_id).text == "# CV"
+
+
+def test_deferred_render_is_uploaded_and_presigned(tmp_path, fake_s3) -> None:
+    state, client = fake_s3
+    store = S3ArtifactStore(LocalArtifactStore(str(tmp_path / "artifacts")), client, presign_ttl_seconds=60)
+    artifact = store.deferred_artifact(
+        source_document=_source(),
+        document_id="a" * 64,
+        output_format="markdown",
+        media_type="text/markdown",
+    )
+    assert not store.artifact_exists(artifact.storage_path)
+
+    store.save_deferred_artifact(storage_path=artifact.storage_path, write=lambda sink: sink.write(b"# CV"))
+
+    assert isinstance(store, PresignedArtifactStore)
+    assert store.artifact_exists(artifact.storage_path)
+    assert f"artifacts/renders/aa/{'a' * 64}.md.gz" in state.objects
+    url = store.presigned_download_url(artifact.storage_path, filename="cv.md", media_type="text/markdown")
+    assert f"/cv-bucket/artifacts/renders/aa/{'a' * 64}.md.gz?" in url
+    assert "X-Amz-Expires=60" in url
+    assert "response-content-type=text%2Fmarkdown" in url
+
+
+def test_blobs_already_in_the_bucket_are_not_uploaded_again(tmp_path, fake_s3) -> None:
+    state, client = fake_s3
+    first = S3ArtifactStore(LocalArtifactStore(str(tmp_path / "a")), client, key_prefix="shared/")
+    second = S3ArtifactStore(LocalArtifactStore(str(tmp_path / "b")), client, key_prefix="shared/")
+
+    first.save_payload(source_document=_source(), payload={"same": True})
+    second.save_payload(source_document=_source(), payload={"same": True})
+
+    assert [method for method, _ in state.requests].count("PUT") == 1
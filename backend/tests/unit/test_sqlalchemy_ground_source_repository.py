@@ -0,0 +1,126 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.infrastructure.persistence.models import GroundSourceORM
+from app.infrastructure.repositories.sqlalchemy_ground_source_repository import SQLAlchemyGroundSourceRepository
+
+
+@pytest.fixture
+def session(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'sources.db'}")
+    Base.metadata.create_all(bind=engine)
+    statements: list[str] = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    with sessionmaker(bind=engine)() as db:
+        db.info["statements"] = statements
+        yield db
+
+
+def _add_sources(session, user_id: str, count: int, created_at: datetime) -> None:
+    for index in range(count):
+        session.add(
+            GroundSourceORM(
+                id=f"{user_id}-{index:03d}",
+                user_id=user_id,
+                name=f"Source {index}",
+                original_filename="cv.txt",
+                content_type="text/plain",
+                size_bytes=10,
+                storage_path="/tmp/cv.txt",
+                canonical_text="x" * 10_000,
+                content_hash="h",
+                # Pairs of rows share a timestamp so the id tie-breaker is exercised.
+                created_at=created_at + timedelta(seconds=index // 2),
+            )
+        )
+    session.commit()
+
+
+def test_list_pages_by_created_at_and_id_without_loading_canonical_text(session) -> None:
+    _add_sources(session, "user_1", 5, datetime(2026, 1, 1, tzinfo=UTC))
+    _add_sources(session, "user_2", 2, datetime(2026, 1, 1, tzinfo=UTC))
+    session.expunge_all()
+    session.info["statements"].clear()
+    repository = SQLAlchemyGroundSourceRepository(session)
+
+    first = repository.list_for_user(user_id="user_1", limit=3)
+    last = first[-1]
+    second = repository.list_for_user(user_id="user_1", limit=3, after=(last.created_at, last.id))
+
+    assert [item.id for item in first + second] == [f"user_1-{index:03d}" for index in (4, 3, 2, 1, 0)]
+    assert all("canonical_text" not in statement for statement in session.info["statements"])
+
+
+def test_list_uses_the_composite_index(session) -> None:
+    plan = session.connection().exec_driver_sql(
+        "EXPLAIN QUERY PLAN SELECT id FROM ground_sources WHERE user_id = 'u' "
+        "AND (created_at, id) < ('2026-01-01', 'x') ORDER BY created_at DESC, id DESC LIMIT 3"
+    ).all()
+
+    assert any("ix_ground_sources_user_id_created_at_id" in str(step) for step in plan)
+    assert not any("TEMP B-TREE" in str(step) for step in plan)
+
+
+def test_find_by_source_sha256_is_scoped_to_the_user(session) -> None:
+    repository = SQLAlchemyGroundSourceRepository(session)
+    created = repository.create(
+        user_id="user_1",
+        name="CV",
+        original_filename="cv.txt",
+        content_type="text/plain",
+        size_bytes=10,
+        storage_path="/tmp/cv.txt",
+        canonical_text="text",
+        content_hash="h",
+        source_sha256="a" * 64,
+    )
+
+    assert repository.find_by_source_sha256(user_id="user_1", source_sha256="a" * 64).id == created.id
+    assert repository.find_by_source_sha256(user_id="user_2", source_sha256="a" * 64) is None
+    assert repository.create_from_existing(
+        source_id=created.id,
+        user_id="user_2",
+        name="Copy",
+        original_filename="copy.txt",
+        content_type="text/plain",
+    ) is None
+
+
+def test_deleting_shared_sources_reports_when_the_file_is_released(session) -> None:
+    repository = SQLAlchemyGroundSourceRepository(session)
+    original = repository.create(
+        user_id="user_1",
+        name="CV",
+        original_filename="cv.txt",
+        content_type="text/plain",
+        size_bytes=10,
+        storage_path="/tmp/cv.txt",
+        canonical_text="text",
+        content_hash="h",
+        source_sha256="a" * 64,
+    )
+    copy = repository.create_from_existing(
+        source_id=original.id,
+        user_id="user_1",
+        name="Copy",
+        original_filename="copy.txt",
+        content_type="text/plain",
+    )
+
+    assert (copy.storage_path, copy.canonical_text, copy.original_filename) == ("/tmp/cv.txt", "text", "copy.txt")
+    assert repository.delete_for_user(source_id=original.id, user_id="user_2") is None
+    assert repository.delete_for_user(source_id=original.id, user_id="user_1").storage_shared
+    assert repository.delete_for_user(source_id=original.id, user_id="user_1") is None
+    assert repository.create_from_existing(
+        source_id=original.id,
+        user_id="user_1",
+        name="Late copy",
+        original_filename="late.txt",
+        content_type="text/plain",
+    ) is None
+    last = repository.delete_for_user(source_id=copy.id, user_id="user_1")
+    assert (last.storage_path, last.storage_shared) == ("/tmp/cv.txt", False)
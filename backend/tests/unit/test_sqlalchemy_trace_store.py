@@ -0,0 +1,55 @@
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.application.use_cases.list_trace_runs import ListTraceRunsUseCase
+from app.core.database import Base
+from app.domain.services.trace_store import TraceEvent
+from app.infrastructure.persistence import models  # noqa: F401
+from app.infrastructure.repositories.sqlalchemy_trace_repository import SQLAlchemyTraceRepository
+from app.infrastructure.tracing.sqlalchemy_trace_store import SQLAlchemyTraceStore
+
+
+def _event(run_id: str, event: str, offset_seconds: int, user_id: str | None = "user_1") -> TraceEvent:
+    return TraceEvent(
+        run_id=run_id,
+        stage="ats_pass",
+        event=event,
+        timestamp=datetime(2026, 1, 1, tzinfo=UTC) + timedelta(seconds=offset_seconds),
+        payload={"graph_id": "cv_rewrite_v1", "duration_ms": offset_seconds},
+        user_id=user_id,
+    )
+
+
+def test_sqlalchemy_trace_store_bulk_inserts_and_queries_runs(tmp_path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'traces.db'}")
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+
+    store = SQLAlchemyTraceStore(session_factory, batch_size=2)
+    store.record(_event("run_a", "stage_started", 0))
+    store.record(_event("run_a", "stage_completed", 1))
+    store.record(_event("run_b", "stage_started", 10))
+    store.record(_event("run_b", "stage_failed", 11))
+    store.record(_event("run_c", "stage_started", 20, user_id="user_2"))
+    assert store.flush(timeout=5)
+    store.close()
+
+    with session_factory() as session:
+        repository = SQLAlchemyTraceRepository(session)
+
+        events = repository.list_events_for_run(run_id="run_a", user_id="user_1")
+        assert [event.event for event in events] == ["stage_started", "stage_completed"]
+        assert events[1].payload["duration_ms"] == 1
+        assert repository.list_events_for_run(run_id="run_a", user_id="user_2") == []
+
+        runs = ListTraceRunsUseCase(traces=repository).execute(user_id="user_1", limit=10)
+        assert [run.run_id for run in runs] == ["run_b", "run_a"]
+        assert runs[0].failed_stage_count == 1
+        assert runs[1].event_count == 2
+
+        second_page = repository.list_runs_for_user(user_id="user_1", limit=1, offset=1)
+        assert [run.run_id for run in second_page] == ["run_a"]
+
+    engine.dispose()
@@ -0,0 +1,88 @@
+import json
+from collections.abc import Iterator
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.api.middleware.request_tracing import RequestTracingMiddleware
+from app.core import telemetry
+from app.core.database import instrument_engine
+from app.core.telemetry import set_correlation, start_span
+from app.infrastructure.tracing.span_exporters import InMemorySpanExporter, OtlpHttpSpanExporter
+
+
+@pytest.fixture
+def exporter() -> Iterator[InMemorySpanExporter]:
+    previous = telemetry._exporter
+    memory = InMemorySpanExporter()
+    telemetry.configure_span_exporter(memory)
+    yield memory
+    telemetry.configure_span_exporter(previous)
+
+
+def test_spans_nest_and_inherit_correlation(exporter: InMemorySpanExporter) -> None:
+    with start_span("root", attributes={"request_id": "req_1"}) as root:
+        with start_span("child"):
+            set_correlation("run_id", "run_1")
+        with pytest.raises(ValueError):
+            with start_span("failing"):
+                raise ValueError("boom")
+
+    spans = {span.name: span for span in exporter.spans(trace_id=root.trace_id)}
+    assert spans["child"].parent_span_id == root.span_id
+    assert spans["child"].attributes["request_id"] == "req_1"
+    assert spans["root"].attributes["run_id"] == "run_1"
+    assert spans["failing"].status == "error"
+    assert spans["root"].duration_ms is not None
+
+
+def test_query_spans_are_recorded_inside_a_trace(exporter: InMemorySpanExporter, tmp_path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'spans.db'}")
+    instrument_engine(engine)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        with start_span("request"):
+            connection.execute(text("SELECT 2"))
+
+    queries = [span for span in exporter.spans() if span.name == "db.query"]
+    assert len(queries) == 1
+    assert queries[0].attributes["db.operation"] == "SELECT"
+    engine.dispose()
+
+
+def test_request_middleware_propagates_request_id(exporter: InMemorySpanExporter) -> None:
+    app = FastAPI()
+    app.add_middleware(RequestTracingMiddleware)
+
+    @app.get("/work")
+    def work() -> dict[str, str]:
+        with start_span("work"):
+            return {"status": "ok"}
+
+    response = TestClient(app).get("/work", headers={"X-Request-ID": "req-42"})
+
+    assert response.headers["x-request-id"] == "req-42"
+    spans = {span.name: span for span in exporter.spans(trace_id=response.headers["x-trace-id"])}
+    assert spans["work"].parent_span_id == spans["http.request"].span_id
+    assert spans["work"].attributes["request_id"] == "req-42"
+    assert spans["http.request"].attributes["http.route"] == "/work"
+    assert spans["http.request"].attributes["http.status_code"] == 200
+
+
+def test_otlp_exporter_encodes_spans(exporter: InMemorySpanExporter) -> None:
+    with start_span("root", attributes={"size_bytes": 12, "ocr_enabled": True}):
+        pass
+
+    otlp = OtlpHttpSpanExporter("http://collector:4318", service_name="api")
+    payload = json.loads(otlp.encode(exporter.spans()))
+    otlp.close()
+
+    resource_spans = payload["resourceSpans"][0]
+    assert resource_spans["resource"]["attributes"][0]["value"] == {"stringValue": "api"}
+    encoded = resource_spans["scopeSpans"][0]["spans"][0]
+    assert len(encoded["traceId"]) == 32
+    assert {"key": "size_bytes", "value": {"intValue": "12"}} in encoded["attributes"]
+    assert {"key": "ocr_enabled", "value": {"boolValue": True}} in encoded["attributes"]
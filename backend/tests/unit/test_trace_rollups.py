@@ -0,0 +1,101 @@
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.application.use_cases.get_stage_latency_report import GetStageLatencyReportUseCase
+from app.application.use_cases.rollup_trace_events import RollupTraceEventsUseCase
+from app.core.database import Base
+from app.domain.services.trace_store import TraceEvent
+from app.infrastructure.persistence import models  # noqa: F401
+from app.infrastructure.repositories.sqlalchemy_trace_analytics_repository import SQLAlchemyTraceAnalyticsRepository
+from app.infrastructure.tracing.sqlalchemy_trace_store import SQLAlchemyTraceStore
+
+START = datetime(2026, 1, 1, 10, tzinfo=UTC)
+
+
+def _event(event: str, minutes: int, duration_ms: int, prompt_hash: str = "hash_a") -> TraceEvent:
+    return TraceEvent(
+        run_id=f"run_{minutes}",
+        stage="ats_pass",
+        event=event,
+        timestamp=START + timedelta(minutes=minutes),
+        payload={
+            "graph_id": "cv_rewrite_v1",
+            "graph_version": "1",
+            "llm_model": "model_a",
+            "prompt_hash": prompt_hash,
+            "duration_ms": duration_ms,
+            "output_chars": 900,
+        },
+    )
+
+
+def test_rollups_are_incremental_and_feed_latency_report(tmp_path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'traces.db'}")
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+
+    store = SQLAlchemyTraceStore(session_factory)
+    store.record(_event("stage_started", 0, 0))
+    store.record(_event("stage_completed", 1, 80))
+    store.record(_event("stage_completed", 2, 400))
+    store.record(_event("stage_failed", 70, 3000))
+    assert store.flush(timeout=5)
+
+    now = START + timedelta(days=1)
+    with session_factory() as session:
+        rollup = RollupTraceEventsUseCase(analytics=SQLAlchemyTraceAnalyticsRepository(session), batch_size=2)
+        assert rollup.execute(now=now) == 3
+        assert rollup.execute(now=now) == 0
+
+    store.record(_event("stage_completed", 75, 90, prompt_hash="hash_b"))
+    store.record(_event("stage_completed", 80, 90))
+    assert store.flush(timeout=5)
+    store.close()
+
+    with session_factory() as session:
+        analytics = SQLAlchemyTraceAnalyticsRepository(session)
+        assert RollupTraceEventsUseCase(analytics=analytics).execute(now=now) == 2
+
+        reports = GetStageLatencyReportUseCase(analytics=analytics).execute(since=START, until=now)
+        by_hash = {report.prompt_hash: report for report in reports}
+        assert by_hash["hash_b"].completed_count == 1
+        report = by_hash["hash_a"]
+        assert (report.completed_count, report.failed_count) == (3, 1)
+        assert report.failure_rate == 0.25
+        assert report.p50_ms == 100
+        assert report.p99_ms == 4000
+        assert report.first_window_start == START
+        assert report.last_window_start == START + timedelta(hours=1)
+
+        hourly = GetStageLatencyReportUseCase(analytics=analytics).execute(
+            since=START,
+            until=now,
+            graph_id="cv_rewrite_v1",
+            window_hours=1,
+        )
+        assert len([item for item in hourly if item.prompt_hash == "hash_a"]) == 2
+
+    engine.dispose()
+
+
+def test_rollups_skip_events_that_have_not_settled(tmp_path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'traces.db'}")
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, expire_on_commit=False)
+
+    store = SQLAlchemyTraceStore(session_factory)
+    store.record(_event("stage_completed", 0, 80))
+    store.record(_event("stage_completed", 5, 80))
+    assert store.flush(timeout=5)
+    store.close()
+
+    with session_factory() as session:
+        analytics = SQLAlchemyTraceAnalyticsRepository(session)
+        use_case = RollupTraceEventsUseCase(analytics=analytics, settle_seconds=60)
+        assert use_case.execute(now=START + timedelta(minutes=2)) == 1
+        assert use_case.execute(now=START + timedelta(minutes=10)) == 1
+        assert analytics.get_rollup_watermark() == 2
+
+    engine.dispose()
@@ -0,0 +1,58 @@
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+
+from app.api.middleware.upload_size_limit import UploadSizeLimitMiddleware
+
+
+def _client(received: list[int]) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(UploadSizeLimitMiddleware, max_body_bytes=4096)
+
+    @app.post("/upload")
+    def upload(file: UploadFile = File(...)) -> dict[str, int]:
+        size = len(file.file.read())
+        received.append(size)
+        return {"size": size}
+
+    return TestClient(app)
+
+
+def test_small_uploads_pass_through() -> None:
+    received: list[int] = []
+
+    response = _client(received).post("/upload", files={"file": ("cv.txt", b"x" * 1024, "text/plain")})
+
+    assert response.status_code == 200
+    assert received == [1024]
+
+
+def test_declared_oversize_body_is_rejected_from_the_headers() -> None:
+    received: list[int] = []
+
+    response = _client(received).post("/upload", files={"file": ("cv.txt", b"x" * 8192, "text/plain")})
+
+    assert response.status_code == 413
+    assert response.json() == {"detail": "File is too large"}
+    assert received == []
+
+
+def test_undeclared_oversize_body_is_cut_off_while_streaming() -> None:
+    received: list[int] = []
+    boundary = "limit"
+    body = (
+        f"--{boundary}\r\nContent-Disposition: form-data; name=\"file\"; filename=\"cv.txt\"\r\n"
+        "Content-Type: text/plain\r\n\r\n"
+    ).encode() + b"x" * 8192 + f"\r\n--{boundary}--\r\n".encode()
+
+    def chunks():
+        for start in range(0, len(body), 1024):
+            yield body[start : start + 1024]
+
+    response = _client(received).post(
+        "/upload",
+        content=chunks(),
+        headers={"Content-Type": f"multipart/form-data; boundary={boundary}"},
+    )
+
+    assert response.status_code == 413
+    assert received == []
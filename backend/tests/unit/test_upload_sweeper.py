@@ -0,0 +1,54 @@
+import io
+import os
+import time
+
+from app.infrastructure.storage.local_file_storage import LocalFileStorage
+from app.infrastructure.storage.upload_sweeper import UploadSweeper
+
+
+def _upload(storage: LocalFileStorage, name: str, *, age_hours: float):
+    stored = storage.save_from_stream(
+        stream=io.BytesIO(b"cv"),
+        original_name=name,
+        content_type="text/plain",
+        max_size_bytes=1024,
+    )
+    timestamp = time.time() - age_hours * 3600
+    os.utime(stored.storage_path, (timestamp, timestamp))
+    return stored.storage_path
+
+
+def test_sweep_expires_transient_uploads_and_keeps_ground_sources(tmp_path) -> None:
+    upload_dir = str(tmp_path / "uploads")
+    transient = LocalFileStorage(upload_dir=upload_dir)
+    sources = LocalFileStorage(upload_dir=upload_dir, purpose="ground_source")
+    old_transient = _upload(transient, "old.txt", age_hours=30)
+    fresh_transient = _upload(transient, "fresh.txt", age_hours=1)
+    old_source = _upload(sources, "source.txt", age_hours=24 * 365)
+    legacy = tmp_path / "uploads" / "legacy_flat.txt"
+    legacy.write_text("kept", encoding="utf-8")
+
+    sweeper = UploadSweeper(upload_dir, retention_hours={"transient": 24, "ground_source": 0})
+
+    assert sweeper.sweep() == 1
+    assert not old_transient.exists()
+    assert fresh_transient.exists()
+    assert old_source.exists()
+    assert legacy.exists()
+
+
+def test_sweep_deletes_in_batches_up_to_the_per_run_cap(tmp_path) -> None:
+    upload_dir = str(tmp_path / "uploads")
+    storage = LocalFileStorage(upload_dir=upload_dir)
+    paths = [_upload(storage, f"cv{index}.txt", age_hours=48) for index in range(7)]
+    sweeper = UploadSweeper(
+        upload_dir,
+        retention_hours={"transient": 24},
+        batch_size=2,
+        max_deletes_per_run=4,
+        batch_pause_seconds=0,
+    )
+
+    assert sweeper.sweep() == 4
+    assert sweeper.sweep() == 3
+    assert not any(path.exists() for path in paths)
@@ -241,14 +241,19 @@ export function AuthProvider({ children }) {
     }
   }
 
-  async function listGroundSources() {
+  async function listGroundSources({ cursor = null, limit = 20 } = {}) {
+    const params = new URLSearchParams({ limit: String(limit) });
+    if (cursor) {
+      params.set("cursor", cursor);
+    }
+
     try {
-      const payload = await authRequest("/v1/sources", {
+      const payload = await authRequest(`/v1/sources?${params.toString()}`, {
         method: "GET",
       });
-      return { ok: true, items: payload.items || [] };
+      return { ok: true, items: payload.items || [], next_cursor: payload.next_cursor || null };
     } catch (error) {
-      return { ok: false, message: normalizeError(error), items: [] };
+      return { ok: false, message: normalizeError(error), items: [], next_cursor: null };
     }
   }
 
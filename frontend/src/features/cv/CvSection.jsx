@@ -10,7 +10,9 @@ export default function CvSection() {
   const { listGroundSources, createGroundSource, deleteGroundSource, generateCvPdfFromSource } = useAuth();
   const [sources, setSources] = useState([]);
   const [selectedSourceId, setSelectedSourceId] = useState("");
+  const [nextCursor, setNextCursor] = useState(null);
   const [isLoadingSources, setIsLoadingSources] = useState(true);
+  const [isLoadingMore, setIsLoadingMore] = useState(false);
   const [loadError, setLoadError] = useState("");
 
   useEffect(() => {
@@ -30,6 +32,7 @@ export default function CvSection() {
 
     const nextSources = result.items || [];
     setSources(nextSources);
+    setNextCursor(result.next_cursor);
 
     const containsPreferred = preferredSourceId && nextSources.some((item) => item.id === preferredSourceId);
     if (containsPreferred) {
@@ -47,6 +50,27 @@ export default function CvSection() {
     return { ok: true };
   }
 
+  async function loadMoreSources() {
+    if (!nextCursor) {
+      return;
+    }
+    setIsLoadingMore(true);
+    setLoadError("");
+
+    const result = await listGroundSources({ cursor: nextCursor });
+    setIsLoadingMore(false);
+    if (!result.ok) {
+      setLoadError(result.message || t("cv.sources.loadError"));
+      return;
+    }
+
+    setSources((currentSources) => {
+      const knownIds = new Set(currentSources.map((item) => item.id));
+      return [...currentSources, ...result.items.filter((item) => !knownIds.has(item.id))];
+    });
+    setNextCursor(result.next_cursor);
+  }
+
   async function handleCreateSource({ name, file }) {
     const result = await createGroundSource({ name, file });
     if (!result.ok) {
@@ -71,7 +95,10 @@ export default function CvSection() {
         sources={sources}
         selectedSourceId={selectedSourceId}
         isLoading={isLoadingSources}
+        isLoadingMore={isLoadingMore}
+        hasMore={Boolean(nextCursor)}
         loadError={loadError}
+        onLoadMore={loadMoreSources}
         onSelectSource={setSelectedSourceId}
         onCreateSource={handleCreateSource}
         onDeleteSource={handleDeleteSource}
@@ -9,7 +9,10 @@ export default function SourceLibrarySection({
   sources,
   selectedSourceId,
   isLoading,
+  isLoadingMore,
+  hasMore,
   loadError,
+  onLoadMore,
   onSelectSource,
   onCreateSource,
   onDeleteSource,
@@ -135,6 +138,12 @@ export default function SourceLibrarySection({
             })}
           </ul>
         ) : null}
+
+        {hasMore && !isLoading ? (
+          <Button variant="ghost" onClick={onLoadMore} disabled={isLoadingMore}>
+            {isLoadingMore ? t("cv.sources.loadingMore") : t("cv.sources.loadMore")}
+          </Button>
+        ) : null}
       </div>
     </Card>
   );
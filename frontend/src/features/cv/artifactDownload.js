@@ -26,7 +26,11 @@ export function resolveArtifactDownloadPath(artifact) {
   }
 
   if (typeof artifact.storage_path === "string" && artifact.storage_path) {
-    return `/v1/documents/artifacts/download?storage_path=${encodeURIComponent(artifact.storage_path)}`;
+    const params = new URLSearchParams({ storage_path: artifact.storage_path });
+    if (typeof artifact.filename === "string" && artifact.filename) {
+      params.set("filename", artifact.filename);
+    }
+    return `/v1/documents/artifacts/download?${params.toString()}`;
   }
 
   return "";